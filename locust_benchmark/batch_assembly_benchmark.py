@@ -0,0 +1,187 @@
+"""Client-side benchmark of the batch feature vector assembly.
+
+Measures the time spent stitching the results of the online store SQL client and
+assembling them into feature vectors for increasingly large batches. The online store
+is replaced by in-memory results, so no Hopsworks cluster is required. Batches larger
+than the `batch_chunk_size` of the SQL client are streamed from the in-memory results:
+
+    python batch_assembly_benchmark.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from unittest import mock
+
+from hsfs import feature_group, serving_key, training_dataset_feature
+from hsfs.core import online_store_sql_engine, vector_server
+
+
+BATCH_STATEMENT_INDICES = [0, 1]
+
+
+def build_features_and_serving_keys():
+    fgs = [
+        feature_group.FeatureGroup(
+            name=f"fg{idx}",
+            version=1,
+            featurestore_id=99,
+            id=idx,
+            primary_key=["id"],
+            partition_key=[],
+        )
+        for idx in BATCH_STATEMENT_INDICES
+    ]
+    features = []
+    serving_keys = []
+    for fg, prefix in zip(fgs, ["", "fg1_"]):
+        features.append(
+            training_dataset_feature.TrainingDatasetFeature(
+                name=f"{prefix}id", type="bigint", featuregroup=fg
+            )
+        )
+        features += [
+            training_dataset_feature.TrainingDatasetFeature(
+                name=f"{prefix}feature_{idx}", type="double", featuregroup=fg
+            )
+            for idx in range(5)
+        ]
+        serving_keys.append(
+            serving_key.ServingKey(
+                feature_name="id",
+                join_index=fg.id,
+                feature_group=fg,
+                prefix=prefix,
+            )
+        )
+    return features, serving_keys
+
+
+def build_sql_client(serving_keys, n_entries):
+    sql_client = online_store_sql_engine.OnlineStoreSqlClient(
+        feature_store_id=99, skip_fg_ids=set(), external=True
+    )
+    sql_client._serving_key_by_serving_index = {
+        sk.join_index: [sk] for sk in serving_keys
+    }
+    sql_client._prefix_by_serving_index = {
+        sk.join_index: sk.prefix for sk in serving_keys
+    }
+    # the online store returns the rows in arbitrary order
+    rows = {
+        sk.join_index: [
+            {
+                f"{sk.prefix}id": i,
+                **{f"{sk.prefix}feature_{idx}": float(i) for idx in range(5)},
+            }
+            for i in reversed(range(n_entries))
+        ]
+        for sk in serving_keys
+    }
+
+    async def execute_prep_statements(prepared_statements, entries):
+        return rows
+
+    sql_client._execute_prep_statements = execute_prep_statements
+    # streamed lookups of large batches query the connection pool, the statement of each
+    # feature group is its serving index
+    rows_by_key = {
+        index: {(row[f"{prefix}id"],): row for row in index_rows}
+        for index, prefix, index_rows in (
+            (sk.join_index, sk.prefix, rows[sk.join_index]) for sk in serving_keys
+        )
+    }
+    sql_client._connection_pool = InMemoryConnectionPool(rows_by_key)
+    return sql_client
+
+
+class InMemoryCursor:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    async def close(self):
+        pass
+
+
+class InMemoryConnectionPool:
+    def __init__(self, rows_by_key):
+        self._rows_by_key = rows_by_key
+
+    def acquire(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def execute(self, stmt, bind_params):
+        rows = self._rows_by_key[stmt]
+        return InMemoryCursor(
+            [rows[key] for key in bind_params["batch_ids"] if key in rows]
+        )
+
+
+def time_it(func, repetitions):
+    timings = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def run(sizes, repetitions):
+    features, serving_keys = build_features_and_serving_keys()
+    print(f"{'entries':>10} {'sql stitching [ms]':>20} {'assembly [ms]':>15}")
+    for n_entries in sizes:
+        entries = [{"id": i, "fg1_id": i} for i in range(n_entries)]
+        sql_client = build_sql_client(serving_keys, n_entries)
+        statements = {idx: idx for idx in BATCH_STATEMENT_INDICES}
+        stitching = time_it(
+            lambda sql_client=sql_client, entries=entries: asyncio.run(
+                sql_client._batch_vector_results_async(entries, statements)
+            ),
+            repetitions,
+        )
+
+        server = vector_server.VectorServer(
+            feature_store_id=99, features=features, serving_keys=serving_keys
+        )
+        server._on_demand_feature_names = []
+        server._default_client = server.DEFAULT_SQL_CLIENT
+        server._init_sql_client = True
+        server._sql_client = mock.Mock()
+        server._sql_client.get_batch_feature_vectors.side_effect = (
+            lambda entries, sql_client=sql_client: asyncio.run(
+                sql_client._batch_vector_results_async(entries, statements)
+            )
+        )
+        server.validate_entry = lambda entry, **kwargs: entry
+        assembly = time_it(
+            lambda server=server, entries=entries: server.get_feature_vectors(
+                entries, return_type="list"
+            ),
+            repetitions,
+        )
+        print(f"{n_entries:>10} {stitching * 1000:>20.1f} {assembly * 1000:>15.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 10000, 50000, 100000]
+    )
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+    # no connection to Hopsworks is needed to assemble the feature vectors
+    with mock.patch("hsfs.client.get_instance"), mock.patch(
+        "hsfs.engine.get_type", return_value="python"
+    ):
+        run(args.sizes, args.repetitions)
@@ -15,6 +15,8 @@
 #
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 from typing import Any, Dict, List, Optional, Union
 from warnings import warn
@@ -77,12 +79,16 @@ class OnlineStoreRestClientSingleton:
     TIMEOUT = "timeout"
     SERVER_API_VERSION = "server_api_version"
     API_KEY = "api_key"
+    BATCH_SIZE = "batch_size"
+    MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
     _DEFAULT_ONLINE_STORE_REST_CLIENT_PORT = 4406
     _DEFAULT_ONLINE_STORE_REST_CLIENT_TIMEOUT_SECOND = 2
     _DEFAULT_ONLINE_STORE_REST_CLIENT_VERIFY_CERTS = True
     _DEFAULT_ONLINE_STORE_REST_CLIENT_USE_SSL = True
     _DEFAULT_ONLINE_STORE_REST_CLIENT_SERVER_API_VERSION = "0.1.0"
     _DEFAULT_ONLINE_STORE_REST_CLIENT_HTTP_AUTHORIZATION = "X-API-KEY"
+    _DEFAULT_ONLINE_STORE_REST_CLIENT_BATCH_SIZE = 1000
+    _DEFAULT_ONLINE_STORE_REST_CLIENT_MAX_CONCURRENT_REQUESTS = 4
 
     def __init__(
         self,
@@ -166,10 +172,18 @@ class OnlineStoreRestClientSingleton:
                 "Use the init_or_reset_online_store_connection method with reset_connection flag set "
                 + "to True to reset the online_store_client_connection"
             )
-        if transport is not None:
+        if transport is None:
+            # size the connection pool so that chunks of a batch request can be sent concurrently
+            transport = requests.adapters.HTTPAdapter(
+                pool_maxsize=max(
+                    requests.adapters.DEFAULT_POOLSIZE,
+                    self._current_config[self.MAX_CONCURRENT_REQUESTS],
+                )
+            )
+        else:
             _logger.debug("Setting custom transport adapter.")
-            self._session.mount("https://", transport)
-            self._session.mount("http://", transport)
+        self._session.mount("https://", transport)
+        self._session.mount("http://", transport)
 
         if not self._current_config[self.VERIFY_CERTS]:
             _logger.warning(
@@ -217,6 +231,8 @@ class OnlineStoreRestClientSingleton:
             self.USE_SSL: self._DEFAULT_ONLINE_STORE_REST_CLIENT_USE_SSL,
             self.SERVER_API_VERSION: self._DEFAULT_ONLINE_STORE_REST_CLIENT_SERVER_API_VERSION,
             self.HTTP_AUTHORIZATION: self._DEFAULT_ONLINE_STORE_REST_CLIENT_HTTP_AUTHORIZATION,
+            self.BATCH_SIZE: self._DEFAULT_ONLINE_STORE_REST_CLIENT_BATCH_SIZE,
+            self.MAX_CONCURRENT_REQUESTS: self._DEFAULT_ONLINE_STORE_REST_CLIENT_MAX_CONCURRENT_REQUESTS,
         }
 
     def _get_default_dynamic_parameters_config(
@@ -299,6 +315,30 @@ class OnlineStoreRestClientSingleton:
             timeout=timeout if timeout < 500 else timeout / 1000,
         )
 
+    async def send_request_async(
+        self,
+        method: str,
+        path_params: List[str],
+        headers: Optional[Dict[str, Any]] = None,
+        data: Optional[str] = None,
+    ) -> requests.Response:
+        """Send a request without blocking the running event loop.
+
+        The request is sent through the pooled session of the client from the default executor
+        of the running event loop, allowing many lookups to be awaited concurrently.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.send_request,
+                method=method,
+                path_params=path_params,
+                headers=headers,
+                data=data,
+            ),
+        )
+
     def _check_hopsworks_connection(self) -> None:
         _logger.debug("Checking Hopsworks connection.")
         assert (
@@ -23,8 +23,11 @@ from hsfs import client, engine, feature_store, usage, util
 from hsfs.core import (
     feature_store_api,
     hosts_api,
+    kafka_engine,
     project_api,
+    query_constructor_api,
     services_api,
+    storage_connector_api,
     variable_api,
 )
 from hsfs.core.opensearch import OpenSearchClientSingleton
@@ -282,6 +285,9 @@ class Connection:
             ```
         """
         OpenSearchClientSingleton().close()
+        kafka_engine.close_kafka_resources()
+        query_constructor_api.QueryConstructorApi.clear_cache()
+        storage_connector_api.StorageConnectorApi.invalidate_online_connector()
         client.stop()
         self._feature_store_api = None
         engine.stop()
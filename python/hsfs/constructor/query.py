@@ -18,7 +18,7 @@ from __future__ import annotations
 import json
 import warnings
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
 
 import humps
 import numpy as np
@@ -94,7 +94,7 @@ class Query:
 
         if online:
             sql_query = self._to_string(fs_query, online)
-            online_conn = self._storage_connector_api.get_online_connector(
+            online_conn = self._storage_connector_api.get_cached_online_connector(
                 self._feature_store_id
             )
         else:
@@ -185,17 +185,7 @@ class Query:
             read_options = {}
         sql_query, online_conn = self._prep_read(online, read_options)
 
-        schema = None
-        if (
-            read_options
-            and "pandas_types" in read_options
-            and read_options["pandas_types"]
-        ):
-            schema = self.features
-            if len(self.joins) > 0 or None in [f.type for f in schema]:
-                raise ValueError(
-                    "Pandas types casting only supported for feature_group.read()/query.select_all()"
-                )
+        schema = self._get_pandas_types_schema(read_options)
 
         return engine.get_instance().sql(
             sql_query,
@@ -206,6 +196,85 @@ class Query:
             schema,
         )
 
+    def read_batches(
+        self,
+        batch_size: Optional[int] = None,
+        dataframe_type: str = "default",
+        read_options: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[
+        Union[
+            pd.DataFrame,
+            np.ndarray,
+            List[List[Any]],
+            TypeVar("pyarrow.RecordBatch"),
+            TypeVar("polars.DataFrame"),
+        ]
+    ]:
+        """Read the specified query from the offline storage in batches.
+
+        The batches are streamed from the Hopsworks Feature Query Service and only one batch is
+        held in memory at a time, so that queries larger than the available memory can be processed.
+
+        !!! example "Process a query in chunks"
+            ```python
+            query = fg1.select_all().join(fg2.select_all())
+
+            for df in query.read_batches(batch_size=100000):
+                process(df)
+            ```
+
+        !!! warning "Engine Support"
+            **Python only**, reading in batches requires the Hopsworks Feature Query Service.
+
+        # Arguments
+            batch_size: Number of rows per batch. Defaults to `None`, which yields the batches
+                as they are received.
+            dataframe_type: Type of the yielded batches, `"default"`, `"pandas"`, `"polars"`,
+                `"numpy"`, `"python"` or `"pyarrow"` for `pyarrow.RecordBatch`. Defaults to `"default"`,
+                which maps to Pandas dataframes.
+            read_options: Only for python engine:
+                * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
+                  For example: `{"arrow_flight_config": {"timeout": 900}}`
+                  If the result is split over multiple endpoints, they are fetched concurrently by up
+                  to `"max_workers"` threads and the batches are yielded in the order of the result,
+                  set `"ordered": False` to yield them as they arrive instead.
+                Defaults to `{}`.
+
+        # Returns
+            `Iterator`. An iterator over the batches of the query result.
+        """
+        if engine.get_type() != "python":
+            raise FeatureStoreException(
+                "Reading a query in batches is only supported with the Python engine."
+            )
+        if not read_options:
+            read_options = {}
+        sql_query, _ = self._prep_read(False, read_options)
+
+        return engine.get_instance().sql_batches(
+            sql_query,
+            dataframe_type,
+            read_options,
+            self._get_pandas_types_schema(read_options),
+            batch_size=batch_size,
+        )
+
+    def _get_pandas_types_schema(
+        self, read_options: Optional[Dict[str, Any]]
+    ) -> Optional[List[Feature]]:
+        if not (
+            read_options
+            and "pandas_types" in read_options
+            and read_options["pandas_types"]
+        ):
+            return None
+        schema = self.features
+        if len(self.joins) > 0 or None in [f.type for f in schema]:
+            raise ValueError(
+                "Pandas types casting only supported for feature_group.read()/query.select_all()"
+            )
+        return schema
+
     def show(self, n: int, online: bool = False) -> List[List[Any]]:
         """Show the first N rows of the Query.
 
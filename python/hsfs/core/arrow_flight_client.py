@@ -19,7 +19,10 @@ import base64
 import datetime
 import json
 import logging
+import queue
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from typing import Any, Dict, Optional, Union
 
@@ -41,6 +44,9 @@ _logger = logging.getLogger(__name__)
 
 _arrow_flight_instance = None
 
+# marks the end of the record batches of an endpoint
+_END_OF_STREAM = object()
+
 
 def get_instance() -> ArrowFlightClient:
     global _arrow_flight_instance
@@ -143,6 +149,9 @@ class ArrowFlightClient:
     DEFAULT_TIMEOUT_SECONDS = 900
     DEFAULT_HEALTHCHECK_TIMEOUT_SECONDS = 5
     DEFAULT_GRPC_MIN_RECONNECT_BACKOFF_MS = 2000
+    DEFAULT_MAX_ENDPOINT_WORKERS = 8
+    # number of record batches buffered per endpoint while streaming
+    ENDPOINT_QUEUE_SIZE = 4
 
     def __init__(self, disabled_for_session: bool = False):
         _logger.debug("Initializing Hopsworks Feature Query Service Client.")
@@ -381,25 +390,191 @@ class ArrowFlightClient:
             options=options,
         )
 
+    def _get_endpoints(self, descriptor):
+        info = self.get_flight_info(descriptor)
+        _logger.debug("Retrieved flight info: %s. Fetching dataset.", str(info))
+        return info.endpoints
+
+    def _do_get(self, endpoint, timeout):
+        options = pyarrow.flight.FlightCallOptions(timeout=timeout)
+        return self._connection.do_get(endpoint.ticket, options)
+
+    def _get_max_workers(self, endpoints, max_workers=None):
+        return max(
+            1, min(len(endpoints), max_workers or self.DEFAULT_MAX_ENDPOINT_WORKERS)
+        )
+
+    # each endpoint is retried on its own, so a failing endpoint does not refetch the others
     @retry(
         wait_exponential_multiplier=1000,
         stop_max_attempt_number=3,
         retry_on_exception=_should_retry,
     )
-    def _get_dataset(self, descriptor, timeout=None, dataframe_type="pandas"):
+    def _read_endpoint(self, endpoint, timeout):
+        return self._do_get(endpoint, timeout).read_all()
+
+    def _get_dataset(
+        self, descriptor, timeout=None, dataframe_type="pandas", max_workers=None
+    ):
         if timeout is None:
             timeout = self.timeout
-        info = self.get_flight_info(descriptor)
-        _logger.debug("Retrieved flight info: %s. Fetching dataset.", str(info))
-        options = pyarrow.flight.FlightCallOptions(timeout=timeout)
-        reader = self._connection.do_get(info.endpoints[0].ticket, options)
+        endpoints = self._get_endpoints(descriptor)
+        if len(endpoints) == 1:
+            table = self._read_endpoint(endpoints[0], timeout)
+        else:
+            _logger.debug("Fetching %d endpoints concurrently.", len(endpoints))
+            with ThreadPoolExecutor(
+                max_workers=self._get_max_workers(endpoints, max_workers)
+            ) as executor:
+                # map keeps the order of the endpoints, which is the order of the result
+                tables = list(
+                    executor.map(
+                        lambda endpoint: self._read_endpoint(endpoint, timeout),
+                        endpoints,
+                    )
+                )
+            table = pyarrow.concat_tables(tables)
         _logger.debug("Dataset fetched. Converting to dataframe %s.", dataframe_type)
         if dataframe_type.lower() == "polars":
-            return pl.from_arrow(reader.read_all())
+            return pl.from_arrow(table)
         else:
-            return reader.read_pandas()
+            return table.to_pandas()
+
+    # only the request is retried, the stream can not be resumed once batches were consumed
+    @retry(
+        wait_exponential_multiplier=1000,
+        stop_max_attempt_number=3,
+        retry_on_exception=_should_retry,
+    )
+    def _get_endpoint_reader(self, endpoint, timeout):
+        return self._do_get(endpoint, timeout)
 
-    # retry is handled in get_dataset
+    def _iter_record_batches(self, reader, batch_size=None):
+        exhausted = False
+        try:
+            batches = (chunk.data for chunk in reader)
+            if batch_size is not None:
+                batches = _rebatch(batches, batch_size)
+            yield from batches
+            exhausted = True
+        except Exception as e:
+            _logger.debug("Caught exception while streaming record batches: %s", str(e))
+            _logger.exception(e)
+            raise FeatureStoreException(self.READ_ERROR) from e
+        finally:
+            if not exhausted:
+                # stop the server from streaming the rest of the result
+                reader.cancel()
+
+    def _iter_endpoints_record_batches(
+        self, endpoints, timeout, batch_size=None, max_workers=None, ordered=True
+    ):
+        """Stream the record batches of all endpoints, fetched concurrently on a thread pool.
+
+        Every endpoint gets its own bounded queue if the order of the batches has to be kept,
+        otherwise the endpoints share a single queue and batches are yielded as they arrive.
+        The bounded queues keep the memory limited when the consumer is slower than the server.
+        """
+        queues = [
+            queue.Queue(maxsize=self.ENDPOINT_QUEUE_SIZE)
+            for _ in range(len(endpoints) if ordered else 1)
+        ]
+        readers = []
+        stop = threading.Event()
+
+        def put(endpoint_queue, item):
+            # give up once the consumer went away, so that the workers can terminate
+            while not stop.is_set():
+                try:
+                    endpoint_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch(index, endpoint):
+            endpoint_queue = queues[index if ordered else 0]
+            try:
+                if stop.is_set():
+                    return
+                reader = self._get_endpoint_reader(endpoint, timeout)
+                readers.append(reader)
+                if stop.is_set():
+                    # the consumer went away while the request was sent, and might have
+                    # cancelled the other readers before this one was added
+                    reader.cancel()
+                    return
+                for chunk in reader:
+                    if not put(endpoint_queue, chunk.data):
+                        return
+                put(endpoint_queue, _END_OF_STREAM)
+            except Exception as e:
+                put(endpoint_queue, e)
+
+        def drain():
+            for endpoint_queue in queues:
+                remaining = 1 if ordered else len(endpoints)
+                while remaining:
+                    item = endpoint_queue.get()
+                    if item is _END_OF_STREAM:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+
+        executor = ThreadPoolExecutor(
+            max_workers=self._get_max_workers(endpoints, max_workers)
+        )
+        exhausted = False
+        try:
+            for index, endpoint in enumerate(endpoints):
+                executor.submit(fetch, index, endpoint)
+            batches = drain()
+            if batch_size is not None:
+                batches = _rebatch(batches, batch_size)
+            yield from batches
+            exhausted = True
+        except Exception as e:
+            _logger.debug("Caught exception while streaming record batches: %s", str(e))
+            _logger.exception(e)
+            raise FeatureStoreException(self.READ_ERROR) from e
+        finally:
+            stop.set()
+            if not exhausted:
+                # stop the server from streaming the rest of the result
+                for reader in list(readers):
+                    reader.cancel()
+            executor.shutdown(wait=False)
+
+    # retry of the requests is handled in _get_endpoint_reader
+    @_handle_afs_exception(user_message=READ_ERROR)
+    def read_query_batches(self, query_object, arrow_flight_config, batch_size=None):
+        """Stream the result of the query as `pyarrow.RecordBatch`es.
+
+        The batches are yielded as they are received from the Feature Query Service, or of
+        `batch_size` rows each if provided, so that the result does not have to fit in memory.
+        If the result is split over multiple endpoints, they are fetched concurrently. The
+        batches are yielded in the order of the result unless `"ordered": False` is set in the
+        `arrow_flight_config`, in which case they are yielded as they arrive.
+        """
+        arrow_flight_config = arrow_flight_config or {}
+        timeout = arrow_flight_config.get("timeout", self.timeout)
+        query_encoded = json.dumps(query_object).encode("ascii")
+        descriptor = pyarrow.flight.FlightDescriptor.for_command(query_encoded)
+        endpoints = self._get_endpoints(descriptor)
+        if len(endpoints) == 1:
+            reader = self._get_endpoint_reader(endpoints[0], timeout)
+            return self._iter_record_batches(reader, batch_size)
+        return self._iter_endpoints_record_batches(
+            endpoints,
+            timeout,
+            batch_size,
+            max_workers=arrow_flight_config.get("max_workers"),
+            ordered=arrow_flight_config.get("ordered", True),
+        )
+
+    # retry is handled in _read_endpoint
     @_handle_afs_exception(user_message=READ_ERROR)
     def read_query(self, query_object, arrow_flight_config, dataframe_type):
         query_encoded = json.dumps(query_object).encode("ascii")
@@ -412,9 +587,12 @@ class ArrowFlightClient:
                 else self.timeout
             ),
             dataframe_type,
+            max_workers=(
+                arrow_flight_config.get("max_workers") if arrow_flight_config else None
+            ),
         )
 
-    # retry is handled in get_dataset
+    # retry is handled in _read_endpoint
     @_handle_afs_exception(user_message=READ_ERROR)
     def read_path(self, path, arrow_flight_config, dataframe_type):
         descriptor = pyarrow.flight.FlightDescriptor.for_path(path)
@@ -424,6 +602,9 @@ class ArrowFlightClient:
             if arrow_flight_config
             else self.timeout,
             dataframe_type=dataframe_type,
+            max_workers=arrow_flight_config.get("max_workers")
+            if arrow_flight_config
+            else None,
         )
 
     @_handle_afs_exception(user_message=WRITE_ERROR)
@@ -534,6 +715,26 @@ class ArrowFlightClient:
         return self._enabled_on_cluster
 
 
+def _rebatch(batches, batch_size):
+    """Regroup a stream of record batches into batches of `batch_size` rows, the last one may be smaller."""
+    pending = []
+    pending_rows = 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows < batch_size:
+            continue
+        table = pyarrow.Table.from_batches(pending)
+        offset = 0
+        while pending_rows - offset >= batch_size:
+            yield table.slice(offset, batch_size).combine_chunks().to_batches()[0]
+            offset += batch_size
+        pending = table.slice(offset).to_batches()
+        pending_rows -= offset
+    if pending_rows > 0:
+        yield pyarrow.Table.from_batches(pending).combine_chunks().to_batches()[0]
+
+
 def _serialize_featuregroup_connector(fg, query, on_demand_fg_aliases):
     connector = {}
     if isinstance(fg, feature_group.ExternalFeatureGroup):
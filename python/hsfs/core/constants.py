@@ -31,7 +31,17 @@ HAS_ARROW: bool = importlib.util.find_spec("pyarrow") is not None
 HAS_PANDAS: bool = importlib.util.find_spec("pandas") is not None
 HAS_NUMPY: bool = importlib.util.find_spec("numpy") is not None
 HAS_POLARS: bool = importlib.util.find_spec("polars") is not None
+HAS_ORJSON: bool = importlib.util.find_spec("orjson") is not None
 
 # SQL packages
 HAS_SQLALCHEMY: bool = importlib.util.find_spec("sqlalchemy") is not None
 HAS_AIOMYSQL: bool = importlib.util.find_spec("aiomysql") is not None
+
+# Async vector database client
+HAS_AIOHTTP: bool = importlib.util.find_spec("aiohttp") is not None
+aiohttp_not_installed_message = (
+    "aiohttp package not found. "
+    "The async client of the vector database requires aiohttp, "
+    "you can install it directly in your environment e.g `pip install aiohttp`. "
+    "You will need to restart your kernel if applicable."
+)
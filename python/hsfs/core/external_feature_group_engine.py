@@ -117,6 +117,7 @@ class ExternalFeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngin
         self._feature_group_api.update_metadata(
             feature_group, copy_feature_group, "updateMetadata"
         )
+        self._invalidate_query_caches(feature_group)
 
     def update_features(self, feature_group, updated_features):
         """Updates features safely."""
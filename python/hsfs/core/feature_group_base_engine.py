@@ -17,7 +17,13 @@ from __future__ import annotations
 
 from hsfs import util
 from hsfs.client.exceptions import FeatureStoreException
-from hsfs.core import feature_group_api, kafka_api, storage_connector_api, tags_api
+from hsfs.core import (
+    feature_group_api,
+    kafka_api,
+    query_constructor_api,
+    storage_connector_api,
+    tags_api,
+)
 
 
 class FeatureGroupBaseEngine:
@@ -32,6 +38,16 @@ class FeatureGroupBaseEngine:
 
     def delete(self, feature_group):
         self._feature_group_api.delete(feature_group)
+        self._invalidate_query_caches(feature_group)
+
+    def _invalidate_query_caches(self, feature_group):
+        # constructed queries and online connectors are cached across queries, see Query._prep_read
+        query_constructor_api.QueryConstructorApi.invalidate_feature_group(
+            feature_group
+        )
+        storage_connector_api.StorageConnectorApi.invalidate_online_connector(
+            self._feature_store_id
+        )
 
     def add_tag(self, feature_group, name, value):
         """Attach a name/value tag to a feature group."""
@@ -196,6 +196,7 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
 
     def delete(self, feature_group):
         self._feature_group_api.delete(feature_group)
+        self._invalidate_query_caches(feature_group)
 
     def commit_details(self, feature_group, wallclock_time, limit):
         if (
@@ -265,6 +266,9 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
         self._feature_group_api.update_metadata(
             feature_group, copy_feature_group, "updateMetadata"
         )
+        # the avro schema changed, fetch the new subject on next access
+        feature_group._subject = None
+        self._invalidate_query_caches(feature_group)
 
     def update_features(self, feature_group, updated_features):
         """Updates features safely."""
@@ -0,0 +1,151 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+_logger = logging.getLogger(__name__)
+
+
+class FeatureVectorCache:
+    """Client-side read-through cache for feature values fetched from the online feature store.
+
+    Entries expire `ttl` seconds after they were stored and the least recently used entry
+    is evicted once the cache holds `max_entries` entries.
+    """
+
+    TTL_KEY = "ttl"
+    MAX_ENTRIES_KEY = "max_entries"
+    DEFAULT_TTL = 60
+    DEFAULT_MAX_ENTRIES = 10000
+
+    def __init__(
+        self,
+        ttl: Optional[float] = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Feature vector cache `ttl` must be a positive number.")
+        if max_entries <= 0:
+            raise ValueError(
+                "Feature vector cache `max_entries` must be a positive integer."
+            )
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Tuple[float, Dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> FeatureVectorCache:
+        unknown_keys = set(config.keys()) - {cls.TTL_KEY, cls.MAX_ENTRIES_KEY}
+        if unknown_keys:
+            raise ValueError(
+                f"Unknown feature vector cache configuration options: {sorted(unknown_keys)}. "
+                f"Supported options are '{cls.TTL_KEY}' and '{cls.MAX_ENTRIES_KEY}'."
+            )
+        return cls(
+            ttl=config.get(cls.TTL_KEY, cls.DEFAULT_TTL),
+            max_entries=config.get(cls.MAX_ENTRIES_KEY, cls.DEFAULT_MAX_ENTRIES),
+        )
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return the cached feature values for `key` or None if missing or expired."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and (
+                self._ttl is None or time.monotonic() - cached[0] < self._ttl
+            ):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached[1]
+            if cached is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def get_all(self, keys: List[Hashable]) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached feature values for all `keys` or None if any of them is missing or expired.
+
+        The lookup counts as a single hit or miss, as the values are only served if all keys are cached.
+        """
+        with self._lock:
+            now = time.monotonic()
+            values = []
+            for key in keys:
+                cached = self._entries.get(key)
+                if cached is not None and (
+                    self._ttl is None or now - cached[0] < self._ttl
+                ):
+                    values.append(cached[1])
+                    continue
+                if cached is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            for key in keys:
+                self._entries.move_to_end(key)
+            self._hits += 1
+            return values
+
+    def put(self, key: Hashable, values: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        _logger.debug("Clearing feature vector cache.")
+        with self._lock:
+            self._entries.clear()
+
+    def reset_statistics(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -37,6 +37,7 @@ from hsfs.core import (
     query_constructor_api,
     statistics_engine,
     tags_api,
+    training_dataset_cache,
     training_dataset_engine,
 )
 from hsfs.core.feature_logging import FeatureLogging
@@ -48,6 +49,7 @@ class FeatureViewEngine:
     _TRAINING_DATA_API_PATH = "trainingdatasets"
     _OVERWRITE = "overwrite"
     _APPEND = "append"
+    TRAINING_DATASET_CACHE_KEY = "training_dataset_cache"
 
     _LOG_TD_VERSION = "td_version"
     _LOG_TIME = "log_time"
@@ -332,6 +334,14 @@ class FeatureViewEngine:
                 f"Incorrect `get` method is used. Use `feature_view.{method_name}` instead."
             )
 
+        td_cache = None
+        if read_options and self.TRAINING_DATASET_CACHE_KEY in read_options:
+            # the cache is not an option of the execution engine
+            read_options = dict(read_options)
+            td_cache = self._get_training_dataset_cache(
+                read_options.pop(self.TRAINING_DATASET_CACHE_KEY)
+            )
+
         read_options = engine.get_instance().read_options(
             td_updated.data_format, read_options
         )
@@ -362,6 +372,8 @@ class FeatureViewEngine:
                 dataframe_type="default"
                 if dataframe_type.lower() in ["numpy", "python"]
                 else dataframe_type,  # forcing dataframe type to default here since dataframe operations are required for training data split.
+                feature_view_obj=feature_view_obj,
+                training_dataset_cache=td_cache,
             )
         else:
             self._check_feature_group_accessibility(feature_view_obj)
@@ -408,6 +420,15 @@ class FeatureViewEngine:
             )
             return td_updated, split_df
 
+    def _get_training_dataset_cache(self, cache_config):
+        if engine.get_type() != "python":
+            warnings.warn(
+                "The training dataset cache is only supported by the python engine, ignoring it.",
+                stacklevel=1,
+            )
+            return None
+        return training_dataset_cache.TrainingDatasetCache.from_config(cache_config)
+
     def _set_event_time(self, feature_view_obj, training_dataset_obj):
         event_time = feature_view_obj.query._left_feature_group.event_time
         if event_time:
@@ -463,6 +484,10 @@ class FeatureViewEngine:
             training_dataset_obj=training_dataset_obj,
             spine=spine,
         )
+        # the recreated data keeps the metadata of the training dataset version
+        training_dataset_cache.TrainingDatasetCache.invalidate(
+            feature_view_obj, training_dataset_obj.version
+        )
         return training_dataset_obj, td_job
 
     def _read_from_storage_connector(
@@ -478,6 +503,8 @@ class FeatureViewEngine:
         training_helper_columns,
         feature_view_features,
         dataframe_type,
+        feature_view_obj=None,
+        training_dataset_cache=None,
     ):
         if splits:
             result = {}
@@ -495,6 +522,9 @@ class FeatureViewEngine:
                     training_helper_columns,
                     feature_view_features,
                     dataframe_type,
+                    feature_view_obj=feature_view_obj,
+                    training_dataset_cache=training_dataset_cache,
+                    split_name=split.name,
                 )
             return result
         else:
@@ -511,6 +541,9 @@ class FeatureViewEngine:
                 training_helper_columns,
                 feature_view_features,
                 dataframe_type,
+                feature_view_obj=feature_view_obj,
+                training_dataset_cache=training_dataset_cache,
+                split_name=training_data_obj.name,
             )
 
     def _cast_columns(self, data_format, df, schema):
@@ -534,16 +567,37 @@ class FeatureViewEngine:
         training_helper_columns,
         feature_view_features,
         dataframe_type,
+        feature_view_obj=None,
+        training_dataset_cache=None,
+        split_name=None,
     ):
         try:
-            df = training_data_obj.storage_connector.read(
-                # always read from materialized dataset, not query object
-                query=None,
-                data_format=training_data_obj.data_format,
-                options=read_options,
-                path=path,
-                dataframe_type=dataframe_type,
-            )
+            df = None
+            if training_dataset_cache is not None:
+                df = training_dataset_cache.get(
+                    feature_view_obj,
+                    training_data_obj,
+                    split_name,
+                    dataframe_type,
+                    columns=read_options.get("columns"),
+                )
+            if df is None:
+                df = training_data_obj.storage_connector.read(
+                    # always read from materialized dataset, not query object
+                    query=None,
+                    data_format=training_data_obj.data_format,
+                    options=read_options,
+                    path=path,
+                    dataframe_type=dataframe_type,
+                )
+                if training_dataset_cache is not None:
+                    training_dataset_cache.put(
+                        feature_view_obj,
+                        training_data_obj,
+                        split_name,
+                        df,
+                        columns=read_options.get("columns"),
+                    )
 
             df = self._drop_helper_columns(
                 df,
@@ -734,6 +788,9 @@ class FeatureViewEngine:
         return td
 
     def delete_training_data(self, feature_view_obj, training_data_version=None):
+        training_dataset_cache.TrainingDatasetCache.invalidate(
+            feature_view_obj, training_data_version
+        )
         if training_data_version:
             self._feature_view_api.delete_training_data_version(
                 feature_view_obj.name, feature_view_obj.version, training_data_version
@@ -746,6 +803,9 @@ class FeatureViewEngine:
     def delete_training_dataset_only(
         self, feature_view_obj, training_data_version=None
     ):
+        training_dataset_cache.TrainingDatasetCache.invalidate(
+            feature_view_obj, training_data_version
+        )
         if training_data_version:
             self._feature_view_api.delete_training_dataset_only_version(
                 feature_view_obj.name, feature_view_obj.version, training_data_version
@@ -797,6 +857,62 @@ class FeatureViewEngine:
         else:
             return feature_dataframe
 
+    def get_batch_data_iter(
+        self,
+        feature_view_obj,
+        start_time,
+        end_time,
+        training_dataset_version,
+        transformation_functions,
+        batch_size=None,
+        read_options=None,
+        primary_keys=False,
+        event_time=False,
+        inference_helper_columns=False,
+        dataframe_type="default",
+        transformed=True,
+    ):
+        self._check_feature_group_accessibility(feature_view_obj)
+
+        # check if primary_keys/event_time are ambiguous
+        if primary_keys:
+            self._get_primary_keys_from_query(feature_view_obj.query)
+        if event_time:
+            self._get_eventtimes_from_query(feature_view_obj.query)
+
+        transform = bool(transformation_functions and transformed)
+        if transform and dataframe_type.lower() == "pyarrow":
+            raise FeatureStoreException(
+                "Transformation functions can not be applied to `pyarrow` record batches. "
+                "Use another `dataframe_type` or set `transformed=False`."
+            )
+
+        batches = self.get_batch_query(
+            feature_view_obj,
+            start_time,
+            end_time,
+            with_label=False,
+            primary_keys=primary_keys,
+            event_time=event_time,
+            inference_helper_columns=inference_helper_columns or transformed,
+            training_helper_columns=False,
+            training_dataset_version=training_dataset_version,
+        ).read_batches(
+            batch_size=batch_size,
+            read_options=read_options,
+            dataframe_type=dataframe_type,
+        )
+        if transform:
+            # transformations are applied per batch as they are streamed
+            return (
+                engine.get_instance()._apply_transformation_function(
+                    transformation_functions, dataset=batch
+                )
+                for batch in batches
+            )
+        else:
+            return batches
+
     def add_tag(
         self, feature_view_obj, name: str, value, training_dataset_version=None
     ):
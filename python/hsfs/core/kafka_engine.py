@@ -16,8 +16,22 @@
 from __future__ import annotations
 
 import json
+import queue
+import threading
+import zlib
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from hsfs import client
 from hsfs.client import hopsworks
@@ -86,17 +100,10 @@ def _init_kafka_resources(
 ) -> Tuple[
     Producer, Dict[str, bytes], Dict[str, Callable[..., bytes]], Callable[..., bytes] :
 ]:
-    # setup kafka producer
-    producer = init_kafka_producer(
-        feature_group.feature_store_id, offline_write_options
-    )
-    # setup complex feature writers
-    feature_writers = {
-        feature: get_encoder_func(feature_group._get_feature_avro_schema(feature))
-        for feature in feature_group.get_complex_features()
-    }
-    # setup row writer function
-    writer = get_encoder_func(feature_group._get_encoded_avro_schema())
+    # setup kafka producer, reused across inserts into the same feature group
+    producer = _kafka_resources_cache.get_producer(feature_group, offline_write_options)
+    # setup complex feature writers and row writer function
+    feature_writers, writer = _kafka_resources_cache.get_encoders(feature_group)
 
     # custom headers for hopsworks onlineFS
     headers = {
@@ -107,6 +114,122 @@ def _init_kafka_resources(
     return producer, headers, feature_writers, writer
 
 
+class KafkaResourcesCache:
+    """Cache of Kafka producers and avro encoders per feature group.
+
+    Producers are recreated if the Kafka options of the write options change, encoders if the
+    avro schema of the feature group changes.
+    """
+
+    PRODUCER_OPTIONS = ["kafka_producer_config", "internal_kafka"]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._producers: Dict[Tuple[int, int], Tuple[str, Producer]] = {}
+        self._encoders: Dict[
+            Tuple[int, int],
+            Tuple[str, Dict[str, Callable[..., bytes]], Callable[..., bytes]],
+        ] = {}
+        self._producer_reuses = 0
+        self._encoder_reuses = 0
+
+    def get_producer(
+        self,
+        feature_group: Union[FeatureGroup, ExternalFeatureGroup],
+        offline_write_options: Dict[str, Any],
+    ) -> Producer:
+        cache_key = (feature_group.feature_store_id, feature_group._id)
+        producer_options = json.dumps(
+            {
+                option: offline_write_options.get(option)
+                for option in self.PRODUCER_OPTIONS
+            },
+            sort_keys=True,
+            default=str,
+        )
+        with self._lock:
+            cached = self._producers.get(cache_key)
+            if cached is not None and cached[0] == producer_options:
+                self._producer_reuses += 1
+                return cached[1]
+            if cached is not None:
+                # kafka options changed, deliver what is left before replacing the producer
+                cached[1].flush()
+            producer = init_kafka_producer(
+                feature_group.feature_store_id, offline_write_options
+            )
+            self._producers[cache_key] = (producer_options, producer)
+            return producer
+
+    def get_encoders(
+        self, feature_group: Union[FeatureGroup, ExternalFeatureGroup]
+    ) -> Tuple[Dict[str, Callable[..., bytes]], Callable[..., bytes]]:
+        cache_key = (feature_group.feature_store_id, feature_group._id)
+        avro_schema = feature_group.avro_schema
+        with self._lock:
+            cached = self._encoders.get(cache_key)
+            if cached is not None and cached[0] == avro_schema:
+                self._encoder_reuses += 1
+                return cached[1], cached[2]
+        feature_writers = {
+            feature: get_encoder_func(feature_group._get_feature_avro_schema(feature))
+            for feature in feature_group.get_complex_features()
+        }
+        writer = get_encoder_func(feature_group._get_encoded_avro_schema())
+        with self._lock:
+            self._encoders[cache_key] = (avro_schema, feature_writers, writer)
+        return feature_writers, writer
+
+    def close(
+        self,
+        feature_group: Optional[Union[FeatureGroup, ExternalFeatureGroup]] = None,
+    ) -> None:
+        """Flush and drop the cached producers and encoders of a feature group.
+
+        If no feature group is given, all cached resources are dropped and the reuse counters reset.
+        """
+        with self._lock:
+            if feature_group is None:
+                cache_keys = set(self._producers.keys()) | set(self._encoders.keys())
+                self._producer_reuses = 0
+                self._encoder_reuses = 0
+            else:
+                cache_keys = {(feature_group.feature_store_id, feature_group._id)}
+            producers = [
+                self._producers.pop(cache_key)[1]
+                for cache_key in cache_keys
+                if cache_key in self._producers
+            ]
+            for cache_key in cache_keys:
+                self._encoders.pop(cache_key, None)
+        for producer in producers:
+            producer.flush()
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "producers": len(self._producers),
+                "producer_reuses": self._producer_reuses,
+                "encoders": len(self._encoders),
+                "encoder_reuses": self._encoder_reuses,
+            }
+
+
+_kafka_resources_cache = KafkaResourcesCache()
+
+
+def close_kafka_resources(
+    feature_group: Optional[Union[FeatureGroup, ExternalFeatureGroup]] = None,
+) -> None:
+    _kafka_resources_cache.close(feature_group)
+
+
+def get_kafka_resources_statistics() -> Dict[str, int]:
+    """Number of cached producers and encoders and how many times they were reused."""
+    return _kafka_resources_cache.statistics
+
+
 def init_kafka_producer(
     feature_store_id: int,
     offline_write_options: Dict[str, Any],
@@ -171,6 +294,77 @@ def kafka_produce(
             producer.poll(1)
 
 
+def kafka_produce_parallel(
+    producers: List[Producer],
+    record_batches: Iterable[List[Tuple[str, bytes]]],
+    topic_name: str,
+    headers: Dict[str, bytes],
+    acked: callable,
+    debug_kafka: bool = False,
+    max_queued_batches: int = 4,
+) -> None:
+    """Produce batches of (key, encoded row) records with one thread per producer.
+
+    Records are assigned to producers by the hash of their key, so that all records of a key are
+    produced by the same producer in the order of the batches, which keeps the per-key ordering.
+    """
+    errors = []
+    batch_queues = [queue.Queue(maxsize=max_queued_batches) for _ in producers]
+
+    def produce_batches(producer: Producer, batch_queue: queue.Queue) -> None:
+        while True:
+            batch = batch_queue.get()
+            if batch is None:
+                break
+            # keep draining the queue after a failure so that the feeding thread does not block
+            if errors:
+                continue
+            try:
+                for key, encoded_row in batch:
+                    kafka_produce(
+                        producer=producer,
+                        key=key,
+                        encoded_row=encoded_row,
+                        topic_name=topic_name,
+                        headers=headers,
+                        acked=acked,
+                        debug_kafka=debug_kafka,
+                    )
+            except Exception as e:
+                errors.append(e)
+
+    threads = [
+        threading.Thread(
+            target=produce_batches,
+            args=(producer, batch_queue),
+            name=f"hsfs_kafka_producer_{i}",
+            daemon=True,
+        )
+        for i, (producer, batch_queue) in enumerate(zip(producers, batch_queues))
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for batch in record_batches:
+            if errors:
+                break
+            producer_batches = [[] for _ in producers]
+            for record in batch:
+                producer_batches[
+                    zlib.crc32(record[0].encode("utf8")) % len(producers)
+                ].append(record)
+            for batch_queue, producer_batch in zip(batch_queues, producer_batches):
+                if producer_batch:
+                    batch_queue.put(producer_batch)
+    finally:
+        for batch_queue in batch_queues:
+            batch_queue.put(None)
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+
 def encode_complex_features(
     feature_writers: Dict[str, callable], row: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -181,6 +375,17 @@ def encode_complex_features(
     return row
 
 
+def encode_records(writer: Callable[..., None], records: List[Any]) -> List[bytes]:
+    """Encode records into a single shared buffer and split it into one bytes object per record."""
+    offsets = [0]
+    with BytesIO() as outf:
+        for record in records:
+            writer(record, outf)
+            offsets.append(outf.tell())
+        encoded = outf.getvalue()
+    return [encoded[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
 def get_encoder_func(writer_schema: str) -> callable:
     if HAS_FAST_AVRO:
         schema = json.loads(writer_schema)
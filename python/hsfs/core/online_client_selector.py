@@ -0,0 +1,145 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from __future__ import annotations
+
+import logging
+import statistics
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple
+
+
+_logger = logging.getLogger(__name__)
+
+
+class OnlineClientSelector:
+    """Routes online feature vector lookups to the client with the lower observed latency.
+
+    Latencies are recorded per client and per batch size bucket, the buckets being powers of two.
+    Each bucket sticks to its selected client until the median latency of the other client is lower
+    by more than the `hysteresis` ratio. Every `exploration_interval` lookups of a bucket one lookup is
+    routed to the other client, so that its latencies stay up to date as the load changes.
+    """
+
+    DEFAULT_WINDOW_SIZE = 100
+    DEFAULT_MIN_SAMPLES = 5
+    DEFAULT_HYSTERESIS = 0.2
+    DEFAULT_EXPLORATION_INTERVAL = 50
+
+    def __init__(
+        self,
+        clients: List[str],
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        hysteresis: float = DEFAULT_HYSTERESIS,
+        exploration_interval: int = DEFAULT_EXPLORATION_INTERVAL,
+    ):
+        if len(clients) < 2:
+            raise ValueError(
+                "Automatic client selection requires at least two clients."
+            )
+        if min_samples > window_size:
+            raise ValueError("`min_samples` must not be larger than `window_size`.")
+        self._clients = clients
+        self._window_size = window_size
+        self._min_samples = min_samples
+        self._hysteresis = hysteresis
+        self._exploration_interval = exploration_interval
+        self._latencies: Dict[Tuple[int, str], Deque[float]] = {}
+        self._selected: Dict[int, str] = {}
+        self._calls: Dict[int, int] = {}
+        self._switches = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def batch_size_bucket(batch_size: int) -> int:
+        """Upper bound of the power of two bucket of the batch size, e.g. 5 to 8 fall into bucket 8."""
+        return 1 << max(batch_size - 1, 0).bit_length()
+
+    def select(self, batch_size: int) -> str:
+        """Return the client to fetch a batch of `batch_size` entries with."""
+        bucket = self.batch_size_bucket(batch_size)
+        with self._lock:
+            # first collect enough samples of every client
+            for client in self._clients:
+                if len(self._latencies.get((bucket, client), ())) < self._min_samples:
+                    return client
+
+            selected = self._selected.get(bucket)
+            medians = {
+                client: statistics.median(self._latencies[(bucket, client)])
+                for client in self._clients
+            }
+            fastest = min(medians, key=medians.get)
+            if selected is None:
+                selected = fastest
+            elif fastest != selected and medians[fastest] < medians[selected] * (
+                1 - self._hysteresis
+            ):
+                _logger.debug(
+                    "Switching online client for batch size bucket %d from %s to %s.",
+                    bucket,
+                    selected,
+                    fastest,
+                )
+                selected = fastest
+                self._switches += 1
+            self._selected[bucket] = selected
+
+            self._calls[bucket] = self._calls.get(bucket, 0) + 1
+            if self._calls[bucket] % self._exploration_interval == 0:
+                return next(client for client in self._clients if client != selected)
+            return selected
+
+    def record(self, client: str, batch_size: int, latency: float) -> None:
+        """Record the latency in seconds of a lookup of `batch_size` entries."""
+        bucket = self.batch_size_bucket(batch_size)
+        with self._lock:
+            latencies = self._latencies.get((bucket, client))
+            if latencies is None:
+                latencies = deque(maxlen=self._window_size)
+                self._latencies[(bucket, client)] = latencies
+            latencies.append(latency)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latencies.clear()
+            self._selected.clear()
+            self._calls.clear()
+            self._switches = 0
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Recent latencies in milliseconds and the selected client per batch size bucket."""
+        with self._lock:
+            buckets = {}
+            for (bucket, client), latencies in sorted(self._latencies.items()):
+                sorted_latencies = sorted(latencies)
+                bucket_statistics = buckets.setdefault(
+                    bucket, {"selected_client": self._selected.get(bucket)}
+                )
+                bucket_statistics[client] = {
+                    "count": len(sorted_latencies),
+                    "p50_ms": statistics.median(sorted_latencies) * 1000,
+                    "p95_ms": sorted_latencies[
+                        min(
+                            int(0.95 * len(sorted_latencies)),
+                            len(sorted_latencies) - 1,
+                        )
+                    ]
+                    * 1000,
+                }
+            return {"switches": self._switches, "batch_size_buckets": buckets}
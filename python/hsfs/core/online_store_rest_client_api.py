@@ -13,20 +13,26 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import asyncio
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Union
 
+import requests
 from hsfs import util
 from hsfs.client import exceptions, online_store_rest_client
-from hsfs.core.constants import HAS_NUMPY
+from hsfs.core.constants import HAS_NUMPY, HAS_ORJSON
 from requests import Response
 
 
 if HAS_NUMPY:
     import numpy as np
 
+if HAS_ORJSON:
+    import orjson
+
 _logger = logging.getLogger(__name__)
 
 if HAS_NUMPY:
@@ -35,7 +41,7 @@ if HAS_NUMPY:
         def default(self, obj):
             dtypes = (np.datetime64, np.complexfloating)
             if isinstance(obj, (datetime, date)):
-                return util.dateconvert_event_time_to_timestamp(obj)
+                return util.convert_event_time_to_timestamp(obj)
             elif isinstance(obj, dtypes):
                 return str(obj)
             elif isinstance(obj, np.integer):
@@ -93,20 +99,23 @@ class OnlineStoreRestClientApi:
                 - 500: Internal server error.
         """
         _logger.debug(
-            f"Sending request to RonDB Rest Server with payload: {json.dumps(payload, indent=2, cls=util.NpDatetimeEncoder)}"
+            f"Sending request to RonDB Rest Server with payload: {json.dumps(payload, indent=2, cls=NpDatetimeEncoder)}"
         )
         return self.handle_rdrs_feature_store_response(
             online_store_rest_client.get_instance().send_request(
                 method="POST",
                 path_params=[self.SINGLE_VECTOR_ENDPOINT],
                 headers={"Content-Type": "application/json"},
-                data=json.dumps(payload, cls=util.NpDatetimeEncoder),
+                data=json.dumps(payload, cls=NpDatetimeEncoder),
             ),
         )
 
     def get_batch_raw_feature_vectors(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Get a list of feature vectors from the feature store.
 
+        Payloads with more entries than the `batch_size` of the client configuration are split into
+        chunks, which are sent concurrently and whose responses are merged in order.
+
         Check the RonDB Rest Server documentation for more details:
         https://docs.hopsworks.ai/latest/user_guides/fs/feature_view/feature-server
 
@@ -136,18 +145,187 @@ class OnlineStoreRestClientApi:
                     or authorization header (x-api-key) is not properly set.
                 - 500: Internal server error.
         """
+        rest_client = online_store_rest_client.get_instance()
+        chunk_payloads = self._split_batch_payload(
+            payload,
+            rest_client.current_config[rest_client.BATCH_SIZE],
+        )
+        if len(chunk_payloads) == 1:
+            return self._send_batch_request(payload)
+
+        _logger.debug(
+            "Sending batch request with %d entries in %d chunks.",
+            len(payload["entries"]),
+            len(chunk_payloads),
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(
+                len(chunk_payloads),
+                rest_client.current_config[rest_client.MAX_CONCURRENT_REQUESTS],
+            )
+        ) as executor:
+            chunk_responses = list(executor.map(self._send_batch_chunk, chunk_payloads))
+        return self._merge_batch_responses(chunk_payloads, chunk_responses)
+
+    def _send_batch_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         _logger.debug(
-            f"Sending request to RonDB Rest Server with payload: {json.dumps(payload, indent=2, cls=util.NpDatetimeEncoder)}"
+            f"Sending request to RonDB Rest Server with payload: {json.dumps(payload, indent=2, cls=NpDatetimeEncoder)}"
         )
         return self.handle_rdrs_feature_store_response(
             online_store_rest_client.get_instance().send_request(
                 method="POST",
                 path_params=[self.BATCH_VECTOR_ENDPOINT],
                 headers={"Content-Type": "application/json"},
-                data=json.dumps(payload, cls=util.NpDatetimeEncoder),
+                data=json.dumps(payload, cls=NpDatetimeEncoder),
+            ),
+        )
+
+    def _send_batch_chunk(
+        self, payload: Dict[str, Any]
+    ) -> Union[Dict[str, Any], Exception]:
+        try:
+            return self._send_batch_request(payload)
+        except (exceptions.RestAPIError, requests.exceptions.RequestException) as e:
+            return e
+
+    async def get_single_raw_feature_vector_async(
+        self, payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Get a single feature vector from the feature store without blocking the running event loop.
+
+        See `get_single_raw_feature_vector` for details on the payload and response.
+        """
+        return self.handle_rdrs_feature_store_response(
+            await online_store_rest_client.get_instance().send_request_async(
+                method="POST",
+                path_params=[self.SINGLE_VECTOR_ENDPOINT],
+                headers={"Content-Type": "application/json"},
+                data=json.dumps(payload, cls=NpDatetimeEncoder),
+            ),
+        )
+
+    async def get_batch_raw_feature_vectors_async(
+        self, payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Get a list of feature vectors from the feature store without blocking the running event loop.
+
+        See `get_batch_raw_feature_vectors` for details on the payload and response.
+        """
+        rest_client = online_store_rest_client.get_instance()
+        chunk_payloads = self._split_batch_payload(
+            payload,
+            rest_client.current_config[rest_client.BATCH_SIZE],
+        )
+        if len(chunk_payloads) == 1:
+            return await self._send_batch_request_async(payload)
+
+        semaphore = asyncio.Semaphore(
+            rest_client.current_config[rest_client.MAX_CONCURRENT_REQUESTS]
+        )
+
+        async def send_batch_chunk(
+            chunk_payload: Dict[str, Any],
+        ) -> Union[Dict[str, Any], Exception]:
+            async with semaphore:
+                try:
+                    return await self._send_batch_request_async(chunk_payload)
+                except (
+                    exceptions.RestAPIError,
+                    requests.exceptions.RequestException,
+                ) as e:
+                    return e
+
+        chunk_responses = await asyncio.gather(
+            *[send_batch_chunk(chunk_payload) for chunk_payload in chunk_payloads]
+        )
+        return self._merge_batch_responses(chunk_payloads, chunk_responses)
+
+    async def _send_batch_request_async(
+        self, payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return self.handle_rdrs_feature_store_response(
+            await online_store_rest_client.get_instance().send_request_async(
+                method="POST",
+                path_params=[self.BATCH_VECTOR_ENDPOINT],
+                headers={"Content-Type": "application/json"},
+                data=json.dumps(payload, cls=NpDatetimeEncoder),
             ),
         )
 
+    @staticmethod
+    def _split_batch_payload(
+        payload: Dict[str, Any], batch_size: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Split a batch payload into payloads of at most `batch_size` entries."""
+        entries = payload["entries"]
+        if not batch_size or len(entries) <= batch_size:
+            return [payload]
+        passed_features = payload.get("passedFeatures") or []
+        return [
+            {
+                **payload,
+                "entries": entries[offset : offset + batch_size],
+                "passedFeatures": passed_features[offset : offset + batch_size],
+            }
+            for offset in range(0, len(entries), batch_size)
+        ]
+
+    @staticmethod
+    def _merge_batch_responses(
+        chunk_payloads: List[Dict[str, Any]],
+        chunk_responses: List[Union[Dict[str, Any], Exception]],
+    ) -> Dict[str, Any]:
+        """Merge the responses to the chunks of a batch request in order.
+
+        Entries of a chunk whose request failed with a server or connection error are returned with
+        status `ERROR` and the error in their detailed status, unless all chunks failed. Client errors,
+        e.g. authorization or metadata errors, affect all chunks alike and are raised.
+        """
+        errors = [
+            response for response in chunk_responses if isinstance(response, Exception)
+        ]
+        for error in errors:
+            if (
+                isinstance(error, exceptions.RestAPIError)
+                and error.response.status_code < 500
+            ) or len(errors) == len(chunk_responses):
+                raise error
+
+        merged_response = {"features": [], "status": [], "metadata": None}
+        detailed_status = []
+        include_detailed_status = False
+        for chunk_payload, response in zip(chunk_payloads, chunk_responses):
+            n_entries = len(chunk_payload["entries"])
+            if isinstance(response, Exception):
+                _logger.warning(
+                    f"Failed to retrieve {n_entries} feature vectors of a batch request: {response}"
+                )
+                http_status = getattr(
+                    getattr(response, "response", None), "status_code", None
+                )
+                merged_response["features"].extend([None] * n_entries)
+                merged_response["status"].extend(["ERROR"] * n_entries)
+                detailed_status.extend(
+                    [
+                        [{"httpStatus": http_status or 500, "message": str(response)}]
+                        for _ in range(n_entries)
+                    ]
+                )
+                include_detailed_status = True
+                continue
+            merged_response["features"].extend(response["features"])
+            merged_response["status"].extend(response.get("status") or [])
+            if merged_response["metadata"] is None:
+                merged_response["metadata"] = response.get("metadata")
+            if response.get("detailedStatus") is not None:
+                detailed_status.extend(response["detailedStatus"])
+                include_detailed_status = True
+            else:
+                detailed_status.extend([None] * n_entries)
+        if include_detailed_status:
+            merged_response["detailedStatus"] = detailed_status
+        return merged_response
+
     def ping_rondb_rest_server(self) -> int:
         """Ping the RonDB Rest Server to check if it is alive."""
         _logger.debug("Pinging RonDB Rest Server")
@@ -177,8 +355,13 @@ class OnlineStoreRestClientApi:
             _logger.debug(
                 "Received response from RonDB Rest Server with status code 200"
             )
-            _logger.debug(f"Response: {json.dumps(response.json(), indent=2)}")
-            return response.json()
+            # orjson decodes large batch responses considerably faster than the json module
+            response_json = (
+                orjson.loads(response.content) if HAS_ORJSON else response.json()
+            )
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(f"Response: {json.dumps(response_json, indent=2)}")
+            return response_json
         else:
             _logger.error(
                 f"Received response from RonDB Rest Server with status code {response.status_code}"
@@ -17,11 +17,16 @@ from __future__ import annotations
 
 import itertools
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from hsfs import training_dataset_feature as td_feature_mod
 from hsfs import util
-from hsfs.core import online_store_rest_client_api
+from hsfs.core import online_store_rest_client_api, serving_latency
+from hsfs.core.constants import HAS_ARROW
+
+
+if HAS_ARROW:
+    import pyarrow as pa
 
 
 _logger = logging.getLogger(__name__)
@@ -31,6 +36,8 @@ class OnlineStoreRestClientEngine:
     RETURN_TYPE_FEATURE_VALUE_DICT = "feature_value_dict"
     RETURN_TYPE_FEATURE_VALUE_LIST = "feature_value_list"
     RETURN_TYPE_RESPONSE_JSON = "response_json"  # as a python dict
+    RETURN_TYPE_FEATURE_VALUE_COLUMNS = "feature_value_columns"
+    RETURN_TYPE_ARROW_TABLE = "arrow_table"
     MISSING_STATUS = "MISSING"
 
     def __init__(
@@ -81,6 +88,17 @@ class OnlineStoreRestClientEngine:
         _logger.debug(
             f"Mapping fg_id to feature names: {self._feature_names_per_fg_id}."
         )
+        # positions and names of the feature values in a response row, with and without inference helpers
+        self._feature_value_positions: Dict[bool, List[Tuple[int, str]]] = {
+            inference_helpers_only: [
+                (position, name)
+                for position, (name, is_helper) in enumerate(
+                    zip(self._ordered_feature_names, self._is_inference_helpers_list)
+                )
+                if is_helper is inference_helpers_only
+            ]
+            for inference_helpers_only in [False, True]
+        }
 
     def build_base_payload(
         self,
@@ -171,6 +189,68 @@ class OnlineStoreRestClientEngine:
         _logger.debug(
             f"Getting single raw feature vector for Feature View {self._feature_view_name}, version: {self._feature_view_version} in Feature Store {self._feature_store_name}."
         )
+        payload = self._build_single_payload(
+            entry=entry,
+            passed_features=passed_features,
+            metadata_options=metadata_options,
+            drop_missing=drop_missing,
+        )
+        with serving_latency.measure_stage(serving_latency.REST_REQUEST):
+            response = self._online_store_rest_client_api.get_single_raw_feature_vector(
+                payload=payload
+            )
+        with serving_latency.measure_stage(serving_latency.REST_DECODE):
+            return self._convert_single_response(
+                response,
+                drop_missing=drop_missing,
+                inference_helpers_only=inference_helpers_only,
+                return_type=return_type,
+            )
+
+    async def get_single_feature_vector_async(
+        self,
+        entry: Dict[str, Any],
+        passed_features: Optional[Dict[str, Any]] = None,
+        metadata_options: Optional[Dict[str, bool]] = None,
+        drop_missing: bool = False,
+        inference_helpers_only: bool = False,
+        return_type: str = RETURN_TYPE_FEATURE_VALUE_DICT,
+    ) -> Union[
+        Tuple[Union[List[Any], Dict[str, Any]], Optional[List[Dict[str, Any]]]],
+        Dict[str, Any],
+    ]:
+        """Get a single feature vector from the online feature store without blocking the running event loop.
+
+        See `get_single_feature_vector` for details on the arguments and return value.
+        """
+        _logger.debug(
+            f"Getting single raw feature vector asynchronously for Feature View {self._feature_view_name}, version: {self._feature_view_version} in Feature Store {self._feature_store_name}."
+        )
+        payload = self._build_single_payload(
+            entry=entry,
+            passed_features=passed_features,
+            metadata_options=metadata_options,
+            drop_missing=drop_missing,
+        )
+        with serving_latency.measure_stage(serving_latency.REST_REQUEST):
+            response = await self._online_store_rest_client_api.get_single_raw_feature_vector_async(
+                payload=payload
+            )
+        with serving_latency.measure_stage(serving_latency.REST_DECODE):
+            return self._convert_single_response(
+                response,
+                drop_missing=drop_missing,
+                inference_helpers_only=inference_helpers_only,
+                return_type=return_type,
+            )
+
+    def _build_single_payload(
+        self,
+        entry: Dict[str, Any],
+        passed_features: Optional[Dict[str, Any]],
+        metadata_options: Optional[Dict[str, bool]],
+        drop_missing: bool,
+    ) -> Dict[str, Any]:
         _logger.debug(f"entry: {entry}, passed features: {passed_features}")
         payload = self.build_base_payload(
             metadata_options=metadata_options,
@@ -181,11 +261,15 @@ class OnlineStoreRestClientEngine:
         )
         payload["entries"] = entry
         payload["passedFeatures"] = passed_features
+        return payload
 
-        response = self._online_store_rest_client_api.get_single_raw_feature_vector(
-            payload=payload
-        )
-
+    def _convert_single_response(
+        self,
+        response: Dict[str, Any],
+        drop_missing: bool,
+        inference_helpers_only: bool,
+        return_type: str,
+    ) -> Union[List[Any], Dict[str, Any]]:
         if return_type != self.RETURN_TYPE_RESPONSE_JSON:
             return self.convert_rdrs_response_to_feature_value_row(
                 row_feature_values=response["features"],
@@ -222,7 +306,9 @@ class OnlineStoreRestClientEngine:
                 Keys are "featureName" and "featureType" and values are boolean.
             drop_missing: Whether to drop missing features from the feature vector. Requires including detailed status.
             helpers_only: Whether to return only the inference helper columns.
-            return_type: The type of the return value. Either "feature_value_dict", "feature_value_list" or "response_json".
+            return_type: The type of the return value. Either "feature_value_dict", "feature_value_list", "response_json",
+                "feature_value_columns" or "arrow_table". The latter two return the feature values per feature, see
+                `convert_rdrs_response_to_feature_value_columns`.
 
         # Returns:
             The response json containing the feature vector as well as status information
@@ -242,6 +328,68 @@ class OnlineStoreRestClientEngine:
         _logger.debug(
             f"Getting batch raw feature vectors for Feature View {self._feature_view_name}, version: {self._feature_view_version} in Feature Store {self._feature_store_name}."
         )
+        payload = self._build_batch_payload(
+            entries=entries,
+            passed_features=passed_features,
+            metadata_options=metadata_options,
+            drop_missing=drop_missing,
+        )
+        with serving_latency.measure_stage(serving_latency.REST_REQUEST):
+            response = self._online_store_rest_client_api.get_batch_raw_feature_vectors(
+                payload=payload
+            )
+        with serving_latency.measure_stage(serving_latency.REST_DECODE):
+            return self._convert_batch_response(
+                response,
+                drop_missing=drop_missing,
+                inference_helpers_only=inference_helpers_only,
+                return_type=return_type,
+            )
+
+    async def get_batch_feature_vectors_async(
+        self,
+        entries: List[Dict[str, Any]],
+        passed_features: Optional[List[Dict[str, Any]]] = None,
+        metadata_options: Optional[Dict[str, bool]] = None,
+        drop_missing: bool = False,
+        inference_helpers_only: bool = False,
+        return_type: str = RETURN_TYPE_FEATURE_VALUE_DICT,
+    ) -> Union[
+        Tuple[List[Union[List[Any], Dict[str, Any]]], List[Dict[str, Any]]],
+        Dict[str, Any],
+    ]:
+        """Get a list of feature vectors from the online feature store without blocking the running event loop.
+
+        See `get_batch_feature_vectors` for details on the arguments and return value.
+        """
+        _logger.debug(
+            f"Getting batch raw feature vectors asynchronously for Feature View {self._feature_view_name}, version: {self._feature_view_version} in Feature Store {self._feature_store_name}."
+        )
+        payload = self._build_batch_payload(
+            entries=entries,
+            passed_features=passed_features,
+            metadata_options=metadata_options,
+            drop_missing=drop_missing,
+        )
+        with serving_latency.measure_stage(serving_latency.REST_REQUEST):
+            response = await self._online_store_rest_client_api.get_batch_raw_feature_vectors_async(
+                payload=payload
+            )
+        with serving_latency.measure_stage(serving_latency.REST_DECODE):
+            return self._convert_batch_response(
+                response,
+                drop_missing=drop_missing,
+                inference_helpers_only=inference_helpers_only,
+                return_type=return_type,
+            )
+
+    def _build_batch_payload(
+        self,
+        entries: List[Dict[str, Any]],
+        passed_features: Optional[List[Dict[str, Any]]],
+        metadata_options: Optional[Dict[str, bool]],
+        drop_missing: bool,
+    ) -> Dict[str, Any]:
         _logger.debug(f"entries: {entries}\npassed features: {passed_features}")
         payload = self.build_base_payload(
             metadata_options=metadata_options,
@@ -262,12 +410,28 @@ class OnlineStoreRestClientEngine:
                 "Length of passed features does not match the length of the entries. "
                 "If some entries do not have passed features, pass an empty dict for those entries."
             )
+        return payload
 
-        response = self._online_store_rest_client_api.get_batch_raw_feature_vectors(
-            payload=payload
-        )
-
-        if return_type != self.RETURN_TYPE_RESPONSE_JSON:
+    def _convert_batch_response(
+        self,
+        response: Dict[str, Any],
+        drop_missing: bool,
+        inference_helpers_only: bool,
+        return_type: str,
+    ) -> Union[List[Union[List[Any], Dict[str, Any]]], Dict[str, Any]]:
+        if return_type in [
+            self.RETURN_TYPE_FEATURE_VALUE_COLUMNS,
+            self.RETURN_TYPE_ARROW_TABLE,
+        ]:
+            columns = self.convert_rdrs_response_to_feature_value_columns(
+                response,
+                drop_missing=drop_missing,
+                inference_helpers_only=inference_helpers_only,
+            )
+            if return_type == self.RETURN_TYPE_ARROW_TABLE:
+                return pa.Table.from_pydict(columns)
+            return columns
+        elif return_type != self.RETURN_TYPE_RESPONSE_JSON:
             _logger.debug("Converting batch response to feature value rows for each.")
             return [
                 self.convert_rdrs_response_to_feature_value_row(
@@ -315,16 +479,10 @@ class OnlineStoreRestClientEngine:
             raise ValueError(
                 "Detailed status is required to drop missing features from the feature vector."
             )
-        failed_read_feature_names = []
-        if detailed_status is not None and drop_missing:
-            for operation_status in detailed_status:
-                if operation_status["httpStatus"] != 200:
-                    failed_read_feature_names.extend(
-                        self.feature_names_per_fg_id[operation_status["featureGroupId"]]
-                    )
-            _logger.debug(
-                f"Feature names which failed on read: {failed_read_feature_names}."
-            )
+        failed_read_feature_names = self._get_failed_read_feature_names(
+            detailed_status, drop_missing
+        )
+        feature_value_positions = self._feature_value_positions[inference_helpers_only]
 
         if return_type == self.RETURN_TYPE_FEATURE_VALUE_LIST:
             if row_feature_values is None and drop_missing:
@@ -334,26 +492,15 @@ class OnlineStoreRestClientEngine:
                 _logger.debug(
                     "Feature vector is null, returning None for all features."
                 )
-                return [
-                    None
-                    for is_helper in self.is_inference_helpers_list
-                    if is_helper is inference_helpers_only
-                ]
+                return [None] * len(feature_value_positions)
             elif drop_missing:
                 _logger.debug(
                     "Dropping missing features from the feature vector and return as list."
                 )
                 return [
-                    value
-                    for (name, value, is_helper) in zip(
-                        self.ordered_feature_names,
-                        row_feature_values,
-                        self.is_inference_helpers_list,
-                    )
-                    if (
-                        name not in failed_read_feature_names
-                        and is_helper is inference_helpers_only
-                    )
+                    row_feature_values[position]
+                    for (position, name) in feature_value_positions
+                    if name not in failed_read_feature_names
                 ]
             _logger.debug("Returning feature vector as list.")
             return row_feature_values
@@ -366,42 +513,83 @@ class OnlineStoreRestClientEngine:
                 _logger.debug(
                     "Feature vector is null, returning None for all features."
                 )
-                return {
-                    name: None
-                    for (name, is_helper) in zip(
-                        self.ordered_feature_names, self.is_inference_helpers_list
-                    )
-                    if is_helper is inference_helpers_only
-                }
+                return {name: None for (_, name) in feature_value_positions}
             elif drop_missing:
                 _logger.debug(
                     "Dropping missing features from the feature vector and return as dict."
                 )
                 return {
-                    name: value
-                    for (name, value, is_helper) in zip(
-                        self.ordered_feature_names,
-                        row_feature_values,
-                        self.is_inference_helpers_list,
-                    )
-                    if (
-                        name not in failed_read_feature_names
-                        and is_helper is inference_helpers_only
-                    )
+                    name: row_feature_values[position]
+                    for (position, name) in feature_value_positions
+                    if name not in failed_read_feature_names
                 }
             else:
                 _logger.debug("Returning feature vector as dict.")
-                return dict(
-                    {
-                        name: value
-                        for (name, value, is_helper) in zip(
-                            self.ordered_feature_names,
-                            row_feature_values,
-                            self.is_inference_helpers_list,
+                return {
+                    name: row_feature_values[position]
+                    for (position, name) in feature_value_positions
+                }
+
+    def convert_rdrs_response_to_feature_value_columns(
+        self,
+        response: Dict[str, Any],
+        drop_missing: bool,
+        inference_helpers_only: bool = False,
+    ) -> Dict[str, List[Any]]:
+        """Convert a batch response from the RonDB Rest Server Feature Store API to a feature:values dict.
+
+        The feature values are transposed into one list per feature without building a dictionary
+        per feature vector. Null feature vectors and, if `drop_missing` is set, features which failed on
+        read are returned as None values.
+
+        # Arguments:
+            response: The response json of a batch request.
+            drop_missing: Whether to set missing features to None. Relies on detailed status.
+            inference_helpers_only: Whether to return only the inference helper columns.
+
+        # Returns:
+            A dictionary with the feature names as keys and the list of values of the feature as values,
+            ordered as the entries of the request.
+        """
+        feature_value_positions = self._feature_value_positions[inference_helpers_only]
+        rows = response["features"]
+        if len(rows) == 0:
+            return {name: [] for (_, name) in feature_value_positions}
+
+        null_row = [None] * len(self._ordered_feature_names)
+        transposed = list(zip(*[null_row if row is None else row for row in rows]))
+        columns = {
+            name: list(transposed[position])
+            for (position, name) in feature_value_positions
+        }
+        if drop_missing:
+            for row_index, detailed_status in enumerate(
+                response.get("detailedStatus") or []
+            ):
+                for name in self._get_failed_read_feature_names(
+                    detailed_status, drop_missing
+                ):
+                    if name in columns:
+                        columns[name][row_index] = None
+        return columns
+
+    def _get_failed_read_feature_names(
+        self, detailed_status: Optional[List[Dict[str, Any]]], drop_missing: bool
+    ) -> Set[str]:
+        failed_read_feature_names = set()
+        if detailed_status is not None and drop_missing:
+            for operation_status in detailed_status:
+                if operation_status["httpStatus"] != 200:
+                    # failed requests of a chunked batch are not attributed to a feature group
+                    failed_read_feature_names.update(
+                        self.feature_names_per_fg_id.get(
+                            operation_status.get("featureGroupId"), []
                         )
-                        if is_helper is inference_helpers_only
-                    }
-                )
+                    )
+            _logger.debug(
+                "Feature names which failed on read: %s.", failed_read_feature_names
+            )
+        return failed_read_feature_names
 
     @property
     def feature_store_name(self) -> str:
@@ -16,14 +16,26 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import re
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from hsfs import util
 from hsfs.core import (
     feature_view_api,
+    serving_latency,
     storage_connector_api,
     training_dataset_api,
 )
@@ -55,6 +67,10 @@ class OnlineStoreSqlClient:
     SINGLE_HELPER_KEY = "single_helper_column"
     BATCH_VECTOR_KEY = "batch_feature_vectors"
     SINGLE_VECTOR_KEY = "single_feature_vector"
+    BATCH_CHUNK_SIZE_KEY = "batch_chunk_size"
+    FETCH_SIZE_KEY = "fetch_size"
+    DEFAULT_BATCH_CHUNK_SIZE = 10000
+    DEFAULT_FETCH_SIZE = 1000
 
     def __init__(
         self,
@@ -72,6 +88,10 @@ class OnlineStoreSqlClient:
         self._prefix_by_serving_index = None
         self._pkname_by_serving_index = None
         self._serving_key_by_serving_index: Dict[str, ServingKey] = {}
+        # (required serving key, feature name) pairs to bind entries to each prepared statement
+        self._serving_key_bindings_by_serving_index: Optional[
+            Dict[int, Tuple[Tuple[str, str], ...]]
+        ] = None
         self._connection_pool = None
         self._serving_keys: Set[ServingKey] = set(serving_keys or [])
 
@@ -197,6 +217,7 @@ class OnlineStoreSqlClient:
                         join_index
                     ].get(_sk.feature_name, 0),
                 )
+        self._serving_key_bindings_by_serving_index = None
 
     def _parametrize_prepared_statements(
         self,
@@ -262,6 +283,22 @@ class OnlineStoreSqlClient:
             entries, self.parametrised_prepared_statements[self.BATCH_VECTOR_KEY]
         )
 
+    async def get_single_feature_vector_async(
+        self, entry: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Retrieve single vector with parallel queries using aiomysql engine, without blocking the running event loop."""
+        return await self._single_vector_result_async(
+            entry, self.parametrised_prepared_statements[self.SINGLE_VECTOR_KEY]
+        )
+
+    async def get_batch_feature_vectors_async(
+        self, entries: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Retrieve batch vector with parallel queries using aiomysql engine, without blocking the running event loop."""
+        return await self._batch_vector_results_async(
+            entries, self.parametrised_prepared_statements[self.BATCH_VECTOR_KEY]
+        )
+
     def get_inference_helper_vector(self, entry: Dict[str, Any]) -> Dict[str, Any]:
         """Retrieve single vector with parallel queries using aiomysql engine."""
         return self._single_vector_result(
@@ -280,6 +317,15 @@ class OnlineStoreSqlClient:
         self, entry: Dict[str, Any], prepared_statement_objects: Dict[int, sql.text]
     ) -> Dict[str, Any]:
         """Retrieve single vector with parallel queries using aiomysql engine."""
+        loop = self._get_or_create_event_loop()
+        return loop.run_until_complete(
+            self._single_vector_result_async(entry, prepared_statement_objects)
+        )
+
+    async def _single_vector_result_async(
+        self, entry: Dict[str, Any], prepared_statement_objects: Dict[int, sql.text]
+    ) -> Dict[str, Any]:
+        """Retrieve single vector with parallel queries using aiomysql engine."""
 
         if all([isinstance(val, list) for val in entry.values()]):
             raise ValueError(
@@ -293,44 +339,44 @@ class OnlineStoreSqlClient:
         serving_vector = {}
         bind_entries = {}
         prepared_statement_execution = {}
+        serving_key_bindings = self.serving_key_bindings_by_serving_index
         for prepared_statement_index in prepared_statement_objects:
             pk_entry = {}
-            next_statement = False
-            for sk in self.serving_key_by_serving_index[prepared_statement_index]:
-                if sk.required_serving_key not in entry.keys():
-                    # Check if there is any entry matched with feature name.
-                    if sk.feature_name in entry.keys():
-                        pk_entry[sk.feature_name] = entry[sk.feature_name]
-                    else:
-                        # User did not provide the necessary serving keys, we expect they have
-                        # provided the necessary features as passed_features.
-                        # We are going to check later if this is true
-                        next_statement = True
-                        break
+            for required_serving_key, feature_name in serving_key_bindings[
+                prepared_statement_index
+            ]:
+                if required_serving_key in entry:
+                    pk_entry[feature_name] = entry[required_serving_key]
+                # Check if there is any entry matched with feature name.
+                elif feature_name in entry:
+                    pk_entry[feature_name] = entry[feature_name]
                 else:
-                    pk_entry[sk.feature_name] = entry[sk.required_serving_key]
-            if next_statement:
-                continue
-            bind_entries[prepared_statement_index] = pk_entry
-            prepared_statement_execution[prepared_statement_index] = (
-                prepared_statement_objects[prepared_statement_index]
-            )
+                    # User did not provide the necessary serving keys, we expect they have
+                    # provided the necessary features as passed_features.
+                    # We are going to check later if this is true
+                    break
+            else:
+                bind_entries[prepared_statement_index] = pk_entry
+                prepared_statement_execution[prepared_statement_index] = (
+                    prepared_statement_objects[prepared_statement_index]
+                )
 
         # run all the prepared statements in parallel using aiomysql engine
         _logger.debug(
             f"Executing prepared statements for serving vector with entries: {bind_entries}"
         )
-        loop = self._get_or_create_event_loop()
-        results_dict = loop.run_until_complete(
-            self._execute_prep_statements(prepared_statement_execution, bind_entries)
-        )
+        with serving_latency.measure_stage(serving_latency.SQL_EXECUTE):
+            results_dict = await self._execute_prep_statements(
+                prepared_statement_execution, bind_entries
+            )
         _logger.debug(f"Retrieved feature vectors: {results_dict}")
         _logger.debug("Constructing serving vector from results")
-        for key in results_dict:
-            for row in results_dict[key]:
-                _logger.debug(f"Processing row: {row} for prepared statement {key}")
-                result_dict = dict(row)
-                serving_vector.update(result_dict)
+        with serving_latency.measure_stage(serving_latency.SQL_ASSEMBLE):
+            for key in results_dict:
+                for row in results_dict[key]:
+                    _logger.debug(f"Processing row: {row} for prepared statement {key}")
+                    result_dict = dict(row)
+                    serving_vector.update(result_dict)
 
         return serving_vector
 
@@ -338,10 +384,22 @@ class OnlineStoreSqlClient:
         self,
         entries: List[Dict[str, Any]],
         prepared_statement_objects: Dict[int, sql.text],
+    ):
+        """Execute prepared statements in parallel using aiomysql engine."""
+        loop = self._get_or_create_event_loop()
+        return loop.run_until_complete(
+            self._batch_vector_results_async(entries, prepared_statement_objects)
+        )
+
+    async def _batch_vector_results_async(
+        self,
+        entries: List[Dict[str, Any]],
+        prepared_statement_objects: Dict[int, sql.text],
     ):
         """Execute prepared statements in parallel using aiomysql engine."""
         _logger.debug(
-            f"Starting batch vector retrieval for {len(entries)} entries via aiomysql engine."
+            "Starting batch vector retrieval for %d entries via aiomysql engine.",
+            len(entries),
         )
         # create dict object that will have of order of the vector as key and values as
         # vector itself to stitch them correctly if there are multiple feature groups involved. At this point we
@@ -350,8 +408,9 @@ class OnlineStoreSqlClient:
         entry_values = {}
         serving_keys_all_fg = []
         prepared_stmts_to_execute = {}
+        serving_key_bindings = self.serving_key_bindings_by_serving_index
         # construct the list of entry values for binding to query
-        _logger.debug(f"Parametrize prepared statements with entry values: {entries}")
+        _logger.debug("Parametrize prepared statements with entry values: %s", entries)
         for prepared_statement_index in prepared_statement_objects:
             # prepared_statement_index include fg with label only
             # But _serving_key_by_serving_index include the index when the join_index is 0 (left side)
@@ -361,80 +420,148 @@ class OnlineStoreSqlClient:
             prepared_stmts_to_execute[prepared_statement_index] = (
                 prepared_statement_objects[prepared_statement_index]
             )
-            entry_values_tuples = list(
-                map(
-                    lambda e, prepared_statement_index=prepared_statement_index: tuple(
-                        [
-                            (
-                                e.get(sk.required_serving_key)
-                                # Check if there is any entry matched with feature name,
-                                # if the required serving key is not provided.
-                                or e.get(sk.feature_name)
-                            )
-                            for sk in self.serving_key_by_serving_index[
-                                prepared_statement_index
-                            ]
-                        ]
-                    ),
-                    entries,
+            entry_values_tuples = [
+                self._get_result_key_serving_key(
+                    serving_key_bindings[prepared_statement_index], e
+                )
+                for e in entries
+            ]
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    f"Prepared statement {prepared_statement_index} with entries: {entry_values_tuples}"
                 )
-            )
-            _logger.debug(
-                f"Prepared statement {prepared_statement_index} with entries: {entry_values_tuples}"
-            )
             entry_values[prepared_statement_index] = {"batch_ids": entry_values_tuples}
 
-        _logger.debug(
-            f"Executing prepared statements for batch vector with entries: {entry_values}"
-        )
+        if len(entries) > self.batch_chunk_size:
+            # rows are stitched into the batch results while they are fetched
+            with serving_latency.measure_stage(serving_latency.SQL_EXECUTE):
+                await self._stream_prep_statements(
+                    prepared_stmts_to_execute, entry_values, batch_results
+                )
+            for prepared_statement_index in prepared_stmts_to_execute:
+                serving_keys_all_fg += self.serving_key_by_serving_index[
+                    prepared_statement_index
+                ]
+            return batch_results, serving_keys_all_fg
+
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                f"Executing prepared statements for batch vector with entries: {entry_values}"
+            )
         # run all the prepared statements in parallel using aiomysql engine
-        loop = self._get_or_create_event_loop()
-        parallel_results = loop.run_until_complete(
-            self._execute_prep_statements(prepared_stmts_to_execute, entry_values)
-        )
+        with serving_latency.measure_stage(serving_latency.SQL_EXECUTE):
+            parallel_results = await self._execute_prep_statements(
+                prepared_stmts_to_execute, entry_values
+            )
 
-        _logger.debug(f"Retrieved feature vectors: {parallel_results}, stitching them.")
-        # construct the results
-        for prepared_statement_index in prepared_stmts_to_execute:
-            statement_results = {}
-            serving_keys = self.serving_key_by_serving_index[prepared_statement_index]
-            serving_keys_all_fg += serving_keys
-            prefix_features = [
-                (self.prefix_by_serving_index[prepared_statement_index] or "")
-                + sk.feature_name
-                for sk in self.serving_key_by_serving_index[prepared_statement_index]
-            ]
+        if _logger.isEnabledFor(logging.DEBUG):
             _logger.debug(
-                f"Use prefix from prepare statement because prefix from serving key is collision adjusted {prefix_features}."
+                f"Retrieved feature vectors: {parallel_results}, stitching them."
             )
-            _logger.debug("iterate over results by index of the prepared statement")
-            for row in parallel_results[prepared_statement_index]:
-                _logger.debug(f"Processing row: {row}")
-                row_dict = dict(row)
-                # can primary key be complex feature? No, not supported.
-                result_dict = row_dict
-                _logger.debug(
-                    f"Add result to statement results: {self._get_result_key(prefix_features, row_dict)} : {result_dict}"
-                )
-                statement_results[self._get_result_key(prefix_features, row_dict)] = (
-                    result_dict
+        # construct the results
+        with serving_latency.measure_stage(serving_latency.SQL_ASSEMBLE):
+            for prepared_statement_index in prepared_stmts_to_execute:
+                serving_keys = self.serving_key_by_serving_index[
+                    prepared_statement_index
+                ]
+                serving_keys_all_fg += serving_keys
+                prefix_features = self._get_prefixed_serving_key_names(
+                    prepared_statement_index
                 )
+                # can primary key be complex feature? No, not supported.
+                statement_results = {}
+                for row in parallel_results[prepared_statement_index]:
+                    row_dict = dict(row)
+                    statement_results[
+                        self._get_result_key(prefix_features, row_dict)
+                    ] = row_dict
+
+                # the keys of the entries were already computed to bind the prepared statement
+                _logger.debug("Add partial results to batch results.")
+                for batch_result, entry_key in zip(
+                    batch_results,
+                    entry_values[prepared_statement_index]["batch_ids"],
+                ):
+                    statement_result = statement_results.get(entry_key)
+                    if statement_result is not None:
+                        batch_result.update(statement_result)
+        return batch_results, serving_keys_all_fg
 
-            _logger.debug(f"Add partial results to batch results: {statement_results}")
-            for i, entry in enumerate(entries):
-                _logger.debug(
-                    "Processing entry %s : %s",
-                    entry,
-                    statement_results.get(
-                        self._get_result_key_serving_key(serving_keys, entry), {}
-                    ),
-                )
-                batch_results[i].update(
-                    statement_results.get(
-                        self._get_result_key_serving_key(serving_keys, entry), {}
+    async def _stream_prep_statements(
+        self,
+        prepared_statements: Dict[int, sql.text],
+        entry_values: Dict[int, Dict[str, List[Tuple[Any, ...]]]],
+        batch_results: List[Dict[str, Any]],
+    ) -> None:
+        """Execute the batch prepared statements in chunks of keys and stitch the rows into `batch_results`.
+
+        The distinct keys of each prepared statement are split into IN-lists of at most `batch_chunk_size`
+        keys, which are executed concurrently on the connection pool. Rows are fetched `fetch_size` at a
+        time and merged into the preallocated results right away, so that neither the full result sets nor
+        a dictionary per row of them are held in memory.
+        """
+        if self._connection_pool is None:
+            # created upfront, the chunks would otherwise race to create their own pool
+            await self._get_connection_pool(self._default_pool_min_size())
+        tasks = []
+        for prepared_statement_index, stmt in prepared_statements.items():
+            # entries with the same key share the row fetched for it
+            positions_by_key: Dict[Tuple[Any, ...], List[int]] = {}
+            for position, entry_key in enumerate(
+                entry_values[prepared_statement_index]["batch_ids"]
+            ):
+                positions_by_key.setdefault(entry_key, []).append(position)
+            stitch_rows = functools.partial(
+                self._stitch_rows,
+                self._get_prefixed_serving_key_names(prepared_statement_index),
+                positions_by_key,
+                batch_results,
+            )
+            keys = list(positions_by_key)
+            for start in range(0, len(keys), self.batch_chunk_size):
+                tasks.append(
+                    asyncio.create_task(
+                        self._stream_query_async_sql(
+                            stmt,
+                            {"batch_ids": keys[start : start + self.batch_chunk_size]},
+                            stitch_rows,
+                        ),
+                        name=f"stream_prep_statement_key{prepared_statement_index}_{start}",
                     )
                 )
-        return batch_results, serving_keys_all_fg
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError as e:
+            _logger.error(f"Failed executing prepared statements: {e}")
+            raise e
+
+    def _stitch_rows(
+        self,
+        prefix_features: List[str],
+        positions_by_key: Dict[Tuple[Any, ...], List[int]],
+        batch_results: List[Dict[str, Any]],
+        rows: List[Any],
+    ) -> None:
+        for row in rows:
+            row_dict = dict(row)
+            for position in positions_by_key.get(
+                self._get_result_key(prefix_features, row_dict), ()
+            ):
+                batch_results[position].update(row_dict)
+
+    def _get_prefixed_serving_key_names(
+        self, prepared_statement_index: int
+    ) -> List[str]:
+        prefix_features = [
+            (self.prefix_by_serving_index[prepared_statement_index] or "")
+            + sk.feature_name
+            for sk in self.serving_key_by_serving_index[prepared_statement_index]
+        ]
+        _logger.debug(
+            "Use prefix from prepare statement because prefix from serving key is collision adjusted %s.",
+            prefix_features,
+        )
+        return prefix_features
 
     def _get_or_create_event_loop(self):
         try:
@@ -500,30 +627,23 @@ class OnlineStoreSqlClient:
     def _get_result_key(
         primary_keys: List[str], result_dict: Dict[str, str]
     ) -> Tuple[str]:
-        _logger.debug(f"Get result key {primary_keys} from result dict {result_dict}")
-        result_key = []
-        for pk in primary_keys:
-            result_key.append(result_dict.get(pk))
-        return tuple(result_key)
+        _logger.debug(
+            "Get result key %s from result dict %s", primary_keys, result_dict
+        )
+        return tuple(result_dict.get(pk) for pk in primary_keys)
 
     @staticmethod
     def _get_result_key_serving_key(
-        serving_keys: List[ServingKey], result_dict: Dict[str, Dict[str, Any]]
+        serving_key_bindings: Tuple[Tuple[str, str], ...], entry: Dict[str, Any]
     ) -> Tuple[str]:
-        _logger.debug(
-            f"Get result key serving key {serving_keys} from result dict {result_dict}"
+        # Called once per entry and prepared statement, the serving key attributes are resolved upfront
+        return tuple(
+            entry.get(required_serving_key)
+            # Check if there is any entry matched with feature name,
+            # if the required serving key is not provided.
+            or entry.get(feature_name)
+            for required_serving_key, feature_name in serving_key_bindings
         )
-        result_key = []
-        for sk in serving_keys:
-            _logger.debug(
-                f"Get result key for serving key {sk.required_serving_key} or {sk.feature_name}"
-            )
-            result_key.append(
-                result_dict.get(sk.required_serving_key)
-                or result_dict.get(sk.feature_name)
-            )
-        _logger.debug(f"Result key: {result_key}")
-        return tuple(result_key)
 
     @staticmethod
     def get_prepared_statement_labels(
@@ -541,6 +661,13 @@ class OnlineStoreSqlClient:
             OnlineStoreSqlClient.BATCH_VECTOR_KEY,
         ]
 
+    def _default_pool_min_size(self) -> int:
+        # one connection per feature group, only the batch statements might be set up
+        statements = self._prepared_statements.get(
+            self.SINGLE_VECTOR_KEY
+        ) or self._prepared_statements.get(self.BATCH_VECTOR_KEY, {})
+        return max(1, len(statements))
+
     async def _get_connection_pool(self, default_min_size: int) -> None:
         self._connection_pool = await util_sql.create_async_engine(
             self._online_connector,
@@ -553,9 +680,7 @@ class OnlineStoreSqlClient:
     async def _query_async_sql(self, stmt, bind_params):
         """Query prepared statement together with bind params using aiomysql connection pool"""
         if self._connection_pool is None:
-            await self._get_connection_pool(
-                len(self._prepared_statements[self.SINGLE_VECTOR_KEY])
-            )
+            await self._get_connection_pool(self._default_pool_min_size())
         async with self._connection_pool.acquire() as conn:
             # Execute the prepared statement
             _logger.debug(
@@ -570,6 +695,24 @@ class OnlineStoreSqlClient:
 
         return resultset
 
+    async def _stream_query_async_sql(
+        self, stmt, bind_params, on_rows: Callable[[List[Any]], None]
+    ) -> None:
+        """Query prepared statement together with bind params and pass the rows to `on_rows` `fetch_size` at a time."""
+        async with self._connection_pool.acquire() as conn:
+            _logger.debug(
+                f"Executing prepared statement: {stmt} with {len(bind_params['batch_ids'])} keys."
+            )
+            cursor = await conn.execute(stmt, bind_params)
+            try:
+                while True:
+                    rows = await cursor.fetchmany(self.fetch_size)
+                    if not rows:
+                        break
+                    on_rows(rows)
+            finally:
+                await cursor.close()
+
     async def _execute_prep_statements(
         self,
         prepared_statements: Dict[int, str],
@@ -607,6 +750,20 @@ class OnlineStoreSqlClient:
 
         return results_dict
 
+    @property
+    def batch_chunk_size(self) -> int:
+        """Maximum number of keys looked up by a single statement of a streamed batch lookup."""
+        return (self._connection_options or {}).get(
+            self.BATCH_CHUNK_SIZE_KEY, self.DEFAULT_BATCH_CHUNK_SIZE
+        )
+
+    @property
+    def fetch_size(self) -> int:
+        """Number of rows fetched at a time by a streamed batch lookup."""
+        return (self._connection_options or {}).get(
+            self.FETCH_SIZE_KEY, self.DEFAULT_FETCH_SIZE
+        )
+
     @property
     def feature_store_id(self) -> int:
         return self._feature_store_id
@@ -675,6 +832,23 @@ class OnlineStoreSqlClient:
         """
         return self._serving_key_by_serving_index
 
+    @property
+    def serving_key_bindings_by_serving_index(
+        self,
+    ) -> Dict[int, Tuple[Tuple[str, str], ...]]:
+        """The (required serving key, feature name) pairs of the serving keys of each prepared statement,
+        in the order of `serving_key_by_serving_index`. Resolved once so that binding entries does not
+        access the serving key attributes for every entry.
+        """
+        if self._serving_key_bindings_by_serving_index is None:
+            self._serving_key_bindings_by_serving_index = {
+                index: tuple(
+                    (sk.required_serving_key, sk.feature_name) for sk in serving_keys
+                )
+                for index, serving_keys in self.serving_key_by_serving_index.items()
+            }
+        return self._serving_key_bindings_by_serving_index
+
     @property
     def feature_name_order_by_psp(self) -> Dict[int, Dict[str, int]]:
         """The dict object of feature names as values and keys as indices of positions in the query for
@@ -15,14 +15,17 @@
 #
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import threading
 from functools import wraps
 
 import opensearchpy
 import urllib3
 from hsfs import client
 from hsfs.client.exceptions import FeatureStoreException, VectorDatabaseException
+from hsfs.core.constants import HAS_AIOHTTP, aiohttp_not_installed_message
 from hsfs.core.opensearch_api import OpenSearchApi
 from opensearchpy import OpenSearch
 from opensearchpy.exceptions import (
@@ -43,34 +46,55 @@ def _is_timeout(exception):
 def _handle_opensearch_exception(func):
     @wraps(func)
     def error_handler_wrapper(*args, **kw):
+        failed_client = OpenSearchClientSingleton()._opensearch_client
         try:
             return func(*args, **kw)
         except (ConnectionError, AuthenticationException):
             # OpenSearchConnectionError occurs when connection is closed.
             # OpenSearchAuthenticationException occurs when jwt is expired
-            OpenSearchClientSingleton()._refresh_opensearch_connection()
+            OpenSearchClientSingleton()._refresh_opensearch_connection(failed_client)
             return func(*args, **kw)
-        except RequestError as e:
-            caused_by = e.info.get("error") and e.info["error"].get("caused_by")
-            if caused_by and caused_by["type"] == "illegal_argument_exception":
-                raise OpenSearchClientSingleton()._create_vector_database_exception(
-                    caused_by["reason"]) from e
-            raise VectorDatabaseException(
-                VectorDatabaseException.OTHERS,
-                f"Error in Opensearch request: {e}",
-                e.info,
-            ) from e
         except Exception as e:
-            if _is_timeout(e):
-                raise FeatureStoreException(
-                    OpenSearchClientSingleton.TIMEOUT_ERROR_MSG
-                ) from e
-            else:
-                raise e
+            _raise_opensearch_exception(e)
+
+    return error_handler_wrapper
+
+
+def _handle_opensearch_exception_async(func):
+    @wraps(func)
+    async def error_handler_wrapper(*args, **kw):
+        failed_client = OpenSearchClientSingleton()._async_opensearch_client
+        try:
+            return await func(*args, **kw)
+        except (ConnectionError, AuthenticationException):
+            await OpenSearchClientSingleton()._refresh_async_opensearch_connection(
+                failed_client
+            )
+            return await func(*args, **kw)
+        except Exception as e:
+            _raise_opensearch_exception(e)
 
     return error_handler_wrapper
 
 
+def _raise_opensearch_exception(e):
+    if isinstance(e, RequestError):
+        caused_by = e.info.get("error") and e.info["error"].get("caused_by")
+        if caused_by and caused_by["type"] == "illegal_argument_exception":
+            raise OpenSearchClientSingleton()._create_vector_database_exception(
+                caused_by["reason"]) from e
+        raise VectorDatabaseException(
+            VectorDatabaseException.OTHERS,
+            f"Error in Opensearch request: {e}",
+            e.info,
+        ) from e
+    if _is_timeout(e):
+        raise FeatureStoreException(
+            OpenSearchClientSingleton.TIMEOUT_ERROR_MSG
+        ) from e
+    raise e
+
+
 class OpensearchRequestOption:
     DEFAULT_OPTION_MAP = {
         "timeout": "30s",
@@ -130,29 +154,143 @@ class OpenSearchClientSingleton:
     Cannot fetch results from Opensearch due to timeout. It is because the server is busy right now or longer time is needed to reload a large index. Try and increase the timeout limit by providing the parameter `options={"timeout": 60}` in the method `find_neighbor` or `count`.
     """
 
+    # number of connections kept open to the vector database, and so of requests that can run
+    # concurrently without opening a new connection, e.g. from the threads of a model server
+    DEFAULT_POOL_MAXSIZE = 10
+    _pool_maxsize = DEFAULT_POOL_MAXSIZE
+
     def __new__(cls):
         if not cls._instance:
             cls._instance = super(OpenSearchClientSingleton, cls).__new__(cls)
             cls._instance._opensearch_client = None
+            cls._instance._async_opensearch_client = None
+            cls._instance._async_client_loop = None
+            cls._instance._lock = threading.Lock()
             cls._instance._setup_opensearch_client()
         return cls._instance
 
+    @classmethod
+    def set_pool_maxsize(cls, pool_maxsize: int) -> None:
+        """Set the number of connections kept open to the vector database.
+
+        Clients that are already set up are recreated with the new pool size.
+        """
+        if not isinstance(pool_maxsize, int) or pool_maxsize <= 0:
+            raise ValueError("`pool_maxsize` must be a positive integer.")
+        cls._pool_maxsize = pool_maxsize
+        if cls._instance and cls._instance._opensearch_client:
+            cls._instance._refresh_opensearch_connection()
+        if cls._instance and cls._instance._async_opensearch_client:
+            # set up again with the new pool size on next use
+            cls._instance._release_async_client()
+
+    def _get_opensearch_config(self):
+        return OpenSearchApi(
+            client.get_instance()._project_id,
+            client.get_instance()._project_name,
+        ).get_default_py_config()
+
     def _setup_opensearch_client(self):
         if not self._opensearch_client:
             # query log is at INFO level
             # 2023-11-24 15:10:49,470 INFO: POST https://localhost:9200/index/_search [status:200 request:0.041s]
             logging.getLogger("opensearchpy").setLevel(logging.WARNING)
             self._opensearch_client = OpenSearch(
-                **OpenSearchApi(
-                    client.get_instance()._project_id,
-                    client.get_instance()._project_name,
-                ).get_default_py_config()
+                **self._get_opensearch_config(),
+                pool_maxsize=OpenSearchClientSingleton._pool_maxsize,
             )
 
-    def _refresh_opensearch_connection(self):
-        self._opensearch_client.close()
-        self._opensearch_client = None
-        self._setup_opensearch_client()
+    def _refresh_opensearch_connection(self, failed_client=None):
+        with self._lock:
+            if failed_client is not None and self._opensearch_client is not failed_client:
+                # another thread already refreshed the connection
+                return
+            if self._opensearch_client:
+                self._opensearch_client.close()
+            self._opensearch_client = None
+            self._setup_opensearch_client()
+
+    def get_async_client(self):
+        """Get the async client, which is set up on first use.
+
+        The client opens its connections on the event loop it is first used on, and should not be
+        shared across event loops.
+        """
+        if not self._async_opensearch_client:
+            if not HAS_AIOHTTP:
+                raise ModuleNotFoundError(aiohttp_not_installed_message)
+            from opensearchpy import AsyncOpenSearch
+
+            logging.getLogger("opensearchpy").setLevel(logging.WARNING)
+            self._async_opensearch_client = AsyncOpenSearch(
+                **self._get_opensearch_config(),
+                maxsize=OpenSearchClientSingleton._pool_maxsize,
+            )
+            try:
+                self._async_client_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._async_client_loop = None
+        return self._async_opensearch_client
+
+    def _release_async_client(self):
+        """Drop the async client and close it on the event loop its connections are bound to."""
+        async_client = self._async_opensearch_client
+        loop = self._async_client_loop
+        self._async_opensearch_client = None
+        self._async_client_loop = None
+        if async_client is None:
+            return
+        try:
+            if loop is not None and loop.is_running():
+                try:
+                    running_loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    running_loop = None
+                if running_loop is loop:
+                    loop.create_task(async_client.close())
+                else:
+                    asyncio.run_coroutine_threadsafe(async_client.close(), loop)
+            elif loop is not None and not loop.is_closed():
+                loop.run_until_complete(async_client.close())
+            else:
+                asyncio.run(async_client.close())
+        except Exception as e:
+            # the connections are dropped with the client once its event loop is gone
+            logging.getLogger(__name__).debug(f"Failed to close async client: {e}")
+
+    async def _refresh_async_opensearch_connection(self, failed_client=None):
+        if failed_client is not None and self._async_opensearch_client is not failed_client:
+            return
+        async_client = self._async_opensearch_client
+        self._async_opensearch_client = None
+        if async_client:
+            await async_client.close()
+        self.get_async_client()
+
+    def get_pool_statistics(self):
+        """Get the state of the HTTP connection pools of the sync client, one entry per host.
+
+        `num_connections` is the number of connections opened so far, `num_requests` the number of
+        requests sent, `idle_connections` the number of open connections currently available and
+        `maxsize` the number of connections kept open.
+        """
+        if not self._opensearch_client:
+            return []
+        statistics = []
+        for connection in self._opensearch_client.transport.connection_pool.connections:
+            pool = getattr(connection, "pool", None)
+            if pool is None:
+                continue
+            statistics.append(
+                {
+                    "host": connection.host,
+                    "num_connections": pool.num_connections,
+                    "num_requests": pool.num_requests,
+                    "idle_connections": pool.pool.qsize() if pool.pool else 0,
+                    "maxsize": pool.pool.maxsize if pool.pool else 0,
+                }
+            )
+        return statistics
 
     @retry(
         wait_exponential_multiplier=1000,
@@ -163,6 +301,59 @@ class OpenSearchClientSingleton:
     def search(self, index=None, body=None, options=None):
         return self._opensearch_client.search(body=body, index=index, params=OpensearchRequestOption.get_options(options))
 
+    @_handle_opensearch_exception_async
+    async def search_async(self, index=None, body=None, options=None):
+        return await self.get_async_client().search(
+            body=body, index=index, params=OpensearchRequestOption.get_options(options)
+        )
+
+    @retry(
+        wait_exponential_multiplier=1000,
+        stop_max_attempt_number=5,
+        retry_on_exception=_is_timeout,
+    )
+    @_handle_opensearch_exception
+    def msearch(self, index=None, body=None, options=None):
+        """Run several searches in a single request.
+
+        `body` alternates header and query entries, one pair per search. Returns the
+        responses in the order of the searches and raises if any of them failed.
+        """
+        result = self._opensearch_client.msearch(
+            body=body, index=index, params=OpensearchRequestOption.get_options(options)
+        )
+        for response in result["responses"]:
+            if "error" in response:
+                raise self._create_msearch_exception(response["error"])
+        return result["responses"]
+
+    @_handle_opensearch_exception
+    def scroll_search(self, index=None, body=None, scroll="1m", options=None):
+        """Run a search that opens a scroll context kept alive for `scroll`.
+
+        The response contains the first page of hits and the `_scroll_id` to fetch the next ones
+        with `scroll`. Not retried on timeout, the scroll context opened by a timed out request
+        could not be cleared as its id is lost.
+        """
+        params = dict(OpensearchRequestOption.get_options(options))
+        params["scroll"] = scroll
+        return self._opensearch_client.search(body=body, index=index, params=params)
+
+    @_handle_opensearch_exception
+    def scroll(self, scroll_id, scroll="1m", options=None):
+        # not retried on timeout, a repeated request would skip a page of the scroll
+        return self._opensearch_client.scroll(
+            body={"scroll_id": scroll_id, "scroll": scroll},
+            params=OpensearchRequestOption.get_options(options),
+        )
+
+    def clear_scroll(self, scroll_id):
+        try:
+            self._opensearch_client.clear_scroll(body={"scroll_id": scroll_id})
+        except Exception as e:
+            # the scroll context expires on its own after the keep alive
+            logging.getLogger(__name__).debug(f"Failed to clear scroll: {e}")
+
     @retry(
         wait_exponential_multiplier=1000,
         stop_max_attempt_number=5,
@@ -178,6 +369,24 @@ class OpenSearchClientSingleton:
     def close(self):
         if self._opensearch_client:
             self._opensearch_client.close()
+        self._release_async_client()
+
+    async def close_async(self):
+        if self._async_opensearch_client:
+            await self._async_opensearch_client.close()
+            self._async_opensearch_client = None
+            self._async_client_loop = None
+
+    def _create_msearch_exception(self, error):
+        # errors of single searches are returned in the response instead of being raised
+        caused_by = error.get("caused_by") if isinstance(error, dict) else None
+        if caused_by and caused_by.get("type") == "illegal_argument_exception":
+            return self._create_vector_database_exception(caused_by["reason"])
+        return VectorDatabaseException(
+            VectorDatabaseException.OTHERS,
+            f"Error in Opensearch request: {error}",
+            {"error": error},
+        )
 
     def _create_vector_database_exception(self, message):
         if "[knn] requires k" in message:
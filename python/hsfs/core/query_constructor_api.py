@@ -15,17 +15,71 @@
 #
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
 from hsfs import client
 from hsfs.constructor import fs_query
 
 
 class QueryConstructorApi:
+    # number of constructed queries kept across query objects, 0 disables the cache
+    MAX_CACHED_QUERIES = 128
+
+    _cache: OrderedDict[Hashable, fs_query.FsQuery] = OrderedDict()
+    _cache_lock = threading.Lock()
+
     def construct_query(self, query):
         _client = client.get_instance()
+        # the constructed query only depends on the query and the schemas of its feature groups,
+        # the feature list stands in for a schema version as feature groups do not have one
+        key = (
+            _client._project_id,
+            query.json(),
+            tuple(
+                sorted(
+                    (
+                        fg.id,
+                        fg.version,
+                        tuple((feat.name, feat.type) for feat in fg.features),
+                    )
+                    for fg in query.featuregroups
+                )
+            ),
+        )
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
         path_params = ["project", _client._project_id, "featurestores", "query"]
         headers = {"content-type": "application/json"}
-        return fs_query.FsQuery.from_response_json(
+        constructed_query = fs_query.FsQuery.from_response_json(
             _client._send_request(
                 "PUT", path_params, headers=headers, data=query.json()
             )
         )
+
+        if self.MAX_CACHED_QUERIES > 0:
+            with self._cache_lock:
+                self._cache[key] = constructed_query
+                while len(self._cache) > self.MAX_CACHED_QUERIES:
+                    self._cache.popitem(last=False)
+        return constructed_query
+
+    @classmethod
+    def invalidate_feature_group(cls, feature_group) -> None:
+        """Drop the cached queries reading from the feature group, e.g. after its schema changed."""
+        with cls._cache_lock:
+            for key in [
+                key
+                for key in cls._cache
+                if any(fg_key[0] == feature_group.id for fg_key in key[2])
+            ]:
+                del cls._cache[key]
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._cache_lock:
+            cls._cache.clear()
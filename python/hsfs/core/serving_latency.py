@@ -0,0 +1,200 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+
+_logger = logging.getLogger(__name__)
+
+# Stages of a feature vector retrieval
+VALIDATE_ENTRY = "validate_entry"
+FETCH = "fetch"
+RETURN_VALUE_HANDLERS = "return_value_handlers"
+ON_DEMAND_TRANSFORMATIONS = "on_demand_transformations"
+MODEL_DEPENDENT_TRANSFORMATIONS = "model_dependent_transformations"
+RETURN_TYPE = "return_type"
+TOTAL = "total"
+# Stages within the online clients, part of the fetch stage
+REST_REQUEST = "rest_request"
+REST_DECODE = "rest_decode"
+SQL_EXECUTE = "sql_execute"
+SQL_ASSEMBLE = "sql_assemble"
+
+# Latencies in seconds per stage of the retrieval currently measured in this context
+_current_breakdown: contextvars.ContextVar[Optional[Dict[str, float]]] = (
+    contextvars.ContextVar("serving_latency_breakdown", default=None)
+)
+
+
+def measure_stage(stage: str) -> _MeasuredStage:
+    """Add the time spent within the returned context manager to `stage` of the retrieval currently measured.
+
+    Does nothing if no retrieval is measured in the current context, so that the online clients
+    can be instrumented without knowing whether instrumentation is enabled.
+    """
+    return _MeasuredStage(stage)
+
+
+def add_stage_latency(stage: str, latency: float) -> None:
+    """Add `latency` seconds to `stage` of the retrieval currently measured, if any."""
+    breakdown = _current_breakdown.get()
+    if breakdown is not None:
+        breakdown[stage] = breakdown.get(stage, 0.0) + latency
+
+
+class ServingLatencyRecorder:
+    """Records how the latency of feature vector retrievals splits across their stages.
+
+    The latencies of the last `window_size` retrievals are kept per stage. Hooks are called with the
+    breakdown of every retrieval, a dictionary of stage names to seconds, and can be used to export
+    the latencies, e.g. to a Prometheus histogram or an OpenTelemetry meter.
+    """
+
+    WINDOW_SIZE_KEY = "window_size"
+    HOOKS_KEY = "hooks"
+    DEFAULT_WINDOW_SIZE = 1000
+
+    def __init__(
+        self,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        hooks: Optional[List[Callable[[Dict[str, float]], None]]] = None,
+    ):
+        if window_size <= 0:
+            raise ValueError("Latency `window_size` must be a positive integer.")
+        self._window_size = window_size
+        self._hooks = list(hooks or [])
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> ServingLatencyRecorder:
+        unknown_keys = set(config.keys()) - {cls.WINDOW_SIZE_KEY, cls.HOOKS_KEY}
+        if unknown_keys:
+            raise ValueError(
+                f"Unknown serving latency configuration options: {sorted(unknown_keys)}. "
+                f"Supported options are '{cls.WINDOW_SIZE_KEY}' and '{cls.HOOKS_KEY}'."
+            )
+        return cls(
+            window_size=config.get(cls.WINDOW_SIZE_KEY, cls.DEFAULT_WINDOW_SIZE),
+            hooks=config.get(cls.HOOKS_KEY),
+        )
+
+    def measure(self) -> _MeasuredRetrieval:
+        """Measure the retrieval executed within the returned context manager."""
+        return _MeasuredRetrieval(self)
+
+    def record(self, breakdown: Dict[str, float]) -> None:
+        """Record the latencies in seconds of the stages of a single retrieval."""
+        with self._lock:
+            for stage, latency in breakdown.items():
+                latencies = self._latencies.get(stage)
+                if latencies is None:
+                    latencies = deque(maxlen=self._window_size)
+                    self._latencies[stage] = latencies
+                latencies.append(latency)
+        for hook in self._hooks:
+            try:
+                hook(breakdown)
+            except Exception as e:
+                _logger.warning(f"Serving latency hook {hook} failed: {e}")
+
+    def add_hook(self, hook: Callable[[Dict[str, float]], None]) -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[Dict[str, float]], None]) -> None:
+        self._hooks.remove(hook)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latencies.clear()
+
+    @property
+    def statistics(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean and percentiles in milliseconds of the recent latencies per stage."""
+        with self._lock:
+            snapshot = {
+                stage: sorted(latencies) for stage, latencies in self._latencies.items()
+            }
+        return {
+            stage: {
+                "count": len(latencies),
+                "mean_ms": sum(latencies) / len(latencies) * 1000,
+                "p50_ms": _percentile(latencies, 0.50) * 1000,
+                "p95_ms": _percentile(latencies, 0.95) * 1000,
+                "p99_ms": _percentile(latencies, 0.99) * 1000,
+            }
+            for stage, latencies in snapshot.items()
+        }
+
+    @property
+    def hooks(self) -> List[Callable[[Dict[str, float]], None]]:
+        return self._hooks
+
+
+class _MeasuredRetrieval:
+    __slots__ = ("_recorder", "_token", "_start")
+
+    def __init__(self, recorder: ServingLatencyRecorder):
+        self._recorder = recorder
+
+    def __enter__(self) -> None:
+        # nested retrievals, e.g. the batch path calling the single path, are measured once
+        if _current_breakdown.get() is not None:
+            self._token = None
+            return
+        self._token = _current_breakdown.set({})
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if self._token is None:
+            return
+        breakdown = _current_breakdown.get()
+        _current_breakdown.reset(self._token)
+        # failed retrievals would skew the latencies
+        if exc_type is None:
+            breakdown[TOTAL] = time.perf_counter() - self._start
+            self._recorder.record(breakdown)
+
+
+class _MeasuredStage:
+    __slots__ = ("_stage", "_breakdown", "_start")
+
+    def __init__(self, stage: str):
+        self._stage = stage
+
+    def __enter__(self) -> None:
+        self._breakdown = _current_breakdown.get()
+        if self._breakdown is not None:
+            self._start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        if self._breakdown is not None:
+            latency = time.perf_counter() - self._start
+            self._breakdown[self._stage] = (
+                self._breakdown.get(self._stage, 0.0) + latency
+            )
+
+
+def _percentile(sorted_values: List[float], quantile: float) -> float:
+    return sorted_values[
+        min(int(quantile * len(sorted_values)), len(sorted_values) - 1)
+    ]
@@ -15,12 +15,21 @@
 #
 from __future__ import annotations
 
-from typing import Any, Dict
+import hashlib
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 from hsfs import client, storage_connector
 
 
 class StorageConnectorApi:
+    # online connectors are cached per project, user and feature store for repeated online reads,
+    # as they carry the credentials of the user
+    _online_connectors: Dict[
+        Tuple[int, str, int], storage_connector.OnlineStorageConnector
+    ] = {}
+    _online_connectors_lock = threading.Lock()
+
     def _get(self, feature_store_id: int, name: str) -> Dict[str, Any]:
         """Returning response dict instead of initialized object."""
         _client = client.get_instance()
@@ -82,6 +91,33 @@ class StorageConnectorApi:
             _client._send_request("GET", path_params)
         )
 
+    def get_cached_online_connector(
+        self, feature_store_id: int
+    ) -> storage_connector.OnlineStorageConnector:
+        _client = client.get_instance()
+        # identify the user by a digest of the client credentials, not the credentials themselves
+        user_digest = hashlib.sha256(
+            str(getattr(_client._auth, "_token", "")).encode()
+        ).hexdigest()
+        key = (_client._project_id, user_digest, feature_store_id)
+        with self._online_connectors_lock:
+            if key in self._online_connectors:
+                return self._online_connectors[key]
+        online_connector = self.get_online_connector(feature_store_id)
+        with self._online_connectors_lock:
+            self._online_connectors[key] = online_connector
+        return online_connector
+
+    @classmethod
+    def invalidate_online_connector(
+        cls, feature_store_id: Optional[int] = None
+    ) -> None:
+        """Drop the cached online connectors of the feature store, or of all feature stores."""
+        with cls._online_connectors_lock:
+            for key in list(cls._online_connectors):
+                if feature_store_id is None or key[-1] == feature_store_id:
+                    del cls._online_connectors[key]
+
     def get_kafka_connector(
         self, feature_store_id: int, external: bool = False
     ) -> storage_connector.KafkaConnector:
@@ -0,0 +1,247 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+
+_logger = logging.getLogger(__name__)
+
+
+class TrainingDatasetCache:
+    """Local on-disk cache of materialized training datasets, for the python engine.
+
+    Every split is stored as an Arrow IPC file under
+    `<dir>/<feature view name>_<feature view version>/td_<training dataset version>/`,
+    which is memory-mapped when read back. Polars frames and the numeric columns without nulls
+    of pandas frames are read without copying the data, other pandas columns are copied.
+    An entry is only served if it was written for the same training dataset metadata, otherwise
+    it is dropped and the data is read again from the storage connector. Once the files in the
+    cache exceed `max_size` bytes, the least recently read ones are evicted.
+    Recreating or deleting a training dataset drops its entries from the caches used in this process.
+    """
+
+    DIR_KEY = "dir"
+    MAX_SIZE_KEY = "max_size"
+    DEFAULT_MAX_SIZE = 10 * 1024**3
+    METADATA_FILE = "_metadata.json"
+    FILE_SUFFIX = ".arrow"
+
+    # cache directories used in this process, to invalidate them when training data changes
+    _dirs: Set[Path] = set()
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_dir: Union[str, os.PathLike],
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        if max_size <= 0:
+            raise ValueError(
+                "Training dataset cache `max_size` must be a positive number of bytes."
+            )
+        self._dir = Path(cache_dir).expanduser()
+        self._max_size = max_size
+        with self._lock:
+            self._dirs.add(self._dir)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> TrainingDatasetCache:
+        unknown_keys = set(config.keys()) - {cls.DIR_KEY, cls.MAX_SIZE_KEY}
+        if unknown_keys:
+            raise ValueError(
+                f"Unknown training dataset cache configuration options: {sorted(unknown_keys)}. "
+                f"Supported options are '{cls.DIR_KEY}' and '{cls.MAX_SIZE_KEY}'."
+            )
+        if not config.get(cls.DIR_KEY):
+            raise ValueError(
+                f"Training dataset cache requires the '{cls.DIR_KEY}' option."
+            )
+        return cls(
+            config[cls.DIR_KEY],
+            max_size=config.get(cls.MAX_SIZE_KEY, cls.DEFAULT_MAX_SIZE),
+        )
+
+    def get(
+        self,
+        feature_view_obj,
+        training_dataset_obj,
+        split: str,
+        dataframe_type: str = "default",
+        columns: Optional[List[str]] = None,
+    ) -> Optional[Union[pd.DataFrame, pl.DataFrame]]:
+        """Return the cached split or None if it is not cached or no longer valid."""
+        entry_dir = self._entry_dir(feature_view_obj, training_dataset_obj)
+        path = entry_dir / self._file_name(split, columns)
+        with self._lock:
+            if not self._is_valid(entry_dir, training_dataset_obj):
+                return None
+            try:
+                # update the modification time, which orders the entries for eviction
+                os.utime(path)
+                source = pa.memory_map(str(path), "r")
+            except FileNotFoundError:
+                return None
+        _logger.debug("Reading training dataset split from cache %s.", path)
+        # the returned columns keep the mapped region alive after the file is closed
+        with source:
+            table = pa.ipc.open_file(source).read_all()
+            if dataframe_type.lower() == "polars":
+                return pl.from_arrow(table)
+            # only numeric columns without nulls stay zero-copy in pandas, the others are
+            # copied one at a time while the table releases its buffers
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def put(
+        self,
+        feature_view_obj,
+        training_dataset_obj,
+        split: str,
+        df: Union[pd.DataFrame, pl.DataFrame],
+        columns: Optional[List[str]] = None,
+    ) -> None:
+        if isinstance(df, pl.DataFrame):
+            table = df.to_arrow()
+        else:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        entry_dir = self._entry_dir(feature_view_obj, training_dataset_obj)
+        path = entry_dir / self._file_name(split, columns)
+        with self._lock:
+            if not self._is_valid(entry_dir, training_dataset_obj):
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                entry_dir.mkdir(parents=True, exist_ok=True)
+                (entry_dir / self.METADATA_FILE).write_text(
+                    self._fingerprint(training_dataset_obj)
+                )
+            # write to a temporary file first, so that concurrent readers never see partial files
+            fd, tmp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+                size = os.path.getsize(tmp_path)
+                if size > self._max_size:
+                    _logger.debug(
+                        "Training dataset split of %d bytes exceeds the cache size, not caching it.",
+                        size,
+                    )
+                    os.remove(tmp_path)
+                    return
+                self._evict(size, exclude=path)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+    @classmethod
+    def invalidate(
+        cls, feature_view_obj, training_dataset_version: Optional[int] = None
+    ) -> None:
+        """Remove the cached splits of a training dataset version, or of all versions,
+        from the caches used in this process, e.g. after recreating or deleting them."""
+        with cls._lock:
+            for cache_dir in cls._dirs:
+                path = cls._feature_view_dir(cache_dir, feature_view_obj)
+                if training_dataset_version is not None:
+                    path = path / f"td_{training_dataset_version}"
+                _logger.debug("Invalidating training dataset cache entry %s.", path)
+                shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def _feature_view_dir(cache_dir: Path, feature_view_obj) -> Path:
+        return cache_dir / f"{feature_view_obj.name}_{feature_view_obj.version}"
+
+    def _entry_dir(self, feature_view_obj, training_dataset_obj) -> Path:
+        return (
+            self._feature_view_dir(self._dir, feature_view_obj)
+            / f"td_{training_dataset_obj.version}"
+        )
+
+    def _file_name(self, split: str, columns: Optional[List[str]]) -> str:
+        if columns is None:
+            return split + self.FILE_SUFFIX
+        # projected reads are cached separately from the full split
+        digest = hashlib.sha1(json.dumps(list(columns)).encode()).hexdigest()[:12]
+        return f"{split}-{digest}{self.FILE_SUFFIX}"
+
+    def _fingerprint(self, training_dataset_obj) -> str:
+        return json.dumps(
+            {
+                "id": training_dataset_obj.id,
+                "version": training_dataset_obj.version,
+                "location": training_dataset_obj.location,
+                "data_format": training_dataset_obj.data_format,
+                "seed": training_dataset_obj.seed,
+                "event_start_time": training_dataset_obj.event_start_time,
+                "event_end_time": training_dataset_obj.event_end_time,
+                "splits": [split.to_dict() for split in training_dataset_obj.splits],
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+    def _is_valid(self, entry_dir: Path, training_dataset_obj) -> bool:
+        try:
+            fingerprint = (entry_dir / self.METADATA_FILE).read_text()
+        except FileNotFoundError:
+            return False
+        if fingerprint != self._fingerprint(training_dataset_obj):
+            _logger.debug(
+                "Training dataset metadata changed, dropping cache entry %s.", entry_dir
+            )
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return False
+        return True
+
+    def _evict(self, reserve: int, exclude: Path) -> None:
+        files = []
+        for path in self._dir.rglob("*" + self.FILE_SUFFIX):
+            if path == exclude:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda file: file[0]):
+            if total + reserve <= self._max_size:
+                break
+            _logger.debug("Evicting %s from the training dataset cache.", path)
+            # files that are memory-mapped by another reader stay readable until unmapped
+            path.unlink(missing_ok=True)
+            total -= size
+
+    @property
+    def dir(self) -> Path:
+        return self._dir
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
@@ -35,7 +35,8 @@ class VectorDbClient:
         Filter.LE: "lte",
     }
     _index_result_limit_k = dict()
-    _index_result_limit_n = dict()
+    DEFAULT_READ_BATCH_SIZE = 1000
+    SCROLL_KEEP_ALIVE = "1m"
 
     def __init__(self, query, serving_keys=None):
         self._opensearch_client = None
@@ -113,21 +114,136 @@ class VectorDbClient:
         filter: Union[Filter, Logic] = None,
         options=None,
     ):
+        embedding_feature, col_name, index_name, query = self._prepare_find_neighbors(
+            embedding, feature, index_name, k, filter
+        )
+
+        results = self._opensearch_client.search(
+            body=query, index=index_name, options=options
+        )
+
+        # When using project index (`embedding_feature.embedding_index.col_prefix` is not empty), sometimes the total number of result returned is less than k. Possible reason is that when using project index, some embedding columns have null value if the row is from a different feature group. And opensearch filter out the result where embedding is null after retrieving the top k results. So search 3 times more data if it is using project index and size of result is not k.
+        if (
+            embedding_feature.embedding_index.col_prefix
+            and len(results["hits"]["hits"]) != k
+        ):
+            self._get_index_result_limit_k(index_name, query, col_name, options)
+            query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = min(
+                VectorDbClient._index_result_limit_k.get(index_name, k), 3 * k
+            )
+            results = self._opensearch_client.search(
+                body=query, index=index_name, options=options
+            )
+
+        return self._convert_neighbors(results, embedding_feature)
+
+    async def find_neighbors_async(
+        self,
+        embedding,
+        feature: Feature = None,
+        index_name=None,
+        k=10,
+        filter: Union[Filter, Logic] = None,
+        options=None,
+    ):
+        """Find the nearest neighbors of an embedding with the async client of the vector database.
+
+        Searches of concurrent calls, e.g. gathered with `asyncio.gather`, run concurrently over the
+        connection pool of the client.
+        """
+        embedding_feature, col_name, index_name, query = self._prepare_find_neighbors(
+            embedding, feature, index_name, k, filter
+        )
+
+        results = await self._opensearch_client.search_async(
+            body=query, index=index_name, options=options
+        )
+
+        # see `find_neighbors`
+        if (
+            embedding_feature.embedding_index.col_prefix
+            and len(results["hits"]["hits"]) != k
+        ):
+            # the limit is requested once per index and cached, so the blocking request is acceptable
+            self._get_index_result_limit_k(index_name, query, col_name, options)
+            query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = min(
+                VectorDbClient._index_result_limit_k.get(index_name, k), 3 * k
+            )
+            results = await self._opensearch_client.search_async(
+                body=query, index=index_name, options=options
+            )
+
+        return self._convert_neighbors(results, embedding_feature)
+
+    def find_neighbors_batch(
+        self,
+        embeddings: List[List[Union[int, float]]],
+        feature: Feature = None,
+        index_name=None,
+        k=10,
+        filter: Union[Filter, Logic] = None,
+        options=None,
+    ) -> List[List[Tuple[float, Dict[str, Any]]]]:
+        """Find the nearest neighbors of several embeddings with a single multi search request.
+
+        Returns the `(score, result)` pairs of the neighbors per embedding, in the order of `embeddings`.
+        """
+        if len(embeddings) == 0:
+            return []
+        embedding_feature = self._get_embedding_feature(feature)
+        self._check_filter(filter, embedding_feature.feature_group)
+        col_name = embedding_feature.embedding_index.col_prefix + embedding_feature.name
+        if not index_name:
+            index_name = embedding_feature.embedding_index.index_name
+
+        knn_k = k
+        if embedding_feature.embedding_index.col_prefix:
+            # Results of the project index are filtered after the knn search, see `find_neighbors`.
+            # Search 3 times more data upfront instead of searching again for every short result.
+            self._get_index_result_limit_k(
+                index_name,
+                self._build_knn_query(embeddings[0], embedding_feature, k, filter),
+                col_name,
+                options,
+            )
+            knn_k = min(VectorDbClient._index_result_limit_k.get(index_name, k), 3 * k)
+
+        body = []
+        for embedding in embeddings:
+            query = self._build_knn_query(embedding, embedding_feature, k, filter)
+            query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = knn_k
+            body += [{}, query]
+        responses = self._opensearch_client.msearch(
+            body=body, index=index_name, options=options
+        )
+        return [
+            self._convert_neighbors(results, embedding_feature) for results in responses
+        ]
+
+    def _prepare_find_neighbors(self, embedding, feature, index_name, k, filter):
+        embedding_feature = self._get_embedding_feature(feature)
+        self._check_filter(filter, embedding_feature.feature_group)
+        col_name = embedding_feature.embedding_index.col_prefix + embedding_feature.name
+        query = self._build_knn_query(embedding, embedding_feature, k, filter)
+        if not index_name:
+            index_name = embedding_feature.embedding_index.index_name
+        return embedding_feature, col_name, index_name, query
+
+    def _get_embedding_feature(self, feature: Optional[Feature]):
         if not feature:
             if not self._embedding_features:
                 raise ValueError("embedding col is not defined.")
             if len(self._embedding_features) > 1:
                 raise ValueError("More than 1 embedding columns but col is not defined")
-            embedding_feature = list(self._embedding_features.values())[0]
-        else:
-            embedding_feature = self._embedding_features.get(feature, None)
-            if embedding_feature is None:
-                raise ValueError(
-                    f"feature: {feature.name} is not an embedding feature."
-                )
-        self._check_filter(filter, embedding_feature.feature_group)
+            return list(self._embedding_features.values())[0]
+        embedding_feature = self._embedding_features.get(feature, None)
+        if embedding_feature is None:
+            raise ValueError(f"feature: {feature.name} is not an embedding feature.")
+        return embedding_feature
+
+    def _build_knn_query(self, embedding, embedding_feature, k, filter):
         col_name = embedding_feature.embedding_index.col_prefix + embedding_feature.name
-        query = {
+        return {
             "size": k,
             "query": {
                 "bool": {
@@ -146,47 +262,36 @@ class VectorDbClient:
                 ).keys()
             ),
         }
-        if not index_name:
-            index_name = embedding_feature.embedding_index.index_name
 
-        results = self._opensearch_client.search(
-            body=query, index=index_name, options=options
-        )
-
-        # When using project index (`embedding_feature.embedding_index.col_prefix` is not empty), sometimes the total number of result returned is less than k. Possible reason is that when using project index, some embedding columns have null value if the row is from a different feature group. And opensearch filter out the result where embedding is null after retrieving the top k results. So search 3 times more data if it is using project index and size of result is not k.
-        if (
-            embedding_feature.embedding_index.col_prefix
-            and len(results["hits"]["hits"]) != k
-        ):
-            # Get the max number of results allowed to request if it is not available.
-            # This is expected to be executed once only.
-            if not VectorDbClient._index_result_limit_k.get(index_name):
-                query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = 2**31 - 1
-                try:
-                    # It is expected that this request ALWAYS fails because requested k is too large.
-                    # The purpose here is to get the max k allowed from the vector database, and cache it.
-                    self._opensearch_client.search(
-                        body=query, index=index_name, options=options
+    def _get_index_result_limit_k(self, index_name, query, col_name, options=None):
+        # Get the max number of results allowed to request if it is not available.
+        # This is expected to be executed once only.
+        if not VectorDbClient._index_result_limit_k.get(index_name):
+            k = query["query"]["bool"]["must"][0]["knn"][col_name]["k"]
+            query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = 2**31 - 1
+            try:
+                # It is expected that this request ALWAYS fails because requested k is too large.
+                # The purpose here is to get the max k allowed from the vector database, and cache it.
+                self._opensearch_client.search(
+                    body=query, index=index_name, options=options
+                )
+            except VectorDatabaseException as e:
+                if (
+                    e.reason == VectorDatabaseException.REQUESTED_K_TOO_LARGE
+                    and e.info.get(
+                        VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K
                     )
-                except VectorDatabaseException as e:
-                    if (
-                        e.reason == VectorDatabaseException.REQUESTED_K_TOO_LARGE
-                        and e.info.get(
-                            VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K
-                        )
-                    ):
-                        VectorDbClient._index_result_limit_k[index_name] = e.info.get(
-                            VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K
-                        )
-                    else:
-                        raise e
-            query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = min(
-                VectorDbClient._index_result_limit_k.get(index_name, k), 3 * k
-            )
-            results = self._opensearch_client.search(
-                body=query, index=index_name, options=options
-            )
+                ):
+                    VectorDbClient._index_result_limit_k[index_name] = e.info.get(
+                        VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K
+                    )
+                else:
+                    raise e
+            finally:
+                query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = k
+        return VectorDbClient._index_result_limit_k.get(index_name)
 
+    def _convert_neighbors(self, results, embedding_feature):
         # https://opensearch.org/docs/latest/search-plugins/knn/approximate-knn/#spaces
         return [
             (
@@ -334,26 +439,43 @@ class VectorDbClient:
                 "size": n,
             }
             if n is None:
-                if VectorDbClient._index_result_limit_n.get(index_name) is None:
-                    try:
-                        query["size"] = 2**31 - 1
-                        self._opensearch_client.search(body=query,
-                                                             index=index_name)
-                    except VectorDatabaseException as e:
-                        if (
-                            e.reason == VectorDatabaseException.REQUESTED_NUM_RESULT_TOO_LARGE
-                            and e.info.get(
-                            VectorDatabaseException.REQUESTED_NUM_RESULT_TOO_LARGE_INFO_N
-                        )
-                        ):
-                            VectorDbClient._index_result_limit_n[index_name] = e.info.get(
-                                VectorDatabaseException.REQUESTED_NUM_RESULT_TOO_LARGE_INFO_N
-                            )
-                        else:
-                            raise e
-                query["size"] = VectorDbClient._index_result_limit_n.get(index_name)
+                # page through the whole index instead of truncating it at the max result window
+                return [
+                    row
+                    for batch in self.read_batches(
+                        fg_id, schema, pk, index_name=index_name
+                    )
+                    for row in batch
+                ]
         query["_source"] = list(self._fg_vdb_col_fg_col_map.get(fg_id).keys())
         results = self._opensearch_client.search(body=query, index=index_name)
+        return self._convert_read_results(fg_id, schema, results)
+
+    async def read_async(self, fg_id, schema, keys, index_name=None):
+        """Read the documents matching the `keys` with the async client of the vector database."""
+        if fg_id not in self._fg_vdb_col_fg_col_map:
+            raise FeatureStoreException("Provided fg does not have embedding.")
+        if not index_name:
+            index_name = self._get_vector_db_index_name(fg_id)
+        query = {
+            "query": {
+                "bool": {
+                    "must": [
+                        {"match": {key: value}}
+                        for key, value in self._rewrite_result_key(
+                            keys, self._fg_col_vdb_col_map[fg_id]
+                        ).items()
+                    ]
+                }
+            },
+            "_source": list(self._fg_vdb_col_fg_col_map.get(fg_id).keys()),
+        }
+        results = await self._opensearch_client.search_async(
+            body=query, index=index_name
+        )
+        return self._convert_read_results(fg_id, schema, results)
+
+    def _convert_read_results(self, fg_id, schema, results):
         # https://opensearch.org/docs/latest/search-plugins/knn/approximate-knn/#spaces
         return [
             self._convert_to_pandas_type(schema, self._rewrite_result_key(
@@ -362,6 +484,56 @@ class VectorDbClient:
             for item in results["hits"]["hits"]
         ]
 
+    def get_pool_statistics(self):
+        """Get the state of the connection pools of the vector database client."""
+        return self._opensearch_client.get_pool_statistics()
+
+    def read_batches(
+        self,
+        fg_id,
+        schema,
+        pk,
+        index_name=None,
+        batch_size=DEFAULT_READ_BATCH_SIZE,
+        options=None,
+    ):
+        """Read all documents of the index of the feature group in batches of `batch_size` rows.
+
+        The index is paged through with a scroll, so only one batch is held in memory at
+        a time and the read is not limited by the max result window of the index.
+        """
+        if fg_id not in self._fg_vdb_col_fg_col_map:
+            raise FeatureStoreException("Provided fg does not have embedding.")
+        if not pk:
+            raise FeatureStoreException("No pk provided.")
+        if batch_size <= 0:
+            raise ValueError("`batch_size` must be a positive integer.")
+        if not index_name:
+            index_name = self._get_vector_db_index_name(fg_id)
+        query = {
+            "query": {"bool": {"must": {"exists": {"field": pk}}}},
+            "size": batch_size,
+            # index order is the cheapest order to scroll in
+            "sort": ["_doc"],
+            "_source": list(self._fg_vdb_col_fg_col_map.get(fg_id).keys()),
+        }
+        results = self._opensearch_client.scroll_search(
+            index=index_name, body=query, scroll=self.SCROLL_KEEP_ALIVE, options=options
+        )
+        scroll_id = results.get("_scroll_id")
+        try:
+            while results["hits"]["hits"]:
+                yield self._convert_read_results(fg_id, schema, results)
+                if len(results["hits"]["hits"]) < batch_size:
+                    break
+                results = self._opensearch_client.scroll(
+                    scroll_id, scroll=self.SCROLL_KEEP_ALIVE, options=options
+                )
+                scroll_id = results.get("_scroll_id", scroll_id)
+        finally:
+            if scroll_id:
+                self._opensearch_client.clear_scroll(scroll_id)
+
     @staticmethod
     def read_feature_group(feature_group: "hsfs.feature_group.FeatureGroup", n: int =None) -> list:
         if feature_group.embedding_index:
@@ -377,6 +549,28 @@ class VectorDbClient:
         else:
             raise FeatureStoreException("Feature group does not have embedding.")
 
+    @staticmethod
+    def read_feature_group_batches(
+        feature_group: "hsfs.feature_group.FeatureGroup",
+        batch_size: int = DEFAULT_READ_BATCH_SIZE,
+    ):
+        if feature_group.embedding_index:
+            vector_db_client = VectorDbClient(feature_group.select_all())
+            for results in vector_db_client.read_batches(
+                feature_group.id,
+                feature_group.features,
+                pk=feature_group.embedding_index.col_prefix
+                + feature_group.primary_key[0],
+                index_name=feature_group.embedding_index.index_name,
+                batch_size=batch_size,
+            ):
+                yield [
+                    [result[f.name] for f in feature_group.features]
+                    for result in results
+                ]
+        else:
+            raise FeatureStoreException("Feature group does not have embedding.")
+
     def count(self, fg, options=None):
         query = {
             "query": {
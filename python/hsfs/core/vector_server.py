@@ -15,13 +15,29 @@
 #
 from __future__ import annotations
 
+import functools
+import inspect
 import itertools
+import json
 import logging
+import time
 import warnings
 from base64 import b64decode
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from io import BytesIO
-from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import avro.io
 import avro.schema
@@ -40,8 +56,11 @@ from hsfs import (
 from hsfs import training_dataset_feature as tdf_mod
 from hsfs.client import exceptions, online_store_rest_client
 from hsfs.core import (
+    feature_vector_cache,
+    online_client_selector,
     online_store_rest_client_engine,
     online_store_sql_engine,
+    serving_latency,
 )
 from hsfs.core import (
     transformation_function_engine as tf_engine_mod,
@@ -50,7 +69,7 @@ from hsfs.core import (
 
 HAS_FASTAVRO = False
 try:
-    from fastavro import schemaless_reader
+    from fastavro import parse_schema, schemaless_reader
 
     HAS_FASTAVRO = True
 except ImportError:
@@ -59,9 +78,100 @@ except ImportError:
 _logger = logging.getLogger(__name__)
 
 
+def _measure_retrieval(func: Callable) -> Callable:
+    """Record the latency breakdown of the decorated retrieval if serving latency instrumentation is enabled."""
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if self._serving_latency_recorder is None:
+                return await func(self, *args, **kwargs)
+            with self._serving_latency_recorder.measure():
+                return await func(self, *args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._serving_latency_recorder is None:
+            return func(self, *args, **kwargs)
+        with self._serving_latency_recorder.measure():
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+@dataclass(frozen=True)
+class EntryValidationPlan:
+    """Serving key lookups compiled once per feature view to validate entries without building sets per entry."""
+
+    # required serving keys and feature names of the serving keys
+    valid_serving_keys: FrozenSet[str]
+    # required serving keys of the feature groups fetched from RonDB
+    rondb_serving_keys: FrozenSet[str]
+    # (required serving key, feature name) pairs of feature groups with composite serving keys
+    composite_serving_key_groups: Tuple[Tuple[Tuple[str, str], ...], ...]
+    # required serving key, feature name and names of the features fetched with it
+    serving_key_features: Tuple[Tuple[str, str, FrozenSet[str]], ...]
+
+
+class ComplexFeatureDecoder:
+    """Deserializes the avro encoded values of a complex feature.
+
+    The avro schema is parsed once. Values are decoded one at a time by calling the decoder, or
+    a whole column at once with `decode_batch`, which reads all values from a single buffer.
+    """
+
+    def __init__(self, avro_schema: str):
+        if HAS_FASTAVRO:
+            self._fastavro_schema = parse_schema(json.loads(avro_schema))
+        else:
+            self._datum_reader = avro.io.DatumReader(avro.schema.parse(avro_schema))
+
+    def __call__(self, feature_value: Any) -> Any:
+        # embedded features are deserialized already but not complex features stored in Opensearch
+        if not isinstance(feature_value, (bytes, str)):
+            return feature_value
+        return self._read(BytesIO(self._to_bytes(feature_value)), 1)[0]
+
+    def decode_batch(self, feature_values: List[Any]) -> List[Any]:
+        encoded_indices = [
+            idx
+            for idx, feature_value in enumerate(feature_values)
+            if isinstance(feature_value, (bytes, str))
+        ]
+        if len(encoded_indices) == 0:
+            return feature_values
+        # schemaless values are not delimited, each read consumes exactly one value
+        buffer = BytesIO(
+            b"".join(self._to_bytes(feature_values[idx]) for idx in encoded_indices)
+        )
+        decoded_values = list(feature_values)
+        for idx, decoded_value in zip(
+            encoded_indices, self._read(buffer, len(encoded_indices))
+        ):
+            decoded_values[idx] = decoded_value
+        return decoded_values
+
+    def _read(self, buffer: BytesIO, n: int) -> List[Any]:
+        if HAS_FASTAVRO:
+            return [schemaless_reader(buffer, self._fastavro_schema) for _ in range(n)]
+        decoder = BinaryDecoder(buffer)
+        return [self._datum_reader.read(decoder) for _ in range(n)]
+
+    @staticmethod
+    def _to_bytes(feature_value: Union[bytes, str]) -> bytes:
+        return (
+            feature_value
+            if isinstance(feature_value, bytes)
+            else b64decode(feature_value)
+        )
+
+
 class VectorServer:
     DEFAULT_REST_CLIENT = "rest"
     DEFAULT_SQL_CLIENT = "sql"
+    AUTO_CLIENT = "auto"
     # Compatibility with 3.7
     DEFAULT_CLIENT_KEY = "default_online_store_client"
     REST_CLIENT_CONFIG_OPTIONS_KEY = "config_online_store_rest_client"
@@ -124,11 +234,22 @@ class VectorServer:
         self._rest_client_engine = None
         self._init_rest_client: Optional[bool] = None
         self._init_sql_client: Optional[bool] = None
-        self._default_client: Optional[Literal["rest", "sql"]] = None
+        self._default_client: Optional[Literal["rest", "sql", "auto"]] = None
+        self._online_client_selector: Optional[
+            online_client_selector.OnlineClientSelector
+        ] = None
         self._return_feature_value_handlers: Dict[str, Callable] = {}
+        self._return_feature_value_batch_handlers: Dict[str, Callable] = {}
         self._feature_to_handle_if_rest: Optional[Set[str]] = None
         self._feature_to_handle_if_sql: Optional[Set[str]] = None
         self._valid_serving_keys: Set[str] = set()
+        self._entry_validation_plan: Optional[EntryValidationPlan] = None
+        self._feature_vector_cache: Optional[
+            feature_vector_cache.FeatureVectorCache
+        ] = None
+        self._serving_latency_recorder: Optional[
+            serving_latency.ServingLatencyRecorder
+        ] = None
 
     def init_serving(
         self,
@@ -140,7 +261,9 @@ class VectorServer:
         init_rest_client: bool = False,
         reset_rest_client: bool = False,
         config_rest_client: Optional[Dict[str, Any]] = None,
-        default_client: Optional[Literal["rest", "sql"]] = None,
+        default_client: Optional[Literal["rest", "sql", "auto"]] = None,
+        config_feature_vector_cache: Optional[Dict[str, Any]] = None,
+        config_serving_latency: Optional[Dict[str, Any]] = None,
     ):
         if options is not None:
             reset_rest_client = reset_rest_client or options.get(
@@ -163,6 +286,8 @@ class VectorServer:
             init_sql_client=init_sql_client,
             default_client=default_client,
         )
+        self.init_feature_vector_cache(config_feature_vector_cache)
+        self.init_serving_latency_recorder(config_serving_latency)
 
         if external is None:
             external = isinstance(client.get_instance(), client.external.Client)
@@ -170,6 +295,7 @@ class VectorServer:
         # has to be done successfully before it is able to fetch feature vectors.
         self.init_transformation(entity)
         self.set_return_feature_value_handlers(features=entity.features)
+        self.init_entry_validation_plan()
 
         if self._init_rest_client:
             self.setup_rest_client_and_engine(
@@ -186,6 +312,57 @@ class VectorServer:
                 options=options,
             )
 
+    def init_feature_vector_cache(
+        self, config_feature_vector_cache: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if config_feature_vector_cache is None:
+            self._feature_vector_cache = None
+            return
+        _logger.debug(
+            "Initialising feature vector cache with config: %s",
+            config_feature_vector_cache,
+        )
+        self._feature_vector_cache = (
+            feature_vector_cache.FeatureVectorCache.from_config(
+                config_feature_vector_cache
+            )
+        )
+
+    def init_serving_latency_recorder(
+        self, config_serving_latency: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if config_serving_latency is None:
+            self._serving_latency_recorder = None
+            return
+        _logger.debug(
+            "Initialising serving latency recorder with config: %s",
+            config_serving_latency,
+        )
+        self._serving_latency_recorder = (
+            serving_latency.ServingLatencyRecorder.from_config(config_serving_latency)
+        )
+
+    def init_entry_validation_plan(self) -> EntryValidationPlan:
+        _logger.debug("Compiling entry validation plan.")
+        self._entry_validation_plan = EntryValidationPlan(
+            valid_serving_keys=frozenset(self.valid_serving_keys),
+            rondb_serving_keys=frozenset(self.rondb_serving_keys),
+            composite_serving_key_groups=tuple(
+                tuple(composite_group)
+                for composite_group in self.groups_of_composite_serving_keys.values()
+                # a single serving key is always either present or not
+                if len(composite_group) > 1
+            ),
+            serving_key_features=tuple(
+                (sk_name, sk_no_prefix, frozenset(fetched_features))
+                for sk_name, (
+                    sk_no_prefix,
+                    fetched_features,
+                ) in self.per_serving_key_features.items()
+            ),
+        )
+        return self._entry_validation_plan
+
     def init_batch_scoring(
         self,
         entity: Union[feature_view.FeatureView, training_dataset.TrainingDataset],
@@ -302,6 +479,7 @@ class VectorServer:
             )
             raise exceptions.FeatureStoreException(error)
 
+    @_measure_retrieval
     def get_feature_vector(
         self,
         entry: Dict[str, Any],
@@ -318,26 +496,130 @@ class VectorServer:
         online_client_choice = self.which_client_and_ensure_initialised(
             force_rest_client=force_rest_client, force_sql_client=force_sql_client
         )
-        rondb_entry = self.validate_entry(
-            entry=entry,
-            allow_missing=allow_missing,
-            passed_features=passed_features,
-            vector_db_features=vector_db_features,
-        )
+        with serving_latency.measure_stage(serving_latency.VALIDATE_ENTRY):
+            rondb_entry = self.validate_entry(
+                entry=entry,
+                allow_missing=allow_missing,
+                passed_features=passed_features,
+                vector_db_features=vector_db_features,
+            )
         if len(rondb_entry) == 0:
             _logger.debug("Empty entry for rondb, skipping fetching.")
             serving_vector = {}  # updated below with vector_db_features and passed_features
-        elif online_client_choice == self.DEFAULT_REST_CLIENT:
+        else:
+            serving_vector = self._get_cached_serving_vector(
+                rondb_entry, online_client_choice
+            )
+
+        fetch_start = time.perf_counter()
+        if serving_vector is None and online_client_choice == self.DEFAULT_REST_CLIENT:
             _logger.debug("get_feature_vector Online REST client")
             serving_vector = self.rest_client_engine.get_single_feature_vector(
                 rondb_entry,
                 drop_missing=not allow_missing,
                 return_type=self.rest_client_engine.RETURN_TYPE_FEATURE_VALUE_DICT,
             )
-        else:
+            self._record_fetch_latency(online_client_choice, 1, fetch_start)
+            self._cache_serving_vector(
+                rondb_entry, online_client_choice, serving_vector
+            )
+        elif serving_vector is None:
             _logger.debug("get_feature_vector Online SQL client")
             serving_vector = self.sql_client.get_single_feature_vector(rondb_entry)
+            self._record_fetch_latency(online_client_choice, 1, fetch_start)
+            self._cache_serving_vector(
+                rondb_entry, online_client_choice, serving_vector
+            )
+
+        return self._build_feature_vector(
+            serving_vector,
+            return_type=return_type,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            allow_missing=allow_missing,
+            online_client_choice=online_client_choice,
+            transformed=transformed,
+            request_parameters=request_parameters,
+        )
 
+    @_measure_retrieval
+    async def get_feature_vector_async(
+        self,
+        entry: Dict[str, Any],
+        return_type: Union[Literal["list", "numpy", "pandas", "polars"]],
+        passed_features: Optional[Dict[str, Any]] = None,
+        vector_db_features: Optional[Dict[str, Any]] = None,
+        allow_missing: bool = False,
+        force_rest_client: bool = False,
+        force_sql_client: bool = False,
+        transformed=True,
+        request_parameters: Optional[Dict[str, Any]] = None,
+    ) -> Union[pd.DataFrame, pl.DataFrame, np.ndarray, List[Any], Dict[str, Any]]:
+        """Assembles serving vector from online feature store without blocking the running event loop."""
+        online_client_choice = self.which_client_and_ensure_initialised(
+            force_rest_client=force_rest_client, force_sql_client=force_sql_client
+        )
+        with serving_latency.measure_stage(serving_latency.VALIDATE_ENTRY):
+            rondb_entry = self.validate_entry(
+                entry=entry,
+                allow_missing=allow_missing,
+                passed_features=passed_features,
+                vector_db_features=vector_db_features,
+            )
+        if len(rondb_entry) == 0:
+            _logger.debug("Empty entry for rondb, skipping fetching.")
+            serving_vector = {}  # updated below with vector_db_features and passed_features
+        else:
+            serving_vector = self._get_cached_serving_vector(
+                rondb_entry, online_client_choice
+            )
+
+        fetch_start = time.perf_counter()
+        if serving_vector is None and online_client_choice == self.DEFAULT_REST_CLIENT:
+            _logger.debug("get_feature_vector_async Online REST client")
+            serving_vector = (
+                await self.rest_client_engine.get_single_feature_vector_async(
+                    rondb_entry,
+                    drop_missing=not allow_missing,
+                    return_type=self.rest_client_engine.RETURN_TYPE_FEATURE_VALUE_DICT,
+                )
+            )
+            self._record_fetch_latency(online_client_choice, 1, fetch_start)
+            self._cache_serving_vector(
+                rondb_entry, online_client_choice, serving_vector
+            )
+        elif serving_vector is None:
+            _logger.debug("get_feature_vector_async Online SQL client")
+            serving_vector = await self.sql_client.get_single_feature_vector_async(
+                rondb_entry
+            )
+            self._record_fetch_latency(online_client_choice, 1, fetch_start)
+            self._cache_serving_vector(
+                rondb_entry, online_client_choice, serving_vector
+            )
+
+        return self._build_feature_vector(
+            serving_vector,
+            return_type=return_type,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            allow_missing=allow_missing,
+            online_client_choice=online_client_choice,
+            transformed=transformed,
+            request_parameters=request_parameters,
+        )
+
+    def _build_feature_vector(
+        self,
+        serving_vector: Dict[str, Any],
+        return_type: Union[Literal["list", "numpy", "pandas", "polars"]],
+        passed_features: Optional[Dict[str, Any]],
+        vector_db_features: Optional[Dict[str, Any]],
+        allow_missing: bool,
+        online_client_choice: Literal["rest", "sql"],
+        transformed: bool,
+        request_parameters: Optional[Dict[str, Any]],
+    ) -> Union[pd.DataFrame, pl.DataFrame, np.ndarray, List[Any], Dict[str, Any]]:
         vector = self.assemble_feature_vector(
             result_dict=serving_vector,
             passed_values=passed_features or {},
@@ -348,15 +630,117 @@ class VectorServer:
             request_parameters=request_parameters,
         )
 
-        return self.handle_feature_vector_return_type(
-            vector,
-            batch=False,
-            inference_helper=False,
+        with serving_latency.measure_stage(serving_latency.RETURN_TYPE):
+            return self.handle_feature_vector_return_type(
+                vector,
+                batch=False,
+                inference_helper=False,
+                return_type=return_type,
+                transformed=transformed,
+            )
+
+    @_measure_retrieval
+    def get_feature_vectors(
+        self,
+        entries: List[Dict[str, Any]],
+        return_type: Optional[
+            Union[Literal["list", "numpy", "pandas", "polars"]]
+        ] = None,
+        passed_features: Optional[List[Dict[str, Any]]] = None,
+        vector_db_features: Optional[List[Dict[str, Any]]] = None,
+        request_parameters: Optional[List[Dict[str, Any]]] = None,
+        allow_missing: bool = False,
+        force_rest_client: bool = False,
+        force_sql_client: bool = False,
+        transformed=True,
+    ) -> Union[pd.DataFrame, pl.DataFrame, np.ndarray, List[Any], List[Dict[str, Any]]]:
+        """Assembles serving vector from online feature store."""
+        if passed_features is None:
+            passed_features = []
+        online_client_choice, rondb_entries, skipped_empty_entries = (
+            self._validate_entries(
+                entries=entries,
+                passed_features=passed_features,
+                vector_db_features=vector_db_features,
+                request_parameters=request_parameters,
+                allow_missing=allow_missing,
+                force_rest_client=force_rest_client,
+                force_sql_client=force_sql_client,
+            )
+        )
+
+        if self._use_columnar_rest_batch(
+            online_client_choice=online_client_choice,
+            skipped_empty_entries=skipped_empty_entries,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            request_parameters=request_parameters,
+            allow_missing=allow_missing,
+            transformed=transformed,
+        ):
+            _logger.debug("get_batch_feature_vector Online REST client, columnar")
+            fetch_start = time.perf_counter()
+            columns = self.rest_client_engine.get_batch_feature_vectors(
+                entries=rondb_entries,
+                drop_missing=False,
+                return_type=self.rest_client_engine.RETURN_TYPE_FEATURE_VALUE_COLUMNS,
+            )
+            self._record_fetch_latency(
+                online_client_choice, len(rondb_entries), fetch_start
+            )
+            return self._build_feature_vectors_from_columns(
+                columns,
+                n_entries=len(rondb_entries),
+                return_type=return_type,
+                transformed=transformed,
+            )
+
+        cached_results, entries_to_fetch = self._get_cached_serving_vectors(
+            rondb_entries, online_client_choice
+        )
+        fetch_start = time.perf_counter()
+        if (
+            online_client_choice == self.DEFAULT_REST_CLIENT
+            and len(entries_to_fetch) > 0
+        ):
+            _logger.debug("get_batch_feature_vector Online REST client")
+            batch_results = self.rest_client_engine.get_batch_feature_vectors(
+                entries=entries_to_fetch,
+                drop_missing=not allow_missing,
+                return_type=self.rest_client_engine.RETURN_TYPE_FEATURE_VALUE_DICT,
+            )
+        elif len(entries_to_fetch) > 0:
+            # get result row
+            _logger.debug("get_batch_feature_vectors through SQL client")
+            batch_results, _ = self.sql_client.get_batch_feature_vectors(
+                entries_to_fetch
+            )
+        else:
+            _logger.debug("Empty entries for rondb, skipping fetching.")
+            batch_results = []
+        if len(entries_to_fetch) > 0:
+            self._record_fetch_latency(
+                online_client_choice, len(rondb_entries), fetch_start
+            )
+        batch_results = self._merge_cached_serving_vectors(
+            rondb_entries, online_client_choice, cached_results, batch_results
+        )
+
+        return self._build_feature_vectors(
+            batch_results,
+            skipped_empty_entries,
+            entries=entries,
             return_type=return_type,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            request_parameters=request_parameters,
+            allow_missing=allow_missing,
+            online_client_choice=online_client_choice,
             transformed=transformed,
         )
 
-    def get_feature_vectors(
+    @_measure_retrieval
+    async def get_feature_vectors_async(
         self,
         entries: List[Dict[str, Any]],
         return_type: Optional[
@@ -370,9 +754,109 @@ class VectorServer:
         force_sql_client: bool = False,
         transformed=True,
     ) -> Union[pd.DataFrame, pl.DataFrame, np.ndarray, List[Any], List[Dict[str, Any]]]:
-        """Assembles serving vector from online feature store."""
+        """Assembles serving vector from online feature store without blocking the running event loop."""
         if passed_features is None:
             passed_features = []
+        online_client_choice, rondb_entries, skipped_empty_entries = (
+            self._validate_entries(
+                entries=entries,
+                passed_features=passed_features,
+                vector_db_features=vector_db_features,
+                request_parameters=request_parameters,
+                allow_missing=allow_missing,
+                force_rest_client=force_rest_client,
+                force_sql_client=force_sql_client,
+            )
+        )
+
+        if self._use_columnar_rest_batch(
+            online_client_choice=online_client_choice,
+            skipped_empty_entries=skipped_empty_entries,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            request_parameters=request_parameters,
+            allow_missing=allow_missing,
+            transformed=transformed,
+        ):
+            _logger.debug("get_batch_feature_vector_async Online REST client, columnar")
+            fetch_start = time.perf_counter()
+            columns = await self.rest_client_engine.get_batch_feature_vectors_async(
+                entries=rondb_entries,
+                drop_missing=False,
+                return_type=self.rest_client_engine.RETURN_TYPE_FEATURE_VALUE_COLUMNS,
+            )
+            self._record_fetch_latency(
+                online_client_choice, len(rondb_entries), fetch_start
+            )
+            return self._build_feature_vectors_from_columns(
+                columns,
+                n_entries=len(rondb_entries),
+                return_type=return_type,
+                transformed=transformed,
+            )
+
+        cached_results, entries_to_fetch = self._get_cached_serving_vectors(
+            rondb_entries, online_client_choice
+        )
+        fetch_start = time.perf_counter()
+        if (
+            online_client_choice == self.DEFAULT_REST_CLIENT
+            and len(entries_to_fetch) > 0
+        ):
+            _logger.debug("get_batch_feature_vector_async Online REST client")
+            batch_results = (
+                await self.rest_client_engine.get_batch_feature_vectors_async(
+                    entries=entries_to_fetch,
+                    drop_missing=not allow_missing,
+                    return_type=self.rest_client_engine.RETURN_TYPE_FEATURE_VALUE_DICT,
+                )
+            )
+        elif len(entries_to_fetch) > 0:
+            # get result row
+            _logger.debug("get_batch_feature_vectors_async through SQL client")
+            batch_results, _ = await self.sql_client.get_batch_feature_vectors_async(
+                entries_to_fetch
+            )
+        else:
+            _logger.debug("Empty entries for rondb, skipping fetching.")
+            batch_results = []
+        if len(entries_to_fetch) > 0:
+            self._record_fetch_latency(
+                online_client_choice, len(rondb_entries), fetch_start
+            )
+        batch_results = self._merge_cached_serving_vectors(
+            rondb_entries, online_client_choice, cached_results, batch_results
+        )
+
+        return self._build_feature_vectors(
+            batch_results,
+            skipped_empty_entries,
+            entries=entries,
+            return_type=return_type,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            request_parameters=request_parameters,
+            allow_missing=allow_missing,
+            online_client_choice=online_client_choice,
+            transformed=transformed,
+        )
+
+    def _validate_entries(
+        self,
+        entries: List[Dict[str, Any]],
+        passed_features: List[Dict[str, Any]],
+        vector_db_features: Optional[List[Dict[str, Any]]],
+        request_parameters: Optional[Union[List[Dict[str, Any]], Dict[str, Any]]],
+        allow_missing: bool,
+        force_rest_client: bool,
+        force_sql_client: bool,
+    ) -> Tuple[Literal["rest", "sql"], List[Dict[str, Any]], List[int]]:
+        """Validate the entries of a batch request and select the online client to fetch them with.
+
+        # Returns
+            `Tuple[str, List[Dict[str, Any]], List[int]]`: The online client to use, the entries to fetch from RonDB and the
+                indices of the entries for which nothing has to be fetched.
+        """
         # Assertions on passed_features and vector_db_features
         assert (
             passed_features is None
@@ -391,47 +875,250 @@ class VectorServer:
             or len(request_parameters) == len(entries)
         ), "Request Parameters should be a Dictionary, None, empty or have the same length as the entries"
 
-        online_client_choice = self.which_client_and_ensure_initialised(
-            force_rest_client=force_rest_client, force_sql_client=force_sql_client
-        )
         rondb_entries = []
         skipped_empty_entries = []
-        for (idx, entry), passed, vector_features in itertools.zip_longest(
-            enumerate(entries),
-            passed_features,
-            vector_db_features,
+        with serving_latency.measure_stage(serving_latency.VALIDATE_ENTRY):
+            for (idx, entry), passed, vector_features in itertools.zip_longest(
+                enumerate(entries),
+                passed_features,
+                vector_db_features or [],
+            ):
+                rondb_entry = self.validate_entry(
+                    entry=entry,
+                    allow_missing=allow_missing,
+                    passed_features=passed,
+                    vector_db_features=vector_features,
+                )
+                if len(rondb_entry) != 0:
+                    rondb_entries.append(rondb_entry)
+                else:
+                    skipped_empty_entries.append(idx)
+        # the client is selected for and records the latency of the entries fetched from the online store
+        online_client_choice = self.which_client_and_ensure_initialised(
+            force_rest_client=force_rest_client,
+            force_sql_client=force_sql_client,
+            batch_size=len(rondb_entries),
+        )
+        return online_client_choice, rondb_entries, skipped_empty_entries
+
+    def _feature_vector_cache_keys(
+        self, rondb_entry: Dict[str, Any], online_client_choice: Literal["rest", "sql"]
+    ) -> List[Tuple[Any, ...]]:
+        """Build one cache key per feature group whose serving keys are all present in the entry.
+
+        The client is part of the key as the REST and SQL clients return raw values of different types.
+        """
+        cache_keys = []
+        for fg_id, composite_group in self.groups_of_composite_serving_keys.items():
+            if fg_id in self._skip_fg_ids:
+                continue
+            if any(
+                sk_required not in rondb_entry for sk_required, _ in composite_group
+            ):
+                continue
+            cache_keys.append(
+                (
+                    online_client_choice,
+                    fg_id,
+                    tuple(
+                        rondb_entry[sk_required] for sk_required, _ in composite_group
+                    ),
+                )
+            )
+        return cache_keys
+
+    def _get_cached_serving_vector(
+        self, rondb_entry: Dict[str, Any], online_client_choice: Literal["rest", "sql"]
+    ) -> Optional[Dict[str, Any]]:
+        """Assemble the serving vector from the feature vector cache, None if any feature group is not cached."""
+        if self._feature_vector_cache is None:
+            return None
+        cache_keys = self._feature_vector_cache_keys(rondb_entry, online_client_choice)
+        if len(cache_keys) == 0:
+            return None
+        try:
+            # a hit only if every feature group is cached, otherwise the entry is fetched
+            cached_values = self._feature_vector_cache.get_all(cache_keys)
+        except TypeError:
+            _logger.debug("Serving key values of %s are not hashable.", rondb_entry)
+            return None
+        if cached_values is None:
+            return None
+        serving_vector = {}
+        for feature_values in cached_values:
+            serving_vector.update(feature_values)
+        return serving_vector
+
+    def _cache_serving_vector(
+        self,
+        rondb_entry: Dict[str, Any],
+        online_client_choice: Literal["rest", "sql"],
+        serving_vector: Optional[Dict[str, Any]],
+    ) -> None:
+        """Split the fetched serving vector per feature group and store it in the feature vector cache."""
+        if self._feature_vector_cache is None or not serving_vector:
+            return
+        for cache_key in self._feature_vector_cache_keys(
+            rondb_entry, online_client_choice
         ):
-            rondb_entry = self.validate_entry(
-                entry=entry,
-                allow_missing=allow_missing,
-                passed_features=passed,
-                vector_db_features=vector_features,
+            feature_values = {
+                fname: serving_vector[fname]
+                for fname in self.feature_names_per_fg_id.get(cache_key[1], [])
+                if fname in serving_vector
+            }
+            # Rows missing from the online store are not cached
+            if any(value is not None for value in feature_values.values()):
+                try:
+                    self._feature_vector_cache.put(cache_key, feature_values)
+                except TypeError:
+                    _logger.debug(
+                        "Serving key values of %s are not hashable.", rondb_entry
+                    )
+                    return
+
+    def _get_cached_serving_vectors(
+        self,
+        rondb_entries: List[Dict[str, Any]],
+        online_client_choice: Literal["rest", "sql"],
+    ) -> Tuple[Dict[int, Dict[str, Any]], List[Dict[str, Any]]]:
+        """Look up a batch of entries in the feature vector cache.
+
+        # Returns
+            `Tuple[Dict[int, Dict[str, Any]], List[Dict[str, Any]]]`: The cached serving vectors by entry index
+                and the entries which still have to be fetched from RonDB.
+        """
+        if self._feature_vector_cache is None:
+            return {}, rondb_entries
+        cached_results = {}
+        entries_to_fetch = []
+        for idx, rondb_entry in enumerate(rondb_entries):
+            serving_vector = self._get_cached_serving_vector(
+                rondb_entry, online_client_choice
             )
-            if len(rondb_entry) != 0:
-                rondb_entries.append(rondb_entry)
+            if serving_vector is None:
+                entries_to_fetch.append(rondb_entry)
             else:
-                skipped_empty_entries.append(idx)
+                cached_results[idx] = serving_vector
+        _logger.debug(
+            "Feature vector cache hits for %d out of %d entries.",
+            len(cached_results),
+            len(rondb_entries),
+        )
+        return cached_results, entries_to_fetch
 
-        if online_client_choice == self.DEFAULT_REST_CLIENT and len(rondb_entries) > 0:
-            _logger.debug("get_batch_feature_vector Online REST client")
-            batch_results = self.rest_client_engine.get_batch_feature_vectors(
-                entries=rondb_entries,
-                drop_missing=not allow_missing,
-                return_type=self.rest_client_engine.RETURN_TYPE_FEATURE_VALUE_DICT,
+    def _merge_cached_serving_vectors(
+        self,
+        rondb_entries: List[Dict[str, Any]],
+        online_client_choice: Literal["rest", "sql"],
+        cached_results: Dict[int, Dict[str, Any]],
+        batch_results: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Interleave cached and fetched serving vectors in entry order, caching the fetched ones."""
+        if self._feature_vector_cache is None:
+            return batch_results
+        fetched_results = iter(batch_results)
+        merged_results = []
+        for idx, rondb_entry in enumerate(rondb_entries):
+            if idx in cached_results:
+                merged_results.append(cached_results[idx])
+            else:
+                serving_vector = next(fetched_results)
+                self._cache_serving_vector(
+                    rondb_entry, online_client_choice, serving_vector
+                )
+                merged_results.append(serving_vector)
+        return merged_results
+
+    def clear_feature_vector_cache(self) -> None:
+        if self._feature_vector_cache is not None:
+            self._feature_vector_cache.clear()
+
+    def _use_columnar_rest_batch(
+        self,
+        online_client_choice: Literal["rest", "sql"],
+        skipped_empty_entries: List[int],
+        passed_features: List[Dict[str, Any]],
+        vector_db_features: Optional[List[Dict[str, Any]]],
+        request_parameters: Optional[Union[List[Dict[str, Any]], Dict[str, Any]]],
+        allow_missing: bool,
+        transformed: bool,
+    ) -> bool:
+        """Whether the feature vectors can be built from the columnar REST response.
+
+        This is the case if the fetched feature values do not need to be merged with other values or
+        transformed, so that no dictionary has to be assembled per feature vector.
+        """
+        return (
+            online_client_choice == self.DEFAULT_REST_CLIENT
+            and allow_missing
+            and len(skipped_empty_entries) == 0
+            and not passed_features
+            and not vector_db_features
+            and not request_parameters
+            and self._feature_vector_cache is None
+            and len(self._skip_fg_ids) == 0
+            and len(self._on_demand_feature_names) == 0
+            and not (
+                transformed
+                and (
+                    len(self.model_dependent_transformation_functions) > 0
+                    or len(self.on_demand_transformation_functions) > 0
+                )
+            )
+        )
+
+    def _build_feature_vectors_from_columns(
+        self,
+        columns: Dict[str, List[Any]],
+        n_entries: int,
+        return_type: Optional[Union[Literal["list", "numpy", "pandas", "polars"]]],
+        transformed: bool,
+    ) -> Union[pd.DataFrame, pl.DataFrame, np.ndarray, List[Any]]:
+        with serving_latency.measure_stage(serving_latency.RETURN_VALUE_HANDLERS):
+            for fname in self.feature_to_handle_if_rest.intersection(columns.keys()):
+                columns[fname] = self._handle_column(fname, columns[fname])
+
+        null_column = [None] * n_entries
+        vectors = [
+            list(vector)
+            for vector in zip(
+                *[
+                    columns.get(fname, null_column)
+                    for fname in (
+                        self.transformed_feature_vector_col_name
+                        if transformed
+                        else self._untransformed_feature_vector_col_name
+                    )
+                ]
+            )
+        ]
+        with serving_latency.measure_stage(serving_latency.RETURN_TYPE):
+            return self.handle_feature_vector_return_type(
+                vectors,
+                batch=True,
+                inference_helper=False,
+                return_type=return_type,
+                transformed=transformed,
             )
-        elif len(rondb_entries) > 0:
-            # get result row
-            _logger.debug("get_batch_feature_vectors through SQL client")
-            batch_results, _ = self.sql_client.get_batch_feature_vectors(rondb_entries)
-        else:
-            _logger.debug("Empty entries for rondb, skipping fetching.")
-            batch_results = []
 
+    def _build_feature_vectors(
+        self,
+        batch_results: List[Dict[str, Any]],
+        skipped_empty_entries: List[int],
+        entries: List[Dict[str, Any]],
+        return_type: Optional[Union[Literal["list", "numpy", "pandas", "polars"]]],
+        passed_features: List[Dict[str, Any]],
+        vector_db_features: Optional[List[Dict[str, Any]]],
+        request_parameters: Optional[Union[List[Dict[str, Any]], Dict[str, Any]]],
+        allow_missing: bool,
+        online_client_choice: Literal["rest", "sql"],
+        transformed: bool,
+    ) -> Union[pd.DataFrame, pl.DataFrame, np.ndarray, List[Any], List[Dict[str, Any]]]:
         _logger.debug("Assembling feature vectors from batch results")
-        next_skipped = (
-            skipped_empty_entries.pop(0) if len(skipped_empty_entries) > 0 else None
-        )
-        vectors = []
+        skipped_empty_entries = set(skipped_empty_entries)
+        batch_results_index = 0
+        result_dicts = []
+        result_request_parameters = []
 
         # If request parameter is a dictionary then copy it to list with the same length as that of entires
         request_parameters = (
@@ -451,37 +1138,54 @@ class VectorServer:
             request_parameters or [],
             fillvalue=None,
         ):
-            if next_skipped == idx:
+            if idx in skipped_empty_entries:
                 _logger.debug("Entry %d was skipped, setting to empty dict.", idx)
-                next_skipped = (
-                    skipped_empty_entries.pop(0)
-                    if len(skipped_empty_entries) > 0
-                    else None
-                )
                 result_dict = {}
             else:
-                result_dict = batch_results.pop(0)
+                result_dict = batch_results[batch_results_index]
+                batch_results_index += 1
 
-            vector = self.assemble_feature_vector(
+            result_dict = self.assemble_result_dict(
                 result_dict=result_dict,
                 passed_values=passed_values,
                 vector_db_result=vector_db_result,
                 allow_missing=allow_missing,
                 client=online_client_choice,
-                transformed=transformed,
                 request_parameters=request_parameter,
+                apply_return_value_handlers=False,
             )
 
-            if vector is not None:
-                vectors.append(vector)
+            if result_dict is not None:
+                result_dicts.append(result_dict)
+                result_request_parameters.append(request_parameter or {})
 
-        return self.handle_feature_vector_return_type(
-            vectors,
-            batch=True,
-            inference_helper=False,
-            return_type=return_type,
-            transformed=transformed,
-        )
+        # Return value handlers decode whole columns instead of single values
+        if len(self.return_feature_value_handlers) > 0:
+            with serving_latency.measure_stage(serving_latency.RETURN_VALUE_HANDLERS):
+                self.apply_return_value_handlers_batch(
+                    result_dicts, client=online_client_choice
+                )
+
+        # Transformations are applied once over all the assembled rows instead of once per feature vector
+        if (
+            len(self.model_dependent_transformation_functions) > 0
+            or len(self.on_demand_transformation_functions) > 0
+        ) and transformed:
+            self.apply_transformation_batch(result_dicts, result_request_parameters)
+
+        vectors = [
+            self.result_dict_to_feature_vector(result_dict, transformed=transformed)
+            for result_dict in result_dicts
+        ]
+
+        with serving_latency.measure_stage(serving_latency.RETURN_TYPE):
+            return self.handle_feature_vector_return_type(
+                vectors,
+                batch=True,
+                inference_helper=False,
+                return_type=return_type,
+                transformed=transformed,
+            )
 
     def assemble_feature_vector(
         self,
@@ -494,6 +1198,41 @@ class VectorServer:
         request_parameters: Optional[Dict[str, Any]] = None,
     ) -> Optional[List[Any]]:
         """Assembles serving vector from online feature store."""
+        result_dict = self.assemble_result_dict(
+            result_dict=result_dict,
+            passed_values=passed_values,
+            vector_db_result=vector_db_result,
+            allow_missing=allow_missing,
+            client=client,
+            request_parameters=request_parameters,
+        )
+        if result_dict is None:
+            return None
+
+        if (
+            len(self.model_dependent_transformation_functions) > 0
+            or len(self.on_demand_transformation_functions) > 0
+        ) and transformed:
+            self.apply_transformation(result_dict, request_parameters or {})
+
+        return self.result_dict_to_feature_vector(result_dict, transformed=transformed)
+
+    def assemble_result_dict(
+        self,
+        result_dict: Dict[str, Any],
+        passed_values: Optional[Dict[str, Any]],
+        vector_db_result: Optional[Dict[str, Any]],
+        allow_missing: bool,
+        client: Literal["rest", "sql"],
+        request_parameters: Optional[Dict[str, Any]] = None,
+        apply_return_value_handlers: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """Merges the fetched, vector db and passed feature values and applies the return value handlers.
+
+        Transformation functions are not applied to the returned dictionary. The return value handlers
+        are not applied either if `apply_return_value_handlers` is `False`, e.g. to apply them to a batch
+        of dictionaries at once.
+        """
         # Errors in batch requests are returned as None values
         _logger.debug("Assembling serving vector: %s", result_dict)
         if result_dict is None:
@@ -533,14 +1272,15 @@ class VectorServer:
                 f"[{', '.join(set(sk.feature_name for sk in self._serving_keys))}] are not provided."
             )
 
-        if len(self.return_feature_value_handlers) > 0:
-            self.apply_return_value_handlers(result_dict, client=client)
-        if (
-            len(self.model_dependent_transformation_functions) > 0
-            or len(self.on_demand_transformation_functions) > 0
-        ) and transformed:
-            self.apply_transformation(result_dict, request_parameters or {})
+        if apply_return_value_handlers and len(self.return_feature_value_handlers) > 0:
+            with serving_latency.measure_stage(serving_latency.RETURN_VALUE_HANDLERS):
+                self.apply_return_value_handlers(result_dict, client=client)
+        return result_dict
 
+    def result_dict_to_feature_vector(
+        self, result_dict: Dict[str, Any], transformed: bool
+    ) -> List[Any]:
+        """Orders the values of an assembled feature dictionary into a feature vector."""
         _logger.debug("Assembled and transformed dict feature vector: %s", result_dict)
         if transformed:
             return [
@@ -861,13 +1601,14 @@ class VectorServer:
         )
 
     def which_client_and_ensure_initialised(
-        self, force_rest_client: bool, force_sql_client: bool
+        self, force_rest_client: bool, force_sql_client: bool, batch_size: int = 1
     ) -> str:
         """Check if the requested client is initialised as well as deciding which client to use based on default.
 
         # Arguments:
             force_rest_client: bool. user specified override to use rest_client.
             force_sql_client: bool. user specified override to use sql_client.
+            batch_size: int. Number of entries to fetch, used to select the client if the default client is "auto".
 
         # Returns:
             An enum specifying the client to be used.
@@ -879,6 +1620,8 @@ class VectorServer:
 
         # No override, use default client
         if not force_rest_client and not force_sql_client:
+            if self._default_client == self.AUTO_CLIENT:
+                return self._online_client_selector.select(batch_size)
             return self.default_client
 
         if self._init_rest_client is False and self._init_sql_client is False:
@@ -899,6 +1642,15 @@ class VectorServer:
         elif force_rest_client:
             return self.DEFAULT_REST_CLIENT
 
+    def _record_fetch_latency(
+        self, client: Literal["rest", "sql"], batch_size: int, fetch_start: float
+    ) -> None:
+        """Record the latency of a fetch from the online store for the client selection and latency breakdown."""
+        latency = time.perf_counter() - fetch_start
+        serving_latency.add_stage_latency(serving_latency.FETCH, latency)
+        if self._online_client_selector is not None:
+            self._online_client_selector.record(client, batch_size, latency)
+
     def _set_default_client(
         self,
         init_rest_client: bool,
@@ -909,10 +1661,17 @@ class VectorServer:
             raise ValueError(
                 "At least one of the clients should be initialised. Set init_sql_client or init_rest_client to True."
             )
+        if default_client == self.AUTO_CLIENT and init_sql_client is None:
+            # automatic client selection needs both clients, initialise the sql client
+            # unless it was explicitly disabled.
+            init_sql_client = True
         self._init_rest_client = init_rest_client
         self._init_sql_client = init_sql_client
 
-        if init_rest_client is True and init_sql_client is True:
+        if default_client == self.AUTO_CLIENT or (
+            init_rest_client is True and init_sql_client is True
+        ):
+            # the setter raises if "auto" is requested with one of the clients disabled
             self.default_client = default_client
 
         elif init_rest_client is True:
@@ -921,6 +1680,25 @@ class VectorServer:
             self.default_client = self.DEFAULT_SQL_CLIENT
             self._init_sql_client = True
 
+    @staticmethod
+    def _transformation_input(values: List[Any]) -> pd.Series:
+        """Build the input column of a transformation function from the values of a feature.
+
+        With missing values pandas would infer a float column and replace None by NaN,
+        the column then keeps the values as they are, like the single vector lookup.
+        """
+        if any(value is None for value in values):
+            return pd.Series(values, dtype=object)
+        return pd.Series(values)
+
+    @staticmethod
+    def _transformation_input_value(value: Any) -> pd.Series:
+        """Build the input column of a transformation function from the value of a feature of a single vector."""
+        if value is None:
+            # an empty column otherwise
+            return pd.Series([None], dtype=object)
+        return pd.Series(value)
+
     def apply_on_demand_transformations(
         self, rows: Union[dict, pd.DataFrame], request_parameter: Dict[str, Any]
     ) -> dict:
@@ -928,14 +1706,12 @@ class VectorServer:
         for tf in self._on_demand_transformation_functions:
             # Check if feature provided as request parameter if not get it from retrieved feature vector.
             features = [
-                pd.Series(request_parameter[feature])
+                self._transformation_input_value(request_parameter[feature])
                 if feature in request_parameter.keys()
                 else (
-                    pd.Series(
-                        rows[feature]
-                        if (not isinstance(rows[feature], pd.Series))
-                        else rows[feature]
-                    )
+                    self._transformation_input_value(rows[feature])
+                    if (not isinstance(rows[feature], pd.Series))
+                    else rows[feature]
                 )
                 for feature in tf.hopsworks_udf.transformation_features
             ]
@@ -950,7 +1726,7 @@ class VectorServer:
         _logger.debug("Applying Model-Dependent transformation functions.")
         for tf in self.model_dependent_transformation_functions:
             features = [
-                pd.Series(rows[feature])
+                self._transformation_input_value(rows[feature])
                 if (not isinstance(rows[feature], pd.Series))
                 else rows[feature]
                 for feature in tf.hopsworks_udf.transformation_features
@@ -971,11 +1747,97 @@ class VectorServer:
         """
         Function that applies both on-demand and model dependent transformation to the input dictonary
         """
-        feature_dict = self.apply_on_demand_transformations(row_dict, request_parameter)
+        with serving_latency.measure_stage(serving_latency.ON_DEMAND_TRANSFORMATIONS):
+            feature_dict = self.apply_on_demand_transformations(
+                row_dict, request_parameter
+            )
 
-        encoded_feature_dict = self.apply_model_dependent_transformations(feature_dict)
+        with serving_latency.measure_stage(
+            serving_latency.MODEL_DEPENDENT_TRANSFORMATIONS
+        ):
+            encoded_feature_dict = self.apply_model_dependent_transformations(
+                feature_dict
+            )
         return encoded_feature_dict
 
+    def apply_on_demand_transformations_batch(
+        self,
+        rows: List[Dict[str, Any]],
+        request_parameters: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Apply on-demand transformation functions once over the columns built from all rows.
+
+        # Arguments
+            rows: `List[Dict[str, Any]]`. Assembled feature dictionaries, updated in place with the on-demand features.
+            request_parameters: `List[Dict[str, Any]]`. Request parameters for each row, same length as `rows`.
+        """
+        _logger.debug("Applying On-Demand transformation functions in batch.")
+        for tf in self._on_demand_transformation_functions:
+            # Features provided as request parameter take precedence over the retrieved feature vector.
+            features = [
+                self._transformation_input(
+                    [
+                        request_parameter[feature]
+                        if feature in request_parameter
+                        else row[feature]
+                        for row, request_parameter in zip(rows, request_parameters)
+                    ]
+                )
+                for feature in tf.hopsworks_udf.transformation_features
+            ]
+            on_demand_feature = tf.hopsworks_udf.get_udf(force_python_udf=True)(
+                *features
+            )  # Get only python compatible UDF irrespective of engine
+
+            for row, value in zip(rows, on_demand_feature.values):
+                row[on_demand_feature.name] = value
+        return rows
+
+    def apply_model_dependent_transformations_batch(
+        self, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Apply model-dependent transformation functions once over the columns built from all rows.
+
+        # Arguments
+            rows: `List[Dict[str, Any]]`. Assembled feature dictionaries, updated in place with the transformed features.
+        """
+        _logger.debug("Applying Model-Dependent transformation functions in batch.")
+        for tf in self.model_dependent_transformation_functions:
+            features = [
+                self._transformation_input([row[feature] for row in rows])
+                for feature in tf.hopsworks_udf.transformation_features
+            ]
+            transformed_result = tf.hopsworks_udf.get_udf(force_python_udf=True)(
+                *features
+            )  # Get only python compatible UDF irrespective of engine
+            if isinstance(transformed_result, pd.Series):
+                for row, value in zip(rows, transformed_result.values):
+                    row[transformed_result.name] = value
+            else:
+                for col in transformed_result:
+                    for row, value in zip(rows, transformed_result[col].values):
+                        row[col] = value
+        return rows
+
+    def apply_transformation_batch(
+        self,
+        rows: List[Dict[str, Any]],
+        request_parameters: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Function that applies both on-demand and model dependent transformation to a list of dictionaries, executing each transformation function once for all of them.
+        """
+        if len(rows) == 0:
+            return rows
+        with serving_latency.measure_stage(serving_latency.ON_DEMAND_TRANSFORMATIONS):
+            feature_dicts = self.apply_on_demand_transformations_batch(
+                rows, request_parameters
+            )
+        with serving_latency.measure_stage(
+            serving_latency.MODEL_DEPENDENT_TRANSFORMATIONS
+        ):
+            return self.apply_model_dependent_transformations_batch(feature_dicts)
+
     def apply_return_value_handlers(
         self, row_dict: Dict[str, Any], client: Literal["rest", "sql"]
     ):
@@ -991,20 +1853,39 @@ class VectorServer:
             row_dict[fname] = self.return_feature_value_handlers[fname](row_dict[fname])
         return row_dict
 
-    def build_complex_feature_decoders(self) -> Dict[str, Callable]:
-        """Build a dictionary of functions to deserialize or convert feature values.
-
-        Handles:
-            - deserialization of complex features from the online feature store
-            - conversion of string or int timestamps to datetime objects
+    def apply_return_value_handlers_batch(
+        self, row_dicts: List[Dict[str, Any]], client: Literal["rest", "sql"]
+    ) -> List[Dict[str, Any]]:
+        """Apply the return value handlers to the rows column by column."""
+        if client == self.DEFAULT_REST_CLIENT:
+            features_to_handle = self.feature_to_handle_if_rest
+        else:
+            features_to_handle = self.feature_to_handle_if_sql
+        for fname in features_to_handle:
+            rows = [row_dict for row_dict in row_dicts if fname in row_dict]
+            if len(rows) == 0:
+                continue
+            _logger.debug("Applying return value handler to feature: %s", fname)
+            values = self._handle_column(fname, [row_dict[fname] for row_dict in rows])
+            for row_dict, value in zip(rows, values):
+                row_dict[fname] = value
+        return row_dicts
+
+    def _handle_column(self, fname: str, values: List[Any]) -> List[Any]:
+        batch_handler = self._return_feature_value_batch_handlers.get(fname)
+        if batch_handler is not None:
+            return batch_handler(values)
+        handler = self.return_feature_value_handlers[fname]
+        return [handler(value) for value in values]
+
+    def build_complex_feature_decoders(self) -> Dict[str, ComplexFeatureDecoder]:
+        """Build a dictionary of decoders to deserialize complex features from the online feature store.
+
+        The decoders can be called on single values and decode whole columns with `decode_batch`.
         """
         complex_feature_schemas = {
-            f.name: avro.io.DatumReader(
-                avro.schema.parse(
-                    f._feature_group._get_feature_avro_schema(
-                        f.feature_group_feature_name
-                    )
-                )
+            f.name: f._feature_group._get_feature_avro_schema(
+                f.feature_group_feature_name
             )
             for f in self._features
             if f.is_complex()
@@ -1012,55 +1893,17 @@ class VectorServer:
 
         if len(complex_feature_schemas) == 0:
             return {}
-        else:
-            _logger.debug(
-                f"Building complex feature decoders corresponding to {complex_feature_schemas}."
-            )
+        _logger.debug(
+            f"Building complex feature decoders corresponding to {complex_feature_schemas}."
+        )
         if HAS_FASTAVRO:
             _logger.debug("Using fastavro for deserialization.")
-            return {
-                f_name: (
-                    lambda feature_value, avro_schema=schema: (
-                        schemaless_reader(
-                            BytesIO(
-                                feature_value
-                                if isinstance(feature_value, bytes)
-                                else b64decode(feature_value)
-                            ),
-                            avro_schema.writers_schema.to_json(),
-                        )
-                        # embedded features are deserialized already but not complex features stored in Opensearch
-                        if (
-                            isinstance(feature_value, bytes)
-                            or isinstance(feature_value, str)
-                        )
-                        else feature_value
-                    )
-                )
-                for (f_name, schema) in complex_feature_schemas.items()
-            }
         else:
             _logger.debug("Fast Avro not found, using avro for deserialization.")
-            return {
-                f_name: (
-                    lambda feature_value, avro_schema=schema: avro_schema.read(
-                        BinaryDecoder(
-                            BytesIO(
-                                feature_value
-                                if isinstance(feature_value, bytes)
-                                else b64decode(feature_value)
-                            )
-                        )
-                    )
-                    # embedded features are deserialized already but not complex features stored in Opensearch
-                    if (
-                        isinstance(feature_value, str)
-                        or isinstance(feature_value, bytes)
-                    )
-                    else feature_value
-                )
-                for (f_name, schema) in complex_feature_schemas.items()
-            }
+        return {
+            f_name: ComplexFeatureDecoder(schema)
+            for (f_name, schema) in complex_feature_schemas.items()
+        }
 
     def set_return_feature_value_handlers(
         self, features: List[tdf_mod.TrainingDatasetFeature]
@@ -1081,14 +1924,17 @@ class VectorServer:
             f"Setting return feature value handlers for Feature View {self._feature_view_name},"
             f" version: {self._feature_view_version} in Feature Store {self._feature_store_name}."
         )
-        self._return_feature_value_handlers.update(
-            self.build_complex_feature_decoders()
-        )
+        for f_name, decoder in self.build_complex_feature_decoders().items():
+            self._return_feature_value_handlers[f_name] = decoder
+            self._return_feature_value_batch_handlers[f_name] = decoder.decode_batch
         for feature in features:
             if feature.type == "timestamp":
                 self._return_feature_value_handlers[feature.name] = (
                     self._handle_timestamp_based_on_dtype
                 )
+                self._return_feature_value_batch_handlers[feature.name] = (
+                    self._handle_timestamps_based_on_dtype
+                )
 
     def _handle_timestamp_based_on_dtype(
         self, timestamp_value: Union[str, int]
@@ -1110,6 +1956,12 @@ class VectorServer:
             ).replace(tzinfo=None)
         elif isinstance(timestamp_value, str):
             # rest client returns timestamp as string
+            if len(timestamp_value) == 19 and timestamp_value[10] == " ":
+                # fast path for the canonical format, strptime is an order of magnitude slower
+                try:
+                    return datetime.fromisoformat(timestamp_value)
+                except ValueError:
+                    pass
             return datetime.strptime(timestamp_value, self.SQL_TIMESTAMP_STRING_FORMAT)
         elif isinstance(timestamp_value, datetime):
             # sql client returns already datetime object
@@ -1119,6 +1971,38 @@ class VectorServer:
                 f"Timestamp value {timestamp_value} was expected to be of type int, str or datetime."
             )
 
+    def _handle_timestamps_based_on_dtype(
+        self, timestamp_values: List[Union[str, int]]
+    ) -> List[Optional[datetime]]:
+        """Handle a column of timestamps, see `_handle_timestamp_based_on_dtype`.
+
+        Columns of a single type are converted at once, columns mixing types are
+        handled value by value.
+        """
+        value_types = {type(value) for value in timestamp_values if value is not None}
+        if all(issubclass(value_type, datetime) for value_type in value_types):
+            # sql client returns already datetime objects, or all values are missing
+            return list(timestamp_values)
+        handle_timestamp = self._handle_timestamp_based_on_dtype
+        try:
+            if value_types == {str}:
+                timestamps = pd.to_datetime(
+                    timestamp_values, format=self.SQL_TIMESTAMP_STRING_FORMAT
+                )
+            elif value_types == {int}:
+                # passed features given as epoch milliseconds
+                timestamps = pd.to_datetime(
+                    pd.array(timestamp_values, dtype="Int64"), unit="ms"
+                )
+            else:
+                return [handle_timestamp(value) for value in timestamp_values]
+        except ValueError:
+            # out of bounds or malformed, the single value handler converts or fails on the value
+            return [handle_timestamp(value) for value in timestamp_values]
+        values = timestamps.to_pydatetime()
+        values[timestamps.isna()] = None
+        return values.tolist()
+
     def validate_entry(
         self,
         entry: Dict[str, Any],
@@ -1138,19 +2022,18 @@ class VectorServer:
 
         Keys relevant to vector_db are filtered out.
         """
+        plan = self.entry_validation_plan
         _logger.debug("Checking keys in entry are valid serving keys.")
-        for key in entry.keys():
-            if key not in self.valid_serving_keys:
+        for key in entry:
+            if key not in plan.valid_serving_keys:
                 raise exceptions.FeatureStoreException(
                     f"Provided key {key} is not a serving key. Required serving keys: {self.required_serving_keys}."
                 )
 
         _logger.debug("Checking entry has either all or none of composite serving keys")
-        for composite_group in self.groups_of_composite_serving_keys.values():
+        for composite_group in plan.composite_serving_key_groups:
             present_keys = [
-                True
-                if (sk_required in entry.keys() or sk_name in entry.keys())
-                else False
+                sk_required in entry or sk_name in entry
                 for (sk_required, sk_name) in composite_group
             ]
             if not all(present_keys) and any(present_keys):
@@ -1167,7 +2050,7 @@ class VectorServer:
             )
 
         return {
-            key: value for key, value in entry.items() if key in self.rondb_serving_keys
+            key: value for key, value in entry.items() if key in plan.rondb_serving_keys
         }
 
     def identify_missing_features_pre_fetch(
@@ -1192,33 +2075,32 @@ class VectorServer:
         )
         missing_features_per_serving_keys = {}
         has_missing = False
-        for sk_name, (
+        passed_feature_names = set(passed_features.keys()) if passed_features else set()
+        if vector_db_features and len(vector_db_features) > 0:
+            _logger.debug(
+                "vector_db_features for pre-fetch missing : %s", vector_db_features
+            )
+            passed_feature_names.update(vector_db_features.keys())
+        for (
+            sk_name,
             sk_no_prefix,
             fetched_features,
-        ) in self.per_serving_key_features.items():
-            passed_feature_names = (
-                set(passed_features.keys()) if passed_features else set()
-            )
-            if vector_db_features and len(vector_db_features) > 0:
-                _logger.debug(
-                    "vector_db_features for pre-fetch missing : %s", vector_db_features
-                )
-                passed_feature_names = passed_feature_names.union(
-                    vector_db_features.keys()
-                )
-            neither_fetched_nor_passed = fetched_features.difference(
-                passed_feature_names
-            )
+        ) in self.entry_validation_plan.serving_key_features:
             # if not present and all corresponding features are not passed via passed_features
             # or vector_db_features
             if (
-                sk_name not in entry.keys() and sk_no_prefix not in entry.keys()
+                sk_name not in entry and sk_no_prefix not in entry
             ) and not fetched_features.issubset(passed_feature_names):
+                neither_fetched_nor_passed = fetched_features.difference(
+                    passed_feature_names
+                )
                 _logger.debug(
                     f"Missing serving key {sk_name} and corresponding features {neither_fetched_nor_passed}."
                 )
                 has_missing = True
-                missing_features_per_serving_keys[sk_name] = neither_fetched_nor_passed
+                missing_features_per_serving_keys[sk_name] = set(
+                    neither_fetched_nor_passed
+                )
 
         if has_missing:
             raise exceptions.FeatureStoreException(
@@ -1271,6 +2153,14 @@ class VectorServer:
     @serving_keys.setter
     def serving_keys(self, serving_vector_keys: List[sk_mod.ServingKey]):
         self._serving_keys = serving_vector_keys
+        # derived from the serving keys, rebuilt on next use
+        self._required_serving_keys = []
+        self._valid_serving_keys = set()
+        self._per_serving_key_features = None
+        for attribute in ["_rondb_serving_keys", "_groups_of_composite_serving_keys"]:
+            if hasattr(self, attribute):
+                delattr(self, attribute)
+        self._entry_validation_plan = None
 
     @property
     def required_serving_keys(self) -> List[str]:
@@ -1298,6 +2188,38 @@ class VectorServer:
             )
         return self._groups_of_composite_serving_keys
 
+    @property
+    def entry_validation_plan(self) -> EntryValidationPlan:
+        if self._entry_validation_plan is None:
+            return self.init_entry_validation_plan()
+        return self._entry_validation_plan
+
+    @property
+    def feature_vector_cache(
+        self,
+    ) -> Optional[feature_vector_cache.FeatureVectorCache]:
+        return self._feature_vector_cache
+
+    @property
+    def serving_latency_recorder(
+        self,
+    ) -> Optional[serving_latency.ServingLatencyRecorder]:
+        return self._serving_latency_recorder
+
+    @property
+    def feature_names_per_fg_id(self) -> Dict[int, List[str]]:
+        if not hasattr(self, "_feature_names_per_fg_id"):
+            self._feature_names_per_fg_id = {}
+            for feature in self._features:
+                if (
+                    feature.feature_group is not None
+                    and feature.feature_group.id not in self._skip_fg_ids
+                ):
+                    self._feature_names_per_fg_id.setdefault(
+                        feature.feature_group.id, []
+                    ).append(feature.name)
+        return self._feature_names_per_fg_id
+
     @property
     def rondb_serving_keys(self) -> List[str]:
         if not hasattr(self, "_rondb_serving_keys"):
@@ -1408,13 +2330,22 @@ class VectorServer:
         return self._default_client
 
     @default_client.setter
-    def default_client(self, default_client: Literal["rest", "sql"]):
+    def default_client(self, default_client: Literal["rest", "sql", "auto"]):
         if default_client not in [
             self.DEFAULT_REST_CLIENT,
             self.DEFAULT_SQL_CLIENT,
+            self.AUTO_CLIENT,
         ]:
             raise ValueError(
-                f"Default Online Feature Store Client should be one of {self.DEFAULT_REST_CLIENT} or {self.DEFAULT_SQL_CLIENT}."
+                f"Default Online Feature Store Client should be one of {self.DEFAULT_REST_CLIENT}, {self.DEFAULT_SQL_CLIENT} or {self.AUTO_CLIENT}."
+            )
+
+        if default_client == self.AUTO_CLIENT and not (
+            self._init_rest_client and self._init_sql_client
+        ):
+            raise ValueError(
+                f"Default Online Store Client is set to {self.AUTO_CLIENT} but it requires both the REST and the SQL"
+                + " client. Call `init_serving` with init_rest_client and init_sql_client set to True before using it."
             )
 
         if (
@@ -1435,6 +2366,20 @@ class VectorServer:
 
         _logger.debug(f"Default Online Store Client is set to {default_client}.")
         self._default_client = default_client
+        self._online_client_selector = (
+            online_client_selector.OnlineClientSelector(
+                [self.DEFAULT_SQL_CLIENT, self.DEFAULT_REST_CLIENT]
+            )
+            if default_client == self.AUTO_CLIENT
+            else None
+        )
+
+    @property
+    def online_client_selector(
+        self,
+    ) -> Optional[online_client_selector.OnlineClientSelector]:
+        """Latency based client selection, if the default client is "auto"."""
+        return self._online_client_selector
 
     @property
     def transformed_feature_vector_col_name(self):
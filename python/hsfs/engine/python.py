@@ -15,22 +15,26 @@
 #
 from __future__ import annotations
 
+import functools
 import json
 import math
+import multiprocessing
 import numbers
 import os
-import random
 import re
 import sys
-import uuid
 import warnings
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -46,6 +50,7 @@ from hsfs.core.type_systems import (
 
 if TYPE_CHECKING:
     import great_expectations
+    from confluent_kafka import Producer
 
 import boto3
 import hsfs
@@ -112,6 +117,13 @@ if HAS_PANDAS:
 
 
 class Engine:
+    # number of rows converted and encoded at once when writing to kafka
+    KAFKA_ENCODING_CHUNK_SIZE = 10000
+    # number of files downloaded and parsed concurrently when reading training datasets
+    READ_WORKERS = 8
+    # number of inodes listed per request to the dataset api
+    LIST_FILES_PAGE_SIZE = 100
+
     def __init__(self) -> None:
         self._dataset_api: dataset_api.DatasetApi = dataset_api.DatasetApi()
         self._job_api: job_api.JobApi = job_api.JobApi()
@@ -189,6 +201,54 @@ class Engine:
             result_df = Engine.cast_columns(result_df, schema)
         return self._return_dataframe_type(result_df, dataframe_type)
 
+    def sql_batches(
+        self,
+        sql_query: Union[str, Dict[str, Any]],
+        dataframe_type: str,
+        read_options: Optional[Dict[str, Any]],
+        schema: Optional[List["feature.Feature"]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[
+        Union[pa.RecordBatch, pd.DataFrame, pl.DataFrame, np.ndarray, List[List[Any]]]
+    ]:
+        dataframe_type = dataframe_type.lower()
+        if dataframe_type != "pyarrow":
+            self._validate_dataframe_type(dataframe_type)
+        if batch_size is not None and (
+            not isinstance(batch_size, int) or batch_size <= 0
+        ):
+            raise ValueError("`batch_size` must be a positive integer.")
+        if not (isinstance(sql_query, dict) and "query_string" in sql_query):
+            raise FeatureStoreException(
+                "Reading data in batches requires the Hopsworks Feature Query Service."
+            )
+        record_batches = arrow_flight_client.get_instance().read_query_batches(
+            sql_query,
+            read_options.get("arrow_flight_config", {}) if read_options else {},
+            batch_size,
+        )
+        return self._convert_record_batches(record_batches, dataframe_type, schema)
+
+    def _convert_record_batches(
+        self,
+        record_batches: Iterator[pa.RecordBatch],
+        dataframe_type: str,
+        schema: Optional[List["feature.Feature"]],
+    ) -> Iterator[
+        Union[pa.RecordBatch, pd.DataFrame, pl.DataFrame, np.ndarray, List[List[Any]]]
+    ]:
+        for record_batch in record_batches:
+            if dataframe_type == "pyarrow":
+                yield record_batch
+                continue
+            if dataframe_type == "polars":
+                df = pl.from_arrow(record_batch)
+            else:
+                df = record_batch.to_pandas()
+            if schema:
+                df = Engine.cast_columns(df, schema)
+            yield self._return_dataframe_type(df, dataframe_type)
+
     def _jdbc(
         self,
         sql_query: str,
@@ -235,7 +295,11 @@ class Engine:
             )
         elif storage_connector.type == storage_connector.S3:
             df_list = self._read_s3(
-                storage_connector, location, data_format, dataframe_type
+                storage_connector,
+                location,
+                data_format,
+                dataframe_type,
+                read_options,
             )
         else:
             raise NotImplementedError(
@@ -259,15 +323,17 @@ class Engine:
                 pd.concat(df_list, ignore_index=True), dataframe_type=dataframe_type
             )
 
-    def _read_pandas(self, data_format: str, obj: Any) -> pd.DataFrame:
+    def _read_pandas(
+        self, data_format: str, obj: Any, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         if data_format.lower() == "csv":
-            return pd.read_csv(obj)
+            return pd.read_csv(obj, usecols=columns)
         elif data_format.lower() == "tsv":
-            return pd.read_csv(obj, sep="\t")
+            return pd.read_csv(obj, sep="\t", usecols=columns)
         elif data_format.lower() == "parquet" and isinstance(obj, StreamingBody):
-            return pd.read_parquet(BytesIO(obj.read()))
+            return pd.read_parquet(BytesIO(obj.read()), columns=columns)
         elif data_format.lower() == "parquet":
-            return pd.read_parquet(obj)
+            return pd.read_parquet(obj, columns=columns)
         else:
             raise TypeError(
                 "{} training dataset format is not supported to read as pandas dataframe.".format(
@@ -276,16 +342,21 @@ class Engine:
             )
 
     def _read_polars(
-        self, data_format: Literal["csv", "tsv", "parquet"], obj: Any
+        self,
+        data_format: Literal["csv", "tsv", "parquet"],
+        obj: Any,
+        columns: Optional[List[str]] = None,
     ) -> pl.DataFrame:
         if data_format.lower() == "csv":
-            return pl.read_csv(obj)
+            return pl.read_csv(obj, columns=columns)
         elif data_format.lower() == "tsv":
-            return pl.read_csv(obj, separator="\t")
+            return pl.read_csv(obj, separator="\t", columns=columns)
         elif data_format.lower() == "parquet" and isinstance(obj, StreamingBody):
-            return pl.read_parquet(BytesIO(obj.read()), use_pyarrow=True)
+            return pl.read_parquet(
+                BytesIO(obj.read()), columns=columns, use_pyarrow=True
+            )
         elif data_format.lower() == "parquet":
-            return pl.read_parquet(obj, use_pyarrow=True)
+            return pl.read_parquet(obj, columns=columns, use_pyarrow=True)
         else:
             raise TypeError(
                 "{} training dataset format is not supported to read as polars dataframe.".format(
@@ -296,6 +367,26 @@ class Engine:
     def _is_metadata_file(self, path):
         return Path(path).stem.startswith("_")
 
+    def _read_dataframe(
+        self,
+        data_format: str,
+        obj: Any,
+        dataframe_type: str,
+        columns: Optional[List[str]] = None,
+    ) -> Union[pd.DataFrame, pl.DataFrame]:
+        if dataframe_type.lower() == "polars":
+            return self._read_polars(data_format, obj, columns)
+        else:
+            return self._read_pandas(data_format, obj, columns)
+
+    def _get_read_workers(self, read_options: Dict[str, Any]) -> int:
+        read_workers = read_options.get("read_workers", self.READ_WORKERS)
+        if not isinstance(read_workers, int) or read_workers < 1:
+            raise FeatureStoreException(
+                f"read_workers must be a positive integer, got '{read_workers}'."
+            )
+        return read_workers
+
     def _read_hopsfs(
         self,
         location: str,
@@ -312,6 +403,7 @@ class Engine:
             )
         util.setup_pydoop()
         path_list = hdfs.ls(location, recursive=True)
+        columns = (read_options or {}).get("columns")
 
         df_list = []
         for path in path_list:
@@ -320,10 +412,9 @@ class Engine:
                 and not self._is_metadata_file(path)
                 and hdfs.path.getsize(path) > 0
             ):
-                if dataframe_type.lower() == "polars":
-                    df_list.append(self._read_polars(data_format, path))
-                else:
-                    df_list.append(self._read_pandas(data_format, path))
+                df_list.append(
+                    self._read_dataframe(data_format, path, dataframe_type, columns)
+                )
         return df_list
 
     # This is a version of the read method that uses the Hopsworks REST APIs or Flyginduck Server
@@ -336,43 +427,53 @@ class Engine:
         read_options: Optional[Dict[str, Any]] = None,
         dataframe_type: str = "default",
     ) -> List[Union[pd.DataFrame, pl.DataFrame]]:
-        total_count = 10000
-        offset = 0
-        df_list = []
         if read_options is None:
             read_options = {}
+        columns = read_options.get("columns")
+        use_arrow_flight = arrow_flight_client.is_data_format_supported(
+            data_format, read_options
+        )
 
-        while offset < total_count:
-            total_count, inode_list = self._dataset_api.list_files(
-                location, offset, 100
+        def read_inode(path):
+            if use_arrow_flight:
+                df = arrow_flight_client.get_instance().read_path(
+                    path,
+                    read_options.get("arrow_flight_config"),
+                    dataframe_type=dataframe_type,
+                )
+                return df if columns is None else df[columns]
+            content_stream = self._dataset_api.read_content(path)
+            return self._read_dataframe(
+                data_format, BytesIO(content_stream.content), dataframe_type, columns
             )
 
-            for inode in inode_list:
-                if not self._is_metadata_file(inode.path):
-                    if arrow_flight_client.is_data_format_supported(
-                        data_format, read_options
-                    ):
-                        arrow_flight_config = read_options.get("arrow_flight_config")
-                        df = arrow_flight_client.get_instance().read_path(
-                            inode.path,
-                            arrow_flight_config,
-                            dataframe_type=dataframe_type,
-                        )
-                    else:
-                        content_stream = self._dataset_api.read_content(inode.path)
-                        if dataframe_type.lower() == "polars":
-                            df = self._read_polars(
-                                data_format, BytesIO(content_stream.content)
-                            )
-                        else:
-                            df = self._read_pandas(
-                                data_format, BytesIO(content_stream.content)
-                            )
-
-                    df_list.append(df)
-                offset += 1
-
-        return df_list
+        page_size = self.LIST_FILES_PAGE_SIZE
+        with ThreadPoolExecutor(
+            max_workers=self._get_read_workers(read_options)
+        ) as executor:
+            total_count, inode_list = self._dataset_api.list_files(
+                location, 0, page_size
+            )
+            # the remaining pages can be listed concurrently once the number of files is known,
+            # they are submitted first so that the listing is not queued behind the downloads
+            pages = [
+                executor.submit(
+                    self._dataset_api.list_files, location, offset, page_size
+                )
+                for offset in range(page_size, total_count, page_size)
+            ]
+            df_futures = []
+            while True:
+                df_futures.extend(
+                    executor.submit(read_inode, inode.path)
+                    for inode in inode_list
+                    if not self._is_metadata_file(inode.path)
+                )
+                if not pages:
+                    break
+                _, inode_list = pages.pop(0).result()
+            # the futures are kept in listing order so that the dataframes are reassembled in order
+            return [future.result() for future in df_futures]
 
     def _read_s3(
         self,
@@ -380,7 +481,12 @@ class Engine:
         location: str,
         data_format: str,
         dataframe_type: str = "default",
+        read_options: Optional[Dict[str, Any]] = None,
     ) -> List[Union[pd.DataFrame, pl.DataFrame]]:
+        if read_options is None:
+            read_options = {}
+        columns = read_options.get("columns")
+
         # get key prefix
         path_parts = location.replace("s3://", "").split("/")
         _ = path_parts.pop(0)  # pop first element -> bucket
@@ -401,34 +507,39 @@ class Engine:
                 aws_secret_access_key=storage_connector.secret_key,
             )
 
-        df_list = []
-        object_list = {"is_truncated": True}
-        while object_list.get("is_truncated", False):
-            if "NextContinuationToken" in object_list:
-                object_list = s3.list_objects_v2(
-                    Bucket=storage_connector.bucket,
-                    Prefix=prefix,
-                    MaxKeys=1000,
-                    ContinuationToken=object_list["NextContinuationToken"],
-                )
-            else:
-                object_list = s3.list_objects_v2(
-                    Bucket=storage_connector.bucket,
-                    Prefix=prefix,
-                    MaxKeys=1000,
-                )
+        def read_object(key):
+            obj = s3.get_object(Bucket=storage_connector.bucket, Key=key)
+            return self._read_dataframe(
+                data_format, obj["Body"], dataframe_type, columns
+            )
 
-            for obj in object_list["Contents"]:
-                if not self._is_metadata_file(obj["Key"]) and obj["Size"] > 0:
-                    obj = s3.get_object(
+        df_futures = []
+        with ThreadPoolExecutor(
+            max_workers=self._get_read_workers(read_options)
+        ) as executor:
+            object_list = {"is_truncated": True}
+            while object_list.get("is_truncated", False):
+                if "NextContinuationToken" in object_list:
+                    object_list = s3.list_objects_v2(
                         Bucket=storage_connector.bucket,
-                        Key=obj["Key"],
+                        Prefix=prefix,
+                        MaxKeys=1000,
+                        ContinuationToken=object_list["NextContinuationToken"],
+                    )
+                else:
+                    object_list = s3.list_objects_v2(
+                        Bucket=storage_connector.bucket,
+                        Prefix=prefix,
+                        MaxKeys=1000,
                     )
-                    if dataframe_type.lower() == "polars":
-                        df_list.append(self._read_polars(data_format, obj["Body"]))
-                    else:
-                        df_list.append(self._read_pandas(data_format, obj["Body"]))
-        return df_list
+
+                # the objects of a page are downloaded while the next page is listed
+                df_futures.extend(
+                    executor.submit(read_object, obj["Key"])
+                    for obj in object_list["Contents"]
+                    if not self._is_metadata_file(obj["Key"]) and obj["Size"] > 0
+                )
+            return [future.result() for future in df_futures]
 
     def read_options(
         self, data_format: Optional[str], provided_options: Optional[Dict[str, Any]]
@@ -476,6 +587,25 @@ class Engine:
             df = pd.DataFrame(results, columns=feature_names, index=None)
         return self._return_dataframe_type(df, dataframe_type)
 
+    def read_vector_db_batches(
+        self,
+        feature_group: "hsfs.feature_group.FeatureGroup",
+        batch_size: int = VectorDbClient.DEFAULT_READ_BATCH_SIZE,
+        dataframe_type: str = "default",
+    ) -> Iterator[Union[pd.DataFrame, pl.DataFrame, np.ndarray, List[List[Any]]]]:
+        dataframe_type = dataframe_type.lower()
+        self._validate_dataframe_type(dataframe_type)
+
+        feature_names = [f.name for f in feature_group.features]
+        for results in VectorDbClient.read_feature_group_batches(
+            feature_group, batch_size
+        ):
+            if dataframe_type == "polars":
+                df = pl.DataFrame(results, schema=feature_names)
+            else:
+                df = pd.DataFrame(results, columns=feature_names, index=None)
+            yield self._return_dataframe_type(df, dataframe_type)
+
     def register_external_temporary_table(
         self, external_fg: ExternalFeatureGroup, alias: str
     ) -> None:
@@ -982,7 +1112,6 @@ class Engine:
         df: Union[pd.DataFrame, pl.DataFrame],
         training_dataset_obj: TrainingDataset,
     ) -> Dict[str, Union[pd.DataFrame, pl.DataFrame]]:
-        split_column = f"_SPLIT_INDEX_{uuid.uuid1()}"
         result_dfs = {}
         splits = training_dataset_obj.splits
         if (
@@ -997,23 +1126,23 @@ class Engine:
             )
 
         df_size = len(df)
-        groups = []
-        for i, split in enumerate(splits):
-            groups += [i] * int(df_size * split.percentage)
-        groups += [len(splits) - 1] * (df_size - len(groups))
-        random.shuffle(groups)
-        if isinstance(df, pl.DataFrame) or isinstance(df, pl.dataframe.frame.DataFrame):
-            df = df.with_columns(pl.Series(name=split_column, values=groups))
-        else:
-            df[split_column] = groups
-        for i, split in enumerate(splits):
-            if isinstance(df, pl.DataFrame) or isinstance(
-                df, pl.dataframe.frame.DataFrame
-            ):
-                split_df = df.filter(pl.col(split_column) == i).drop(split_column)
+        split_sizes = [int(df_size * split.percentage) for split in splits[:-1]]
+        split_sizes.append(df_size - sum(split_sizes))
+        # a single permutation of row positions, split into consecutive slices
+        permutation = np.random.default_rng(training_dataset_obj.seed).permutation(
+            df_size
+        )
+        split_offset = 0
+        for split, split_size in zip(splits, split_sizes):
+            # keep the original row order within each split
+            row_positions = np.sort(
+                permutation[split_offset : split_offset + split_size]
+            )
+            split_offset += split_size
+            if isinstance(df, pl.DataFrame):
+                result_dfs[split.name] = df[row_positions]
             else:
-                split_df = df[df[split_column] == i].drop(split_column, axis=1)
-            result_dfs[split.name] = split_df
+                result_dfs[split.name] = df.iloc[row_positions]
         return result_dfs
 
     def _time_series_split(
@@ -1024,24 +1153,70 @@ class Engine:
         drop_event_time: bool = False,
     ) -> Dict[str, Union[pd.DataFrame, pl.DataFrame]]:
         result_dfs = {}
+        # convert the event time column once and derive all splits from it
+        event_time_ms = (
+            self._convert_event_time_to_timestamp_array(df[event_time])
+            if len(df[event_time]) > 0
+            else None
+        )
         for split in training_dataset_obj.splits:
-            if len(df[event_time]) > 0:
-                result_df = df[
-                    [
-                        split.start_time
-                        <= util.convert_event_time_to_timestamp(t)
-                        < split.end_time
-                        for t in df[event_time]
-                    ]
-                ]
+            if event_time_ms is not None:
+                mask = (split.start_time <= event_time_ms) & (
+                    event_time_ms < split.end_time
+                )
+                result_df = (
+                    df.filter(pl.Series(mask))
+                    if isinstance(df, pl.DataFrame)
+                    else df[mask]
+                )
             else:
                 # if df[event_time] is empty, it returns an empty dataframe
                 result_df = df
             if drop_event_time:
-                result_df = result_df.drop([event_time], axis=1)
+                result_df = (
+                    result_df.drop(event_time)
+                    if isinstance(result_df, pl.DataFrame)
+                    else result_df.drop([event_time], axis=1)
+                )
             result_dfs[split.name] = result_df
         return result_dfs
 
+    @staticmethod
+    def _convert_event_time_to_timestamp_array(
+        event_times: Union[pd.Series, pl.Series],
+    ) -> np.ndarray:
+        """Vectorized `util.convert_event_time_to_timestamp`.
+
+        Returns the event times as unix epoch milliseconds in a float array, missing
+        event times are NaN and therefore never fall into a split.
+        """
+        if isinstance(event_times, pl.Series):
+            if event_times.dtype in (pl.Date, pl.Datetime):
+                return event_times.dt.epoch("ms").cast(pl.Float64).to_numpy()
+            if event_times.dtype.is_numeric():
+                event_times = event_times.cast(pl.Float64).to_numpy()
+            else:
+                event_times = pd.Series(event_times.to_numpy())
+        if isinstance(event_times, pd.Series):
+            if pd.api.types.is_datetime64_any_dtype(event_times.dtype):
+                if event_times.dt.tz is not None:
+                    event_times = event_times.dt.tz_convert(None)
+                return (
+                    (event_times - pd.Timestamp(0)) // pd.Timedelta(1, "ms")
+                ).to_numpy(dtype="float64", na_value=np.nan)
+            if not pd.api.types.is_numeric_dtype(event_times.dtype):
+                # strings and python date objects are converted once per distinct value
+                codes, uniques = pd.factorize(event_times)
+                converted = [
+                    util.convert_event_time_to_timestamp(value) for value in uniques
+                ]
+                converted.append(None)
+                return np.array(converted, dtype="float64")[codes]
+            event_times = event_times.to_numpy(dtype="float64", na_value=np.nan)
+        event_times = np.where(event_times == 0, np.nan, event_times)
+        # jdbc supports timestamp precision up to second only.
+        return np.where(event_times < 10**10, event_times * 1000, event_times)
+
     def write_training_dataset(
         self,
         training_dataset: TrainingDataset,
@@ -1294,53 +1469,38 @@ class Engine:
             offline_write_options=offline_write_options,
         )
 
-        if isinstance(dataframe, pd.DataFrame):
-            row_iterator = dataframe.itertuples(index=False)
-        else:
-            row_iterator = dataframe.iter_rows(named=True)
-
-        # loop over rows
-        for row in row_iterator:
-            if isinstance(dataframe, pd.DataFrame):
-                # itertuples returns Python NamedTyple, to be able to serialize it using
-                # avro, create copy of row only by converting to dict, which preserves datatypes
-                row = row._asdict()
-
-                # transform special data types
-                # here we might need to handle also timestamps and other complex types
-                # possible optimizaiton: make it based on type so we don't need to loop over
-                # all keys in the row
-                for k in row.keys():
-                    # for avro to be able to serialize them, they need to be python data types
-                    if isinstance(row[k], np.ndarray):
-                        row[k] = row[k].tolist()
-                    if isinstance(row[k], pd.Timestamp):
-                        row[k] = row[k].to_pydatetime()
-                    if isinstance(row[k], datetime) and row[k].tzinfo is None:
-                        row[k] = row[k].replace(tzinfo=timezone.utc)
-                    if isinstance(row[k], pd._libs.missing.NAType):
-                        row[k] = None
-
-            # encode complex features
-            row = kafka_engine.encode_complex_features(feature_writers, row)
-
-            # encode feature row
-            with BytesIO() as outf:
-                writer(row, outf)
-                encoded_row = outf.getvalue()
-
-            # assemble key
-            key = "".join([str(row[pk]) for pk in sorted(feature_group.primary_key)])
-
-            kafka_engine.kafka_produce(
+        debug_kafka = offline_write_options.get("debug_kafka", False)
+        if (
+            offline_write_options.get("kafka_encoding_workers", 1) > 1
+            or offline_write_options.get("kafka_producers", 1) > 1
+        ):
+            self._produce_dataframe_kafka_parallel(
+                feature_group,
+                dataframe,
                 producer=producer,
-                key=key,
-                encoded_row=encoded_row,
-                topic_name=feature_group._online_topic_name,
                 headers=headers,
+                feature_writers=feature_writers,
+                writer=writer,
                 acked=acked,
-                debug_kafka=offline_write_options.get("debug_kafka", False),
+                offline_write_options=offline_write_options,
             )
+        else:
+            for key, encoded_row in self._encode_kafka_records(
+                dataframe,
+                primary_key=feature_group.primary_key,
+                feature_writers=feature_writers,
+                writer=writer,
+                chunk_size=offline_write_options.get("kafka_chunk_size", None),
+            ):
+                kafka_engine.kafka_produce(
+                    producer=producer,
+                    key=key,
+                    encoded_row=encoded_row,
+                    topic_name=feature_group._online_topic_name,
+                    headers=headers,
+                    acked=acked,
+                    debug_kafka=debug_kafka,
+                )
 
         # make sure producer blocks and everything is delivered
         if not feature_group._multi_part_insert:
@@ -1386,6 +1546,218 @@ class Engine:
             )
         return feature_group.materialization_job
 
+    def _produce_dataframe_kafka_parallel(
+        self,
+        feature_group: Union[FeatureGroup, ExternalFeatureGroup],
+        dataframe: Union[pd.DataFrame, pl.DataFrame],
+        producer: Producer,
+        headers: Dict[str, bytes],
+        feature_writers: Dict[str, Callable[..., None]],
+        writer: Callable[..., None],
+        acked: Callable,
+        offline_write_options: Dict[str, Any],
+    ) -> None:
+        """Encode the dataframe chunks on a worker pool and produce them with `kafka_producers` producers in parallel."""
+        # the feature group producer is kept for multi part inserts, additional ones only live for this insert
+        additional_producers = [
+            kafka_engine.init_kafka_producer(
+                feature_group.feature_store_id, offline_write_options
+            )
+            for _ in range(offline_write_options.get("kafka_producers", 1) - 1)
+        ]
+        try:
+            kafka_engine.kafka_produce_parallel(
+                producers=[producer] + additional_producers,
+                record_batches=self._encode_kafka_record_batches(
+                    feature_group,
+                    dataframe,
+                    feature_writers=feature_writers,
+                    writer=writer,
+                    offline_write_options=offline_write_options,
+                ),
+                topic_name=feature_group._online_topic_name,
+                headers=headers,
+                acked=acked,
+                debug_kafka=offline_write_options.get("debug_kafka", False),
+            )
+        finally:
+            for additional_producer in additional_producers:
+                additional_producer.flush()
+
+    def _encode_kafka_records(
+        self,
+        dataframe: Union[pd.DataFrame, pl.DataFrame],
+        primary_key: List[str],
+        feature_writers: Dict[str, Callable[..., None]],
+        writer: Callable[..., None],
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Tuple[str, bytes]]:
+        """Encode the dataframe into Kafka keys and avro encoded rows, one chunk of rows at a time."""
+        for chunk in self._split_dataframe(
+            dataframe, chunk_size or self.KAFKA_ENCODING_CHUNK_SIZE
+        ):
+            yield from self._encode_kafka_chunk(
+                chunk, primary_key, feature_writers, writer
+            )
+
+    def _encode_kafka_record_batches(
+        self,
+        feature_group: Union[FeatureGroup, ExternalFeatureGroup],
+        dataframe: Union[pd.DataFrame, pl.DataFrame],
+        feature_writers: Dict[str, Callable[..., None]],
+        writer: Callable[..., None],
+        offline_write_options: Dict[str, Any],
+    ) -> Iterator[List[Tuple[str, bytes]]]:
+        """Encode the dataframe chunks into batches of Kafka records, in the order of the chunks.
+
+        With `kafka_encoding_workers` > 1 the chunks are encoded concurrently on a thread pool,
+        or a process pool if `kafka_encoding_pool` is set to `"process"`.
+        """
+        n_workers = offline_write_options.get("kafka_encoding_workers", 1)
+        chunks = self._split_dataframe(
+            dataframe,
+            offline_write_options.get(
+                "kafka_chunk_size", self.KAFKA_ENCODING_CHUNK_SIZE
+            ),
+        )
+        if n_workers <= 1:
+            for chunk in chunks:
+                yield self._encode_kafka_chunk(
+                    chunk, feature_group.primary_key, feature_writers, writer
+                )
+            return
+
+        pool = offline_write_options.get("kafka_encoding_pool", "thread")
+        if pool not in ["process", "thread"]:
+            raise FeatureStoreException(
+                f"Unknown kafka_encoding_pool '{pool}', supported values are 'thread' and 'process'."
+            )
+        # the workers build their own encoders as the encoder functions can not be pickled
+        writer_schema = feature_group._get_encoded_avro_schema()
+        feature_schemas = {
+            feature_name: feature_group._get_feature_avro_schema(feature_name)
+            for feature_name in feature_group.get_complex_features()
+        }
+        if pool == "process":
+            # the Kafka producers run librdkafka threads at this point, forking the
+            # multi-threaded process can deadlock, so the workers are spawned instead
+            executor = ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=n_workers)
+        with executor:
+            # bound the number of encoded chunks waiting to be produced
+            pending = deque()
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(
+                        _encode_kafka_chunk_with_schemas,
+                        chunk,
+                        feature_group.primary_key,
+                        feature_schemas,
+                        writer_schema,
+                    )
+                )
+                if len(pending) >= 2 * n_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def _split_dataframe(
+        dataframe: Union[pd.DataFrame, pl.DataFrame], chunk_size: int
+    ) -> Iterator[Union[pd.DataFrame, pl.DataFrame]]:
+        for offset in range(0, dataframe.shape[0], chunk_size):
+            if isinstance(dataframe, pd.DataFrame):
+                yield dataframe.iloc[offset : offset + chunk_size]
+            else:
+                yield dataframe.slice(offset, chunk_size)
+
+    @staticmethod
+    def _encode_kafka_chunk(
+        chunk: Union[pd.DataFrame, pl.DataFrame],
+        primary_key: List[str],
+        feature_writers: Dict[str, Callable[..., None]],
+        writer: Callable[..., None],
+    ) -> List[Tuple[str, bytes]]:
+        """Encode a dataframe chunk into Kafka keys and avro encoded rows.
+
+        Values are converted to avro compatible Python types column by column, instead of checking
+        the type of every cell of every row.
+        """
+        columns = list(chunk.columns)
+        sorted_primary_key = sorted(primary_key)
+        if isinstance(chunk, pd.DataFrame):
+            column_values = {
+                column: Engine._convert_pandas_column_for_avro(chunk[column])
+                for column in columns
+            }
+        else:
+            column_values = {
+                column: chunk.get_column(column).to_list() for column in columns
+            }
+
+        # assemble keys, before complex features are encoded
+        if len(sorted_primary_key) == 1:
+            keys = list(map(str, column_values[sorted_primary_key[0]]))
+        else:
+            keys = [
+                "".join(map(str, pk_values))
+                for pk_values in zip(*[column_values[pk] for pk in sorted_primary_key])
+            ] or [""] * chunk.shape[0]
+
+        # encode complex features
+        for feature_name, feature_writer in feature_writers.items():
+            column_values[feature_name] = kafka_engine.encode_records(
+                feature_writer, column_values[feature_name]
+            )
+
+        # encode feature rows
+        encoded_rows = kafka_engine.encode_records(
+            writer,
+            [
+                dict(zip(columns, row_values))
+                for row_values in zip(*column_values.values())
+            ],
+        )
+        return list(zip(keys, encoded_rows))
+
+    @staticmethod
+    def _convert_pandas_column_for_avro(series: pd.Series) -> List[Any]:
+        """Convert a pandas column to a list of Python values which avro is able to serialize."""
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            if series.dt.tz is None:
+                series = series.dt.tz_localize(timezone.utc)
+            with warnings.catch_warnings():
+                # pandas >= 2.1 warns that a Series will be returned instead of an array
+                warnings.simplefilter("ignore", category=FutureWarning)
+                values = list(series.dt.to_pydatetime())
+            if series.hasnans:
+                values = [
+                    None if is_na else value
+                    for value, is_na in zip(values, series.isna())
+                ]
+            return values
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+            return series.tolist()
+        if not pd.api.types.is_object_dtype(series.dtype):
+            # pandas extension types, e.g. nullable integers or strings
+            series = series.astype(object)
+        return [Engine._convert_value_for_avro(value) for value in series.tolist()]
+
+    @staticmethod
+    def _convert_value_for_avro(value: Any) -> Any:
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, pd.Timestamp):
+            value = value.to_pydatetime()
+        if isinstance(value, datetime) and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        if value is pd.NA or value is pd.NaT:
+            return None
+        return value
+
     @staticmethod
     def cast_columns(
         df: pd.DataFrame, schema: List[feature.Feature], online: bool = False
@@ -1492,3 +1864,26 @@ class Engine:
         )
         features["log_id"] = [str(uuid.uuid4()) for _ in range(len(features))]
         return features[[feat.name for feat in fg.features]]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_encoder_func(writer_schema: str) -> Callable[..., None]:
+    return kafka_engine.get_encoder_func(writer_schema)
+
+
+def _encode_kafka_chunk_with_schemas(
+    chunk: Union[pd.DataFrame, pl.DataFrame],
+    primary_key: List[str],
+    feature_schemas: Dict[str, str],
+    writer_schema: str,
+) -> List[Tuple[str, bytes]]:
+    # runs in the worker processes of the parallel kafka ingestion, parsed schemas are cached per process
+    return Engine._encode_kafka_chunk(
+        chunk,
+        primary_key,
+        feature_writers={
+            feature_name: _get_cached_encoder_func(feature_schema)
+            for feature_name, feature_schema in feature_schemas.items()
+        },
+        writer=_get_cached_encoder_func(writer_schema),
+    )
@@ -23,7 +23,16 @@ import re
 import shutil
 import warnings
 from datetime import date, datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 
 if TYPE_CHECKING:
@@ -189,6 +198,30 @@ class Engine:
             df = pd.DataFrame(results, columns=feature_names, index=None)
             return self._return_dataframe_type(df, dataframe_type)
 
+    def read_vector_db_batches(
+        self,
+        feature_group: fg_mod.FeatureGroup,
+        batch_size: int = VectorDbClient.DEFAULT_READ_BATCH_SIZE,
+        dataframe_type: str = "default",
+    ) -> Iterator[
+        Union[
+            pd.DataFrame,
+            np.ndarray,
+            List[List[Any]],
+            TypeVar("pyspark.sql.DataFrame"),
+        ]
+    ]:
+        feature_names = [f.name for f in feature_group.features]
+        dataframe_type = dataframe_type.lower()
+        for results in VectorDbClient.read_feature_group_batches(
+            feature_group, batch_size
+        ):
+            if dataframe_type in ["default", "spark"]:
+                yield self._spark_session.createDataFrame(results, feature_names)
+            else:
+                df = pd.DataFrame(results, columns=feature_names, index=None)
+                yield self._return_dataframe_type(df, dataframe_type)
+
     def set_job_group(self, group_id, description):
         self._spark_session.sparkContext.setJobGroup(group_id, description)
 
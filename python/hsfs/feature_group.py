@@ -25,6 +25,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -72,6 +73,7 @@ from hsfs.core import (
     feature_store_api,
     great_expectation_engine,
     job_api,
+    kafka_engine,
     spine_group_engine,
     statistics_engine,
     validation_report_engine,
@@ -2342,6 +2344,51 @@ class FeatureGroup(FeatureGroupBase):
                 read_options or {},
             )
 
+    def read_online_batches(
+        self,
+        batch_size: int = VectorDbClient.DEFAULT_READ_BATCH_SIZE,
+        dataframe_type: str = "default",
+    ) -> Iterator[
+        Union[
+            pd.DataFrame,
+            np.ndarray,
+            List[List[Any]],
+            TypeVar("pyspark.sql.DataFrame"),
+            pl.DataFrame,
+        ]
+    ]:
+        """Read the feature group with embeddings from the online storage in batches.
+
+        All rows of the embedding index are paged through, without being limited by the max
+        result window of the index, and only one batch is held in memory at a time.
+
+        !!! example "Process an embedding feature group in chunks"
+            ```python
+            fg = fs.get_feature_group(...)
+            for df in fg.read_online_batches(batch_size=10000, dataframe_type="pandas"):
+                process(df)
+            ```
+
+        # Arguments
+            batch_size: Maximum number of rows per batch. Defaults to 1000.
+            dataframe_type: str, optional. The type of the returned batches.
+                Possible values are `"default"`, `"spark"`,`"pandas"`, `"polars"`, `"numpy"` or `"python"`.
+                Defaults to "default", which maps to Spark dataframe for the Spark Engine and Pandas dataframe for the Python engine.
+
+        # Returns
+            `Iterator`. An iterator over the batches of the feature group.
+
+        # Raises
+            `hsfs.client.exceptions.FeatureStoreException`. If the feature group does not have an embedding index.
+        """
+        if not self._embedding_index:
+            raise FeatureStoreException(
+                "Reading in batches from the online storage is only supported for feature groups with embeddings."
+            )
+        return engine.get_instance().read_vector_db_batches(
+            self, batch_size=batch_size, dataframe_type=dataframe_type
+        )
+
     def read_changes(
         self,
         start_wallclock_time: Union[str, int, datetime, date],
@@ -2543,6 +2590,17 @@ class FeatureGroup(FeatureGroupBase):
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
                   will use external listeners when connecting from outside of Hopsworks.
+                * key `kafka_chunk_size` and value an integer, the number of rows encoded at once
+                  before being produced to Kafka. Defaults to `10000`.
+                * key `kafka_encoding_workers` and value an integer, the number of workers encoding the chunks
+                  concurrently. Defaults to `1`, encoding in the calling thread.
+                * key `kafka_encoding_pool` and value `"thread"` or `"process"`, the type of pool used by the
+                  encoding workers. Defaults to `"thread"`. With `"process"` the workers are spawned, they re-import
+                  the `__main__` module of a script, which must therefore guard its entry point with
+                  `if __name__ == "__main__":`, and every chunk is pickled to be sent to a worker.
+                * key `kafka_producers` and value an integer, the number of Kafka producers sending the encoded
+                  rows in parallel. Rows with the same primary key are always sent by the same producer to keep
+                  their order. Defaults to `1`.
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
@@ -2735,6 +2793,17 @@ class FeatureGroup(FeatureGroupBase):
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
                   will use external listeners when connecting from outside of Hopsworks.
+                * key `kafka_chunk_size` and value an integer, the number of rows encoded at once
+                  before being produced to Kafka. Defaults to `10000`.
+                * key `kafka_encoding_workers` and value an integer, the number of workers encoding the chunks
+                  concurrently. Defaults to `1`, encoding in the calling thread.
+                * key `kafka_encoding_pool` and value `"thread"` or `"process"`, the type of pool used by the
+                  encoding workers. Defaults to `"thread"`. With `"process"` the workers are spawned, they re-import
+                  the `__main__` module of a script, which must therefore guard its entry point with
+                  `if __name__ == "__main__":`, and every chunk is pickled to be sent to a worker.
+                * key `kafka_producers` and value an integer, the number of Kafka producers sending the encoded
+                  rows in parallel. Rows with the same primary key are always sent by the same producer to keep
+                  their order. Defaults to `1`.
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
@@ -2905,6 +2974,17 @@ class FeatureGroup(FeatureGroupBase):
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
                   will use external listeners when connecting from outside of Hopsworks.
+                * key `kafka_chunk_size` and value an integer, the number of rows encoded at once
+                  before being produced to Kafka. Defaults to `10000`.
+                * key `kafka_encoding_workers` and value an integer, the number of workers encoding the chunks
+                  concurrently. Defaults to `1`, encoding in the calling thread.
+                * key `kafka_encoding_pool` and value `"thread"` or `"process"`, the type of pool used by the
+                  encoding workers. Defaults to `"thread"`. With `"process"` the workers are spawned, they re-import
+                  the `__main__` module of a script, which must therefore guard its entry point with
+                  `if __name__ == "__main__":`, and every chunk is pickled to be sent to a worker.
+                * key `kafka_producers` and value an integer, the number of Kafka producers sending the encoded
+                  rows in parallel. Rows with the same primary key are always sent by the same producer to keep
+                  their order. Defaults to `1`.
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
@@ -2957,6 +3037,7 @@ class FeatureGroup(FeatureGroupBase):
         if self._kafka_producer is not None:
             self._kafka_producer.flush()
             self._kafka_producer = None
+            kafka_engine.close_kafka_resources(self)
         self._feature_writers = None
         self._writer = None
         self._kafka_headers = None
@@ -3763,6 +3844,17 @@ class ExternalFeatureGroup(FeatureGroupBase):
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
                   will use external listeners when connecting from outside of Hopsworks.
+                * key `kafka_chunk_size` and value an integer, the number of rows encoded at once
+                  before being produced to Kafka. Defaults to `10000`.
+                * key `kafka_encoding_workers` and value an integer, the number of workers encoding the chunks
+                  concurrently. Defaults to `1`, encoding in the calling thread.
+                * key `kafka_encoding_pool` and value `"thread"` or `"process"`, the type of pool used by the
+                  encoding workers. Defaults to `"thread"`. With `"process"` the workers are spawned, they re-import
+                  the `__main__` module of a script, which must therefore guard its entry point with
+                  `if __name__ == "__main__":`, and every chunk is pickled to be sent to a worker.
+                * key `kafka_producers` and value an integer, the number of Kafka producers sending the encoded
+                  rows in parallel. Rows with the same primary key are always sent by the same producer to keep
+                  their order. Defaults to `1`.
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
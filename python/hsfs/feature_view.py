@@ -15,6 +15,7 @@
 #
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import warnings
@@ -23,6 +24,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -62,6 +64,7 @@ from hsfs.core import (
 from hsfs.core import feature_monitoring_config as fmc
 from hsfs.core import feature_monitoring_result as fmr
 from hsfs.core.feature_view_api import FeatureViewApi
+from hsfs.core.opensearch import OpenSearchClientSingleton
 from hsfs.core.vector_db_client import VectorDbClient
 from hsfs.decorators import typechecked
 from hsfs.feature import Feature
@@ -292,7 +295,10 @@ class FeatureView:
         init_rest_client: bool = False,
         reset_rest_client: bool = False,
         config_rest_client: Optional[Dict[str, Any]] = None,
-        default_client: Optional[Literal["sql", "rest"]] = None,
+        default_client: Optional[Literal["sql", "rest", "auto"]] = None,
+        config_feature_vector_cache: Optional[Dict[str, Any]] = None,
+        config_serving_latency: Optional[Dict[str, Any]] = None,
+        config_vector_db_client: Optional[Dict[str, Any]] = None,
         **kwargs,
     ) -> None:
         """Initialise feature view to retrieve feature vector from online and offline feature store.
@@ -326,9 +332,14 @@ class FeatureView:
                 If set to True, this ensure the online store rest client is initialised. Pass additional configuration
                 options via the rest_config parameter. Set reset_rest_client to True to reset the rest client.
             default_client: string, optional. Which client to default to if both are initialised. Defaults to None.
+                Set to `"auto"` to route each lookup to the client with the lower observed latency for its batch size,
+                this requires both clients. The SQL client is then initialised unless init_sql_client is set to False.
             options: Additional options as key/value pairs for configuring online serving engine.
                 * key: kwargs of SqlAlchemy engine creation (See: https://docs.sqlalchemy.org/en/20/core/engines.html#sqlalchemy.create_engine).
                   For example: `{"pool_size": 10}`
+                * key `"batch_chunk_size"`: int, optional. Batch lookups with more entries are split into lookups of at most
+                  this many keys, executed concurrently on the connection pool and streamed into the result. Defaults to 10000.
+                * key `"fetch_size"`: int, optional. Number of rows fetched at a time by the streamed batch lookups. Defaults to 1000.
             reset_rest_client: boolean, defaults to False. If set to True, the rest client will be reset and reinitialised with provided configuration.
             config_rest_client: dictionary, optional. Additional configuration options for the rest client. If the client is already initialised,
                 this will be ignored. Options include:
@@ -339,6 +350,27 @@ class FeatureView:
                     provided if initialising the rest client in an internal environment.
                 * `timeout`: int, optional. The timeout for the rest client in seconds. Defaults to 2.
                 * `use_ssl`: boolean, optional. Use SSL to connect to the online store. Defaults to True.
+                * `batch_size`: int, optional. Maximum number of entries sent in a single batch request, larger
+                    batches are split into chunks. Defaults to 1000.
+                * `max_concurrent_requests`: int, optional. Maximum number of chunks of a batch request sent
+                    concurrently. Defaults to 4.
+            config_feature_vector_cache: dictionary, optional. If provided, feature values fetched from the online store
+                are cached client-side per feature group and serving key values, and subsequent lookups of the same keys
+                are served from the cache. Defaults to None, i.e. no caching. Options include:
+                * `ttl`: float, optional. Number of seconds after which a cached entry expires. Defaults to 60.
+                * `max_entries`: int, optional. Maximum number of cached entries, the least recently used entry
+                    is evicted first. Defaults to 10000.
+            config_serving_latency: dictionary, optional. If provided, the time spent in each stage of the feature
+                vector retrievals is recorded, see `get_serving_latency_statistics`. Defaults to None, i.e. no
+                instrumentation. Options include:
+                * `window_size`: int, optional. Number of most recent retrievals the latency percentiles are computed
+                    over. Defaults to 1000.
+                * `hooks`: list of callables, optional. Called after every retrieval with a dictionary of stage names
+                    to seconds, e.g. to observe the latencies with a Prometheus histogram or an OpenTelemetry meter.
+            config_vector_db_client: dictionary, optional. Additional configuration options for the vector database
+                client, used if the feature view contains embeddings. Options include:
+                * `pool_maxsize`: int, optional. Number of connections kept open to the vector database, i.e. of
+                    lookups that can run concurrently without opening a new connection. Defaults to 10.
 
         """
         # initiate batch scoring server
@@ -388,6 +420,8 @@ class FeatureView:
             reset_rest_client=reset_rest_client,
             config_rest_client=config_rest_client,
             default_client=default_client,
+            config_feature_vector_cache=config_feature_vector_cache,
+            config_serving_latency=config_serving_latency,
         )
 
         self._prefix_serving_key_map = dict(
@@ -397,6 +431,10 @@ class FeatureView:
             ]
         )
         if len(self._get_embedding_fgs()) > 0:
+            if config_vector_db_client and "pool_maxsize" in config_vector_db_client:
+                OpenSearchClientSingleton.set_pool_maxsize(
+                    config_vector_db_client["pool_maxsize"]
+                )
             self._vector_db_client = VectorDbClient(
                 self.query, serving_keys=self._serving_keys
             )
@@ -732,6 +770,309 @@ class FeatureView:
             request_parameters=request_parameters,
         )
 
+    async def get_feature_vector_async(
+        self,
+        entry: Dict[str, Any],
+        passed_features: Optional[Dict[str, Any]] = None,
+        external: Optional[bool] = None,
+        return_type: Literal["list", "polars", "numpy", "pandas"] = "list",
+        allow_missing: bool = False,
+        force_rest_client: bool = False,
+        force_sql_client: bool = False,
+        transformed: Optional[bool] = True,
+        request_parameters: Optional[Dict[str, Any]] = None,
+    ) -> Union[List[Any], pd.DataFrame, np.ndarray, pl.DataFrame]:
+        """Returns assembled feature vector from online feature store, as a coroutine.
+
+        Same as [`feature_view.get_feature_vector`](#get_feature_vector) but the lookup in the online feature store
+        does not block the running event loop. Many lookups can therefore be awaited concurrently from an asyncio
+        application, e.g. a model server, without applying `nest_asyncio`.
+
+        !!! example
+            ```python
+            # get feature store instance
+            fs = ...
+
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+
+            # initialise feature view to retrieve feature vectors
+            feature_view.init_serving(training_dataset_version=1)
+
+            # get assembled serving vectors concurrently
+            await asyncio.gather(
+                feature_view.get_feature_vector_async(entry = {"pk1": 1, "pk2": 2}),
+                feature_view.get_feature_vector_async(entry = {"pk1": 3, "pk2": 4}),
+            )
+            ```
+
+        !!! note "Event loop"
+            The connection pool of the SQL client is bound to the event loop it is created in. Call `init_serving`
+            and use the coroutine from the same event loop for the whole lifetime of the serving application.
+
+        # Arguments
+            entry: dictionary of feature group primary key and values provided by serving application.
+                Set of required primary keys is [`feature_view.primary_keys`](#primary_keys)
+                If the required primary keys is not provided, it will look for name
+                of the primary key in feature group in the entry.
+            passed_features: dictionary of feature values provided by the application at runtime.
+                They can replace features values fetched from the feature store as well as
+                providing feature values which are not available in the feature store.
+            external: boolean, optional. If set to True, the connection to the
+                online feature store is established using the same host as
+                for the `host` parameter in the [`hsfs.connection()`](connection_api.md#connection) method.
+                If set to False, the online feature store storage connector is used
+                which relies on the private IP. Defaults to True if connection to Hopsworks is established from
+                external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
+            return_type: `"list"`, `"pandas"`, `"polars"` or `"numpy"`. Defaults to `"list"`.
+            force_rest_client: boolean, defaults to False. If set to True, reads from online feature store
+                using the REST client if initialised.
+            force_sql_client: boolean, defaults to False. If set to True, reads from online feature store
+                using the SQL client if initialised.
+            allow_missing: Setting to `True` returns feature vectors with missing values.
+            transformed: Setting to `False` returns the untransformed feature vectors.
+            request_parameters: Request parameters required by on-demand transformation functions to compute on-demand features present in the feature view.
+
+        # Returns
+            `list`, `pd.DataFrame`, `polars.DataFrame` or `np.ndarray` if `return type` is set to `"list"`, `"pandas"`, `"polars"` or `"numpy"`
+            respectively. Defaults to `list`.
+
+        # Raises
+            `Exception`. When primary key entry cannot be found in one or more of the feature groups used by this
+                feature view.
+        """
+        if self._vector_server is None:
+            self.init_serving(external=external)
+
+        vector_db_features = None
+        if self._vector_db_client:
+            vector_db_features = await self._get_vector_db_result_async(entry)
+        return await self._vector_server.get_feature_vector_async(
+            entry=entry,
+            return_type=return_type,
+            passed_features=passed_features,
+            allow_missing=allow_missing,
+            vector_db_features=vector_db_features,
+            force_rest_client=force_rest_client,
+            force_sql_client=force_sql_client,
+            transformed=transformed,
+            request_parameters=request_parameters,
+        )
+
+    async def get_feature_vectors_async(
+        self,
+        entry: List[Dict[str, Any]],
+        passed_features: Optional[List[Dict[str, Any]]] = None,
+        external: Optional[bool] = None,
+        return_type: Literal["list", "polars", "numpy", "pandas"] = "list",
+        allow_missing: bool = False,
+        force_rest_client: bool = False,
+        force_sql_client: bool = False,
+        transformed: Optional[bool] = True,
+        request_parameters: Optional[List[Dict[str, Any]]] = None,
+    ) -> Union[List[List[Any]], pd.DataFrame, np.ndarray, pl.DataFrame]:
+        """Returns assembled feature vectors in batches from online feature store, as a coroutine.
+
+        Same as [`feature_view.get_feature_vectors`](#get_feature_vectors) but the lookup in the online feature store
+        does not block the running event loop.
+
+        !!! example
+            ```python
+            # get feature store instance
+            fs = ...
+
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+
+            # get assembled serving vectors as a python list of lists
+            await feature_view.get_feature_vectors_async(
+                entry = [
+                    {"pk1": 1, "pk2": 2},
+                    {"pk1": 3, "pk2": 4},
+                    {"pk1": 5, "pk2": 6}
+                ]
+            )
+            ```
+
+        # Arguments
+            entry: a list of dictionary of feature group primary key and values provided by serving application.
+                Set of required primary keys is [`feature_view.primary_keys`](#primary_keys)
+                If the required primary keys is not provided, it will look for name
+                of the primary key in feature group in the entry.
+            passed_features: a list of dictionary of feature values provided by the application at runtime.
+                They can replace features values fetched from the feature store as well as
+                providing feature values which are not available in the feature store.
+            external: boolean, optional. If set to True, the connection to the
+                online feature store is established using the same host as
+                for the `host` parameter in the [`hsfs.connection()`](connection_api.md#connection) method.
+                If set to False, the online feature store storage connector is used
+                which relies on the private IP. Defaults to True if connection to Hopsworks is established from
+                external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
+            return_type: `"list"`, `"pandas"`, `"polars"` or `"numpy"`. Defaults to `"list"`.
+            force_sql_client: boolean, defaults to False. If set to True, reads from online feature store
+                using the SQL client if initialised.
+            force_rest_client: boolean, defaults to False. If set to True, reads from online feature store
+                using the REST client if initialised.
+            allow_missing: Setting to `True` returns feature vectors with missing values.
+            transformed: Setting to `False` returns the untransformed feature vectors.
+            request_parameters: Request parameters required by on-demand transformation functions to compute on-demand features present in the feature view.
+
+        # Returns
+            `List[list]`, `pd.DataFrame`, `polars.DataFrame` or `np.ndarray` if `return type` is set to `"list", `"pandas"`,`"polars"` or `"numpy"`
+            respectively. Defaults to `List[list]`.
+
+        # Raises
+            `Exception`. When primary key entry cannot be found in one or more of the feature groups used by this
+                feature view.
+        """
+        if self._vector_server is None:
+            self.init_serving(external=external, init_rest_client=force_rest_client)
+        vector_db_features = []
+        if self._vector_db_client:
+            vector_db_features = list(
+                await asyncio.gather(
+                    *[self._get_vector_db_result_async(_entry) for _entry in entry]
+                )
+            )
+
+        return await self._vector_server.get_feature_vectors_async(
+            entries=entry,
+            return_type=return_type,
+            passed_features=passed_features,
+            allow_missing=allow_missing,
+            vector_db_features=vector_db_features,
+            force_rest_client=force_rest_client,
+            force_sql_client=force_sql_client,
+            transformed=transformed,
+            request_parameters=request_parameters,
+        )
+
+    def get_feature_vector_cache_statistics(self) -> Optional[Dict[str, int]]:
+        """Returns hit, miss and eviction counters of the client-side feature vector cache.
+
+        !!! example
+            ```python
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+
+            # initialise feature view with a feature vector cache
+            feature_view.init_serving(config_feature_vector_cache={"ttl": 30, "max_entries": 1000})
+
+            feature_view.get_feature_vector(entry={"id": 1})
+            feature_view.get_feature_vector_cache_statistics()
+            ```
+
+        Hits and misses are counted per entry, an entry is a hit only if the values of all its feature groups are cached.
+
+        # Returns
+            `Dict[str, int]`: The `hits`, `misses`, `evictions` and current `size` of the cache,
+                or `None` if serving is not initialised with a feature vector cache.
+        """
+        if (
+            self._vector_server is None
+            or self._vector_server.feature_vector_cache is None
+        ):
+            return None
+        return self._vector_server.feature_vector_cache.statistics
+
+    def get_online_client_statistics(self) -> Optional[Dict[str, Any]]:
+        """Returns the latencies observed per online client when the default client is `"auto"`.
+
+        !!! example
+            ```python
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+
+            # initialise feature view with automatic client selection
+            feature_view.init_serving(
+                init_rest_client=True, init_sql_client=True, default_client="auto"
+            )
+
+            feature_view.get_feature_vectors(entry=[{"id": 1}, {"id": 2}])
+            feature_view.get_online_client_statistics()
+            ```
+
+        # Returns
+            `Dict[str, Any]`: The number of client `switches` and, per batch size bucket, the selected client
+                and the `count`, `p50_ms` and `p95_ms` latencies of each client,
+                or `None` if serving is not initialised with automatic client selection.
+        """
+        if (
+            self._vector_server is None
+            or self._vector_server.online_client_selector is None
+        ):
+            return None
+        return self._vector_server.online_client_selector.statistics
+
+    def get_vector_db_pool_statistics(self) -> Optional[List[Dict[str, Any]]]:
+        """Returns the state of the connection pools of the vector database client.
+
+        !!! example
+            ```python
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+
+            # initialise feature view with a larger connection pool to the vector database
+            feature_view.init_serving(config_vector_db_client={"pool_maxsize": 32})
+
+            feature_view.find_neighbors([0.1, 0.2, 0.3], k=5)
+            feature_view.get_vector_db_pool_statistics()
+            ```
+
+        # Returns
+            `List[Dict[str, Any]]`: Per host, the number of connections opened so far (`num_connections`),
+                of requests sent (`num_requests`), of open connections currently available (`idle_connections`)
+                and of connections kept open (`maxsize`),
+                or `None` if serving is not initialised or the feature view contains no embeddings.
+        """
+        if self._vector_db_client is None:
+            return None
+        return self._vector_db_client.get_pool_statistics()
+
+    def get_serving_latency_statistics(self) -> Optional[Dict[str, Dict[str, float]]]:
+        """Returns how the latency of the recent feature vector retrievals splits across their stages.
+
+        !!! example
+            ```python
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+
+            # initialise feature view with latency instrumentation
+            feature_view.init_serving(config_serving_latency={"window_size": 1000})
+
+            feature_view.get_feature_vector(entry={"id": 1})
+            feature_view.get_serving_latency_statistics()["fetch"]["p99_ms"]
+            ```
+
+        The stages of a retrieval are `validate_entry`, `fetch`, `return_value_handlers`,
+        `on_demand_transformations`, `model_dependent_transformations`, `return_type` and `total`.
+        The fetch is further split into `rest_request` and `rest_decode` for the REST client and
+        into `sql_execute` and `sql_assemble` for the SQL client.
+
+        # Returns
+            `Dict[str, Dict[str, float]]`: The `count`, `mean_ms`, `p50_ms`, `p95_ms` and `p99_ms` latencies per stage,
+                or `None` if serving is not initialised with latency instrumentation.
+        """
+        if (
+            self._vector_server is None
+            or self._vector_server.serving_latency_recorder is None
+        ):
+            return None
+        return self._vector_server.serving_latency_recorder.statistics
+
+    def reset_serving_latency_statistics(self) -> None:
+        """Drops the latencies recorded so far by the serving latency instrumentation, if any."""
+        if (
+            self._vector_server is not None
+            and self._vector_server.serving_latency_recorder is not None
+        ):
+            self._vector_server.serving_latency_recorder.reset()
+
+    def clear_feature_vector_cache(self) -> None:
+        """Drops all entries of the client-side feature vector cache, if any."""
+        if self._vector_server is not None:
+            self._vector_server.clear_feature_vector_cache()
+
     def get_inference_helper(
         self,
         entry: Dict[str, Any],
@@ -867,6 +1208,35 @@ class FeatureView:
                 result_vectors.update(vector_db_features)
         return result_vectors
 
+    async def _get_vector_db_result_async(
+        self,
+        entry: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        if not self._vector_db_client:
+            return {}
+        reads = []
+        for join_index, fg in self._vector_db_client.embedding_fg_by_join_index.items():
+            complete, fg_entry = self._vector_db_client.filter_entry_by_join_index(
+                entry, join_index
+            )
+            if not complete:
+                # Not retrieving from vector db if entry is not completed
+                continue
+            reads.append(
+                self._vector_db_client.read_async(
+                    fg.id,
+                    fg.features,
+                    keys=fg_entry,
+                    index_name=fg.embedding_index.index_name,
+                )
+            )
+        result_vectors = {}
+        # the feature groups are read concurrently, the results are merged in join order
+        for vector_db_features in await asyncio.gather(*reads):
+            if vector_db_features:
+                result_vectors.update(vector_db_features[0])  # get the first result
+        return result_vectors
+
     def find_neighbors(
         self,
         embedding: List[Union[int, float]],
@@ -941,7 +1311,7 @@ class FeatureView:
             filter=filter,
         )
         if len(results) == 0:
-            return []
+            return self._empty_feature_vectors(return_type)
 
         return self._vector_server.get_feature_vectors(
             [self._extract_primary_key(res[1]) for res in results],
@@ -950,6 +1320,158 @@ class FeatureView:
             allow_missing=True,
         )
 
+    async def find_neighbors_async(
+        self,
+        embedding: List[Union[int, float]],
+        feature: Optional[Feature] = None,
+        k: Optional[int] = 10,
+        filter: Optional[Union[Filter, Logic]] = None,
+        external: Optional[bool] = None,
+        return_type: Literal["list", "polars", "pandas"] = "list",
+    ) -> List[List[Any]]:
+        """
+        Finds the nearest neighbors for a given embedding in the vector database, as a coroutine.
+
+        Same as [`feature_view.find_neighbors`](#find_neighbors) but the search in the vector database and the
+        lookup in the online feature store do not block the running event loop. Concurrent searches share the
+        connection pool of the vector database client, see the `config_vector_db_client` option of `init_serving`.
+
+        # Arguments
+            embedding: The target embedding for which neighbors are to be found.
+            feature: The feature used to compute similarity score. Required only if there
+            are multiple embeddings (optional).
+            k: The number of nearest neighbors to retrieve (default is 10).
+            filter: A filter expression to restrict the search space (optional).
+            external: boolean, optional. If set to True, the connection to the
+                online feature store is established using the same host as
+                for the `host` parameter in the [`hsfs.connection()`](connection_api.md#connection) method.
+                If set to False, the online feature store storage connector is used
+                which relies on the private IP. Defaults to True if connection to Hopsworks is established from
+                external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
+            return_type: `"list"`, `"pandas"` or `"polars"`. Defaults to `"list"`.
+
+        # Returns
+            `list`, `pd.DataFrame` or `polars.DataFrame` if `return type` is set to `"list"`, `"pandas"` or
+            `"polars"` respectively. Defaults to `list`.
+
+        !!! Example
+            ```
+            await asyncio.gather(
+                fv.find_neighbors_async([0.1, 0.2, 0.3], k=5),
+                fv.find_neighbors_async([0.3, 0.2, 0.1], k=5),
+            )
+            ```
+        """
+        if self._vector_db_client is None:
+            self.init_serving(external=external)
+        results = await self._vector_db_client.find_neighbors_async(
+            embedding,
+            feature=(feature if feature else None),
+            k=k,
+            filter=filter,
+        )
+        if len(results) == 0:
+            return self._empty_feature_vectors(return_type)
+
+        return await self._vector_server.get_feature_vectors_async(
+            [self._extract_primary_key(res[1]) for res in results],
+            return_type=return_type,
+            vector_db_features=[res[1] for res in results],
+            allow_missing=True,
+        )
+
+    def find_neighbors_batch(
+        self,
+        embeddings: List[List[Union[int, float]]],
+        feature: Optional[Feature] = None,
+        k: Optional[int] = 10,
+        filter: Optional[Union[Filter, Logic]] = None,
+        external: Optional[bool] = None,
+        return_type: Literal["list", "polars", "pandas"] = "list",
+    ) -> List[Union[List[List[Any]], pd.DataFrame, pl.DataFrame]]:
+        """
+        Finds the nearest neighbors for each of the given embeddings in the vector database.
+
+        All embeddings are searched with a single request to the vector database and the feature vectors
+        of all neighbors are retrieved with a single batch lookup, which is considerably faster than
+        calling `find_neighbors` once per embedding.
+
+        # Arguments
+            embeddings: The target embeddings for which neighbors are to be found.
+            feature: The feature used to compute similarity score. Required only if there
+            are multiple embeddings (optional).
+            k: The number of nearest neighbors to retrieve per embedding (default is 10).
+            filter: A filter expression to restrict the search space (optional).
+            external: boolean, optional. If set to True, the connection to the
+                online feature store is established using the same host as
+                for the `host` parameter in the [`hsfs.connection()`](connection_api.md#connection) method.
+                If set to False, the online feature store storage connector is used
+                which relies on the private IP. Defaults to True if connection to Hopsworks is established from
+                external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
+            return_type: `"list"`, `"pandas"` or `"polars"`. Defaults to `"list"`.
+
+        # Returns
+            `list` with the neighbors of each embedding, in the order of `embeddings`, as returned by `find_neighbors`.
+
+        !!! Example
+            ```
+            fv.find_neighbors_batch(
+                [[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]],
+                k=5,
+            )
+            ```
+        """
+        if self._vector_db_client is None:
+            self.init_serving(external=external)
+        results = self._vector_db_client.find_neighbors_batch(
+            embeddings,
+            feature=(feature if feature else None),
+            k=k,
+            filter=filter,
+        )
+        neighbors = [neighbor for result in results for neighbor in result]
+        if len(neighbors) == 0:
+            return [self._empty_feature_vectors(return_type) for _ in results]
+
+        feature_vectors = self._vector_server.get_feature_vectors(
+            [self._extract_primary_key(neighbor[1]) for neighbor in neighbors],
+            return_type=return_type,
+            vector_db_features=[neighbor[1] for neighbor in neighbors],
+            allow_missing=True,
+        )
+        # missing values are allowed, so there is one feature vector per neighbor
+        neighbors_per_embedding = []
+        offset = 0
+        for result in results:
+            # embeddings without neighbors get an empty slice, with the columns of the frame
+            if isinstance(feature_vectors, pd.DataFrame):
+                neighbors_per_embedding.append(
+                    feature_vectors.iloc[offset : offset + len(result)].reset_index(
+                        drop=True
+                    )
+                )
+            elif isinstance(feature_vectors, pl.DataFrame):
+                neighbors_per_embedding.append(
+                    feature_vectors.slice(offset, len(result))
+                )
+            else:
+                neighbors_per_embedding.append(
+                    feature_vectors[offset : offset + len(result)]
+                )
+            offset += len(result)
+        return neighbors_per_embedding
+
+    def _empty_feature_vectors(
+        self, return_type: Literal["list", "polars", "pandas"]
+    ) -> Union[List[Any], pd.DataFrame, pl.DataFrame]:
+        return self._vector_server.handle_feature_vector_return_type(
+            [],
+            batch=True,
+            inference_helper=False,
+            return_type=return_type,
+            transformed=True,
+        )
+
     def _extract_primary_key(self, result_key: Dict[str, str]) -> Dict[str, str]:
         primary_key_map = {}
         for prefix_sk, sk in self._prefix_serving_key_map.items():
@@ -1065,6 +1587,86 @@ class FeatureView:
             transformed=transformed,
         )
 
+    def get_batch_data_iter(
+        self,
+        start_time: Optional[Union[str, int, datetime, date]] = None,
+        end_time: Optional[Union[str, int, datetime, date]] = None,
+        batch_size: Optional[int] = None,
+        read_options: Optional[Dict[str, Any]] = None,
+        primary_key: bool = False,
+        event_time: bool = False,
+        inference_helper_columns: bool = False,
+        dataframe_type: Optional[str] = "default",
+        transformed: Optional[bool] = True,
+    ) -> Iterator[
+        Union[TrainingDatasetDataFrameTypes, TypeVar("pyarrow.RecordBatch")]  # noqa: F821
+    ]:
+        """Get a batch of data from an event time interval from the offline feature store, in chunks.
+
+        The chunks are streamed from the Hopsworks Feature Query Service and the model-dependent
+        transformation functions are applied to each chunk, so that batch scoring over feature groups
+        larger than the available memory runs in constant memory.
+
+        !!! example "Batch scoring in chunks"
+            ```python
+                # get feature store instance
+                fs = ...
+
+                # get feature view instance
+                feature_view = fs.get_feature_view(...)
+
+                for df in feature_view.get_batch_data_iter(batch_size=100000):
+                    predictions = model.predict(df)
+            ```
+
+        !!! warning "Engine Support"
+            **Python only**, reading in chunks requires the Hopsworks Feature Query Service.
+
+        # Arguments
+            start_time: Start event time for the batch query, inclusive. Optional. Strings should be
+                formatted in one of the following formats `%Y-%m-%d`, `%Y-%m-%d %H`, `%Y-%m-%d %H:%M`, `%Y-%m-%d %H:%M:%S`,
+                or `%Y-%m-%d %H:%M:%S.%f`. Int, i.e Unix Epoch should be in seconds.
+            end_time: End event time for the batch query, exclusive. Optional. Strings should be
+                formatted in one of the following formats `%Y-%m-%d`, `%Y-%m-%d %H`, `%Y-%m-%d %H:%M`, `%Y-%m-%d %H:%M:%S`,
+                or `%Y-%m-%d %H:%M:%S.%f`. Int, i.e Unix Epoch should be in seconds.
+            batch_size: Number of rows per chunk. Defaults to `None`, which yields the chunks as they are received.
+            read_options: User provided read options for python engine, defaults to `{}`:
+                * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
+                  For example: `{"arrow_flight_config": {"timeout": 900}}`
+                  If the result is split over multiple endpoints, they are fetched concurrently by up
+                  to `"max_workers"` threads and the batches are yielded in the order of the result,
+                  set `"ordered": False` to yield them as they arrive instead.
+            primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
+                features.
+            event_time: whether to include event time feature or not.  Defaults to `False`, no event time feature.
+            inference_helper_columns: whether to include inference helper columns or not. Defaults to `False`, no helper columns.
+            dataframe_type: str, optional. The type of the yielded chunks.
+                Possible values are `"default"`, `"pandas"`, `"polars"`, `"numpy"`, `"python"` or `"pyarrow"`.
+                `"pyarrow"` yields `pyarrow.RecordBatch`es and requires `transformed=False` if the feature view has
+                transformation functions. Defaults to "default", which maps to Pandas dataframe.
+            transformed: Setting to `False` returns the untransformed feature vectors.
+
+        # Returns
+            `Iterator`. An iterator over the chunks of the batch data.
+        """
+        if self._batch_scoring_server is None:
+            self.init_batch_scoring()
+
+        return self._feature_view_engine.get_batch_data_iter(
+            self,
+            start_time,
+            end_time,
+            self._batch_scoring_server.training_dataset_version,
+            self._batch_scoring_server._model_dependent_transformation_functions,
+            batch_size=batch_size,
+            read_options=read_options,
+            primary_keys=primary_key,
+            event_time=event_time,
+            inference_helper_columns=inference_helper_columns,
+            dataframe_type=dataframe_type,
+            transformed=transformed,
+        )
+
     def add_tag(self, name: str, value: Any) -> None:
         """Attach a tag to a feature view.
 
@@ -2279,6 +2881,7 @@ class FeatureView:
         event_time: bool = False,
         training_helper_columns: bool = False,
         dataframe_type: Optional[str] = "default",
+        seed: Optional[int] = None,
         **kwargs,
     ) -> Tuple[
         TrainingDatasetDataFrameTypes,
@@ -2389,6 +2992,8 @@ class FeatureView:
             dataframe_type: str, optional. The type of the returned dataframe.
                 Possible values are `"default"`, `"spark"`,`"pandas"`, `"polars"`, `"numpy"` or `"python"`.
                 Defaults to "default", which maps to Spark dataframe for the Spark Engine and Pandas dataframe for the Python engine.
+            seed: Optionally, define a seed to create the random splits with, in order
+                to guarantee reproducability, defaults to `None`.
         # Returns
             (X_train, X_test, y_train, y_test):
                 Tuple of dataframe of features and labels
@@ -2414,6 +3019,7 @@ class FeatureView:
             statistics_config=statistics_config,
             training_dataset_type=training_dataset.TrainingDataset.IN_MEMORY,
             extra_filter=extra_filter,
+            seed=seed,
         )
         td, df = self._feature_view_engine.get_training_data(
             self,
@@ -2467,6 +3073,7 @@ class FeatureView:
         event_time: bool = False,
         training_helper_columns: bool = False,
         dataframe_type: Optional[str] = "default",
+        seed: Optional[int] = None,
         **kwargs,
     ) -> Tuple[
         TrainingDatasetDataFrameTypes,
@@ -2592,6 +3199,8 @@ class FeatureView:
             dataframe_type: str, optional. The type of the returned dataframe.
                 Possible values are `"default"`, `"spark"`,`"pandas"`, `"polars"`, `"numpy"` or `"python"`.
                 Defaults to "default", which maps to Spark dataframe for the Spark Engine and Pandas dataframe for the Python engine.
+            seed: Optionally, define a seed to create the random splits with, in order
+                to guarantee reproducability, defaults to `None`.
         # Returns
             (X_train, X_val, X_test, y_train, y_val, y_test):
                 Tuple of dataframe of features and labels
@@ -2626,6 +3235,7 @@ class FeatureView:
             statistics_config=statistics_config,
             training_dataset_type=training_dataset.TrainingDataset.IN_MEMORY,
             extra_filter=extra_filter,
+            seed=seed,
         )
         td, df = self._feature_view_engine.get_training_data(
             self,
@@ -2713,6 +3323,18 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"read_workers"` and value an integer, the number of files of the training
+                  dataset downloaded and parsed concurrently. Defaults to `8`.
+                * key `"columns"` and value a list of column names, to read only these columns
+                  from the files of the training dataset.
+                * key `"training_dataset_cache"` and value a dictionary to cache the training
+                  dataset locally as memory-mapped Arrow files, so that it is downloaded only once
+                  per node. For example: `{"training_dataset_cache": {"dir": "/tmp/td_cache",
+                  "max_size": 10 * 1024**3}}`. The least recently read files are evicted once the
+                  cache exceeds `"max_size"` bytes, which defaults to 10 GiB. Cached files are
+                  dropped when the training dataset metadata changes or the training dataset is
+                  recreated or deleted in this process, remove the directory to refresh a training
+                  dataset version recreated elsewhere.
                 Defaults to `{}`.
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
@@ -2780,6 +3402,18 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"read_workers"` and value an integer, the number of files of the training
+                  dataset downloaded and parsed concurrently. Defaults to `8`.
+                * key `"columns"` and value a list of column names, to read only these columns
+                  from the files of the training dataset.
+                * key `"training_dataset_cache"` and value a dictionary to cache the training
+                  dataset locally as memory-mapped Arrow files, so that it is downloaded only once
+                  per node. For example: `{"training_dataset_cache": {"dir": "/tmp/td_cache",
+                  "max_size": 10 * 1024**3}}`. The least recently read files are evicted once the
+                  cache exceeds `"max_size"` bytes, which defaults to 10 GiB. Cached files are
+                  dropped when the training dataset metadata changes or the training dataset is
+                  recreated or deleted in this process, remove the directory to refresh a training
+                  dataset version recreated elsewhere.
                 Defaults to `{}`.
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
@@ -2851,6 +3485,18 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"read_workers"` and value an integer, the number of files of the training
+                  dataset downloaded and parsed concurrently. Defaults to `8`.
+                * key `"columns"` and value a list of column names, to read only these columns
+                  from the files of the training dataset.
+                * key `"training_dataset_cache"` and value a dictionary to cache the training
+                  dataset locally as memory-mapped Arrow files, so that it is downloaded only once
+                  per node. For example: `{"training_dataset_cache": {"dir": "/tmp/td_cache",
+                  "max_size": 10 * 1024**3}}`. The least recently read files are evicted once the
+                  cache exceeds `"max_size"` bytes, which defaults to 10 GiB. Cached files are
+                  dropped when the training dataset metadata changes or the training dataset is
+                  recreated or deleted in this process, remove the directory to refresh a training
+                  dataset version recreated elsewhere.
                 Defaults to `{}`.
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
@@ -220,6 +220,10 @@ class HopsworksUdf:
 
         self._output_column_names: List[str] = []
 
+        # Compiled python wrapper for the UDF along with the key it was compiled for.
+        self._compiled_udf: Optional[Callable] = None
+        self._compiled_udf_key: Optional[Tuple] = None
+
     @staticmethod
     def _validate_and_convert_drop_features(
         dropped_features: Union[str, List[str]],
@@ -565,6 +569,33 @@ def renaming_wrapper(*args):
         # returning executed function object
         return eval("renaming_wrapper", scope)
 
+    def _get_compiled_udf(self) -> Callable:
+        """
+        Function that returns the compiled wrapper function for the UDF, compiling it only if required.
+
+        The compiled function is cached and reused as long as the source code, output column names and transformation statistics of the UDF do not change.
+
+        # Returns
+            `Callable`: A wrapper function that renames outputs of the User defined function into specified output column names.
+        """
+        compiled_udf_key = (
+            self._formatted_function_source,
+            self._module_imports,
+            tuple(self.output_column_names),
+            self.transformation_statistics,
+        )
+        if self._compiled_udf is None or self._compiled_udf_key != compiled_udf_key:
+            self._compiled_udf = self.hopsworksUdf_wrapper()
+            self._compiled_udf_key = compiled_udf_key
+        return self._compiled_udf
+
+    def _invalidate_compiled_udf(self) -> None:
+        """
+        Function that clears the cached compiled wrapper function so that it is recompiled on the next call to `get_udf`.
+        """
+        self._compiled_udf = None
+        self._compiled_udf_key = None
+
     def __call__(self, *features: List[str]) -> "HopsworksUdf":
         """
         Set features to be passed as arguments to the user defined functions
@@ -610,6 +641,7 @@ def renaming_wrapper(*args):
                 self._transformation_features, features
             )
         ]
+        udf._invalidate_compiled_udf()
         udf.output_column_names = udf._get_output_column_names()
         udf.dropped_features = updated_dropped_features
         return udf
@@ -644,12 +676,12 @@ def renaming_wrapper(*args):
             raise FeatureStoreException("UDF Type cannot be None")
 
         if engine.get_type() in ["hive", "python", "training"] or force_python_udf:
-            return self.hopsworksUdf_wrapper()
+            return self._get_compiled_udf()
         else:
             from pyspark.sql.functions import pandas_udf
 
             return pandas_udf(
-                f=self.hopsworksUdf_wrapper(),
+                f=self._get_compiled_udf(),
                 returnType=self._create_pandas_udf_return_schema_from_list(),
             )
 
@@ -881,6 +913,7 @@ def renaming_wrapper(*args):
         self._udf_type = udf_type
         self._validate_udf_type()
         self._output_column_names = self._get_output_column_names()
+        self._invalidate_compiled_udf()
 
     @property
     def dropped_features(self) -> List[str]:
@@ -905,6 +938,7 @@ def renaming_wrapper(*args):
     def transformation_statistics(
         self, statistics: List[FeatureDescriptiveStatistics]
     ) -> None:
+        self._invalidate_compiled_udf()
         self._statistics = TransformationStatistics(*self._statistics_argument_names)
         for stat in statistics:
             if stat.feature_name in self._statistics_argument_mapping.keys():
@@ -923,5 +957,12 @@ def renaming_wrapper(*args):
         else:
             self._output_column_names = output_col_names
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # The compiled wrapper is executed in a dynamically created scope and cannot be pickled, it is recompiled when required.
+        state = self.__dict__.copy()
+        state["_compiled_udf"] = None
+        state["_compiled_udf_key"] = None
+        return state
+
     def __repr__(self):
         return f'{self.function_name}({", ".join(self.transformation_features)})'
@@ -17,6 +17,9 @@
 import os
 import sys
 
+import pytest
+from hsfs.core import kafka_engine, query_constructor_api, storage_connector_api
+
 
 pytest_plugins = [
     "tests.fixtures.backend_fixtures",
@@ -30,3 +33,18 @@ os.environ["PYSPARK_DRIVER_PYTHON"] = sys.executable
 if os.name == "nt":
     current_path = os.path.dirname(os.path.realpath(__file__))
     os.environ["HADOOP_HOME"] = current_path + "/data/hadoop/"
+
+
+@pytest.fixture(autouse=True)
+def close_kafka_resources():
+    # producers and encoders are cached per feature group across inserts
+    yield
+    kafka_engine.close_kafka_resources()
+
+
+@pytest.fixture(autouse=True)
+def clear_query_caches():
+    # constructed queries and online connectors are cached across query objects
+    yield
+    query_constructor_api.QueryConstructorApi.clear_cache()
+    storage_connector_api.StorageConnectorApi.invalidate_online_connector()
@@ -14,11 +14,15 @@
 #   limitations under the License.
 #
 import datetime
+import threading
 from unittest.mock import MagicMock
 
 import pandas as pd
+import pyarrow
+import pyarrow.flight
 import pytest
 from hsfs import feature_group, feature_view, storage_connector, training_dataset
+from hsfs.client import exceptions
 from hsfs.constructor import fs_query
 from hsfs.core import arrow_flight_client
 from hsfs.engine import python
@@ -165,6 +169,227 @@ class TestArrowFlightClient:
         # Assert
         assert mock_read_query.call_count == 1
 
+    def test_read_query_batches(self, mocker, backend_fixtures):
+        # Arrange
+        self._arrange_engine_mocks(mocker, backend_fixtures)
+        fg = self._arrange_featuregroup_mocks(backend_fixtures)
+        record_batches = [
+            pyarrow.record_batch({"a": [1, 2, 3]}),
+            pyarrow.record_batch({"a": [4, 5, 6]}),
+        ]
+        mock_read_query_batches = mocker.patch(
+            "hsfs.core.arrow_flight_client.ArrowFlightClient.read_query_batches",
+            return_value=iter(record_batches),
+        )
+
+        # Act
+        batches = list(fg.select_all().read_batches(batch_size=3))
+
+        # Assert
+        assert mock_read_query_batches.call_args[0][2] == 3
+        assert [batch["a"].tolist() for batch in batches] == [[1, 2, 3], [4, 5, 6]]
+        assert all(isinstance(batch, pd.DataFrame) for batch in batches)
+
+    def test_read_query_batches_rebatches_stream(self, mocker):
+        # Arrange
+        client = arrow_flight_client.get_instance()
+        reader = mocker.MagicMock()
+        reader.__iter__.return_value = [
+            mocker.MagicMock(data=pyarrow.record_batch({"a": list(range(i, i + 3))}))
+            for i in range(0, 9, 3)
+        ]
+        mocker.patch.object(client, "get_flight_info").return_value.endpoints = [
+            mocker.MagicMock()
+        ]
+        mock_connection = mocker.patch.object(client, "_connection")
+        mock_connection.do_get.return_value = reader
+
+        # Act
+        batches = client.read_query_batches({"query_string": ""}, {}, batch_size=4)
+
+        # Assert
+        assert [batch.column(0).to_pylist() for batch in batches] == [
+            [0, 1, 2, 3],
+            [4, 5, 6, 7],
+            [8],
+        ]
+        reader.cancel.assert_not_called()
+
+    def test_read_query_batches_cancels_stream_when_closed_early(self, mocker):
+        # Arrange
+        client = arrow_flight_client.get_instance()
+        reader = mocker.MagicMock()
+        reader.__iter__.return_value = [
+            mocker.MagicMock(data=pyarrow.record_batch({"a": [i]})) for i in range(3)
+        ]
+        mocker.patch.object(client, "get_flight_info").return_value.endpoints = [
+            mocker.MagicMock()
+        ]
+        mock_connection = mocker.patch.object(client, "_connection")
+        mock_connection.do_get.return_value = reader
+        batches = client.read_query_batches({"query_string": ""}, {})
+
+        # Act
+        next(batches)
+        batches.close()
+
+        # Assert
+        reader.cancel.assert_called_once()
+
+    def _arrange_endpoints(self, mocker, client, batches_per_endpoint):
+        endpoints = [
+            mocker.MagicMock(ticket=i) for i in range(len(batches_per_endpoint))
+        ]
+        mocker.patch.object(
+            client, "get_flight_info"
+        ).return_value.endpoints = endpoints
+        readers = []
+        for batches in batches_per_endpoint:
+            reader = mocker.MagicMock()
+            reader.__iter__.return_value = [
+                mocker.MagicMock(data=pyarrow.record_batch({"a": batch}))
+                for batch in batches
+            ]
+            reader.read_all.return_value = pyarrow.Table.from_batches(
+                [chunk.data for chunk in reader.__iter__.return_value]
+            )
+            readers.append(reader)
+        mock_connection = mocker.patch.object(client, "_connection")
+        mock_connection.do_get.side_effect = lambda ticket, options: readers[ticket]
+        return mock_connection, readers
+
+    def test_read_query_multiple_endpoints(self, mocker):
+        # Arrange
+        client = arrow_flight_client.get_instance()
+        mock_connection, _ = self._arrange_endpoints(
+            mocker, client, [[[1, 2]], [[3]], [[4, 5], [6]]]
+        )
+
+        # Act
+        df = client.read_query({"query_string": ""}, {}, "pandas")
+
+        # Assert
+        assert mock_connection.do_get.call_count == 3
+        assert df["a"].tolist() == [1, 2, 3, 4, 5, 6]
+
+    def test_read_query_multiple_endpoints_retries_failed_endpoint(self, mocker):
+        # Arrange
+        mocker.patch("time.sleep")
+        client = arrow_flight_client.get_instance()
+        mock_connection, readers = self._arrange_endpoints(
+            mocker, client, [[[1, 2]], [[3]]]
+        )
+        readers[1].read_all.side_effect = [
+            pyarrow.flight.FlightUnavailableError("unavailable"),
+            pyarrow.Table.from_pydict({"a": [3]}),
+        ]
+
+        # Act
+        df = client.read_query({"query_string": ""}, {}, "polars")
+
+        # Assert
+        assert mock_connection.do_get.call_count == 3
+        assert df["a"].to_list() == [1, 2, 3]
+
+    def test_read_query_batches_multiple_endpoints(self, mocker):
+        # Arrange
+        client = arrow_flight_client.get_instance()
+        self._arrange_endpoints(mocker, client, [[[1, 2], [3]], [[4]], [[5, 6]]])
+
+        # Act
+        batches = client.read_query_batches(
+            {"query_string": ""}, {"max_workers": 2}, batch_size=4
+        )
+
+        # Assert
+        assert [batch.column(0).to_pylist() for batch in batches] == [
+            [1, 2, 3, 4],
+            [5, 6],
+        ]
+
+    def test_read_query_batches_multiple_endpoints_unordered(self, mocker):
+        # Arrange
+        client = arrow_flight_client.get_instance()
+        self._arrange_endpoints(mocker, client, [[[1, 2], [3]], [[4]], [[5, 6]]])
+
+        # Act
+        batches = client.read_query_batches({"query_string": ""}, {"ordered": False})
+
+        # Assert
+        assert sorted(
+            value for batch in batches for value in batch.column(0).to_pylist()
+        ) == [1, 2, 3, 4, 5, 6]
+
+    def test_read_query_batches_multiple_endpoints_error(self, mocker):
+        # Arrange
+        client = arrow_flight_client.get_instance()
+        _, readers = self._arrange_endpoints(mocker, client, [[[1]], [[2]]])
+        readers[1].__iter__.side_effect = pyarrow.flight.FlightInternalError("failed")
+        batches = client.read_query_batches({"query_string": ""}, {})
+
+        # Act
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            list(batches)
+
+        # Assert
+        assert str(e_info.value) == client.READ_ERROR
+
+    def test_read_query_batches_cancels_reader_opened_after_close(self, mocker):
+        # Arrange
+        client = arrow_flight_client.get_instance()
+        mock_connection, readers = self._arrange_endpoints(
+            mocker, client, [[[1], [2]], [[3]]]
+        )
+        requested = threading.Event()
+        closed = threading.Event()
+        cancelled = threading.Event()
+        readers[1].cancel.side_effect = lambda: cancelled.set()
+
+        def do_get(ticket, options):
+            if ticket == 1:
+                # the request of the second endpoint completes after the consumer went away
+                requested.set()
+                closed.wait(timeout=5)
+            return readers[ticket]
+
+        mock_connection.do_get.side_effect = do_get
+        batches = client.read_query_batches({"query_string": ""}, {"max_workers": 2})
+
+        # Act
+        next(batches)
+        assert requested.wait(timeout=5)
+        batches.close()
+        closed.set()
+
+        # Assert
+        assert cancelled.wait(timeout=5)
+        readers[0].cancel.assert_called_once()
+
+    def test_batch_data_iter_featureview(self, mocker, backend_fixtures):
+        # Arrange
+        self._arrange_engine_mocks(mocker, backend_fixtures)
+        fv = self._arrange_featureview_mocks(mocker, backend_fixtures)
+        fv._batch_scoring_server._model_dependent_transformation_functions = [
+            mocker.MagicMock()
+        ]
+        mocker.patch(
+            "hsfs.core.arrow_flight_client.ArrowFlightClient.read_query_batches",
+            return_value=iter(
+                [pyarrow.record_batch({"a": [1]}), pyarrow.record_batch({"a": [2]})]
+            ),
+        )
+        mock_apply_transformation_function = mocker.patch(
+            "hsfs.engine.python.Engine._apply_transformation_function",
+            side_effect=lambda transformation_functions, dataset: dataset * 10,
+        )
+
+        # Act
+        batches = list(fv.get_batch_data_iter())
+
+        # Assert
+        assert mock_apply_transformation_function.call_count == 2
+        assert [batch["a"].tolist() for batch in batches] == [[10], [20]]
+
     def test_get_training_data_featureview(self, mocker, backend_fixtures):
         # Arrange
         self._arrange_engine_mocks(mocker, backend_fixtures)
@@ -603,6 +603,39 @@ class TestFeatureGroupEngine:
         # Assert
         assert mock_fg_api.return_value.update_metadata.call_count == 1
 
+    def test_update_features_metadata_invalidates_query_caches(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch("hsfs.core.feature_group_api.FeatureGroupApi")
+        mock_invalidate_feature_group = mocker.patch(
+            "hsfs.core.query_constructor_api.QueryConstructorApi.invalidate_feature_group"
+        )
+        mock_invalidate_online_connector = mocker.patch(
+            "hsfs.core.storage_connector_api.StorageConnectorApi.invalidate_online_connector"
+        )
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        # Act
+        fg_engine._update_features_metadata(feature_group=fg, features=None)
+
+        # Assert
+        mock_invalidate_feature_group.assert_called_once_with(fg)
+        mock_invalidate_online_connector.assert_called_once_with(feature_store_id)
+
     def test_update_features(self, mocker):
         # Arrange
         feature_store_id = 99
@@ -0,0 +1,97 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import pytest
+from hsfs.core import feature_vector_cache
+
+
+class TestFeatureVectorCache:
+    def test_get_put(self):
+        # Arrange
+        cache = feature_vector_cache.FeatureVectorCache()
+
+        # Act
+        miss = cache.get(("sql", 1, (1,)))
+        cache.put(("sql", 1, (1,)), {"amount": 1.0})
+        hit = cache.get(("sql", 1, (1,)))
+
+        # Assert
+        assert miss is None
+        assert hit == {"amount": 1.0}
+        assert cache.statistics == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+    def test_get_all_counts_one_lookup(self):
+        # Arrange
+        cache = feature_vector_cache.FeatureVectorCache()
+        cache.put("a", {"v": 1})
+        cache.put("b", {"v": 2})
+
+        # Act
+        partial = cache.get_all(["a", "c"])
+        complete = cache.get_all(["a", "b"])
+
+        # Assert
+        assert partial is None
+        assert complete == [{"v": 1}, {"v": 2}]
+        assert cache.statistics == {"hits": 1, "misses": 1, "evictions": 0, "size": 2}
+
+    def test_ttl_expiry(self, mocker):
+        # Arrange
+        mock_monotonic = mocker.patch(
+            "hsfs.core.feature_vector_cache.time.monotonic", return_value=100.0
+        )
+        cache = feature_vector_cache.FeatureVectorCache(ttl=5)
+        cache.put("key", {"amount": 1.0})
+
+        # Act
+        mock_monotonic.return_value = 104.0
+        before_expiry = cache.get("key")
+        mock_monotonic.return_value = 105.0
+        after_expiry = cache.get("key")
+
+        # Assert
+        assert before_expiry == {"amount": 1.0}
+        assert after_expiry is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        # Arrange
+        cache = feature_vector_cache.FeatureVectorCache(max_entries=2)
+        cache.put("a", {"v": 1})
+        cache.put("b", {"v": 2})
+
+        # Act
+        cache.get("a")
+        cache.put("c", {"v": 3})
+
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("c") == {"v": 3}
+        assert cache.statistics["evictions"] == 1
+
+    def test_from_config_unknown_option(self):
+        # Act
+        with pytest.raises(ValueError) as e_info:
+            feature_vector_cache.FeatureVectorCache.from_config({"size": 10})
+
+        # Assert
+        assert "Unknown feature vector cache configuration options" in str(e_info.value)
+
+    def test_invalid_max_entries(self):
+        # Act
+        with pytest.raises(ValueError):
+            feature_vector_cache.FeatureVectorCache(max_entries=0)
@@ -15,6 +15,7 @@
 #
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 from hsfs import (
     engine,
@@ -27,7 +28,11 @@ from hsfs import (
 from hsfs.client.exceptions import FeatureStoreException
 from hsfs.constructor import fs_query
 from hsfs.constructor.query import Query
-from hsfs.core import arrow_flight_client, feature_view_engine
+from hsfs.core import (
+    arrow_flight_client,
+    feature_view_engine,
+    training_dataset_cache,
+)
 from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
 from hsfs.storage_connector import BigQueryConnector, StorageConnector
 
@@ -970,6 +975,9 @@ class TestFeatureViewEngine:
         mock_fv_engine_compute_training_dataset = mocker.patch(
             "hsfs.core.feature_view_engine.FeatureViewEngine.compute_training_dataset"
         )
+        mock_td_cache_invalidate = mocker.patch(
+            "hsfs.core.training_dataset_cache.TrainingDatasetCache.invalidate"
+        )
 
         fv_engine = feature_view_engine.FeatureViewEngine(
             feature_store_id=feature_store_id
@@ -986,6 +994,9 @@ class TestFeatureViewEngine:
         # Assert
         assert mock_fv_engine_get_training_dataset_metadata.call_count == 1
         assert mock_fv_engine_compute_training_dataset.call_count == 1
+        mock_td_cache_invalidate.assert_called_once_with(
+            None, mock_fv_engine_get_training_dataset_metadata.return_value.version
+        )
 
     def test_read_from_storage_connector(self, mocker):
         # Arrange
@@ -1126,6 +1137,58 @@ class TestFeatureViewEngine:
         # Assert
         assert mock_sc_read.call_count == 1
 
+    def test_read_dir_from_storage_connector_cache(self, mocker, tmp_path):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.core.feature_view_api.FeatureViewApi")
+        mock_sc_read = mocker.patch(
+            "hsfs.storage_connector.StorageConnector.read",
+            return_value=pd.DataFrame({"a": [1, 2]}),
+        )
+
+        fv_engine = feature_view_engine.FeatureViewEngine(
+            feature_store_id=feature_store_id
+        )
+        cache = training_dataset_cache.TrainingDatasetCache(tmp_path)
+        fv = feature_view.FeatureView(
+            name="fv", query=mocker.Mock(), featurestore_id=feature_store_id
+        )
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            location="location",
+            version=1,
+            data_format="parquet",
+            featurestore_id=99,
+            splits={},
+        )
+
+        # Act
+        results = [
+            fv_engine._read_dir_from_storage_connector(
+                td,
+                "location/train",
+                {},
+                False,
+                [],
+                False,
+                [],
+                False,
+                [],
+                [],
+                "default",
+                feature_view_obj=fv,
+                training_dataset_cache=cache,
+                split_name="train",
+            )
+            for _ in range(2)
+        ]
+
+        # Assert
+        assert mock_sc_read.call_count == 1
+        assert all(result["a"].tolist() == [1, 2] for result in results)
+
     def test_read_dir_from_storage_connector_file_not_found(self, mocker):
         # Arrange
         feature_store_id = 99
@@ -1657,6 +1720,46 @@ class TestFeatureViewEngine:
         assert mock_fv_api.return_value.delete_training_data_version.call_count == 1
         assert mock_fv_api.return_value.delete_training_data.call_count == 0
 
+    def test_delete_training_data_invalidates_cache(self, mocker, tmp_path):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.core.feature_view_api.FeatureViewApi")
+
+        fv_engine = feature_view_engine.FeatureViewEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fv = feature_view.FeatureView(
+            name="fv_name",
+            version=1,
+            query=query,
+            featurestore_id=feature_store_id,
+            labels=[],
+        )
+        cache = training_dataset_cache.TrainingDatasetCache(tmp_path)
+        for version in [1, 2]:
+            cache.put(
+                fv,
+                training_dataset.TrainingDataset(
+                    name="test",
+                    location="location",
+                    version=version,
+                    data_format="parquet",
+                    featurestore_id=feature_store_id,
+                    splits={},
+                ),
+                "train",
+                pd.DataFrame({"a": [1]}),
+            )
+
+        # Act
+        fv_engine.delete_training_data(feature_view_obj=fv, training_data_version=1)
+
+        # Assert
+        assert not (tmp_path / "fv_name_1" / "td_1").exists()
+        assert (tmp_path / "fv_name_1" / "td_2").exists()
+
     def test_delete_training_dataset_only(self, mocker):
         # Arrange
         feature_store_id = 99
@@ -15,6 +15,7 @@
 #
 import importlib
 
+import pytest
 from hsfs import storage_connector
 from hsfs.core import constants, kafka_engine
 
@@ -67,6 +68,67 @@ class TestKafkaEngine:
         assert mock_print.call_count == 1
         assert mock_print.call_args[0][0] == "Caught: test_error"
 
+    def test_kafka_produce_parallel(self, mocker):
+        # Arrange
+        producers = [mocker.Mock(), mocker.Mock()]
+        record_batches = [
+            [(str(key), f"{key}_{version}".encode()) for key in range(10)]
+            for version in range(3)
+        ]
+
+        # Act
+        kafka_engine.kafka_produce_parallel(
+            producers=producers,
+            record_batches=iter(record_batches),
+            topic_name="test_topic",
+            headers={},
+            acked=None,
+        )
+
+        # Assert
+        produced = {}
+        for producer in producers:
+            for call in producer.produce.call_args_list:
+                assert call.kwargs["key"] not in produced or (
+                    produced[call.kwargs["key"]][0] is producer
+                )
+                produced.setdefault(call.kwargs["key"], (producer, []))[1].append(
+                    call.kwargs["value"]
+                )
+        assert sum(producer.produce.call_count for producer in producers) == 30
+        assert all(producer.produce.call_count > 0 for producer in producers)
+        for key, (_, values) in produced.items():
+            assert values == [f"{key}_{version}".encode() for version in range(3)]
+
+    def test_kafka_produce_parallel_error(self, mocker):
+        # Arrange
+        producer = mocker.Mock()
+        producer.produce.side_effect = ValueError("test_error")
+
+        # Act
+        with pytest.raises(ValueError) as e_info:
+            kafka_engine.kafka_produce_parallel(
+                producers=[producer],
+                record_batches=iter([[("1", b"1")], [("2", b"2")]]),
+                topic_name="test_topic",
+                headers={},
+                acked=None,
+            )
+
+        # Assert
+        assert str(e_info.value) == "test_error"
+
+    def test_encode_records(self):
+        # Arrange
+        def writer(value, bytes_io):
+            bytes_io.write(value.encode("utf8"))
+
+        # Act
+        encoded = kafka_engine.encode_records(writer, ["a", "bc", "", "def"])
+
+        # Assert
+        assert encoded == [b"a", b"bc", b"", b"def"]
+
     def test_encode_complex_features(self):
         # Arrange
         def test_utf(value, bytes_io):
@@ -525,3 +587,91 @@ class TestKafkaEngine:
             mock_storage_connector_api.return_value.get_kafka_connector.call_args[0][1]
             is False
         )
+
+    def test_init_kafka_resources_reuse(self, mocker):
+        # Arrange
+        mock_init_kafka_producer = mocker.patch(
+            "hsfs.core.kafka_engine.init_kafka_producer"
+        )
+        mock_get_encoder_func = mocker.patch("hsfs.core.kafka_engine.get_encoder_func")
+        fg = mocker.Mock()
+        fg.feature_store_id = 99
+        fg._id = 10
+        fg._multi_part_insert = False
+        fg.avro_schema = "schema_v1"
+        fg.subject = {"id": 1, "schema": "schema_v1"}
+        fg.get_complex_features.return_value = ["array_feature"]
+
+        # Act
+        first = kafka_engine.init_kafka_resources(fg, {}, project_id=1)
+        second = kafka_engine.init_kafka_resources(fg, {}, project_id=1)
+
+        # Assert
+        assert first == second
+        assert mock_init_kafka_producer.call_count == 1
+        # one complex feature writer and one row writer
+        assert mock_get_encoder_func.call_count == 2
+        assert kafka_engine.get_kafka_resources_statistics() == {
+            "producers": 1,
+            "producer_reuses": 1,
+            "encoders": 1,
+            "encoder_reuses": 1,
+        }
+
+    def test_init_kafka_resources_invalidation(self, mocker):
+        # Arrange
+        mock_init_kafka_producer = mocker.patch(
+            "hsfs.core.kafka_engine.init_kafka_producer"
+        )
+        mock_get_encoder_func = mocker.patch("hsfs.core.kafka_engine.get_encoder_func")
+        fg = mocker.Mock()
+        fg.feature_store_id = 99
+        fg._id = 10
+        fg._multi_part_insert = False
+        fg.avro_schema = "schema_v1"
+        fg.subject = {"id": 1, "schema": "schema_v1"}
+        fg.get_complex_features.return_value = []
+        kafka_engine.init_kafka_resources(fg, {}, project_id=1)
+        first_producer = mock_init_kafka_producer.return_value
+
+        # Act
+        fg.avro_schema = "schema_v2"
+        kafka_engine.init_kafka_resources(fg, {}, project_id=1)
+        mock_init_kafka_producer.return_value = mocker.Mock()
+        kafka_engine.init_kafka_resources(
+            fg, {"kafka_producer_config": {"linger.ms": 100}}, project_id=1
+        )
+
+        # Assert
+        assert mock_get_encoder_func.call_count == 2
+        assert mock_init_kafka_producer.call_count == 2
+        first_producer.flush.assert_called_once()
+        assert kafka_engine.get_kafka_resources_statistics()["producer_reuses"] == 1
+
+    def test_close_kafka_resources(self, mocker):
+        # Arrange
+        mock_init_kafka_producer = mocker.patch(
+            "hsfs.core.kafka_engine.init_kafka_producer"
+        )
+        mocker.patch("hsfs.core.kafka_engine.get_encoder_func")
+        fgs = []
+        for fg_id in [10, 11]:
+            fg = mocker.Mock()
+            fg.feature_store_id = 99
+            fg._id = fg_id
+            fg._multi_part_insert = False
+            fg.subject = {"id": 1, "schema": "schema"}
+            fg.get_complex_features.return_value = []
+            kafka_engine.init_kafka_resources(fg, {}, project_id=1)
+            fgs.append(fg)
+
+        # Act
+        kafka_engine.close_kafka_resources(fgs[0])
+        statistics_after_fg_close = kafka_engine.get_kafka_resources_statistics()
+        kafka_engine.close_kafka_resources()
+
+        # Assert
+        assert statistics_after_fg_close["producers"] == 1
+        assert statistics_after_fg_close["encoders"] == 1
+        assert kafka_engine.get_kafka_resources_statistics()["producers"] == 0
+        assert mock_init_kafka_producer.return_value.flush.call_count == 2
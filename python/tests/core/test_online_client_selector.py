@@ -0,0 +1,133 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import pytest
+from hsfs.core import online_client_selector
+
+
+class TestOnlineClientSelector:
+    def _selector(self, **kwargs):
+        return online_client_selector.OnlineClientSelector(
+            ["sql", "rest"], min_samples=2, **kwargs
+        )
+
+    def _record(self, selector, client, batch_size, latencies):
+        for latency in latencies:
+            selector.record(client, batch_size, latency)
+
+    def test_batch_size_bucket(self):
+        # Act
+        buckets = [
+            online_client_selector.OnlineClientSelector.batch_size_bucket(size)
+            for size in [1, 2, 3, 5, 8, 9, 1000]
+        ]
+
+        # Assert
+        assert buckets == [1, 2, 4, 8, 8, 16, 1024]
+
+    def test_select_explores_until_min_samples(self):
+        # Arrange
+        selector = self._selector()
+
+        # Act
+        selected = []
+        for client in ["sql", "sql", "rest", "rest"]:
+            selected.append(selector.select(1))
+            selector.record(client, 1, 0.01)
+
+        # Assert
+        assert selected == ["sql", "sql", "rest", "rest"]
+
+    def test_select_fastest_per_batch_size_bucket(self):
+        # Arrange
+        selector = self._selector()
+        self._record(selector, "sql", 1, [0.001, 0.001])
+        self._record(selector, "rest", 1, [0.005, 0.005])
+        self._record(selector, "sql", 1000, [0.5, 0.5])
+        self._record(selector, "rest", 1000, [0.1, 0.1])
+
+        # Act
+        single = selector.select(1)
+        batch = selector.select(1000)
+
+        # Assert
+        assert single == "sql"
+        assert batch == "rest"
+
+    def test_select_hysteresis(self):
+        # Arrange
+        selector = self._selector(window_size=2, hysteresis=0.2)
+        self._record(selector, "sql", 1, [0.010, 0.010])
+        self._record(selector, "rest", 1, [0.020, 0.020])
+        assert selector.select(1) == "sql"
+
+        # Act
+        self._record(selector, "rest", 1, [0.009, 0.009])
+        within_hysteresis = selector.select(1)
+        self._record(selector, "rest", 1, [0.007, 0.007])
+        beyond_hysteresis = selector.select(1)
+
+        # Assert
+        assert within_hysteresis == "sql"
+        assert beyond_hysteresis == "rest"
+        assert selector.statistics["switches"] == 1
+
+    def test_select_exploration_interval(self):
+        # Arrange
+        selector = self._selector(exploration_interval=3)
+        self._record(selector, "sql", 1, [0.001, 0.001])
+        self._record(selector, "rest", 1, [0.005, 0.005])
+
+        # Act
+        selected = [selector.select(1) for _ in range(6)]
+
+        # Assert
+        assert selected == ["sql", "sql", "rest", "sql", "sql", "rest"]
+
+    def test_statistics(self):
+        # Arrange
+        selector = self._selector()
+        self._record(selector, "sql", 4, [0.001, 0.003])
+        self._record(selector, "rest", 4, [0.002, 0.002])
+        selector.select(4)
+
+        # Act
+        statistics = selector.statistics
+
+        # Assert
+        assert statistics["switches"] == 0
+        bucket = statistics["batch_size_buckets"][4]
+        assert bucket["selected_client"] == "sql"
+        assert bucket["sql"]["count"] == 2
+        assert bucket["sql"]["p50_ms"] == pytest.approx(2.0)
+        assert bucket["sql"]["p95_ms"] == pytest.approx(3.0)
+        assert bucket["rest"]["p50_ms"] == pytest.approx(2.0)
+
+    def test_reset(self):
+        # Arrange
+        selector = self._selector()
+        self._record(selector, "sql", 1, [0.001, 0.001])
+
+        # Act
+        selector.reset()
+
+        # Assert
+        assert selector.statistics == {"switches": 0, "batch_size_buckets": {}}
+
+    def test_requires_two_clients(self):
+        # Act
+        with pytest.raises(ValueError):
+            online_client_selector.OnlineClientSelector(["sql"])
@@ -13,13 +13,38 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import asyncio
 import json
 
 import pytest
 import requests
+from hsfs.client import online_store_rest_client
 from hsfs.core import online_store_rest_client_api
 
 
+def _batch_response(status_code, body):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode("utf-8")
+    return response
+
+
+def _echo_batch_response(data, failing_ids=()):
+    # returns one feature vector per entry, or a server error if any entry id is failing
+    entries = json.loads(data)["entries"]
+    if any(entry["id"] in failing_ids for entry in entries):
+        return _batch_response(500, {"errorMsg": "Internal server error."})
+    return _batch_response(
+        200,
+        {
+            "features": [[entry["id"], entry["id"] * 10] for entry in entries],
+            "status": ["COMPLETE"] * len(entries),
+            "metadata": None,
+            "detailedStatus": None,
+        },
+    )
+
+
 class TestOnlineStoreRestClientApi:
     def test_handle_rdrs_feature_store_response_bad_request_primary_key_or_passed_features(
         self, backend_fixtures
@@ -82,3 +107,109 @@ class TestOnlineStoreRestClientApi:
         # Act
         with pytest.raises(online_store_rest_client_api.exceptions.RestAPIError):
             online_rest_api.handle_rdrs_feature_store_response(response)
+
+    @pytest.fixture()
+    def mock_rest_client(self, mocker):
+        rest_client = mocker.patch(
+            "hsfs.client.online_store_rest_client.get_instance"
+        ).return_value
+        rest_client.BATCH_SIZE = (
+            online_store_rest_client.OnlineStoreRestClientSingleton.BATCH_SIZE
+        )
+        rest_client.MAX_CONCURRENT_REQUESTS = online_store_rest_client.OnlineStoreRestClientSingleton.MAX_CONCURRENT_REQUESTS
+        rest_client.current_config = {"batch_size": 2, "max_concurrent_requests": 2}
+        return rest_client
+
+    def test_get_batch_raw_feature_vectors_chunked(self, mock_rest_client):
+        # Arrange
+        mock_rest_client.send_request.side_effect = (
+            lambda method, path_params, headers, data: _echo_batch_response(data)
+        )
+        payload = {
+            "featureViewName": "test_feature_view",
+            "entries": [{"id": i} for i in range(5)],
+            "passedFeatures": [{"passed": i} for i in range(5)],
+        }
+        online_rest_api = online_store_rest_client_api.OnlineStoreRestClientApi()
+
+        # Act
+        response = online_rest_api.get_batch_raw_feature_vectors(payload)
+
+        # Assert
+        assert mock_rest_client.send_request.call_count == 3
+        sent_payloads = [
+            json.loads(call.kwargs["data"])
+            for call in mock_rest_client.send_request.call_args_list
+        ]
+        assert sorted(len(p["entries"]) for p in sent_payloads) == [1, 2, 2]
+        assert all(
+            [e["id"] for e in p["entries"]]
+            == [f["passed"] for f in p["passedFeatures"]]
+            for p in sent_payloads
+        )
+        assert response["features"] == [[i, i * 10] for i in range(5)]
+        assert response["status"] == ["COMPLETE"] * 5
+        assert "detailedStatus" not in response
+
+    def test_get_batch_raw_feature_vectors_chunk_server_error(self, mock_rest_client):
+        # Arrange
+        mock_rest_client.send_request.side_effect = (
+            lambda method, path_params, headers, data: _echo_batch_response(
+                data, failing_ids={2}
+            )
+        )
+        payload = {"entries": [{"id": i} for i in range(5)], "passedFeatures": []}
+        online_rest_api = online_store_rest_client_api.OnlineStoreRestClientApi()
+
+        # Act
+        response = online_rest_api.get_batch_raw_feature_vectors(payload)
+
+        # Assert
+        assert response["features"] == [[0, 0], [1, 10], None, None, [4, 40]]
+        assert response["status"] == [
+            "COMPLETE",
+            "COMPLETE",
+            "ERROR",
+            "ERROR",
+            "COMPLETE",
+        ]
+        assert response["detailedStatus"][0] is None
+        assert response["detailedStatus"][2][0]["httpStatus"] == 500
+
+    def test_get_batch_raw_feature_vectors_chunk_client_error(self, mock_rest_client):
+        # Arrange
+        mock_rest_client.send_request.side_effect = (
+            lambda method, path_params, headers, data: (
+                _batch_response(401, {"errorMsg": "Unauthorized"})
+                if json.loads(data)["entries"][0]["id"] == 0
+                else _echo_batch_response(data)
+            )
+        )
+        payload = {"entries": [{"id": i} for i in range(5)], "passedFeatures": []}
+        online_rest_api = online_store_rest_client_api.OnlineStoreRestClientApi()
+
+        # Act
+        with pytest.raises(online_store_rest_client_api.exceptions.RestAPIError):
+            online_rest_api.get_batch_raw_feature_vectors(payload)
+
+    def test_get_batch_raw_feature_vectors_async_chunked(
+        self, mocker, mock_rest_client
+    ):
+        # Arrange
+        async def send_request_async(method, path_params, headers, data):
+            return _echo_batch_response(data)
+
+        mock_rest_client.send_request_async = mocker.AsyncMock(
+            side_effect=send_request_async
+        )
+        payload = {"entries": [{"id": i} for i in range(5)], "passedFeatures": []}
+        online_rest_api = online_store_rest_client_api.OnlineStoreRestClientApi()
+
+        # Act
+        response = asyncio.run(
+            online_rest_api.get_batch_raw_feature_vectors_async(payload)
+        )
+
+        # Assert
+        assert mock_rest_client.send_request_async.await_count == 3
+        assert response["features"] == [[i, i * 10] for i in range(5)]
@@ -14,6 +14,8 @@
 #   limitations under the License.
 #
 
+import asyncio
+
 import pytest
 from hsfs import training_dataset_feature
 from hsfs.core import online_store_rest_client_engine
@@ -21,6 +23,7 @@ from hsfs.core import online_store_rest_client_engine
 
 ONLINE_STORE_REST_CLIENT_API_GET_BATCH_RAW_FEATURE_VECTORS = "hsfs.core.online_store_rest_client_api.OnlineStoreRestClientApi.get_batch_raw_feature_vectors"
 ONLINE_STORE_REST_CLIENT_API_GET_SINGLE_RAW_FEATURE_VECTOR = "hsfs.core.online_store_rest_client_api.OnlineStoreRestClientApi.get_single_raw_feature_vector"
+ONLINE_STORE_REST_CLIENT_API_GET_BATCH_RAW_FEATURE_VECTORS_ASYNC = "hsfs.core.online_store_rest_client_api.OnlineStoreRestClientApi.get_batch_raw_feature_vectors_async"
 
 
 class TestOnlineRestClientEngine:
@@ -407,3 +410,78 @@ class TestOnlineRestClientEngine:
         # Assert
         assert batch_vectors == reference_batch_vectors
         assert mock_online_rest_api.called_once_with(payload=payload)
+
+    def test_get_batch_feature_vectors_async_as_dict(
+        self,
+        mocker,
+        backend_fixtures,
+        rest_client_engine_ticker: online_store_rest_client_engine.OnlineStoreRestClientEngine,
+    ):
+        # Arrange
+        payload = backend_fixtures["rondb_server"]["get_batch_vector_payload"].copy()
+        mock_online_rest_api = mocker.patch(
+            ONLINE_STORE_REST_CLIENT_API_GET_BATCH_RAW_FEATURE_VECTORS_ASYNC,
+            new_callable=mocker.AsyncMock,
+            return_value=backend_fixtures["rondb_server"][
+                "get_batch_vector_response_json_complete"
+            ],
+        )
+
+        # Act
+        batch_vectors = asyncio.run(
+            rest_client_engine_ticker.get_batch_feature_vectors_async(
+                entries=payload["entries"],
+                return_type=online_store_rest_client_engine.OnlineStoreRestClientEngine.RETURN_TYPE_FEATURE_VALUE_DICT,
+                drop_missing=False,
+            )
+        )
+
+        # Assert
+        assert batch_vectors == [
+            {
+                "ticker": "APPL",
+                "when": "2022-01-01 00:00:00",
+                "price": 21.3,
+                "volume": 10,
+            },
+            {
+                "ticker": "GOOG",
+                "when": "2022-01-01 00:00:00",
+                "price": 12.3,
+                "volume": 43,
+            },
+        ]
+        assert mock_online_rest_api.await_count == 1
+
+    def test_get_batch_feature_vectors_as_columns(
+        self, mocker, backend_fixtures, rest_client_engine_ticker
+    ):
+        # Arrange
+        payload = backend_fixtures["rondb_server"]["get_batch_vector_payload"].copy()
+        mocker.patch(
+            ONLINE_STORE_REST_CLIENT_API_GET_BATCH_RAW_FEATURE_VECTORS,
+            return_value=backend_fixtures["rondb_server"][
+                "get_batch_vector_response_json_partial_error"
+            ],
+        )
+
+        # Act
+        columns = rest_client_engine_ticker.get_batch_feature_vectors(
+            entries=payload["entries"],
+            return_type=online_store_rest_client_engine.OnlineStoreRestClientEngine.RETURN_TYPE_FEATURE_VALUE_COLUMNS,
+            drop_missing=True,
+        )
+        table = rest_client_engine_ticker.get_batch_feature_vectors(
+            entries=payload["entries"],
+            return_type=online_store_rest_client_engine.OnlineStoreRestClientEngine.RETURN_TYPE_ARROW_TABLE,
+            drop_missing=True,
+        )
+
+        # Assert
+        assert columns == {
+            "ticker": ["APPL", None, "GOOG"],
+            "when": ["2022-01-01 00:00:00", None, "2022-01-01 00:00:00"],
+            "price": [21.3, None, 12.3],
+            "volume": [10, None, 43],
+        }
+        assert table.to_pydict() == columns
@@ -0,0 +1,200 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import asyncio
+
+import pytest
+from hsfs import serving_key
+from hsfs.core import online_store_sql_engine
+
+
+class TestOnlineStoreSqlClient:
+    @pytest.fixture()
+    def sql_client(self, mocker):
+        mocker.patch("hsfs.client.get_instance")
+        client = online_store_sql_engine.OnlineStoreSqlClient(
+            feature_store_id=99, skip_fg_ids=set(), external=True
+        )
+        client._serving_key_by_serving_index = {
+            0: [serving_key.ServingKey(feature_name="id", join_index=0)],
+            1: [
+                serving_key.ServingKey(
+                    feature_name="id",
+                    join_index=1,
+                    prefix="right_",
+                )
+            ],
+        }
+        client._prefix_by_serving_index = {0: "", 1: "right_"}
+        return client
+
+    def test_batch_vector_results_stitching(self, mocker, sql_client):
+        # Arrange
+        entries = [{"id": i, "right_id": i} for i in range(4)]
+        mock_execute = mocker.AsyncMock(
+            return_value={
+                # rows are returned in arbitrary order and may be missing
+                0: [{"id": i, "amount": i * 10} for i in [3, 1, 0, 2]],
+                1: [{"right_id": i, "right_age": i + 20} for i in [2, 0]],
+            }
+        )
+        sql_client._execute_prep_statements = mock_execute
+
+        # Act
+        batch_results, _ = asyncio.run(
+            sql_client._batch_vector_results_async(entries, {0: None, 1: None})
+        )
+
+        # Assert
+        assert mock_execute.call_args[0][1] == {
+            0: {"batch_ids": [(0,), (1,), (2,), (3,)]},
+            1: {"batch_ids": [(0,), (1,), (2,), (3,)]},
+        }
+        assert batch_results == [
+            {"id": 0, "amount": 0, "right_id": 0, "right_age": 20},
+            {"id": 1, "amount": 10},
+            {"id": 2, "amount": 20, "right_id": 2, "right_age": 22},
+            {"id": 3, "amount": 30},
+        ]
+
+    def test_single_vector_result_binds_serving_keys(self, mocker, sql_client):
+        # Arrange
+        mock_execute = mocker.AsyncMock(
+            return_value={0: [{"id": 1, "amount": 10}], 1: [{"right_age": 21}]}
+        )
+        sql_client._execute_prep_statements = mock_execute
+
+        # Act
+        # the feature name is used if the prefixed serving key is missing
+        serving_vector = asyncio.run(
+            sql_client._single_vector_result_async({"id": 1}, {0: None, 1: None})
+        )
+
+        # Assert
+        assert sql_client.serving_key_bindings_by_serving_index == {
+            0: (("id", "id"),),
+            1: (("right_id", "id"),),
+        }
+        assert mock_execute.call_args[0][1] == {0: {"id": 1}, 1: {"id": 1}}
+        assert serving_vector == {"id": 1, "amount": 10, "right_age": 21}
+
+    def test_single_vector_result_skips_unbound_statements(self, mocker, sql_client):
+        # Arrange
+        sql_client._serving_key_by_serving_index[1] = [
+            serving_key.ServingKey(feature_name="age", join_index=1, prefix="right_")
+        ]
+        mock_execute = mocker.AsyncMock(return_value={0: [{"id": 1, "amount": 10}]})
+        sql_client._execute_prep_statements = mock_execute
+
+        # Act
+        asyncio.run(
+            sql_client._single_vector_result_async({"id": 1}, {0: None, 1: None})
+        )
+
+        # Assert
+        assert mock_execute.call_args[0] == ({0: None}, {0: {"id": 1}})
+
+    def _arrange_streaming_pool(self, mocker):
+        executed = []
+
+        async def execute(stmt, bind_params):
+            executed.append((stmt, bind_params["batch_ids"]))
+            if stmt == "stmt_0":
+                rows = [
+                    {"id": key[0], "amount": key[0] * 10}
+                    for key in bind_params["batch_ids"]
+                ]
+            else:
+                rows = [
+                    {"right_id": key[0], "right_age": key[0] + 20}
+                    for key in bind_params["batch_ids"]
+                    if key[0] % 2 == 0
+                ]
+            cursor = mocker.MagicMock()
+            cursor.fetchmany = mocker.AsyncMock(
+                side_effect=[[row] for row in reversed(rows)] + [[]]
+            )
+            cursor.close = mocker.AsyncMock()
+            return cursor
+
+        conn = mocker.MagicMock()
+        conn.execute = execute
+        pool = mocker.MagicMock()
+        pool.acquire.return_value.__aenter__ = mocker.AsyncMock(return_value=conn)
+        pool.acquire.return_value.__aexit__ = mocker.AsyncMock(return_value=False)
+        return pool, executed
+
+    def test_batch_vector_results_streaming(self, mocker, sql_client):
+        # Arrange
+        sql_client._connection_options = {"batch_chunk_size": 2, "fetch_size": 1}
+        sql_client._connection_pool, executed = self._arrange_streaming_pool(mocker)
+        # the last entry repeats a key, which is looked up once
+        entries = [{"id": i, "right_id": i} for i in [0, 1, 2, 3, 1]]
+        mock_execute = mocker.AsyncMock()
+        sql_client._execute_prep_statements = mock_execute
+
+        # Act
+        batch_results, _ = asyncio.run(
+            sql_client._batch_vector_results_async(entries, {0: "stmt_0", 1: "stmt_1"})
+        )
+
+        # Assert
+        mock_execute.assert_not_called()
+        assert sorted(executed) == [
+            ("stmt_0", [(0,), (1,)]),
+            ("stmt_0", [(2,), (3,)]),
+            ("stmt_1", [(0,), (1,)]),
+            ("stmt_1", [(2,), (3,)]),
+        ]
+        assert batch_results == [
+            {"id": 0, "amount": 0, "right_id": 0, "right_age": 20},
+            {"id": 1, "amount": 10},
+            {"id": 2, "amount": 20, "right_id": 2, "right_age": 22},
+            {"id": 3, "amount": 30},
+            {"id": 1, "amount": 10},
+        ]
+
+    def test_get_batch_feature_vectors_streaming_creates_pool(self, mocker, sql_client):
+        # Arrange
+        sql_client._connection_options = {"batch_chunk_size": 2, "fetch_size": 1}
+        # only the batch statements are set up
+        sql_client._prepared_statements = {
+            sql_client.BATCH_VECTOR_KEY: [mocker.MagicMock(), mocker.MagicMock()]
+        }
+        sql_client.parametrised_prepared_statements = {
+            sql_client.BATCH_VECTOR_KEY: {0: "stmt_0", 1: "stmt_1"}
+        }
+        pool, executed = self._arrange_streaming_pool(mocker)
+        mock_create_async_engine = mocker.patch(
+            "hsfs.core.util_sql.create_async_engine",
+            new=mocker.AsyncMock(return_value=pool),
+        )
+        entries = [{"id": i, "right_id": i} for i in range(5)]
+
+        # Act
+        batch_results, serving_keys = sql_client.get_batch_feature_vectors(entries)
+
+        # Assert
+        assert mock_create_async_engine.await_args[0][2] == 2
+        assert len(executed) == 6
+        assert batch_results == [
+            {"id": 0, "amount": 0, "right_id": 0, "right_age": 20},
+            {"id": 1, "amount": 10},
+            {"id": 2, "amount": 20, "right_id": 2, "right_age": 22},
+            {"id": 3, "amount": 30},
+            {"id": 4, "amount": 40, "right_id": 4, "right_age": 24},
+        ]
+        assert [sk.join_index for sk in serving_keys] == [0, 1]
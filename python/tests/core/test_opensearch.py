@@ -13,9 +13,12 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import asyncio
+
 import pytest
 from hsfs.client.exceptions import VectorDatabaseException
 from hsfs.core.opensearch import OpenSearchClientSingleton, OpensearchRequestOption
+from opensearchpy.exceptions import ConnectionError
 
 
 class TestOpenSearchClientSingleton:
@@ -67,6 +70,202 @@ class TestOpenSearchClientSingleton:
         assert exception.reason == expected_reason
         assert exception.info == expected_info
 
+    def test_msearch_error(self, mocker):
+        # Arrange
+        self.target._opensearch_client = mocker.MagicMock()
+        self.target._opensearch_client.msearch.return_value = {
+            "responses": [
+                {"hits": {"hits": []}},
+                {
+                    "error": {
+                        "type": "search_phase_execution_exception",
+                        "caused_by": {
+                            "type": "illegal_argument_exception",
+                            "reason": "[knn] requires k <= 5",
+                        },
+                    }
+                },
+            ]
+        }
+
+        # Act
+        with pytest.raises(VectorDatabaseException) as e_info:
+            self.target.msearch(index="index", body=[{}, {}, {}, {}])
+
+        # Assert
+        assert e_info.value.reason == VectorDatabaseException.REQUESTED_K_TOO_LARGE
+        assert e_info.value.info == {
+            VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K: 5
+        }
+
+    def test_scroll_search(self, mocker):
+        # Arrange
+        mocker.patch(
+            "hsfs.core.opensearch.OpensearchRequestOption.get_version",
+            return_value=(2, 3),
+        )
+        self.target._opensearch_client = mocker.MagicMock()
+
+        # Act
+        self.target.scroll_search(index="index", body={}, scroll="2m")
+
+        # Assert
+        self.target._opensearch_client.search.assert_called_once_with(
+            body={}, index="index", params={"timeout": 30, "scroll": "2m"}
+        )
+        assert OpensearchRequestOption.DEFAULT_OPTION_MAP_V2_3 == {"timeout": 30}
+
+    def test_set_pool_maxsize(self, mocker):
+        # Arrange
+        mocker.patch.object(OpenSearchClientSingleton, "_pool_maxsize", 10)
+        mock_refresh = mocker.patch(
+            "hsfs.core.opensearch.OpenSearchClientSingleton._refresh_opensearch_connection"
+        )
+        self.target._opensearch_client = mocker.MagicMock()
+
+        # Act
+        OpenSearchClientSingleton.set_pool_maxsize(32)
+
+        # Assert
+        assert OpenSearchClientSingleton._pool_maxsize == 32
+        mock_refresh.assert_called_once_with()
+
+    def test_set_pool_maxsize_closes_async_client(self, mocker):
+        # Arrange
+        mocker.patch.object(OpenSearchClientSingleton, "_pool_maxsize", 10)
+        async_client = mocker.MagicMock()
+        async_client.close = mocker.AsyncMock()
+        self.target._opensearch_client = None
+        self.target._async_opensearch_client = async_client
+        self.target._async_client_loop = None
+
+        # Act
+        OpenSearchClientSingleton.set_pool_maxsize(32)
+
+        # Assert
+        async_client.close.assert_awaited_once()
+        assert self.target._async_opensearch_client is None
+
+    def test_close_releases_async_client_on_its_loop(self, mocker):
+        # Arrange
+        async_client = mocker.MagicMock()
+        async_client.close = mocker.AsyncMock()
+        self.target._opensearch_client = mocker.MagicMock()
+
+        async def use_client():
+            self.target._async_opensearch_client = async_client
+            self.target._async_client_loop = asyncio.get_running_loop()
+            # the connection is closed while the event loop is running
+            self.target.close()
+            await asyncio.sleep(0)
+
+        # Act
+        asyncio.run(use_client())
+
+        # Assert
+        self.target._opensearch_client.close.assert_called_once()
+        async_client.close.assert_awaited_once()
+        assert self.target._async_opensearch_client is None
+        assert self.target._async_client_loop is None
+
+    def test_set_pool_maxsize_invalid(self):
+        with pytest.raises(ValueError):
+            OpenSearchClientSingleton.set_pool_maxsize(0)
+
+    def test_refresh_opensearch_connection_already_refreshed(self, mocker):
+        # Arrange
+        failed_client = mocker.MagicMock()
+        current_client = mocker.MagicMock()
+        self.target._opensearch_client = current_client
+
+        # Act
+        self.target._refresh_opensearch_connection(failed_client)
+
+        # Assert
+        failed_client.close.assert_not_called()
+        current_client.close.assert_not_called()
+        assert self.target._opensearch_client is current_client
+
+    def test_search_refreshes_connection(self, mocker):
+        # Arrange
+        failed_client = mocker.MagicMock()
+        failed_client.search.side_effect = ConnectionError("N/A", "closed", None)
+        new_client = mocker.MagicMock()
+        new_client.search.return_value = {"hits": {"hits": []}}
+        self.target._opensearch_client = failed_client
+
+        def setup_client():
+            self.target._opensearch_client = new_client
+
+        mocker.patch(
+            "hsfs.core.opensearch.OpenSearchClientSingleton._setup_opensearch_client",
+            side_effect=setup_client,
+        )
+
+        # Act
+        result = self.target.search(index="index", body={})
+
+        # Assert
+        assert result == {"hits": {"hits": []}}
+        failed_client.close.assert_called_once()
+        new_client.search.assert_called_once()
+
+    def test_get_pool_statistics(self, mocker):
+        # Arrange
+        connection = mocker.MagicMock()
+        connection.host = "https://localhost:9200"
+        connection.pool.num_connections = 3
+        connection.pool.num_requests = 42
+        connection.pool.pool.qsize.return_value = 2
+        connection.pool.pool.maxsize = 10
+        self.target._opensearch_client = mocker.MagicMock()
+        self.target._opensearch_client.transport.connection_pool.connections = [
+            connection
+        ]
+
+        # Act
+        statistics = self.target.get_pool_statistics()
+
+        # Assert
+        assert statistics == [
+            {
+                "host": "https://localhost:9200",
+                "num_connections": 3,
+                "num_requests": 42,
+                "idle_connections": 2,
+                "maxsize": 10,
+            }
+        ]
+
+    def test_get_async_client_without_aiohttp(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.core.opensearch.HAS_AIOHTTP", False)
+        self.target._async_opensearch_client = None
+
+        # Act
+        with pytest.raises(ModuleNotFoundError):
+            self.target.get_async_client()
+
+    def test_search_async(self, mocker):
+        # Arrange
+        mocker.patch(
+            "hsfs.core.opensearch.OpensearchRequestOption.get_version",
+            return_value=(2, 3),
+        )
+        async_client = mocker.MagicMock()
+        async_client.search = mocker.AsyncMock(return_value={"hits": {"hits": []}})
+        self.target._async_opensearch_client = async_client
+
+        # Act
+        result = asyncio.run(self.target.search_async(index="index", body={}))
+
+        # Assert
+        assert result == {"hits": {"hits": []}}
+        async_client.search.assert_awaited_once_with(
+            body={}, index="index", params={"timeout": 30}
+        )
+        self.target._async_opensearch_client = None
+
 
 class TestOpensearchRequestOption:
 
@@ -0,0 +1,136 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+from hsfs import feature
+from hsfs.constructor import query
+from hsfs.core import query_constructor_api, storage_connector_api
+
+
+class TestQueryConstructorApi:
+    def _arrange_client(self, mocker, backend_fixtures):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        mock_client = mocker.patch("hsfs.client.get_instance")
+        mock_client.return_value._project_id = 1
+        mock_client.return_value._send_request.side_effect = lambda *args, **kwargs: (
+            backend_fixtures["fs_query"]["get"]["response"]
+        )
+        return mock_client.return_value
+
+    def test_construct_query_cached(self, mocker, backend_fixtures):
+        # Arrange
+        mock_client = self._arrange_client(mocker, backend_fixtures)
+        qc_api = query_constructor_api.QueryConstructorApi()
+        q = query.Query.from_response_json(backend_fixtures["query"]["get"]["response"])
+
+        # Act
+        first = qc_api.construct_query(q)
+        second = qc_api.construct_query(
+            query.Query.from_response_json(backend_fixtures["query"]["get"]["response"])
+        )
+
+        # Assert
+        assert mock_client._send_request.call_count == 1
+        assert first is second
+
+    def test_construct_query_schema_changed(self, mocker, backend_fixtures):
+        # Arrange
+        mock_client = self._arrange_client(mocker, backend_fixtures)
+        qc_api = query_constructor_api.QueryConstructorApi()
+        q = query.Query.from_response_json(backend_fixtures["query"]["get"]["response"])
+        qc_api.construct_query(q)
+
+        # Act
+        q._left_feature_group.features = q._left_feature_group.features + [
+            feature.Feature("new_feature", type="int")
+        ]
+        qc_api.construct_query(q)
+
+        # Assert
+        assert mock_client._send_request.call_count == 2
+
+    def test_invalidate_feature_group(self, mocker, backend_fixtures):
+        # Arrange
+        mock_client = self._arrange_client(mocker, backend_fixtures)
+        qc_api = query_constructor_api.QueryConstructorApi()
+        q = query.Query.from_response_json(backend_fixtures["query"]["get"]["response"])
+        qc_api.construct_query(q)
+
+        # Act
+        query_constructor_api.QueryConstructorApi.invalidate_feature_group(
+            q._left_feature_group
+        )
+        qc_api.construct_query(q)
+
+        # Assert
+        assert mock_client._send_request.call_count == 2
+
+    def test_construct_query_cache_bounded(self, mocker, backend_fixtures):
+        # Arrange
+        mock_client = self._arrange_client(mocker, backend_fixtures)
+        mocker.patch.object(
+            query_constructor_api.QueryConstructorApi, "MAX_CACHED_QUERIES", 1
+        )
+        qc_api = query_constructor_api.QueryConstructorApi()
+        q = query.Query.from_response_json(backend_fixtures["query"]["get"]["response"])
+        other_q = query.Query.from_response_json(
+            backend_fixtures["query"]["get"]["response"]
+        )
+        other_q._left_feature_group_end_time = "other_end_time"
+
+        # Act
+        qc_api.construct_query(q)
+        qc_api.construct_query(other_q)
+        qc_api.construct_query(q)
+
+        # Assert
+        assert mock_client._send_request.call_count == 3
+        assert len(query_constructor_api.QueryConstructorApi._cache) == 1
+
+    def test_get_cached_online_connector(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance").return_value._project_id = 1
+        mock_get_online_connector = mocker.patch(
+            "hsfs.core.storage_connector_api.StorageConnectorApi.get_online_connector"
+        )
+        sc_api = storage_connector_api.StorageConnectorApi()
+
+        # Act
+        sc_api.get_cached_online_connector(99)
+        sc_api.get_cached_online_connector(99)
+        storage_connector_api.StorageConnectorApi.invalidate_online_connector(99)
+        sc_api.get_cached_online_connector(99)
+
+        # Assert
+        assert mock_get_online_connector.call_count == 2
+
+    def test_get_cached_online_connector_per_user(self, mocker):
+        # Arrange
+        mock_client = mocker.patch("hsfs.client.get_instance").return_value
+        mock_client._project_id = 1
+        mock_get_online_connector = mocker.patch(
+            "hsfs.core.storage_connector_api.StorageConnectorApi.get_online_connector"
+        )
+        sc_api = storage_connector_api.StorageConnectorApi()
+
+        # Act
+        mock_client._auth._token = "api_key_user_1"
+        sc_api.get_cached_online_connector(99)
+        mock_client._auth._token = "api_key_user_2"
+        sc_api.get_cached_online_connector(99)
+        sc_api.get_cached_online_connector(99)
+
+        # Assert
+        assert mock_get_online_connector.call_count == 2
@@ -0,0 +1,123 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import pytest
+from hsfs.core import serving_latency
+
+
+class TestServingLatency:
+    def test_measure_stage(self, mocker):
+        # Arrange
+        mocker.patch(
+            "hsfs.core.serving_latency.time.perf_counter",
+            side_effect=[0.0, 1.0, 1.5, 2.0, 2.5, 4.0],
+        )
+        breakdowns = []
+        recorder = serving_latency.ServingLatencyRecorder(hooks=[breakdowns.append])
+
+        # Act
+        with recorder.measure():
+            with serving_latency.measure_stage(serving_latency.FETCH):
+                pass
+            with serving_latency.measure_stage(serving_latency.FETCH):
+                pass
+
+        # Assert
+        assert breakdowns == [{serving_latency.FETCH: 1.0, serving_latency.TOTAL: 4.0}]
+        assert recorder.statistics[serving_latency.FETCH]["count"] == 1
+        assert recorder.statistics[serving_latency.FETCH]["p50_ms"] == 1000.0
+
+    def test_measure_stage_without_retrieval(self):
+        # Arrange
+        recorder = serving_latency.ServingLatencyRecorder()
+
+        # Act
+        with serving_latency.measure_stage(serving_latency.FETCH):
+            pass
+        serving_latency.add_stage_latency(serving_latency.FETCH, 1.0)
+
+        # Assert
+        assert recorder.statistics == {}
+
+    def test_measure_nested_retrieval_once(self):
+        # Arrange
+        recorder = serving_latency.ServingLatencyRecorder()
+
+        # Act
+        with recorder.measure():
+            with recorder.measure():
+                serving_latency.add_stage_latency(serving_latency.FETCH, 0.5)
+
+        # Assert
+        assert recorder.statistics[serving_latency.TOTAL]["count"] == 1
+        assert recorder.statistics[serving_latency.FETCH]["mean_ms"] == 500.0
+
+    def test_failed_retrieval_not_recorded(self):
+        # Arrange
+        recorder = serving_latency.ServingLatencyRecorder()
+
+        # Act
+        with pytest.raises(ValueError):
+            with recorder.measure():
+                raise ValueError("fetch failed")
+
+        # Assert
+        assert recorder.statistics == {}
+
+    def test_statistics_percentiles(self):
+        # Arrange
+        recorder = serving_latency.ServingLatencyRecorder(window_size=100)
+
+        # Act
+        for latency in range(1, 201):
+            recorder.record({serving_latency.TOTAL: latency / 1000})
+
+        # Assert
+        assert recorder.statistics[serving_latency.TOTAL] == {
+            "count": 100,
+            "mean_ms": pytest.approx(150.5),
+            "p50_ms": pytest.approx(151.0),
+            "p95_ms": pytest.approx(196.0),
+            "p99_ms": pytest.approx(200.0),
+        }
+
+    def test_failing_hook(self):
+        # Arrange
+        breakdowns = []
+        recorder = serving_latency.ServingLatencyRecorder(
+            hooks=[lambda breakdown: 1 / 0, breakdowns.append]
+        )
+
+        # Act
+        recorder.record({serving_latency.TOTAL: 0.1})
+
+        # Assert
+        assert breakdowns == [{serving_latency.TOTAL: 0.1}]
+
+    def test_from_config(self):
+        # Act
+        recorder = serving_latency.ServingLatencyRecorder.from_config(
+            {"window_size": 10, "hooks": [print]}
+        )
+
+        # Assert
+        assert recorder._window_size == 10
+        assert recorder.hooks == [print]
+
+    def test_from_config_unknown_option(self):
+        # Act
+        with pytest.raises(ValueError):
+            serving_latency.ServingLatencyRecorder.from_config({"size": 10})
@@ -0,0 +1,182 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import os
+
+import pandas as pd
+import polars as pl
+import pytest
+from hsfs import training_dataset
+from hsfs.core import training_dataset_cache
+
+
+class TestTrainingDatasetCache:
+    def _arrange_training_dataset(self, seed=None):
+        return training_dataset.TrainingDataset(
+            name="test",
+            location="location",
+            version=1,
+            data_format="parquet",
+            featurestore_id=99,
+            splits={},
+            seed=seed,
+        )
+
+    def _arrange_feature_view(self, mocker):
+        fv = mocker.Mock()
+        fv.name = "fv"
+        fv.version = 1
+        return fv
+
+    def test_get_put(self, mocker, tmp_path):
+        # Arrange
+        cache = training_dataset_cache.TrainingDatasetCache(tmp_path)
+        fv = self._arrange_feature_view(mocker)
+        td = self._arrange_training_dataset()
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+        # Act
+        miss = cache.get(fv, td, "train")
+        cache.put(fv, td, "train", df)
+        hit_pandas = cache.get(fv, td, "train")
+        hit_polars = cache.get(fv, td, "train", dataframe_type="polars")
+
+        # Assert
+        assert miss is None
+        assert (tmp_path / "fv_1" / "td_1" / "train.arrow").exists()
+        pd.testing.assert_frame_equal(hit_pandas, df)
+        assert isinstance(hit_polars, pl.DataFrame)
+        assert hit_polars["a"].to_list() == [1, 2]
+
+    def test_get_projected_columns_cached_separately(self, mocker, tmp_path):
+        # Arrange
+        cache = training_dataset_cache.TrainingDatasetCache(tmp_path)
+        fv = self._arrange_feature_view(mocker)
+        td = self._arrange_training_dataset()
+        cache.put(fv, td, "train", pd.DataFrame({"a": [1], "b": [2]}))
+
+        # Act
+        result = cache.get(fv, td, "train", columns=["a"])
+
+        # Assert
+        assert result is None
+
+    def test_get_metadata_changed(self, mocker, tmp_path):
+        # Arrange
+        cache = training_dataset_cache.TrainingDatasetCache(tmp_path)
+        fv = self._arrange_feature_view(mocker)
+        cache.put(
+            fv,
+            self._arrange_training_dataset(seed=1),
+            "train",
+            pd.DataFrame({"a": [1]}),
+        )
+
+        # Act
+        result = cache.get(fv, self._arrange_training_dataset(seed=2), "train")
+
+        # Assert
+        assert result is None
+        assert not (tmp_path / "fv_1" / "td_1").exists()
+
+    def test_put_evicts_least_recently_read(self, mocker, tmp_path):
+        # Arrange
+        fv = self._arrange_feature_view(mocker)
+        td = self._arrange_training_dataset()
+        df = pd.DataFrame({"a": list(range(100))})
+        cache = training_dataset_cache.TrainingDatasetCache(tmp_path)
+        cache.put(fv, td, "train", df)
+        file_size = os.path.getsize(tmp_path / "fv_1" / "td_1" / "train.arrow")
+        cache = training_dataset_cache.TrainingDatasetCache(
+            tmp_path, max_size=2 * file_size
+        )
+        cache.put(fv, td, "test", df)
+        os.utime(tmp_path / "fv_1" / "td_1" / "train.arrow", (0, 0))
+        cache.get(fv, td, "test")
+
+        # Act
+        cache.put(fv, td, "validation", df)
+
+        # Assert
+        assert cache.get(fv, td, "train") is None
+        assert cache.get(fv, td, "test") is not None
+        assert cache.get(fv, td, "validation") is not None
+
+    def test_put_larger_than_cache(self, mocker, tmp_path):
+        # Arrange
+        cache = training_dataset_cache.TrainingDatasetCache(tmp_path, max_size=10)
+        fv = self._arrange_feature_view(mocker)
+        td = self._arrange_training_dataset()
+
+        # Act
+        cache.put(fv, td, "train", pd.DataFrame({"a": list(range(100))}))
+
+        # Assert
+        assert cache.get(fv, td, "train") is None
+        assert list((tmp_path / "fv_1" / "td_1").glob("*.tmp")) == []
+
+    def test_invalidate(self, mocker, tmp_path):
+        # Arrange
+        cache = training_dataset_cache.TrainingDatasetCache(tmp_path)
+        fv = self._arrange_feature_view(mocker)
+        td = self._arrange_training_dataset()
+        cache.put(fv, td, "train", pd.DataFrame({"a": [1]}))
+
+        # Act
+        cache.invalidate(fv, 1)
+
+        # Assert
+        assert cache.get(fv, td, "train") is None
+
+    def test_invalidate_all_versions(self, mocker, tmp_path):
+        # Arrange
+        cache = training_dataset_cache.TrainingDatasetCache(tmp_path)
+        fv = self._arrange_feature_view(mocker)
+        td = self._arrange_training_dataset()
+        cache.put(fv, td, "train", pd.DataFrame({"a": [1]}))
+
+        # Act
+        training_dataset_cache.TrainingDatasetCache.invalidate(fv)
+
+        # Assert
+        assert not (tmp_path / "fv_1").exists()
+
+    def test_from_config(self, tmp_path):
+        # Act
+        cache = training_dataset_cache.TrainingDatasetCache.from_config(
+            {"dir": str(tmp_path), "max_size": 1024}
+        )
+
+        # Assert
+        assert cache.dir == tmp_path
+        assert cache.max_size == 1024
+
+    def test_from_config_invalid(self, tmp_path):
+        # Act
+        with pytest.raises(ValueError) as unknown_info:
+            training_dataset_cache.TrainingDatasetCache.from_config(
+                {"dir": str(tmp_path), "size": 1024}
+            )
+        with pytest.raises(ValueError) as missing_dir_info:
+            training_dataset_cache.TrainingDatasetCache.from_config({"max_size": 1})
+
+        # Assert
+        assert "Unknown training dataset cache configuration options: ['size']" in str(
+            unknown_info.value
+        )
+        assert (
+            str(missing_dir_info.value)
+            == "Training dataset cache requires the 'dir' option."
+        )
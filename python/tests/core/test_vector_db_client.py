@@ -13,10 +13,11 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from hsfs.client.exceptions import FeatureStoreException
+from hsfs.client.exceptions import FeatureStoreException, VectorDatabaseException
 from hsfs.core import vector_db_client
 from hsfs.embedding import EmbeddingIndex
 from hsfs.feature import Feature
@@ -246,6 +247,186 @@ class TestVectorDbClient:
         expected = [{"f1": 4, "f2": [9, 4, 4]}]
         assert actual == expected
 
+    def test_read_async_with_keys(self):
+        # Arrange
+        self.target._opensearch_client.search_async = AsyncMock(
+            return_value={"hits": {"hits": [{"_source": {"f1": 4, "f2": [9, 4, 4]}}]}}
+        )
+
+        # Act
+        actual = asyncio.run(
+            self.target.read_async(
+                self.fg.id, self.fg.features, keys={"f1": 10, "f2": 20}
+            )
+        )
+
+        # Assert
+        expected_query = {
+            "query": {"bool": {"must": [{"match": {"f1": 10}}, {"match": {"f2": 20}}]}},
+            "_source": ["f1", "f2", "f3"],
+        }
+        self.target._opensearch_client.search_async.assert_awaited_once_with(
+            body=expected_query, index="2249__embedding_default_embedding"
+        )
+        self.target._opensearch_client.search.assert_not_called()
+        assert actual == [{"f1": 4, "f2": [9, 4, 4]}]
+
     def test_read_without_pk_or_keys(self):
         with pytest.raises(FeatureStoreException):
             self.target.read(self.fg.id, self.fg.features)
+
+    def test_read_batches(self):
+        # Arrange
+        def page(*values):
+            return {
+                "_scroll_id": "scroll_1",
+                "hits": {
+                    "hits": [{"_source": {"f1": v, "f2": [v, v, v]}} for v in values]
+                },
+            }
+
+        self.target._opensearch_client.scroll_search.return_value = page(1, 2)
+        self.target._opensearch_client.scroll.side_effect = [page(3, 4), page(5)]
+
+        # Act
+        actual = list(
+            self.target.read_batches(self.fg.id, self.fg.features, "f1", batch_size=2)
+        )
+
+        # Assert
+        assert actual == [
+            [{"f1": 1, "f2": [1, 1, 1]}, {"f1": 2, "f2": [2, 2, 2]}],
+            [{"f1": 3, "f2": [3, 3, 3]}, {"f1": 4, "f2": [4, 4, 4]}],
+            [{"f1": 5, "f2": [5, 5, 5]}],
+        ]
+        self.target._opensearch_client.scroll_search.assert_called_once_with(
+            index="2249__embedding_default_embedding",
+            body={
+                "query": {"bool": {"must": {"exists": {"field": "f1"}}}},
+                "size": 2,
+                "sort": ["_doc"],
+                "_source": ["f1", "f2", "f3"],
+            },
+            scroll="1m",
+            options=None,
+        )
+        assert self.target._opensearch_client.scroll.call_count == 2
+        self.target._opensearch_client.clear_scroll.assert_called_once_with("scroll_1")
+
+    def test_read_batches_clears_scroll_when_closed_early(self):
+        # Arrange
+        self.target._opensearch_client.scroll_search.return_value = {
+            "_scroll_id": "scroll_1",
+            "hits": {"hits": [{"_source": {"f1": 1, "f2": [1, 1, 1]}}]},
+        }
+        batches = self.target.read_batches(
+            self.fg.id, self.fg.features, "f1", batch_size=1
+        )
+
+        # Act
+        next(batches)
+        batches.close()
+
+        # Assert
+        self.target._opensearch_client.scroll.assert_not_called()
+        self.target._opensearch_client.clear_scroll.assert_called_once_with("scroll_1")
+
+    def test_read_with_pk_all_rows(self):
+        # Arrange
+        self.target._opensearch_client.scroll_search.return_value = {
+            "_scroll_id": "scroll_1",
+            "hits": {"hits": [{"_source": {"f1": 4, "f2": [9, 4, 4]}}]},
+        }
+
+        # Act
+        actual = self.target.read(self.fg.id, self.fg.features, pk="f1", n=None)
+
+        # Assert
+        assert actual == [{"f1": 4, "f2": [9, 4, 4]}]
+        self.target._opensearch_client.search.assert_not_called()
+
+    def test_find_neighbors_async(self):
+        # Arrange
+        self.target._opensearch_client.search_async = AsyncMock(
+            return_value={
+                "hits": {
+                    "hits": [{"_score": 0.5, "_source": {"f1": 4, "f2": [9, 4, 4]}}]
+                }
+            }
+        )
+
+        async def find_neighbors_concurrently():
+            return await asyncio.gather(
+                self.target.find_neighbors_async([1, 2, 3], k=1),
+                self.target.find_neighbors_async([4, 5, 6], k=1),
+            )
+
+        # Act
+        actual = asyncio.run(find_neighbors_concurrently())
+
+        # Assert
+        assert actual == [[(1.0, {"f1": 4, "f2": [9, 4, 4]})]] * 2
+        assert self.target._opensearch_client.search_async.await_count == 2
+        self.target._opensearch_client.search.assert_not_called()
+
+    def test_find_neighbors_batch(self):
+        # Arrange
+        hit = {
+            "_score": 0.5,
+            "_source": {"f1": 4, "f2": [9, 4, 4]},
+        }
+        self.target._opensearch_client.msearch.return_value = [
+            {"hits": {"hits": [hit]}},
+            {"hits": {"hits": []}},
+        ]
+
+        # Act
+        actual = self.target.find_neighbors_batch([[1, 2, 3], [4, 5, 6]], k=2)
+
+        # Assert
+        body = self.target._opensearch_client.msearch.call_args[1]["body"]
+        assert body[0::2] == [{}, {}]
+        assert [
+            query["query"]["bool"]["must"][0]["knn"]["f2"] for query in body[1::2]
+        ] == [{"vector": [1, 2, 3], "k": 2}, {"vector": [4, 5, 6], "k": 2}]
+        assert self.target._opensearch_client.search.call_count == 0
+        assert actual == [[(1.0, {"f1": 4, "f2": [9, 4, 4]})], []]
+
+    def test_find_neighbors_batch_project_index(self, mocker):
+        # Arrange
+        mocker.patch.object(self.embedding_index, "_col_prefix", "test_fg_1_")
+        self.target._embedding_features = {
+            self.f2: self.embedding_index.get_embedding("f2")
+        }
+        mocker.patch.dict(vector_db_client.VectorDbClient._index_result_limit_k)
+        self.target._opensearch_client.search.side_effect = VectorDatabaseException(
+            VectorDatabaseException.REQUESTED_K_TOO_LARGE,
+            "Requested k is too large",
+            {VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K: 5},
+        )
+        self.target._opensearch_client.msearch.return_value = [
+            {"hits": {"hits": []}}
+        ] * 2
+        self.target._fg_vdb_col_fg_col_map[self.fg.id] = {}
+
+        # Act
+        self.target.find_neighbors_batch([[1, 2, 3], [4, 5, 6]], k=2)
+        self.target.find_neighbors_batch([[1, 2, 3]], k=2)
+
+        # Assert
+        # the max k of the index is probed once and the candidates are not searched again per embedding
+        assert self.target._opensearch_client.search.call_count == 1
+        assert vector_db_client.VectorDbClient._index_result_limit_k == {
+            "2249__embedding_default_embedding": 5
+        }
+        body = self.target._opensearch_client.msearch.call_args[1]["body"]
+        assert body[1]["query"]["bool"]["must"][0]["knn"]["test_fg_1_f2"]["k"] == 5
+        assert body[1]["size"] == 2
+
+    def test_find_neighbors_batch_empty(self):
+        # Act
+        actual = self.target.find_neighbors_batch([])
+
+        # Assert
+        assert actual == []
+        assert self.target._opensearch_client.msearch.call_count == 0
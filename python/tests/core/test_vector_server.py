@@ -0,0 +1,952 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import asyncio
+from base64 import b64encode
+from datetime import datetime
+from io import BytesIO
+
+import avro.io
+import avro.schema
+import pytest
+from hsfs import (
+    feature_group,
+    serving_key,
+    training_dataset_feature,
+    transformation_function,
+)
+from hsfs.client import exceptions
+from hsfs.core import (
+    online_client_selector,
+    online_store_rest_client_engine,
+    vector_server,
+)
+from hsfs.hopsworks_udf import HopsworksUdf, UDFType, udf
+
+
+class TestVectorServer:
+    @pytest.fixture()
+    def vector_server_with_transformations(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(float)
+        def double_amount(amount):
+            return amount * 2
+
+        @udf(float)
+        def plus_one(amount):
+            return amount + 1
+
+        on_demand_tf = transformation_function.TransformationFunction(
+            featurestore_id=99,
+            hopsworks_udf=double_amount,
+            transformation_type=UDFType.ON_DEMAND,
+        )
+        model_dependent_tf = transformation_function.TransformationFunction(
+            featurestore_id=99,
+            hopsworks_udf=plus_one("amount"),
+            transformation_type=UDFType.MODEL_DEPENDENT,
+        )
+
+        features = [
+            training_dataset_feature.TrainingDatasetFeature(name="id", type="bigint"),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="amount", type="double"
+            ),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="double_amount", type="double"
+            ),
+        ]
+        server = vector_server.VectorServer(feature_store_id=99, features=features)
+        server._on_demand_transformation_functions = [on_demand_tf]
+        server._on_demand_feature_names = ["double_amount"]
+        server._model_dependent_transformation_functions = [model_dependent_tf]
+        server._init_sql_client = True
+        server._init_rest_client = False
+        server._default_client = server.DEFAULT_SQL_CLIENT
+        server._sql_client = mocker.MagicMock()
+        mocker.patch.object(
+            server,
+            "validate_entry",
+            side_effect=lambda entry, **kwargs: entry,
+        )
+        return server
+
+    def test_get_feature_vectors_transformations_applied_once(
+        self, mocker, vector_server_with_transformations
+    ):
+        # Arrange
+        server = vector_server_with_transformations
+        server._sql_client.get_batch_feature_vectors.return_value = (
+            [{"id": i, "amount": float(i)} for i in range(5)],
+            None,
+        )
+        mock_get_udf = mocker.spy(HopsworksUdf, "get_udf")
+
+        # Act
+        result = server.get_feature_vectors(
+            entries=[{"id": i} for i in range(5)],
+            return_type="list",
+            vector_db_features=[],
+        )
+
+        # Assert
+        assert mock_get_udf.call_count == 2
+        assert server.transformed_feature_vector_col_name == [
+            "id",
+            "amount",
+            "double_amount",
+            "plus_one_amount_",
+        ]
+        assert result == [[i, float(i), 2.0 * i, i + 1.0] for i in range(5)]
+
+    def test_get_feature_vectors_matches_single_vector(
+        self, vector_server_with_transformations
+    ):
+        # Arrange
+        server = vector_server_with_transformations
+        server._sql_client.get_batch_feature_vectors.return_value = (
+            [{"id": 1, "amount": 10.0}, {"id": 2, "amount": 20.0}],
+            None,
+        )
+        server._sql_client.get_single_feature_vector.return_value = {
+            "id": 2,
+            "amount": 20.0,
+        }
+
+        # Act
+        batch_result = server.get_feature_vectors(
+            entries=[{"id": 1}, {"id": 2}],
+            return_type="list",
+            vector_db_features=[],
+            request_parameters=[{}, {"amount": 5.0}],
+        )
+        single_result = server.get_feature_vector(
+            entry={"id": 2},
+            return_type="list",
+            request_parameters={"amount": 5.0},
+        )
+
+        # Assert
+        assert batch_result[0] == [1, 10.0, 20.0, 11.0]
+        assert batch_result[1] == single_result == [2, 20.0, 10.0, 21.0]
+
+    def test_get_feature_vectors_matches_single_vector_missing_values(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(int)
+        def amount_or_default(amount):
+            return amount.fillna(-1)
+
+        @udf(int)
+        def count_or_default(count):
+            return count.fillna(0)
+
+        features = [
+            training_dataset_feature.TrainingDatasetFeature(name="id", type="bigint"),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="amount", type="bigint"
+            ),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="count", type="bigint"
+            ),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="amount_or_default", type="bigint"
+            ),
+        ]
+        server = vector_server.VectorServer(feature_store_id=99, features=features)
+        server._on_demand_transformation_functions = [
+            transformation_function.TransformationFunction(
+                featurestore_id=99,
+                hopsworks_udf=amount_or_default,
+                transformation_type=UDFType.ON_DEMAND,
+            )
+        ]
+        server._on_demand_feature_names = ["amount_or_default"]
+        server._model_dependent_transformation_functions = [
+            transformation_function.TransformationFunction(
+                featurestore_id=99,
+                hopsworks_udf=count_or_default("count"),
+                transformation_type=UDFType.MODEL_DEPENDENT,
+            )
+        ]
+        server._init_sql_client = True
+        server._init_rest_client = False
+        server._default_client = server.DEFAULT_SQL_CLIENT
+        server._sql_client = mocker.MagicMock()
+        mocker.patch.object(
+            server, "validate_entry", side_effect=lambda entry, **kwargs: entry
+        )
+        rows = [
+            {"id": 1, "amount": 10, "count": None},
+            {"id": 2, "amount": None, "count": 3},
+            {"id": 3, "amount": None, "count": None},
+        ]
+        server._sql_client.get_batch_feature_vectors.return_value = (rows, None)
+        server._sql_client.get_single_feature_vector.side_effect = [
+            dict(row) for row in rows
+        ]
+
+        # Act
+        batch_result = server.get_feature_vectors(
+            entries=[{"id": row["id"]} for row in rows],
+            return_type="list",
+            vector_db_features=[],
+            allow_missing=True,
+        )
+        single_results = [
+            server.get_feature_vector(
+                entry={"id": row["id"]}, return_type="list", allow_missing=True
+            )
+            for row in rows
+        ]
+
+        # Assert
+        assert batch_result == single_results
+        assert batch_result == [
+            [1, 10, None, 10, 0],
+            [2, None, 3, -1, 3],
+            [3, None, None, -1, 0],
+        ]
+        assert [type(value) for value in batch_result[0]] == [
+            type(value) for value in single_results[0]
+        ]
+
+    def test_get_feature_vectors_skipped_entries(
+        self, vector_server_with_transformations
+    ):
+        # Arrange
+        server = vector_server_with_transformations
+        server._on_demand_transformation_functions = []
+        server._sql_client.get_batch_feature_vectors.return_value = (
+            [{"id": 1, "amount": 1.0}, {}, {"id": 3, "amount": 3.0}],
+            None,
+        )
+
+        # Act
+        result = server.get_feature_vectors(
+            entries=[{"id": 1}, {"id": 2}, {"id": 3}],
+            return_type="pandas",
+            vector_db_features=[],
+        )
+
+        # Assert
+        assert result["id"].tolist() == [1, 3]
+        assert result["plus_one_amount_"].tolist() == [2.0, 4.0]
+
+    def test_get_feature_vector_async(self, mocker, vector_server_with_transformations):
+        # Arrange
+        server = vector_server_with_transformations
+        server._sql_client.get_single_feature_vector_async = mocker.AsyncMock(
+            return_value={"id": 2, "amount": 20.0}
+        )
+
+        # Act
+        result = asyncio.run(
+            server.get_feature_vector_async(entry={"id": 2}, return_type="list")
+        )
+
+        # Assert
+        assert result == [2, 20.0, 40.0, 21.0]
+        server._sql_client.get_single_feature_vector_async.assert_awaited_once_with(
+            {"id": 2}
+        )
+        server._sql_client.get_single_feature_vector.assert_not_called()
+
+    def test_get_feature_vectors_async(
+        self, mocker, vector_server_with_transformations
+    ):
+        # Arrange
+        server = vector_server_with_transformations
+        server._sql_client.get_batch_feature_vectors_async = mocker.AsyncMock(
+            return_value=([{"id": 1, "amount": 1.0}, {"id": 2, "amount": 2.0}], None)
+        )
+
+        # Act
+        result = asyncio.run(
+            server.get_feature_vectors_async(
+                entries=[{"id": 1}, {"id": 2}], return_type="list"
+            )
+        )
+
+        # Assert
+        assert result == [[1, 1.0, 2.0, 2.0], [2, 2.0, 4.0, 3.0]]
+        server._sql_client.get_batch_feature_vectors.assert_not_called()
+
+    def test_get_feature_vectors_auto_client_records_latency(
+        self, mocker, vector_server_with_transformations
+    ):
+        # Arrange
+        server = vector_server_with_transformations
+        server._init_rest_client = True
+        server.default_client = server.AUTO_CLIENT
+        server._sql_client.get_batch_feature_vectors.return_value = (
+            [{"id": i, "amount": float(i)} for i in range(5)],
+            None,
+        )
+        mock_rest_get_batch = mocker.patch.object(
+            server, "_rest_client_engine", create=True
+        ).get_batch_feature_vectors
+
+        # Act
+        server.get_feature_vectors(
+            entries=[{"id": i} for i in range(5)],
+            return_type="list",
+            vector_db_features=[],
+        )
+
+        # Assert
+        assert server._sql_client.get_batch_feature_vectors.call_count == 1
+        assert mock_rest_get_batch.call_count == 0
+        statistics = server.online_client_selector.statistics
+        assert statistics["batch_size_buckets"][8]["sql"]["count"] == 1
+
+    def test_get_feature_vectors_auto_client_skipped_entries_batch_size(
+        self, mocker, vector_server_with_transformations
+    ):
+        # Arrange
+        server = vector_server_with_transformations
+        server._init_rest_client = True
+        server.default_client = server.AUTO_CLIENT
+        server._sql_client.get_batch_feature_vectors.return_value = (
+            [{"id": i, "amount": float(i)} for i in range(5)],
+            None,
+        )
+        mocker.patch.object(server, "_rest_client_engine", create=True)
+        mock_select = mocker.spy(server.online_client_selector, "select")
+
+        # Act
+        server.get_feature_vectors(
+            entries=[{"id": i} for i in range(5)] + [{}] * 4,
+            return_type="list",
+            passed_features=[{}] * 5 + [{"amount": 1.0}] * 4,
+            vector_db_features=[],
+            allow_missing=True,
+        )
+
+        # Assert
+        mock_select.assert_called_once_with(5)
+        statistics = server.online_client_selector.statistics
+        assert statistics["batch_size_buckets"][8]["sql"]["count"] == 1
+        assert 16 not in statistics["batch_size_buckets"]
+
+    @pytest.mark.parametrize("init_sql_client", [None, True])
+    def test_init_serving_auto_client(self, mocker, init_sql_client):
+        # Arrange
+        server = vector_server.VectorServer(feature_store_id=99, features=[])
+        mocker.patch.object(server, "init_transformation")
+        mocker.patch.object(server, "set_return_feature_value_handlers")
+        mock_setup_rest = mocker.patch.object(server, "setup_rest_client_and_engine")
+        mock_setup_sql = mocker.patch.object(server, "setup_sql_client")
+
+        # Act
+        server.init_serving(
+            entity=mocker.MagicMock(),
+            external=True,
+            init_sql_client=init_sql_client,
+            init_rest_client=True,
+            default_client="auto",
+        )
+
+        # Assert
+        assert server.default_client == server.AUTO_CLIENT
+        assert isinstance(
+            server.online_client_selector,
+            online_client_selector.OnlineClientSelector,
+        )
+        mock_setup_rest.assert_called_once()
+        mock_setup_sql.assert_called_once()
+
+    def test_init_serving_auto_client_sql_disabled(self, mocker):
+        # Arrange
+        server = vector_server.VectorServer(feature_store_id=99, features=[])
+
+        # Act
+        with pytest.raises(ValueError) as e_info:
+            server.init_serving(
+                entity=mocker.MagicMock(),
+                external=True,
+                init_sql_client=False,
+                init_rest_client=True,
+                default_client="auto",
+            )
+
+        # Assert
+        assert "requires both the REST and the SQL client" in str(e_info.value)
+
+    def test_get_feature_vectors_serving_latency(
+        self, vector_server_with_transformations
+    ):
+        # Arrange
+        server = vector_server_with_transformations
+        server.init_serving_latency_recorder({"window_size": 10})
+        server._sql_client.get_batch_feature_vectors.return_value = (
+            [{"id": i, "amount": float(i)} for i in range(5)],
+            None,
+        )
+
+        # Act
+        server.get_feature_vectors(
+            entries=[{"id": i} for i in range(5)],
+            return_type="list",
+            vector_db_features=[],
+        )
+        server.get_feature_vectors(
+            entries=[{"id": i} for i in range(5)],
+            return_type="list",
+            vector_db_features=[],
+        )
+
+        # Assert
+        statistics = server.serving_latency_recorder.statistics
+        assert set(statistics.keys()) == {
+            "validate_entry",
+            "fetch",
+            "on_demand_transformations",
+            "model_dependent_transformations",
+            "return_type",
+            "total",
+        }
+        assert all(stage["count"] == 2 for stage in statistics.values())
+
+    @pytest.fixture()
+    def vector_server_with_cache(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        fg_transactions = mocker.MagicMock(id=1)
+        fg_customers = mocker.MagicMock(id=2)
+        features = [
+            training_dataset_feature.TrainingDatasetFeature(
+                name="id", type="bigint", featuregroup=fg_transactions
+            ),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="amount", type="double", featuregroup=fg_transactions
+            ),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="customer_id", type="bigint", featuregroup=fg_customers
+            ),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="age", type="bigint", featuregroup=fg_customers
+            ),
+        ]
+        serving_keys = [
+            serving_key.ServingKey(
+                feature_name="id", join_index=0, feature_group=fg_transactions
+            ),
+            serving_key.ServingKey(
+                feature_name="customer_id", join_index=1, feature_group=fg_customers
+            ),
+        ]
+        server = vector_server.VectorServer(
+            feature_store_id=99, features=features, serving_keys=serving_keys
+        )
+        server._init_sql_client = True
+        server._init_rest_client = False
+        server._default_client = server.DEFAULT_SQL_CLIENT
+        server._sql_client = mocker.MagicMock()
+        server._on_demand_feature_names = []
+        server.init_feature_vector_cache({"ttl": 10, "max_entries": 100})
+        mocker.patch.object(
+            server,
+            "validate_entry",
+            side_effect=lambda entry, **kwargs: entry,
+        )
+        return server
+
+    def test_get_feature_vector_cache_hit(self, vector_server_with_cache):
+        # Arrange
+        server = vector_server_with_cache
+        server._sql_client.get_single_feature_vector.return_value = {
+            "id": 1,
+            "amount": 10.0,
+            "customer_id": 7,
+            "age": 33,
+        }
+
+        # Act
+        first = server.get_feature_vector(
+            {"id": 1, "customer_id": 7}, return_type="list"
+        )
+        second = server.get_feature_vector(
+            {"id": 1, "customer_id": 7}, return_type="list"
+        )
+
+        # Assert
+        assert first == second == [1, 10.0, 7, 33]
+        assert server._sql_client.get_single_feature_vector.call_count == 1
+        assert server.feature_vector_cache.statistics == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "size": 2,
+        }
+
+    def test_get_feature_vectors_fetch_only_cache_misses(
+        self, vector_server_with_cache
+    ):
+        # Arrange
+        server = vector_server_with_cache
+
+        def get_batch_feature_vectors(entries):
+            return (
+                [
+                    {
+                        "id": entry["id"],
+                        "amount": float(entry["id"]),
+                        "customer_id": entry["customer_id"],
+                        "age": 20 + entry["customer_id"],
+                    }
+                    for entry in entries
+                ],
+                None,
+            )
+
+        server._sql_client.get_batch_feature_vectors.side_effect = (
+            get_batch_feature_vectors
+        )
+        server.get_feature_vectors(
+            [{"id": 1, "customer_id": 1}, {"id": 3, "customer_id": 3}],
+            return_type="list",
+        )
+
+        # Act
+        result = server.get_feature_vectors(
+            [{"id": i, "customer_id": i} for i in range(4)], return_type="list"
+        )
+
+        # Assert
+        assert result == [[i, float(i), i, 20 + i] for i in range(4)]
+        fetched_entries = server._sql_client.get_batch_feature_vectors.call_args[0][0]
+        assert fetched_entries == [
+            {"id": 0, "customer_id": 0},
+            {"id": 2, "customer_id": 2},
+        ]
+
+    def test_get_feature_vector_cache_partial_hit_fetches_entry(
+        self, vector_server_with_cache
+    ):
+        # Arrange
+        server = vector_server_with_cache
+        server._sql_client.get_single_feature_vector.side_effect = [
+            {"id": 1, "amount": 10.0, "customer_id": 7, "age": 33},
+            {"id": 1, "amount": 10.0, "customer_id": 8, "age": 40},
+        ]
+        server.get_feature_vector({"id": 1, "customer_id": 7}, return_type="list")
+
+        # Act
+        result = server.get_feature_vector(
+            {"id": 1, "customer_id": 8}, return_type="list"
+        )
+
+        # Assert
+        assert result == [1, 10.0, 8, 40]
+        assert server._sql_client.get_single_feature_vector.call_count == 2
+        # the cached transactions are refetched with the entry, so they are not a hit
+        assert server.feature_vector_cache.statistics["hits"] == 0
+        assert server.feature_vector_cache.statistics["misses"] == 2
+
+    def test_get_feature_vector_cache_skips_missing_rows(
+        self, vector_server_with_cache
+    ):
+        # Arrange
+        server = vector_server_with_cache
+        server._sql_client.get_single_feature_vector.return_value = {
+            "id": 1,
+            "amount": 10.0,
+        }
+
+        # Act
+        server.get_feature_vector(
+            {"id": 1, "customer_id": 7}, return_type="list", allow_missing=True
+        )
+
+        # Assert
+        assert len(server.feature_vector_cache) == 1
+
+    @pytest.fixture()
+    def vector_server_rest(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        fg = mocker.MagicMock(id=1)
+        features = [
+            training_dataset_feature.TrainingDatasetFeature(
+                name="id", type="bigint", featuregroup=fg
+            ),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="amount", type="double", featuregroup=fg
+            ),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="ts", type="timestamp", featuregroup=fg
+            ),
+        ]
+        server = vector_server.VectorServer(feature_store_id=99, features=features)
+        server._init_sql_client = False
+        server._init_rest_client = True
+        server._default_client = server.DEFAULT_REST_CLIENT
+        server._on_demand_feature_names = []
+        server._return_feature_value_handlers = {
+            "ts": server._handle_timestamp_based_on_dtype
+        }
+        server._rest_client_engine = (
+            online_store_rest_client_engine.OnlineStoreRestClientEngine(
+                feature_store_name="test_store_featurestore",
+                feature_view_name="test_feature_view",
+                feature_view_version=1,
+                features=features,
+            )
+        )
+        mocker.patch.object(
+            server,
+            "validate_entry",
+            side_effect=lambda entry, **kwargs: entry,
+        )
+        return server
+
+    def test_get_feature_vectors_rest_columnar(self, mocker, vector_server_rest):
+        # Arrange
+        server = vector_server_rest
+        mock_get_batch_raw_feature_vectors = mocker.patch(
+            "hsfs.core.online_store_rest_client_api.OnlineStoreRestClientApi.get_batch_raw_feature_vectors",
+            return_value={
+                "features": [
+                    [1, 10.0, "2024-01-01 00:00:00"],
+                    None,
+                    [3, 30.0, "2024-01-03 00:00:00"],
+                ],
+                "status": ["COMPLETE", "ERROR", "COMPLETE"],
+                "metadata": None,
+                "detailedStatus": None,
+            },
+        )
+        mock_assemble_result_dict = mocker.spy(server, "assemble_result_dict")
+
+        # Act
+        result = server.get_feature_vectors(
+            entries=[{"id": i} for i in [1, 2, 3]],
+            return_type="pandas",
+            allow_missing=True,
+        )
+
+        # Assert
+        assert mock_get_batch_raw_feature_vectors.call_count == 1
+        assert mock_assemble_result_dict.call_count == 0
+        assert list(result.columns) == ["id", "amount", "ts"]
+        assert result["amount"].tolist()[0::2] == [10.0, 30.0]
+        assert result["ts"].tolist()[0] == datetime(2024, 1, 1)
+        assert result.iloc[1].isna().all()
+
+    def test_get_feature_vectors_rest_columnar_matches_row_path(
+        self, mocker, vector_server_rest
+    ):
+        # Arrange
+        server = vector_server_rest
+        mocker.patch(
+            "hsfs.core.online_store_rest_client_api.OnlineStoreRestClientApi.get_batch_raw_feature_vectors",
+            return_value={
+                "features": [
+                    [i, float(i), f"2024-01-0{i} 00:00:00"] for i in range(1, 4)
+                ],
+                "status": ["COMPLETE"] * 3,
+                "metadata": None,
+                "detailedStatus": [[{"featureGroupId": 1, "httpStatus": 200}]] * 3,
+            },
+        )
+        entries = [{"id": i} for i in range(1, 4)]
+
+        # Act
+        columnar = server.get_feature_vectors(
+            entries=entries, return_type="list", allow_missing=True
+        )
+        row_wise = server.get_feature_vectors(
+            entries=entries, return_type="list", allow_missing=False
+        )
+
+        # Assert
+        assert columnar == row_wise
+        assert columnar[0] == [1, 1.0, datetime(2024, 1, 1)]
+
+    @pytest.fixture()
+    def vector_server_with_serving_keys(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        mocker.patch("hsfs.client.get_instance")
+
+        fgs = [
+            feature_group.FeatureGroup(
+                name=f"fg{idx}",
+                version=1,
+                featurestore_id=99,
+                id=idx,
+                primary_key=["id", "date"] if idx == 0 else ["user_id"],
+                partition_key=[],
+            )
+            for idx in [0, 1]
+        ]
+        features = [
+            training_dataset_feature.TrainingDatasetFeature(
+                name=name, type="bigint", featuregroup=fgs[fg_idx]
+            )
+            for name, fg_idx in [
+                ("id", 0),
+                ("date", 0),
+                ("amount", 0),
+                ("right_user_id", 1),
+                ("age", 1),
+            ]
+        ]
+        serving_keys = [
+            serving_key.ServingKey(
+                feature_name="id", join_index=0, feature_group=fgs[0], prefix=""
+            ),
+            serving_key.ServingKey(
+                feature_name="date", join_index=0, feature_group=fgs[0], prefix=""
+            ),
+            serving_key.ServingKey(
+                feature_name="user_id",
+                join_index=1,
+                feature_group=fgs[1],
+                prefix="right_",
+                required=True,
+            ),
+        ]
+        return vector_server.VectorServer(
+            feature_store_id=99, features=features, serving_keys=serving_keys
+        )
+
+    def test_validate_entry(self, vector_server_with_serving_keys):
+        # Arrange
+        server = vector_server_with_serving_keys
+
+        # Act
+        rondb_entry = server.validate_entry(
+            entry={"id": 1, "date": 2, "right_user_id": 3},
+            allow_missing=False,
+            passed_features={},
+            vector_db_features={},
+        )
+
+        # Assert
+        assert rondb_entry == {"id": 1, "date": 2, "right_user_id": 3}
+        assert server.entry_validation_plan.composite_serving_key_groups == (
+            (("id", "id"), ("date", "date")),
+        )
+
+    def test_validate_entry_invalid_key(self, vector_server_with_serving_keys):
+        # Act
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            vector_server_with_serving_keys.validate_entry(
+                entry={"id": 1, "date": 2, "name": "a"},
+                allow_missing=True,
+                passed_features={},
+                vector_db_features={},
+            )
+
+        # Assert
+        assert "Provided key name is not a serving key" in str(e_info.value)
+
+    def test_validate_entry_partial_composite_key(
+        self, vector_server_with_serving_keys
+    ):
+        # Act
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            vector_server_with_serving_keys.validate_entry(
+                entry={"id": 1, "right_user_id": 3},
+                allow_missing=True,
+                passed_features={},
+                vector_db_features={},
+            )
+
+        # Assert
+        assert "Provide either all composite serving keys or none" in str(e_info.value)
+
+    def test_validate_entry_missing_features_passed(
+        self, vector_server_with_serving_keys
+    ):
+        # Arrange
+        server = vector_server_with_serving_keys
+
+        # Act
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            server.validate_entry(
+                entry={"id": 1, "date": 2},
+                allow_missing=False,
+                passed_features={},
+                vector_db_features={},
+            )
+        rondb_entry = server.validate_entry(
+            entry={"id": 1, "date": 2},
+            allow_missing=False,
+            passed_features={"right_user_id": 3, "age": 30},
+            vector_db_features={},
+        )
+
+        # Assert
+        assert "Incomplete feature vector requests: {'right_user_id'" in str(
+            e_info.value
+        )
+        assert rondb_entry == {"id": 1, "date": 2}
+
+    def test_entry_validation_plan_reset_with_serving_keys(
+        self, vector_server_with_serving_keys
+    ):
+        # Arrange
+        server = vector_server_with_serving_keys
+        plan = server.entry_validation_plan
+
+        # Act
+        server.serving_keys = server.serving_keys
+
+        # Assert
+        assert server.entry_validation_plan is not plan
+
+    def test_validate_entry_after_serving_keys_reassigned(
+        self, vector_server_with_serving_keys
+    ):
+        # Arrange
+        server = vector_server_with_serving_keys
+        server.validate_entry(
+            entry={"id": 1, "date": 2, "right_user_id": 3},
+            allow_missing=True,
+            passed_features={},
+            vector_db_features={},
+        )
+
+        # Act
+        server.serving_keys = server.serving_keys[2:]
+        rondb_entry = server.validate_entry(
+            entry={"right_user_id": 3},
+            allow_missing=True,
+            passed_features={},
+            vector_db_features={},
+        )
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            server.validate_entry(
+                entry={"id": 1, "date": 2, "right_user_id": 3},
+                allow_missing=True,
+                passed_features={},
+                vector_db_features={},
+            )
+
+        # Assert
+        assert rondb_entry == {"right_user_id": 3}
+        assert "Provided key id is not a serving key" in str(e_info.value)
+        assert server.required_serving_keys == ["right_user_id"]
+        assert server.rondb_serving_keys == ["right_user_id"]
+        assert list(server.groups_of_composite_serving_keys) == [1]
+
+    @pytest.mark.parametrize("use_fastavro", [True, False])
+    def test_complex_feature_decoder(self, mocker, use_fastavro):
+        # Arrange
+        mocker.patch("hsfs.core.vector_server.HAS_FASTAVRO", use_fastavro)
+        mocker.patch(
+            "hsfs.core.vector_server.BinaryDecoder", avro.io.BinaryDecoder, create=True
+        )
+        schema = '{"type": "array", "items": ["null", "long"]}'
+        encoded = [_encode_avro(schema, value) for value in [[1, 2], [], [3]]]
+        decoder = vector_server.ComplexFeatureDecoder(schema)
+
+        # Act
+        decoded = decoder.decode_batch(
+            [encoded[0], None, b64encode(encoded[1]).decode(), [4], encoded[2]]
+        )
+
+        # Assert
+        assert decoded == [[1, 2], None, [], [4], [3]]
+        assert decoder(encoded[0]) == [1, 2]
+        assert decoder(b64encode(encoded[2]).decode()) == [3]
+
+    def test_get_feature_vectors_decodes_complex_features_per_column(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        schema = '{"type": "array", "items": ["null", "long"]}'
+        fg = mocker.MagicMock(id=1)
+        fg._get_feature_avro_schema.return_value = schema
+        features = [
+            training_dataset_feature.TrainingDatasetFeature(
+                name="id", type="bigint", featuregroup=fg
+            ),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="values", type="array<bigint>", featuregroup=fg
+            ),
+        ]
+        server = vector_server.VectorServer(feature_store_id=99, features=features)
+        server._init_sql_client = True
+        server._init_rest_client = False
+        server._default_client = server.DEFAULT_SQL_CLIENT
+        server._on_demand_feature_names = []
+        server._sql_client = mocker.MagicMock()
+        server._sql_client.get_batch_feature_vectors.return_value = (
+            [{"id": i, "values": _encode_avro(schema, [i, i])} for i in range(3)],
+            None,
+        )
+        decode_batch = mocker.spy(vector_server.ComplexFeatureDecoder, "decode_batch")
+        server.set_return_feature_value_handlers(features)
+        mocker.patch.object(
+            server, "validate_entry", side_effect=lambda entry, **kwargs: entry
+        )
+
+        # Act
+        vectors = server.get_feature_vectors(
+            entries=[{"id": i} for i in range(3)], return_type="list"
+        )
+
+        # Assert
+        assert vectors == [[0, [0, 0]], [1, [1, 1]], [2, [2, 2]]]
+        assert decode_batch.call_count == 1
+
+    @pytest.mark.parametrize(
+        "timestamp_values",
+        [
+            ["2024-01-02 03:04:05", None, "1999-12-31 23:59:59"],
+            [1700000000123, None, 0],
+            [datetime(2024, 1, 2, 3, 4, 5), None],
+            [None, None],
+            ["2024-01-02 03:04:05", 1700000000123, datetime(2020, 1, 1), None],
+            ["9999-12-31 23:59:59", None],
+        ],
+    )
+    def test_handle_timestamps_based_on_dtype(self, timestamp_values):
+        # Arrange
+        server = vector_server.VectorServer(feature_store_id=99, features=[])
+
+        # Act
+        handled = server._handle_timestamps_based_on_dtype(timestamp_values)
+
+        # Assert
+        expected = [
+            server._handle_timestamp_based_on_dtype(value) for value in timestamp_values
+        ]
+        assert handled == expected
+        assert [type(value) for value in handled] == [type(value) for value in expected]
+
+    def test_handle_timestamps_based_on_dtype_invalid_string(self):
+        # Arrange
+        server = vector_server.VectorServer(feature_store_id=99, features=[])
+
+        # Act
+        with pytest.raises(ValueError) as e_info:
+            server._handle_timestamps_based_on_dtype(["2024-01-02T03:04:05.123"])
+
+        # Assert
+        assert "does not match format" in str(e_info.value)
+
+
+def _encode_avro(schema, value):
+    buffer = BytesIO()
+    avro.io.DatumWriter(avro.schema.parse(schema)).write(
+        value, avro.io.BinaryEncoder(buffer)
+    )
+    return buffer.getvalue()
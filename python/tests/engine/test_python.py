@@ -14,8 +14,12 @@
 #   limitations under the License.
 #
 import decimal
-from datetime import date, datetime
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from io import BytesIO
 
+import fastavro
 import numpy as np
 import pandas as pd
 import polars as pl
@@ -33,7 +37,7 @@ from hsfs import (
 from hsfs.client import exceptions
 from hsfs.constructor import query
 from hsfs.constructor.hudi_feature_group_alias import HudiFeatureGroupAlias
-from hsfs.core import inode, job
+from hsfs.core import inode, job, kafka_engine
 from hsfs.core.constants import HAS_GREAT_EXPECTATIONS
 from hsfs.engine import python
 from hsfs.expectation_suite import ExpectationSuite
@@ -707,6 +711,153 @@ class TestPython:
         assert mock_boto3_client.call_count == 1
         assert mock_python_engine_read_pandas.call_count == 4
 
+    def test_read_hopsfs_remote_pages_in_order(self, mocker):
+        # Arrange
+        mock_dataset_api = mocker.patch("hsfs.core.dataset_api.DatasetApi")
+        mocker.patch(
+            "hsfs.core.arrow_flight_client.is_data_format_supported",
+            return_value=False,
+        )
+
+        python_engine = python.Engine()
+        python_engine.LIST_FILES_PAGE_SIZE = 2
+
+        paths = [f"part_{i}" for i in range(5)] + ["_SUCCESS"]
+        mock_dataset_api.return_value.list_files.side_effect = (
+            lambda location, offset, limit: (
+                len(paths),
+                [
+                    inode.Inode(attributes={"path": path})
+                    for path in paths[offset : offset + limit]
+                ],
+            )
+        )
+        mock_dataset_api.return_value.read_content.side_effect = lambda path: (
+            mocker.Mock(content=f"a,b\n{path[-1]},x\n".encode())
+        )
+
+        # Act
+        df_list = python_engine._read_hopsfs_remote(
+            location="location",
+            data_format="csv",
+            read_options={"read_workers": 3, "columns": ["a"]},
+        )
+
+        # Assert
+        assert sorted(
+            call.args[1]
+            for call in mock_dataset_api.return_value.list_files.call_args_list
+        ) == [0, 2, 4]
+        assert [df["a"].tolist() for df in df_list] == [[0], [1], [2], [3], [4]]
+        assert all(list(df.columns) == ["a"] for df in df_list)
+
+    def test_read_s3_in_order(self, mocker):
+        # Arrange
+        mock_boto3_client = mocker.patch("boto3.client")
+
+        python_engine = python.Engine()
+
+        connector = storage_connector.S3Connector(
+            id=1, name="test_connector", featurestore_id=1, bucket="bucket"
+        )
+
+        mock_boto3_client.return_value.list_objects_v2.side_effect = [
+            {
+                "is_truncated": True,
+                "NextContinuationToken": "test_token",
+                "Contents": [
+                    {"Key": "part_0", "Size": 1},
+                    {"Key": "_SUCCESS", "Size": 1},
+                ],
+            },
+            {
+                "is_truncated": False,
+                "Contents": [
+                    {"Key": "part_1", "Size": 1},
+                    {"Key": "part_2", "Size": 0},
+                ],
+            },
+        ]
+
+        def get_object(Bucket, Key):
+            buffer = BytesIO()
+            pd.DataFrame({"a": [int(Key[-1])], "b": ["x"]}).to_parquet(buffer)
+            buffer.seek(0)
+            return {"Body": buffer}
+
+        mock_boto3_client.return_value.get_object.side_effect = get_object
+
+        # Act
+        df_list = python_engine._read_s3(
+            storage_connector=connector,
+            location="s3://bucket/location",
+            data_format="parquet",
+            dataframe_type="polars",
+            read_options={"read_workers": 2, "columns": ["a"]},
+        )
+
+        # Assert
+        assert [df["a"].to_list() for df in df_list] == [[0], [1]]
+        assert all(df.columns == ["a"] for df in df_list)
+
+    def test_read_s3_invalid_read_workers(self, mocker):
+        # Arrange
+        mocker.patch("boto3.client")
+
+        python_engine = python.Engine()
+
+        connector = storage_connector.S3Connector(
+            id=1, name="test_connector", featurestore_id=1
+        )
+
+        # Act
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            python_engine._read_s3(
+                storage_connector=connector,
+                location="",
+                data_format="parquet",
+                read_options={"read_workers": 0},
+            )
+
+        # Assert
+        assert str(e_info.value) == "read_workers must be a positive integer, got '0'."
+
+    @pytest.mark.parametrize(
+        "dataframe_type, expected_type",
+        [("default", pd.DataFrame), ("pandas", pd.DataFrame), ("polars", pl.DataFrame)],
+    )
+    def test_read_vector_db_batches(self, mocker, dataframe_type, expected_type):
+        # Arrange
+        mock_read_batches = mocker.patch(
+            "hsfs.core.vector_db_client.VectorDbClient.read_feature_group_batches",
+            return_value=iter([[[1, "a"], [2, "b"]], [[3, "c"]]]),
+        )
+        python_engine = python.Engine()
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["id"],
+            partition_key=[],
+            features=[
+                feature.Feature(name="id", type="bigint"),
+                feature.Feature(name="name", type="string"),
+            ],
+        )
+
+        # Act
+        batches = list(
+            python_engine.read_vector_db_batches(
+                fg, batch_size=2, dataframe_type=dataframe_type
+            )
+        )
+
+        # Assert
+        mock_read_batches.assert_called_once_with(fg, 2)
+        assert [type(batch) for batch in batches] == [expected_type, expected_type]
+        assert [list(batch.columns) for batch in batches] == [["id", "name"]] * 2
+        assert [batch.shape[0] for batch in batches] == [2, 1]
+
     def test_read_options(self):
         # Arrange
         python_engine = python.Engine()
@@ -2092,6 +2243,43 @@ class TestPython:
         for column in list(result):
             assert not result[column].empty
 
+    @pytest.mark.parametrize("dataframe_type", ["pandas", "polars"])
+    def test_random_split_seed(self, mocker, dataframe_type):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+
+        python_engine = python.Engine()
+
+        d = {"col1": list(range(100)), "col2": list(range(100, 200))}
+        df = pd.DataFrame(data=d) if dataframe_type == "pandas" else pl.DataFrame(d)
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"train": 0.7, "test": 0.3},
+            label=["f", "f_wrong"],
+            id=10,
+            seed=42,
+        )
+
+        # Act
+        result = python_engine._random_split(df=df, training_dataset_obj=td)
+        result_same_seed = python_engine._random_split(df=df, training_dataset_obj=td)
+
+        # Assert
+        assert list(df.columns) == ["col1", "col2"]
+        assert len(result["train"]) == 70
+        assert len(result["test"]) == 30
+        train_ids = list(result["train"]["col1"])
+        test_ids = list(result["test"]["col1"])
+        assert sorted(train_ids + test_ids) == list(range(100))
+        # the rows keep their original order within each split
+        assert train_ids == sorted(train_ids)
+        assert train_ids == list(result_same_seed["train"]["col1"])
+        assert test_ids == list(result_same_seed["test"]["col1"])
+
     def test_random_split_size_precision_1(self, mocker):
         # In python sum([0.6, 0.3, 0.1]) != 1.0 due to floating point precision.
         # This test checks if different split ratios can be handled.
@@ -2291,6 +2479,110 @@ class TestPython:
         for column in list(result):
             assert result[column].equals(expected[column])
 
+    def test_time_series_split_datetime(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+
+        python_engine = python.Engine()
+
+        d = {
+            "col1": [1, 2, 3],
+            "event_time": pd.to_datetime(
+                ["2017-01-01 00:00:00", "2017-01-02 00:00:00", None]
+            ).tz_localize("UTC"),
+        }
+        df = pd.DataFrame(data=d)
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"col1": None, "col2": None},
+            label=["f", "f_wrong"],
+            id=10,
+            train_start=1483228800000,
+            train_end=1483315200000,
+            test_end=1483401600000,
+        )
+
+        # Act
+        result = python_engine._time_series_split(
+            df=df,
+            training_dataset_obj=td,
+            event_time="event_time",
+            drop_event_time=True,
+        )
+
+        # Assert
+        assert list(result) == ["train", "test"]
+        assert result["train"].equals(df.loc[df["col1"] == 1, ["col1"]])
+        assert result["test"].equals(df.loc[df["col1"] == 2, ["col1"]])
+
+    def test_time_series_split_polars(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+
+        python_engine = python.Engine()
+
+        df = pl.DataFrame(
+            {
+                "col1": [1, 2, 3],
+                "event_time": ["2017-01-01 00:00:00", "2017-01-02 00:00:00", None],
+            }
+        )
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"col1": None, "col2": None},
+            label=["f", "f_wrong"],
+            id=10,
+            train_start=1483228800000,
+            train_end=1483315200000,
+            test_end=1483401600000,
+        )
+
+        # Act
+        result = python_engine._time_series_split(
+            df=df,
+            training_dataset_obj=td,
+            event_time="event_time",
+        )
+
+        # Assert
+        assert list(result) == ["train", "test"]
+        assert result["train"]["col1"].to_list() == [1]
+        assert result["test"]["col1"].to_list() == [2]
+
+    def test_convert_event_time_to_timestamp_array(self):
+        # Arrange
+        event_times = [
+            datetime(2017, 1, 1, 12, 30),
+            datetime(2018, 6, 1, 0, 0, 1),
+        ]
+        expected = [util.convert_event_time_to_timestamp(t) for t in event_times]
+
+        # Act
+        results = [
+            python.Engine._convert_event_time_to_timestamp_array(series).tolist()
+            for series in [
+                pd.Series(event_times),
+                pd.Series(event_times).astype("datetime64[ms]"),
+                pl.Series(event_times),
+                pd.Series([str(t) for t in event_times]),
+                pd.Series([t // 1000 for t in expected]),
+                pd.Series(expected),
+            ]
+        ]
+
+        # Assert
+        assert results[:4] == [expected] * 4
+        assert results[4] == [t // 1000 * 1000 for t in expected]
+        assert results[5] == expected
+
     def test_convert_to_unix_timestamp_pandas(self):
         # Act
         result = util.convert_event_time_to_timestamp(
@@ -3149,6 +3441,205 @@ class TestPython:
             await_termination=False,
         )
 
+    def _encode_kafka_records_rows(self, mocker, dataframe):
+        mocker.patch("hsfs.client.get_instance")
+        python_engine = python.Engine()
+        row_schema = {
+            "type": "record",
+            "name": "test",
+            "fields": [
+                {"name": "id", "type": ["null", "long"]},
+                {"name": "name", "type": ["null", "string"]},
+                {
+                    "name": "ts",
+                    "type": [
+                        "null",
+                        {"type": "long", "logicalType": "timestamp-micros"},
+                    ],
+                },
+                {"name": "amount", "type": ["null", "double"]},
+                {"name": "arr", "type": ["null", "bytes"]},
+            ],
+        }
+        arr_schema = ["null", {"type": "array", "items": ["null", "long"]}]
+        writer = kafka_engine.get_encoder_func(json.dumps(row_schema))
+        arr_writer = kafka_engine.get_encoder_func(json.dumps(arr_schema))
+
+        records = list(
+            python_engine._encode_kafka_records(
+                dataframe,
+                primary_key=["name", "id"],
+                feature_writers={"arr": arr_writer},
+                writer=writer,
+                chunk_size=2,
+            )
+        )
+
+        rows = []
+        for key, encoded_row in records:
+            row = fastavro.schemaless_reader(BytesIO(encoded_row), row_schema)
+            row["arr"] = fastavro.schemaless_reader(BytesIO(row["arr"]), arr_schema)
+            rows.append((key, row))
+        return rows
+
+    def test_encode_kafka_records_pandas(self, mocker):
+        # Arrange
+        df = pd.DataFrame(
+            {
+                "id": pd.array([1, 2, None], dtype="Int64"),
+                "name": ["a", "b", None],
+                "ts": pd.to_datetime(
+                    ["2022-01-01 10:00:00", None, "2022-01-03 00:00:00"]
+                ),
+                "amount": [1.5, 2.5, 3.5],
+                "arr": [np.array([1, 2]), np.array([3]), None],
+            }
+        )
+
+        # Act
+        rows = self._encode_kafka_records_rows(mocker, df)
+
+        # Assert
+        assert rows == [
+            (
+                "1a",
+                {
+                    "id": 1,
+                    "name": "a",
+                    "ts": datetime(2022, 1, 1, 10, tzinfo=timezone.utc),
+                    "amount": 1.5,
+                    "arr": [1, 2],
+                },
+            ),
+            (
+                "2b",
+                {"id": 2, "name": "b", "ts": None, "amount": 2.5, "arr": [3]},
+            ),
+            (
+                "NoneNone",
+                {
+                    "id": None,
+                    "name": None,
+                    "ts": datetime(2022, 1, 3, tzinfo=timezone.utc),
+                    "amount": 3.5,
+                    "arr": None,
+                },
+            ),
+        ]
+
+    def test_encode_kafka_records_polars(self, mocker):
+        # Arrange
+        df = pl.DataFrame(
+            {
+                "id": [1, 2],
+                "name": ["a", "b"],
+                "ts": [datetime(2022, 1, 1, 10), None],
+                "amount": [1.5, None],
+                "arr": [[1, 2], [3]],
+            }
+        )
+
+        # Act
+        rows = self._encode_kafka_records_rows(mocker, df)
+
+        # Assert
+        assert rows == [
+            (
+                "1a",
+                {
+                    "id": 1,
+                    "name": "a",
+                    "ts": datetime(2022, 1, 1, 10, tzinfo=timezone.utc),
+                    "amount": 1.5,
+                    "arr": [1, 2],
+                },
+            ),
+            (
+                "2b",
+                {"id": 2, "name": "b", "ts": None, "amount": None, "arr": [3]},
+            ),
+        ]
+
+    @pytest.mark.parametrize(
+        "write_options",
+        [
+            {"kafka_encoding_workers": 2},
+            {"kafka_encoding_workers": 2, "kafka_encoding_pool": "thread"},
+            {"kafka_encoding_workers": 2, "kafka_encoding_pool": "process"},
+            {"kafka_producers": 3},
+        ],
+    )
+    def test_write_dataframe_kafka_parallel(self, mocker, write_options):
+        # Arrange
+        schema = {
+            "type": "record",
+            "name": "test",
+            "fields": [
+                {"name": "id", "type": ["null", "long"]},
+                {"name": "amount", "type": ["null", "double"]},
+            ],
+        }
+        mocker.patch("hsfs.client.get_instance")
+        mocker.patch("hsfs.core.kafka_engine.get_kafka_config", return_value={})
+        mocker.patch(
+            "hsfs.feature_group.FeatureGroup._get_encoded_avro_schema",
+            return_value=json.dumps(schema),
+        )
+        mock_producer = mocker.patch("hsfs.core.kafka_engine.Producer")
+        mocker.patch(
+            "hsfs.core.kafka_engine.kafka_get_offsets", return_value=" tests_offsets"
+        )
+        mocker.patch(
+            "hsfs.engine.python.Engine._start_offline_materialization",
+            return_value=False,
+        )
+        mock_process_pool = mocker.patch(
+            "hsfs.engine.python.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        )
+        python_engine = python.Engine()
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["id"],
+            partition_key=[],
+            features=[
+                feature.Feature(
+                    name="id", type="bigint", primary=True, hudi_precombine_key=True
+                ),
+                feature.Feature(name="amount", type="double"),
+            ],
+            id=10,
+            stream=False,
+            time_travel_format="HUDI",
+        )
+        fg._online_topic_name = "test_topic"
+        fg._subject = {"id": 1, "schema": json.dumps(schema)}
+        fg._materialization_job = mocker.MagicMock()
+        df = pd.DataFrame({"id": range(25), "amount": [float(i) for i in range(25)]})
+
+        # Act
+        python_engine._write_dataframe_kafka(
+            feature_group=fg,
+            dataframe=df,
+            offline_write_options={"kafka_chunk_size": 4, **write_options},
+        )
+
+        # Assert
+        produced = sorted(
+            (
+                int(call.kwargs["key"]),
+                fastavro.schemaless_reader(BytesIO(call.kwargs["value"]), schema),
+            )
+            for call in mock_producer.return_value.produce.call_args_list
+        )
+        assert produced == [(i, {"id": i, "amount": float(i)}) for i in range(25)]
+        assert mock_producer.call_count == write_options.get("kafka_producers", 1)
+        # the encoding workers run in threads unless processes are requested
+        assert mock_process_pool.called == (
+            write_options.get("kafka_encoding_pool") == "process"
+        )
+
     def test_test(self, mocker):
         fg = feature_group.FeatureGroup(
             name="test",
@@ -3776,6 +3776,72 @@ class TestSpark:
         # Assert
         assert result == {"delimiter": "\t", "header": "true", "test_key": "test_value"}
 
+    def test_read_vector_db_batches_spark(self, mocker):
+        # Arrange
+        mock_pyspark_getOrCreate = mocker.patch(
+            "pyspark.sql.session.SparkSession.builder.getOrCreate"
+        )
+        mocker.patch(
+            "hsfs.core.vector_db_client.VectorDbClient.read_feature_group_batches",
+            return_value=iter([[[1, "a"], [2, "b"]], [[3, "c"]]]),
+        )
+        spark_engine = spark.Engine()
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["id"],
+            partition_key=[],
+            features=[
+                feature.Feature(name="id", type="bigint"),
+                feature.Feature(name="name", type="string"),
+            ],
+        )
+
+        # Act
+        batches = list(spark_engine.read_vector_db_batches(fg, batch_size=2))
+
+        # Assert
+        mock_create_dataframe = mock_pyspark_getOrCreate.return_value.createDataFrame
+        assert batches == [mock_create_dataframe.return_value] * 2
+        assert mock_create_dataframe.call_args_list == [
+            mocker.call([[1, "a"], [2, "b"]], ["id", "name"]),
+            mocker.call([[3, "c"]], ["id", "name"]),
+        ]
+
+    def test_read_vector_db_batches_pandas(self, mocker):
+        # Arrange
+        mocker.patch("pyspark.sql.session.SparkSession.builder.getOrCreate")
+        mocker.patch(
+            "hsfs.core.vector_db_client.VectorDbClient.read_feature_group_batches",
+            return_value=iter([[[1, "a"], [2, "b"]], [[3, "c"]]]),
+        )
+        spark_engine = spark.Engine()
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["id"],
+            partition_key=[],
+            features=[
+                feature.Feature(name="id", type="bigint"),
+                feature.Feature(name="name", type="string"),
+            ],
+        )
+
+        # Act
+        batches = list(
+            spark_engine.read_vector_db_batches(
+                fg, batch_size=2, dataframe_type="pandas"
+            )
+        )
+
+        # Assert
+        assert all(isinstance(batch, pd.DataFrame) for batch in batches)
+        assert pd.concat(batches, ignore_index=True).equals(
+            pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+        )
+
     def test_read_options(self):
         # Arrange
         spark_engine = spark.Engine()
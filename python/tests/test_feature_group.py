@@ -31,6 +31,7 @@ from hsfs import (
 )
 from hsfs.client.exceptions import FeatureStoreException, RestAPIError
 from hsfs.core.constants import HAS_GREAT_EXPECTATIONS
+from hsfs.embedding import EmbeddingFeature, EmbeddingIndex
 from hsfs.engine import python
 from hsfs.hopsworks_udf import UDFType
 
@@ -363,6 +364,41 @@ class TestFeatureGroup:
         assert len(features) == 2
         assert set([f.name for f in features]) == {"f1", "f2"}
 
+    def test_read_online_batches(self, mocker):
+        # Arrange
+        mock_engine = mocker.patch("hsfs.engine.get_instance").return_value
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["id"],
+            partition_key=[],
+            embedding_index=EmbeddingIndex(
+                features=[EmbeddingFeature(name="vector", dimension=2)]
+            ),
+        )
+
+        # Act
+        result = fg.read_online_batches(batch_size=10, dataframe_type="polars")
+
+        # Assert
+        assert result is mock_engine.read_vector_db_batches.return_value
+        mock_engine.read_vector_db_batches.assert_called_once_with(
+            fg, batch_size=10, dataframe_type="polars"
+        )
+
+    def test_read_online_batches_without_embedding_index(self, mocker):
+        # Arrange
+        mock_engine = mocker.patch("hsfs.engine.get_instance").return_value
+
+        # Act
+        with pytest.raises(FeatureStoreException) as e_info:
+            test_feature_group.read_online_batches()
+
+        # Assert
+        assert "only supported for feature groups with embeddings" in str(e_info.value)
+        mock_engine.read_vector_db_batches.assert_not_called()
+
     def test_materialization_job(self, mocker):
         mock_job = mocker.Mock()
         mock_job_api = mocker.patch(
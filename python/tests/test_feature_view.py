@@ -13,10 +13,16 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import asyncio
 import warnings
+from unittest.mock import AsyncMock
 
+import pandas as pd
+import polars as pl
+import pytest
 from hsfs import feature_view, training_dataset_feature
 from hsfs.constructor import fs_query, query
+from hsfs.core import vector_server
 from hsfs.feature_store import FeatureStore
 from hsfs.hopsworks_udf import UDFType, udf
 
@@ -168,3 +174,176 @@ class TestFeatureView:
         transformation_functions = fv.transformation_functions
 
         assert transformation_functions[0] != transformation_functions[1]
+
+    def test_find_neighbors_batch(self, mocker, backend_fixtures):
+        # Arrange
+        mocker.patch("hsfs.core.feature_view_engine.FeatureViewEngine")
+        json = backend_fixtures["fs_query"]["get"]["response"]
+        fv = feature_view.FeatureView(
+            featurestore_id=99,
+            name="test_fv",
+            version=1,
+            query=fs_query.FsQuery.from_response_json(json),
+        )
+        fv._vector_db_client = mocker.MagicMock()
+        fv._vector_db_client.find_neighbors_batch.return_value = [
+            [(0.1, {"id": 1}), (0.2, {"id": 2})],
+            [],
+            [(0.3, {"id": 3})],
+        ]
+        fv._vector_server = mocker.MagicMock()
+        fv._vector_server.get_feature_vectors.return_value = pd.DataFrame(
+            {"id": [1, 2, 3]}
+        )
+        mocker.patch.object(
+            fv, "_extract_primary_key", side_effect=lambda result: result
+        )
+
+        # Act
+        neighbors = fv.find_neighbors_batch(
+            [[0.1], [0.2], [0.3]], k=2, return_type="pandas"
+        )
+
+        # Assert
+        assert fv._vector_server.get_feature_vectors.call_count == 1
+        assert fv._vector_server.get_feature_vectors.call_args[0][0] == [
+            {"id": 1},
+            {"id": 2},
+            {"id": 3},
+        ]
+        assert neighbors[0]["id"].tolist() == [1, 2]
+        assert isinstance(neighbors[1], pd.DataFrame)
+        assert neighbors[1].empty
+        assert list(neighbors[1].columns) == ["id"]
+        assert neighbors[2]["id"].tolist() == [3]
+
+    def test_find_neighbors_async(self, mocker, backend_fixtures):
+        # Arrange
+        mocker.patch("hsfs.core.feature_view_engine.FeatureViewEngine")
+        json = backend_fixtures["fs_query"]["get"]["response"]
+        fv = feature_view.FeatureView(
+            featurestore_id=99,
+            name="test_fv",
+            version=1,
+            query=fs_query.FsQuery.from_response_json(json),
+        )
+        fv._vector_db_client = mocker.MagicMock()
+        fv._vector_db_client.find_neighbors_async = AsyncMock(
+            return_value=[(0.1, {"id": 1}), (0.2, {"id": 2})]
+        )
+        fv._vector_server = mocker.MagicMock()
+        fv._vector_server.get_feature_vectors_async = AsyncMock(return_value=[[1], [2]])
+        mocker.patch.object(
+            fv, "_extract_primary_key", side_effect=lambda result: result
+        )
+
+        # Act
+        neighbors = asyncio.run(fv.find_neighbors_async([0.1], k=2))
+
+        # Assert
+        assert neighbors == [[1], [2]]
+        fv._vector_db_client.find_neighbors.assert_not_called()
+        fv._vector_server.get_feature_vectors.assert_not_called()
+        assert fv._vector_server.get_feature_vectors_async.call_args[0][0] == [
+            {"id": 1},
+            {"id": 2},
+        ]
+
+    def test_get_feature_vectors_async_reads_vector_db_async(
+        self, mocker, backend_fixtures
+    ):
+        # Arrange
+        mocker.patch("hsfs.core.feature_view_engine.FeatureViewEngine")
+        json = backend_fixtures["fs_query"]["get"]["response"]
+        fv = feature_view.FeatureView(
+            featurestore_id=99,
+            name="test_fv",
+            version=1,
+            query=fs_query.FsQuery.from_response_json(json),
+        )
+        embedding_fg = mocker.MagicMock()
+        embedding_fg.embedding_index.index_name = "index"
+        fv._vector_db_client = mocker.MagicMock()
+        fv._vector_db_client.embedding_fg_by_join_index = {0: embedding_fg}
+        fv._vector_db_client.filter_entry_by_join_index.side_effect = (
+            lambda entry, join_index: (True, entry)
+        )
+        fv._vector_db_client.read_async = AsyncMock(
+            side_effect=lambda fg_id, schema, keys, index_name: [
+                {"embedding": [keys["id"]] * 2}
+            ]
+        )
+        fv._vector_server = mocker.MagicMock()
+        fv._vector_server.get_feature_vectors_async = AsyncMock(return_value=[])
+
+        # Act
+        asyncio.run(fv.get_feature_vectors_async(entry=[{"id": 1}, {"id": 2}]))
+
+        # Assert
+        fv._vector_db_client.read.assert_not_called()
+        assert fv._vector_db_client.read_async.await_count == 2
+        assert fv._vector_server.get_feature_vectors_async.call_args[1][
+            "vector_db_features"
+        ] == [{"embedding": [1, 1]}, {"embedding": [2, 2]}]
+
+    def test_get_vector_db_pool_statistics(self, mocker, backend_fixtures):
+        # Arrange
+        mocker.patch("hsfs.core.feature_view_engine.FeatureViewEngine")
+        json = backend_fixtures["fs_query"]["get"]["response"]
+        fv = feature_view.FeatureView(
+            featurestore_id=99,
+            name="test_fv",
+            version=1,
+            query=fs_query.FsQuery.from_response_json(json),
+        )
+        statistics = [{"host": "localhost", "num_connections": 1}]
+
+        # Act
+        without_client = fv.get_vector_db_pool_statistics()
+        fv._vector_db_client = mocker.MagicMock()
+        fv._vector_db_client.get_pool_statistics.return_value = statistics
+
+        # Assert
+        assert without_client is None
+        assert fv.get_vector_db_pool_statistics() == statistics
+
+    @pytest.mark.parametrize("return_type", ["pandas", "polars"])
+    def test_find_neighbors_batch_no_neighbors(
+        self, mocker, backend_fixtures, return_type
+    ):
+        # Arrange
+        mocker.patch("hsfs.core.feature_view_engine.FeatureViewEngine")
+        json = backend_fixtures["fs_query"]["get"]["response"]
+        fv = feature_view.FeatureView(
+            featurestore_id=99,
+            name="test_fv",
+            version=1,
+            query=fs_query.FsQuery.from_response_json(json),
+        )
+        fv._vector_db_client = mocker.MagicMock()
+        fv._vector_db_client.find_neighbors.return_value = []
+        fv._vector_db_client.find_neighbors_batch.return_value = [[], []]
+        fv._vector_server = vector_server.VectorServer(
+            feature_store_id=99,
+            features=[
+                training_dataset_feature.TrainingDatasetFeature(
+                    name="id", type="bigint"
+                ),
+                training_dataset_feature.TrainingDatasetFeature(
+                    name="amount", type="double"
+                ),
+            ],
+        )
+
+        # Act
+        neighbors = fv.find_neighbors([0.1], k=2, return_type=return_type)
+        batch_neighbors = fv.find_neighbors_batch(
+            [[0.1], [0.2]], k=2, return_type=return_type
+        )
+
+        # Assert
+        frame_type = pd.DataFrame if return_type == "pandas" else pl.DataFrame
+        for frame in [neighbors] + batch_neighbors:
+            assert isinstance(frame, frame_type)
+            assert frame.shape[0] == 0
+            assert list(frame.columns) == ["id", "amount"]
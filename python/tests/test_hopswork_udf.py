@@ -592,6 +592,89 @@ def test_function():
         assert all(result.columns == ["test_func_col1_col2_0", "test_func_col1_col2_1"])
         assert result.values.tolist() == [[2, 12], [3, 22], [4, 32], [5, 42]]
 
+    def test_get_udf_compiled_once(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        mock_wrapper = mocker.spy(HopsworksUdf, "hopsworksUdf_wrapper")
+
+        @udf(int)
+        def test_func(col1):
+            return col1 + 1
+
+        test_func.udf_type = UDFType.MODEL_DEPENDENT
+
+        first_udf = test_func.get_udf(force_python_udf=True)
+        second_udf = test_func.get_udf(force_python_udf=True)
+
+        assert first_udf is second_udf
+        assert mock_wrapper.call_count == 1
+        assert first_udf(pd.Series([1, 2])).values.tolist() == [2, 3]
+
+    def test_get_udf_recompiled_on_output_column_names_change(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        mock_wrapper = mocker.spy(HopsworksUdf, "hopsworksUdf_wrapper")
+
+        @udf(int)
+        def test_func(col1):
+            return col1 + 1
+
+        test_func.udf_type = UDFType.MODEL_DEPENDENT
+
+        first_udf = test_func.get_udf(force_python_udf=True)
+        test_func.output_column_names = ["new_col"]
+        second_udf = test_func.get_udf(force_python_udf=True)
+
+        assert first_udf is not second_udf
+        assert mock_wrapper.call_count == 2
+        assert second_udf(pd.Series([1, 2])).name == "new_col"
+
+    def test_get_udf_recompiled_on_statistics_change(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        from hsfs.core.feature_descriptive_statistics import (
+            FeatureDescriptiveStatistics,
+        )
+        from hsfs.transformation_statistics import TransformationStatistics
+
+        mock_wrapper = mocker.spy(HopsworksUdf, "hopsworksUdf_wrapper")
+        stats = TransformationStatistics("col1")
+
+        @udf(float)
+        def test_func(col1, statistics=stats):
+            return col1 + statistics.col1.mean
+
+        test_func.udf_type = UDFType.MODEL_DEPENDENT
+
+        test_func.transformation_statistics = [
+            FeatureDescriptiveStatistics(feature_name="col1", mean=1)
+        ]
+        first_udf = test_func.get_udf(force_python_udf=True)
+        assert first_udf(pd.Series([1.0])).values.tolist() == [2.0]
+
+        test_func.transformation_statistics = [
+            FeatureDescriptiveStatistics(feature_name="col1", mean=10)
+        ]
+        second_udf = test_func.get_udf(force_python_udf=True)
+
+        assert mock_wrapper.call_count == 2
+        assert second_udf(pd.Series([1.0])).values.tolist() == [11.0]
+
+    def test_get_udf_call_does_not_reuse_compiled_udf(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(int)
+        def test_func(col1):
+            return col1 + 1
+
+        test_func.udf_type = UDFType.MODEL_DEPENDENT
+        test_func.get_udf(force_python_udf=True)
+
+        new_udf = test_func("new_feature")
+
+        assert new_udf._compiled_udf is None
+        assert (
+            new_udf.get_udf(force_python_udf=True)(pd.Series([1])).name
+            == "test_func_new_feature_"
+        )
+
     def test_HopsworkUDf_call_one_argument(self):
         @udf(int)
         def test_func(col1):